@@ -52,13 +52,14 @@ def create_app(config_name='development'):
     
     app.register_blueprint(api_bp)
 
+    # Register CLI commands
+    from app.commands import register_commands
+    register_commands(app)
+
     # Root health check to avoid noisy 404s on HEAD/GET /
     @app.route('/', methods=['GET'])
     def root():
         return {'status': 'ok'}, 200
-    
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-    
+
+    # Schema changes are applied with `flask db upgrade`, not at startup
     return app
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required
 
 api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
 
@@ -9,6 +10,14 @@ def health_check():
     return jsonify({'status': 'healthy', 'message': 'API is running'}), 200
 
 
+@api_bp.route('/cache-stats', methods=['GET'])
+@jwt_required()
+def cache_stats():
+    """Item list cache hit/miss counters for the worker serving the request."""
+    from app.services.cache import get_item_list_cache
+    return jsonify({'item_list': get_item_list_cache().stats()}), 200
+
+
 @api_bp.route('/', methods=['GET'])
 def index():
     """API welcome endpoint."""
@@ -41,3 +50,6 @@ api_bp.register_blueprint(value_bp, url_prefix='/value')
 
 from .verification import verification_bp
 api_bp.register_blueprint(verification_bp, url_prefix='/verification')
+
+from .image import image_bp
+api_bp.register_blueprint(image_bp, url_prefix='/images')
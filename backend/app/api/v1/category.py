@@ -6,6 +6,7 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 from app.services.category_service import CategoryService
 from app.api.v1.schemas.category_schema import CategorySchemaResponse
+from app.utils.conditional import make_etag, not_modified, with_etag
 
 category_bp = Blueprint('category', __name__)
 
@@ -21,15 +22,22 @@ def get_categories():
     
     Headers:
         Authorization: Bearer <access_token>
+        If-None-Match (optional): ETag of a previously fetched response
         
     Query Parameters:
         no_images (bool): If true, excludes category_pic from response
         
     Returns:
         200: List of categories
+        304: Categories haven't changed since the given ETag
         404: No categories found
     """
     no_images = request.args.get('no_images', 'false').lower() == 'true'
+    etag = make_etag('categories', no_images, *service.get_categories_version())
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
     categories = service.get_all_categories()
 
     if not categories:
@@ -37,18 +45,20 @@ def get_categories():
 
     if no_images:
         # Return categories without pictures
-        return jsonify([
+        response = jsonify([
             {
                 'category_id': cat.category_id,
                 'category_name': cat.category_name
             }
             for cat in categories
-        ]), 200
+        ])
+    else:
+        response = jsonify([
+            CategorySchemaResponse.model_validate(cat).model_dump()
+            for cat in categories
+        ])
 
-    return jsonify([
-        CategorySchemaResponse.model_validate(cat).model_dump()
-        for cat in categories
-    ]), 200
+    return with_etag(response, etag), 200
 
 
 @category_bp.route('/<int:category_id>', methods=['GET'])
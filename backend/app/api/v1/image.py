@@ -0,0 +1,48 @@
+"""
+Image Routes
+Serves content-addressed images from the image store.
+"""
+from flask import Blueprint, jsonify, send_file
+
+from app.services.images import ImageService, ImageNotFoundError
+
+image_bp = Blueprint('images', __name__)
+
+_image_service = ImageService()
+
+# Keys are content hashes, so the bytes behind a URL never change
+IMAGE_CACHE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+@image_bp.route('/<string:key>', methods=['GET'])
+def get_image(key: str):
+    """Get a stored image by its content-addressed key.
+    
+    Public so URLs can be used directly as ``<img src>``. The key is the
+    image's SHA-256, used as a strong ETag; responses are marked immutable,
+    forbid content sniffing and are streamed from disk by the WSGI server.
+    
+    Path Parameters:
+        key (str): Image key as returned in profile_picture / category_pic URLs
+        
+    Returns:
+        200: Image bytes
+        304: Client copy is still current
+        404: Image not found
+    """
+    try:
+        path = _image_service.path(key)
+    except ImageNotFoundError:
+        return jsonify({'message': 'Image not found'}), 404
+
+    response = send_file(
+        path,
+        mimetype=_image_service.mimetype_for_key(key),
+        etag=key.split('.', 1)[0],
+        max_age=IMAGE_CACHE_MAX_AGE,
+        conditional=True
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    return response
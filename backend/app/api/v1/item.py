@@ -1,11 +1,28 @@
 """Item endpoints."""
-from flask import Blueprint, jsonify, request
+import math
+
+from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from pydantic import ValidationError
 
+from app.repositories.base.item_order import ItemOrder
 from app.services.item_service import ItemService
 from app.services.user_service import UserService
-from app.api.v1.schemas.item_schema import CreateItemRequest, ItemResponse
+from app.services.cache import get_item_list_cache
+from app.api.v1.schemas.item_schema import (
+    CreateItemRequest,
+    ItemResponse,
+    ItemSummaryResponse,
+    ItemPageResponse,
+    ItemChangesResponse,
+    ItemFacetsResponse,
+    NearbyItemResponse,
+    NearbyItemsResponse,
+    SetItemTagValueRequest
+)
+from app.utils.conditional import make_etag, not_modified, with_etag
+from app.utils.jwt_claims import get_current_rotation_city_id
+from app.utils.pagination import decode_cursor, decode_score_cursor, parse_limit
 
 item_bp = Blueprint('item', __name__)
 
@@ -25,6 +42,8 @@ def create_item():
         name (str): Item name
         location (str): Item location
         walking_distance (float, optional): Walking distance in meters
+        latitude (float, optional): Latitude in degrees, given with longitude
+        longitude (float, optional): Longitude in degrees, given with latitude
         category_ids (list[int]): List of category IDs (at least one required)
         existing_tags (list[dict]): List of {tag_id, value} for existing tags
         new_tags (list[dict]): List of {name, value_type, value} for new tags
@@ -44,22 +63,24 @@ def create_item():
         # Validate input with Pydantic
         validated_data = CreateItemRequest(**request.json)
         
-        # Get user's rotation_city_id
-        user = _user_service.get_user_by_id(user_id)
+        # Get user's rotation_city_id from the token claims
+        rotation_city_id = get_current_rotation_city_id()
         
-        if not user or not user.rotation_city_id:
+        if not rotation_city_id:
             return jsonify({'message': 'User rotation city not found'}), 400
         
         # Create item
         item = _item_service.create_item(
             name=validated_data.name,
             location=validated_data.location,
-            rotation_city_id=user.rotation_city_id,
+            rotation_city_id=rotation_city_id,
             added_by_user_id=user_id,
             category_ids=validated_data.category_ids,
             existing_tags=[tag.model_dump() for tag in validated_data.existing_tags],
             new_tags=[tag.model_dump() for tag in validated_data.new_tags],
-            walking_distance=validated_data.walking_distance
+            walking_distance=validated_data.walking_distance,
+            latitude=validated_data.latitude,
+            longitude=validated_data.longitude
         )
         
         return jsonify(ItemResponse.model_validate(item).model_dump()), 201
@@ -97,33 +118,405 @@ def get_all_items():
     """Get all items for the current user's rotation city.
     
     Returns all items shared by students in the authenticated user's city,
-    with full details including categories, tags, and values.
+    with full details including categories, tags, and values. Author
+    profile pictures are not embedded; see ``GET /user/<user_id>/avatar``.
+    
+    When ``limit`` or ``cursor`` is given the response is a single page
+    ``{items, next_cursor}``; pass ``next_cursor`` back as ``cursor`` to
+    fetch the following page. Without them the full list is returned.
+    ``order_by=freshness`` sorts by the precomputed freshness score (items
+    most likely to still be there first) instead of newest first; cursors
+    are only valid with the order they were issued for.
+    
+    Filters narrow the list and always return pages. Categories are
+    alternatives; each tag and range filter must hold, and several
+    values of one tag are alternatives (``tag=3:24/7&tag=3:Late``).
+    Serialized responses are cached per city until an item in the city is
+    created or verified.
+    
+    Responses carry an ETag; a matching ``If-None-Match`` gets a 304.
     
     Headers:
         Authorization: Bearer <access_token>
+        If-None-Match (optional): ETag of a previously fetched response
+    
+    Query Parameters:
+        limit (int, optional): Page size (default 50, max 200)
+        cursor (str, optional): Cursor returned by the previous page
+        order_by (str, optional): ``created`` (default) or ``freshness``
+        category_id (int, repeatable): Items in any of these categories
+        tag (str, repeatable): ``<tag_id>:<value>``, items carrying the value
+        tag_min (str, repeatable): ``<tag_id>:<number>``, numeric tag at least
+        tag_max (str, repeatable): ``<tag_id>:<number>``, numeric tag at most
+        max_walking_distance (float, optional): Meters; items without a
+            walking distance are left out
     
     Returns:
-        200: List of items in user's rotation city
-        400: User has no rotation city assigned
+        200: List of items (or one page of items) in user's rotation city
+        304: The list hasn't changed since the given ETag
+        400: User has no rotation city assigned, invalid cursor, order or filter
         500: Internal server error
     """
     try:
-        # Get user's rotation_city_id
-        user_id = get_jwt_identity()
-        user = _user_service.get_user_by_id(user_id)
+        # Get user's rotation_city_id from the token claims
+        city_id = get_current_rotation_city_id()
         
-        if not user or not user.rotation_city_id:
+        if not city_id:
             return jsonify({'message': 'User has no rotation city assigned'}), 400
         
-        # Get items filtered by rotation city with full details
-        items = _item_service.get_all_items_with_details(user.rotation_city_id)
-        return jsonify([ItemResponse.model_validate(item).model_dump() for item in items]), 200
+        try:
+            order = ItemOrder(request.args.get('order_by', ItemOrder.CREATED.value))
+        except ValueError:
+            return jsonify({'message': 'Invalid order_by'}), 400
+        
+        try:
+            filters = _parse_item_filters()
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        
+        paginated = 'limit' in request.args or 'cursor' in request.args or bool(filters)
+        cursor = None
+        
+        if paginated:
+            raw_cursor = request.args.get('cursor')
+            decode = decode_score_cursor if order is ItemOrder.FRESHNESS else decode_cursor
+            try:
+                cursor = decode(raw_cursor) if raw_cursor else None
+            except ValueError as e:
+                return jsonify({'message': str(e)}), 400
+            
+            limit = parse_limit(request.args.get('limit', type=int))
+            variant = f"page:{limit}:{raw_cursor or ''}"
+        else:
+            variant = 'all'
+        if order is not ItemOrder.CREATED:
+            variant = f"{order.value}:{variant}"
+        if filters:
+            variant = f"{variant}:{_filter_key()}"
+        
+        # Answer revalidations from one aggregate query
+        etag = make_etag('item-list', city_id, variant, *_item_service.get_items_version(city_id))
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        
+        # Serve the cached body when the city's list hasn't changed
+        cache = get_item_list_cache()
+        cache_key = cache.key(city_id, variant, etag)
+        body = cache.get(cache_key)
+        if body is not None:
+            response = current_app.response_class(body, mimetype='application/json')
+            return with_etag(response, etag), 200
+        
+        if paginated:
+            items, next_cursor = _item_service.get_items_page_with_details(
+                city_id, limit, cursor, order, filters
+            )
+            page = ItemPageResponse(
+                items=[ItemSummaryResponse.model_validate(item) for item in items],
+                next_cursor=next_cursor
+            )
+            response = jsonify(page.model_dump())
+        else:
+            # Get items filtered by rotation city with full details
+            items = _item_service.get_all_items_with_details(city_id, order)
+            response = jsonify([ItemSummaryResponse.model_validate(item).model_dump() for item in items])
+        
+        cache.set(cache_key, response.get_data())
+        return with_etag(response, etag), 200
     
     except Exception as e:
         # Log the error in production
         return jsonify({'message': 'An error occurred while fetching items'}), 500
 
 
+_FILTER_PARAMS = ('category_id', 'tag', 'tag_min', 'tag_max', 'max_walking_distance')
+
+
+def _parse_item_filters():
+    """Build ItemFilters from the request's filter query parameters.
+    
+    Raises:
+        ValueError: If a parameter is malformed or names an unknown tag
+    """
+    args = request.args
+    try:
+        category_ids = [int(value) for value in args.getlist('category_id')]
+    except ValueError:
+        raise ValueError("category_id must be an integer")
+    
+    tag_values = {}
+    for raw in args.getlist('tag'):
+        tag_id, value = _split_tag_param('tag', raw)
+        tag_values.setdefault(tag_id, []).append(value)
+    
+    numeric_ranges = {}
+    for bound, param in enumerate(('tag_min', 'tag_max')):
+        for raw in args.getlist(param):
+            tag_id, value = _split_tag_param(param, raw)
+            limits = list(numeric_ranges.get(tag_id, (None, None)))
+            limits[bound] = _parse_number(param, value)
+            numeric_ranges[tag_id] = tuple(limits)
+    
+    max_walking_distance = args.get('max_walking_distance')
+    if max_walking_distance is not None:
+        max_walking_distance = _parse_number('max_walking_distance', max_walking_distance)
+    
+    return _item_service.build_item_filters(
+        category_ids, tag_values, numeric_ranges, max_walking_distance
+    )
+
+
+def _split_tag_param(param: str, raw: str):
+    """Split a ``<tag_id>:<value>`` parameter."""
+    tag_id, sep, value = raw.partition(':')
+    if not sep:
+        raise ValueError(f"{param} must look like <tag_id>:<value>")
+    try:
+        return int(tag_id), value
+    except ValueError:
+        raise ValueError(f"{param} must look like <tag_id>:<value>")
+
+
+def _parse_number(param: str, raw: str) -> float:
+    """Parse a finite number from a filter parameter."""
+    try:
+        value = float(raw)
+    except ValueError:
+        value = None
+    if value is None or not math.isfinite(value):
+        raise ValueError(f"{param} must be a number")
+    return value
+
+
+def _filter_key() -> str:
+    """Canonical form of the request's filters, for ETags and cache keys."""
+    return '&'.join(sorted(
+        f"{param}={value}"
+        for param in _FILTER_PARAMS
+        for value in request.args.getlist(param)
+    ))
+
+
+@item_bp.route('/facets', methods=['GET'])
+@jwt_required()
+def get_item_facets():
+    """Get item counts per category and tag value in the user's city.
+    
+    Takes the same filters as ``GET /item/``. Each facet honors every
+    active filter except its own: category counts ignore ``category_id``
+    and a tag's value counts ignore that tag's ``tag`` filters, so the
+    counts match what selecting one more option would show. Cached and
+    ETagged like the item list.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+        If-None-Match (optional): ETag of a previously fetched response
+    
+    Query Parameters:
+        category_id, tag, tag_min, tag_max, max_walking_distance:
+            Filters as for ``GET /item/``
+    
+    Returns:
+        200: ``{categories: [...], tags: [{..., values: [...]}]}``
+        304: The counts haven't changed since the given ETag
+        400: User has no rotation city assigned or invalid filter
+        500: Internal server error
+    """
+    try:
+        city_id = get_current_rotation_city_id()
+        
+        if not city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        try:
+            filters = _parse_item_filters()
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        
+        variant = f"facets:{_filter_key()}"
+        etag = make_etag('item-list', city_id, variant, *_item_service.get_items_version(city_id))
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        
+        cache = get_item_list_cache()
+        cache_key = cache.key(city_id, variant, etag)
+        body = cache.get(cache_key)
+        if body is not None:
+            response = current_app.response_class(body, mimetype='application/json')
+            return with_etag(response, etag), 200
+        
+        facets = ItemFacetsResponse.model_validate(
+            _item_service.get_item_facets(city_id, filters)
+        )
+        response = jsonify(facets.model_dump())
+        cache.set(cache_key, response.get_data())
+        return with_etag(response, etag), 200
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while counting items'}), 500
+
+
+@item_bp.route('/nearby', methods=['GET'])
+@jwt_required()
+def get_nearby_items():
+    """Get items near a point in the current user's rotation city.
+    
+    Only items with coordinates are considered. Results are sorted by
+    great-circle distance, closest first, and each carries its
+    ``distance_meters``.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Query Parameters:
+        lat (float): Latitude in degrees
+        lng (float): Longitude in degrees
+        radius (float, optional): Meters (default 1000, max 20000)
+        limit (int, optional): Maximum number of items (default 50, max 200)
+    
+    Returns:
+        200: ``{items: [...]}`` within the radius, closest first
+        400: No rotation city, missing or invalid coordinates or radius
+        500: Internal server error
+    """
+    try:
+        city_id = get_current_rotation_city_id()
+        
+        if not city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        latitude = request.args.get('lat', type=float)
+        longitude = request.args.get('lng', type=float)
+        radius = request.args.get('radius', 1000.0, type=float)
+        if latitude is None or longitude is None:
+            return jsonify({'message': 'lat and lng are required numbers'}), 400
+        
+        try:
+            items = _item_service.get_nearby_items(
+                city_id, latitude, longitude, radius,
+                parse_limit(request.args.get('limit', type=int))
+            )
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        
+        response = NearbyItemsResponse(
+            items=[NearbyItemResponse.model_validate(item) for item in items]
+        )
+        return jsonify(response.model_dump()), 200
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while fetching nearby items'}), 500
+
+
+@item_bp.route('/search', methods=['GET'])
+@jwt_required()
+def search_items():
+    """Search items in the current user's rotation city.
+    
+    Every word of ``q`` must match, as a word prefix, the item's name,
+    location, one of its category names or one of its text tag values.
+    Results are ranked best match first (name matches weigh most) and
+    paginated like ``GET /item/``: pass ``next_cursor`` back as ``cursor``.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Query Parameters:
+        q (str): Search words
+        limit (int, optional): Page size (default 50, max 200)
+        cursor (str, optional): Cursor returned by the previous page
+    
+    Returns:
+        200: One page of matching items ``{items, next_cursor}``
+        400: No rotation city, no search words or invalid cursor
+        500: Internal server error
+    """
+    try:
+        city_id = get_current_rotation_city_id()
+        
+        if not city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        raw_cursor = request.args.get('cursor')
+        try:
+            cursor = decode_score_cursor(raw_cursor) if raw_cursor else None
+            items, next_cursor = _item_service.search_items(
+                city_id,
+                request.args.get('q', ''),
+                parse_limit(request.args.get('limit', type=int)),
+                cursor
+            )
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        
+        page = ItemPageResponse(
+            items=[ItemSummaryResponse.model_validate(item) for item in items],
+            next_cursor=next_cursor
+        )
+        return jsonify(page.model_dump()), 200
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while searching items'}), 500
+
+
+@item_bp.route('/changes', methods=['GET'])
+@jwt_required()
+def get_item_changes():
+    """Get items in the current user's rotation city changed since a sync.
+    
+    Returns items created, edited or verified since ``since``, oldest
+    change first, with a ``next_token`` to pass as ``since`` next time.
+    Without ``since`` every item is returned, so the first sync replaces
+    ``GET /item/`` and later ones transfer only what changed. While
+    ``has_more`` is true, fetch again with ``next_token`` right away.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Query Parameters:
+        since (str, optional): ``next_token`` of the previous sync
+        limit (int, optional): Maximum items per response (default 50, max 200)
+    
+    Returns:
+        200: Changed items ``{items, next_token, has_more}``
+        400: No rotation city or invalid token
+        500: Internal server error
+    """
+    try:
+        city_id = get_current_rotation_city_id()
+        
+        if not city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        raw_since = request.args.get('since')
+        try:
+            since = decode_cursor(raw_since) if raw_since else None
+        except ValueError:
+            return jsonify({'message': 'Invalid sync token'}), 400
+        
+        items, next_token, has_more = _item_service.get_item_changes(
+            city_id,
+            parse_limit(request.args.get('limit', type=int)),
+            since
+        )
+        
+        response = ItemChangesResponse(
+            items=[ItemSummaryResponse.model_validate(item) for item in items],
+            next_token=next_token,
+            has_more=has_more
+        )
+        return jsonify(response.model_dump()), 200
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while fetching item changes'}), 500
+
+
 @item_bp.route('/<int:item_id>', methods=['GET'])
 @jwt_required()
 def get_item_by_id(item_id):
@@ -150,15 +543,14 @@ def get_item_by_id(item_id):
         500: Internal server error
     """
     try:
-        # Get user's rotation_city_id
-        user_id = get_jwt_identity()
-        user = _user_service.get_user_by_id(user_id)
+        # Get user's rotation_city_id from the token claims
+        rotation_city_id = get_current_rotation_city_id()
         
-        if not user or not user.rotation_city_id:
+        if not rotation_city_id:
             return jsonify({'message': 'User has no rotation city assigned'}), 400
         
         # Get item filtered by rotation city with full details
-        item = _item_service.get_item_by_id_with_details(item_id, user.rotation_city_id)
+        item = _item_service.get_item_by_id_with_details(item_id, rotation_city_id)
         return jsonify(ItemResponse.model_validate(item).model_dump()), 200
     
     except ValueError as e:
@@ -169,6 +561,58 @@ def get_item_by_id(item_id):
         return jsonify({'message': 'An error occurred while fetching item'}), 500
 
 
+@item_bp.route('/<int:item_id>/tags/<int:tag_id>', methods=['PUT'])
+@jwt_required()
+def set_item_tag_value(item_id, tag_id):
+    """Set the value of one tag on an item (must belong to user's rotation city).
+    
+    Only this item changes; other items carrying the old value keep it.
+    
+    Path Parameters:
+        item_id (int): ID of the item to change
+        tag_id (int): ID of the tag to set
+        
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Request Body:
+        value (bool | str | float): New value, matching the tag's value_type
+    
+    Returns:
+        200: Item details with the new value
+        400: Validation error, unknown item or tag, or user has no rotation city
+        500: Internal server error
+    """
+    if not request.json:
+        return jsonify({'message': 'Request body is required'}), 400
+    
+    try:
+        validated_data = SetItemTagValueRequest(**request.json)
+        
+        rotation_city_id = get_current_rotation_city_id()
+        
+        if not rotation_city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        item = _item_service.set_item_tag_value(
+            item_id, rotation_city_id, tag_id, validated_data.value
+        )
+        return jsonify(ItemResponse.model_validate(item).model_dump()), 200
+    
+    except ValidationError as e:
+        return jsonify({
+            'message': 'Validation error',
+            'errors': [{'loc': error['loc'], 'msg': error['msg'], 'type': error['type']} for error in e.errors()]
+        }), 400
+    
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while updating item'}), 500
+
+
 @item_bp.route('/user/<int:user_id>', methods=['GET'])
 @jwt_required()
 def get_user_items(user_id):
@@ -176,6 +620,7 @@ def get_user_items(user_id):
     
     Returns all items created by the specified user,
     with full details including categories, tags, and values.
+    Author profile pictures are not embedded.
     Useful for displaying user profiles showing their contributions.
     
     Path Parameters:
@@ -197,7 +642,7 @@ def get_user_items(user_id):
         
         # Get all items added by this user
         items = _item_service.get_user_items(user_id)
-        return jsonify([ItemResponse.model_validate(item).model_dump() for item in items]), 200
+        return jsonify([ItemSummaryResponse.model_validate(item).model_dump() for item in items]), 200
     
     except Exception as e:
         # Log the error in production
@@ -1,6 +1,7 @@
 from flask import jsonify, Blueprint
 from app.services.rotation_city_service import RotationCityService
 from app.api.v1.schemas.rotation_city_schema import RotationCityResponse
+from app.utils.conditional import make_etag, not_modified, with_etag
 
 rotation_city_bp = Blueprint('rotation_city', __name__)
 
@@ -11,18 +12,24 @@ def get_rotation_cities():
     
     Public endpoint - no authentication required.
     
+    Headers:
+        If-None-Match (optional): ETag of a previously fetched response
+    
     Returns:
         200: List of all rotation cities (empty array if none exist)
+        304: Cities haven't changed since the given ETag
     """
     service = RotationCityService()
 
-    cities = service.get_all_rotation_cities()
+    etag = make_etag('rotation-cities', *service.get_rotation_cities_version())
+    response = not_modified(etag, 'public, no-cache')
+    if response is not None:
+        return response
 
-    # Return empty array if no cities
-    if not cities:
-        return jsonify([]), 200
+    cities = service.get_all_rotation_cities()
 
-    return jsonify([RotationCityResponse.model_validate(city).model_dump() for city in cities]), 200
+    response = jsonify([RotationCityResponse.model_validate(city).model_dump() for city in cities])
+    return with_etag(response, etag, 'public, no-cache'), 200
 
 
 @rotation_city_bp.route('/<int:city_id>', methods=['GET'])
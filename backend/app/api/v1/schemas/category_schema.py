@@ -1,5 +1,5 @@
 """Category response schema."""
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from typing import Optional
 
 
@@ -7,7 +7,11 @@ class CategorySchemaResponse(BaseModel):
     """Schema for category response."""
     category_id: int
     category_name: str
-    category_pic: Optional[str] = None
+    # Image URL once moved to the image store, legacy base64 before that
+    category_pic: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices('category_pic_src', 'category_pic')
+    )
 
     model_config = {
         "from_attributes": True
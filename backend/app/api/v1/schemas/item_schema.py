@@ -1,6 +1,6 @@
 """Item API schemas for requests and responses."""
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator, ConfigDict
 from typing import List, Optional, Union
 
 
@@ -21,7 +21,24 @@ class UserNested(BaseModel):
     first_name: str
     last_name: str
     email: str
-    profile_picture: Optional[str] = None
+    profile_picture: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices('profile_picture_src', 'profile_picture')
+    )
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserSummaryNested(BaseModel):
+    """Nested user in item list responses.
+
+    Omits the base64 profile picture; clients load it once per user from
+    ``GET /api/v1/user/<user_id>/avatar``.
+    """
+    user_id: int
+    first_name: str
+    last_name: str
+    email: str
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -81,11 +98,23 @@ class NewTagRequest(BaseModel):
         return v.strip()
 
 
+class SetItemTagValueRequest(BaseModel):
+    """Schema for setting the value of one tag on an item."""
+    value: Union[bool, str, float] = Field(..., description="New value for the tag")
+
+    model_config = ConfigDict(
+        extra='forbid',
+        str_strip_whitespace=True
+    )
+
+
 class CreateItemRequest(BaseModel):
     """Schema for creating a new item."""
     name: str = Field(..., min_length=1, max_length=200, description="Item name")
     location: str = Field(..., min_length=1, max_length=500, description="Item location")
     walking_distance: Optional[float] = Field(None, ge=0, description="Walking distance in meters")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude in degrees")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude in degrees")
     category_ids: List[int] = Field(..., min_length=1, description="At least one category required")
     existing_tags: List[ExistingTagRequest] = Field(default_factory=list, description="Existing tags with values")
     new_tags: List[NewTagRequest] = Field(default_factory=list, description="New tags to create")
@@ -120,6 +149,13 @@ class CreateItemRequest(BaseModel):
         
         return v
 
+    @model_validator(mode='after')
+    def validate_coordinates(self) -> 'CreateItemRequest':
+        """Require latitude and longitude together."""
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("latitude and longitude must be given together")
+        return self
+
 
 class ItemResponse(BaseModel):
     """Response schema for item with full nested objects."""
@@ -127,6 +163,8 @@ class ItemResponse(BaseModel):
     name: str
     location: str
     walking_distance: Optional[float]
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     rotation_city: RotationCityNested
     added_by_user: UserNested
     categories: List[CategoryNested]
@@ -135,3 +173,67 @@ class ItemResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ItemSummaryResponse(ItemResponse):
+    """Response schema for items in list endpoints (no embedded images)."""
+    added_by_user: UserSummaryNested
+
+
+class ItemPageResponse(BaseModel):
+    """Response schema for one keyset-paginated page of items."""
+    items: List[ItemSummaryResponse]
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, null on the last page"
+    )
+
+
+class ItemChangesResponse(BaseModel):
+    """Response schema for one batch of the item change feed."""
+    items: List[ItemSummaryResponse]
+    next_token: str = Field(
+        ...,
+        description="Token to pass as since on the next sync"
+    )
+    has_more: bool = Field(
+        ...,
+        description="Whether more changes are waiting; fetch again right away"
+    )
+
+
+class NearbyItemResponse(ItemSummaryResponse):
+    """Response schema for an item in a nearby search."""
+    distance_meters: float
+
+
+class NearbyItemsResponse(BaseModel):
+    """Response schema for items near a point, closest first."""
+    items: List[NearbyItemResponse]
+
+
+class CategoryFacet(BaseModel):
+    """Item count for one category."""
+    category_id: int
+    category_name: str
+    count: int
+
+
+class TagValueFacet(BaseModel):
+    """Item count for one value of a tag."""
+    value: Optional[Union[bool, str, float]]
+    count: int
+
+
+class TagFacet(BaseModel):
+    """Item counts for the values of one tag."""
+    tag_id: int
+    name: str
+    value_type: str
+    values: List[TagValueFacet]
+
+
+class ItemFacetsResponse(BaseModel):
+    """Response schema for per-category and per-tag-value item counts."""
+    categories: List[CategoryFacet]
+    tags: List[TagFacet]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from app.api.v1.schemas.rotation_city_schema import RotationCityResponse
 
 
@@ -8,7 +8,11 @@ class UserResponse(BaseModel):
     first_name: str
     last_name: str
     email: str | None = None
-    profile_picture: str | None = None
+    # Image URL once moved to the image store, legacy base64 before that
+    profile_picture: str | None = Field(
+        None,
+        validation_alias=AliasChoices('profile_picture_src', 'profile_picture')
+    )
     rotation_city: RotationCityResponse | None = None
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -3,7 +3,7 @@ Verification Schemas
 Pydantic schemas for verification request/response validation.
 """
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 
 class VerifyItemRequest(BaseModel):
@@ -25,6 +25,24 @@ class VerifyItemRequest(BaseModel):
         return v
 
 
+MAX_BATCH_VERIFICATIONS = 100
+
+
+class BatchVerificationEntry(VerifyItemRequest):
+    """One item in a batch verification request."""
+    item_id: int = Field(..., description="ID of the item to verify")
+
+
+class VerifyItemsRequest(BaseModel):
+    """Request schema for verifying several items at once."""
+    verifications: List[BatchVerificationEntry] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_VERIFICATIONS,
+        description="Items to verify, each with an optional note"
+    )
+
+
 class VerificationResponse(BaseModel):
     """Response schema for a single verification."""
     verification_id: int = Field(..., description="Unique verification ID")
@@ -62,6 +80,10 @@ class ItemVerificationsResponse(BaseModel):
         ...,
         description="Number of verifications in this response"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, null on the last page"
+    )
 
 
 class UserVerificationsResponse(BaseModel):
@@ -75,3 +97,80 @@ class UserVerificationsResponse(BaseModel):
         ...,
         description="Number of verifications returned"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, null on the last page"
+    )
+
+
+class BatchVerificationResult(BaseModel):
+    """Outcome for one item of a batch verification."""
+    item_id: int = Field(..., description="ID of the item")
+    status: Literal['verified', 'already_verified', 'not_found'] = Field(
+        ...,
+        description="Whether the verification was recorded"
+    )
+    verification_id: Optional[int] = Field(
+        None,
+        description="ID of the new verification (verified only)"
+    )
+    verification_count: Optional[int] = Field(
+        None,
+        description="Total verifications for the item (verified only)"
+    )
+
+
+class VerifyItemsResponse(BaseModel):
+    """Response schema for a batch verification."""
+    user_id: int = Field(..., description="ID of the verifying user")
+    results: List[BatchVerificationResult] = Field(
+        ...,
+        description="One result per distinct item, in request order"
+    )
+    verified_count: int = Field(
+        ...,
+        description="Number of items verified by this request"
+    )
+
+
+class VerificationDayBucket(BaseModel):
+    """Verifications in a city on one UTC day."""
+    day: str = Field(..., description="ISO date")
+    verification_count: int
+
+
+class VerificationWeekBucket(BaseModel):
+    """Verifications in a city during one week."""
+    week_start: str = Field(..., description="ISO date of the week's Monday")
+    verification_count: int
+
+
+class TopVerifier(BaseModel):
+    """A user ranked by verifications in a city."""
+    user_id: int
+    user_name: str
+    verification_count: int
+    last_verified_at: Optional[str] = Field(None, description="ISO format timestamp")
+
+
+class CityVerificationStatsResponse(BaseModel):
+    """Response schema for a city's verification activity."""
+    rotation_city_id: int
+    start_day: str = Field(..., description="First day of the range (ISO date)")
+    end_day: str = Field(..., description="Last day of the range (ISO date)")
+    daily: List[VerificationDayBucket] = Field(
+        ...,
+        description="One bucket per day of the range, oldest first"
+    )
+    weekly: List[VerificationWeekBucket] = Field(
+        ...,
+        description="Weeks with verifications in the range, oldest first"
+    )
+    total_verifications: int = Field(..., description="Verifications in the range")
+    item_count: int = Field(..., description="Items in the city")
+    stale_days: int = Field(..., description="Staleness threshold in days")
+    stale_item_count: int = Field(
+        ...,
+        description="Items not verified within stale_days (or never)"
+    )
+    top_verifiers: List[TopVerifier]
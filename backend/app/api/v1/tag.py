@@ -4,6 +4,7 @@ from flask_jwt_extended import jwt_required
 
 from app.services.tag_service import TagService
 from app.api.v1.schemas.tag_schema import TagResponse
+from app.utils.conditional import make_etag, not_modified, with_etag
 
 tag_bp = Blueprint('tag', __name__)
 
@@ -20,13 +21,21 @@ def get_all_tags():
     
     Headers:
         Authorization: Bearer <access_token>
+        If-None-Match (optional): ETag of a previously fetched response
     
     Returns:
         200: List of all tags with their value types
+        304: Tags haven't changed since the given ETag
     """
+    etag = make_etag('tags', *_tag_service.get_tags_version())
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    
     tags = _tag_service.get_all_tags()
     
-    return jsonify([
+    response = jsonify([
         TagResponse.model_validate(tag).model_dump()
         for tag in tags
-    ]), 200
+    ])
+    return with_etag(response, etag), 200
@@ -1,14 +1,23 @@
-from flask import Blueprint, request, jsonify
+import hashlib
+
+from flask import Blueprint, Response, redirect, request, jsonify
 from app.utils.decorators import require_params
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.services.user_service import UserService
+from app.services.auth.token_service import TokenService
+from app.services.images import InvalidImageError
 from app.api.v1.schemas.user_schema import UserResponse
+from app.utils.images import decode_image_data, image_url, sniff_image_type
+from app.utils.jwt_claims import get_current_rotation_city_id
 
 user_bp = Blueprint('user', __name__)
 
 _user_service: UserService = UserService()
 
+# Avatars change rarely; let clients reuse them briefly and revalidate by ETag
+AVATAR_CACHE_MAX_AGE = 300
+
 
 def _serialize_user(user):
     """Serialize user model to response dictionary.
@@ -74,6 +83,53 @@ def get_user(user_id):
 
     return jsonify(_serialize_user(user)), 200
 
+@user_bp.route('/<int:user_id>/avatar', methods=['GET'])
+@jwt_required()
+def get_user_avatar(user_id):
+    """Get a user's profile picture as an image.
+    
+    Item list responses omit the base64 avatar, so clients fetch it here
+    once per user. Pictures already in the image store redirect to their
+    immutable content-addressed URL; legacy base64 pictures are decoded and
+    served with an ETag, honouring If-None-Match with 304 Not Modified.
+    
+    Path Parameters:
+        user_id (int): The ID of the user
+        
+    Headers:
+        Authorization: Bearer <access_token>
+        
+    Returns:
+        200: Image bytes with its content type
+        302: Redirect to the stored image
+        304: Client copy is still current
+        404: User not found or has no PNG, JPEG, GIF or WebP profile picture
+    """
+    key, picture = _user_service.get_profile_picture(user_id)
+
+    if key:
+        return redirect(image_url(key))
+
+    if not picture:
+        return jsonify({'message': 'Profile picture not found.'}), 404
+
+    try:
+        image_bytes, _ = decode_image_data(picture)
+    except ValueError:
+        return jsonify({'message': 'Profile picture not found.'}), 404
+
+    # Serve the type the bytes really are, never the one the data URL claims
+    mimetype = sniff_image_type(image_bytes)
+    if not mimetype:
+        return jsonify({'message': 'Profile picture not found.'}), 404
+
+    response = Response(image_bytes, mimetype=mimetype)
+    response.set_etag(hashlib.sha256(picture.encode('utf-8')).hexdigest())
+    response.cache_control.private = True
+    response.cache_control.max_age = AVATAR_CACHE_MAX_AGE
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    return response.make_conditional(request)
+
 @user_bp.route('/me', methods=['PUT'])
 @jwt_required()
 def update_current_user():
@@ -81,6 +137,10 @@ def update_current_user():
     
     Allows updating first_name, last_name, and rotation_city_id.
     
+    Access tokens carry the user's rotation city, so when it changes the
+    response also includes a fresh ``access_token`` and ``refresh_token``
+    that the client must store in place of the old ones.
+    
     Headers:
         Authorization: Bearer <access_token>
         
@@ -91,6 +151,7 @@ def update_current_user():
         
     Returns:
         200: User updated successfully
+        400: Profile picture is not a PNG, JPEG, GIF or WebP image
         404: User not found
         500: Internal server error
     """
@@ -98,12 +159,20 @@ def update_current_user():
     data = request.json
 
     try:
+        token_city_id = get_current_rotation_city_id()
         user = _user_service.update_user(user_id, data)
 
         if user is None:
             return jsonify({'message': 'User not found.'}), 404
 
-        return jsonify(_serialize_user(user)), 200
+        body = _serialize_user(user)
+        if user.rotation_city_id != token_city_id:
+            body.update(TokenService.generate_tokens(user))
+
+        return jsonify(body), 200
+
+    except InvalidImageError as e:
+        return jsonify({'message': str(e)}), 400
 
     except Exception as e:
         return jsonify({'message': 'An error occurred while updating user data.'}), 500
\ No newline at end of file
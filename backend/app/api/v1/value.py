@@ -138,18 +138,22 @@ def update_value(value_id):
         200: Value updated successfully
         400: No data provided
         404: Value not found
+        409: Items use the value, or the tag already has an identical value
     """
     data = request.get_json()
 
     if not data:
         return jsonify({'error': 'No data provided'}), 400
 
-    value = service.update_value(
-        value_id=value_id,
-        boolean_val=data.get('boolean_val'),
-        name_val=data.get('name_val'),
-        numerical_value=data.get('numerical_value')
-    )
+    try:
+        value = service.update_value(
+            value_id=value_id,
+            boolean_val=data.get('boolean_val'),
+            name_val=data.get('name_val'),
+            numerical_value=data.get('numerical_value')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 409
 
     if not value:
         return jsonify({'error': 'Value not found'}), 404
@@ -2,6 +2,7 @@
 Verification API Endpoints
 Routes for item verification operations.
 """
+from datetime import datetime
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from pydantic import ValidationError
@@ -13,15 +14,28 @@ from app.services.verification_service import (
 )
 from app.api.v1.schemas.verification_schema import (
     VerifyItemRequest,
+    VerifyItemsRequest,
     CreateVerificationResponse,
+    VerifyItemsResponse,
+    CityVerificationStatsResponse,
     VerificationResponse,
     ItemVerificationsResponse,
     UserVerificationsResponse
 )
+from app.services.item_service import ItemService
+from app.services.verification_stats_service import VerificationStatsService
+from app.utils.conditional import make_etag, not_modified, with_etag
+from app.utils.jwt_claims import get_current_rotation_city_id
+from app.utils.pagination import decode_cursor, parse_limit, parse_since
 
 
 verification_bp = Blueprint('verifications', __name__)
 verification_service = VerificationService()
+stats_service = VerificationStatsService()
+item_service = ItemService()
+
+MAX_STATS_DAYS = 365
+MAX_TOP_VERIFIERS = 50
 
 
 @verification_bp.route('/items/<int:item_id>', methods=['POST'])
@@ -77,6 +91,53 @@ def verify_item(item_id: int):
         }), 500
 
 
+@verification_bp.route('/items/batch', methods=['POST'])
+@jwt_required()
+def verify_items():
+    """
+    Verify several items at once.
+    
+    Required: JWT authentication
+    
+    Request Body:
+        {
+            "verifications": [
+                {"item_id": 1, "note": "Optional note"},
+                {"item_id": 2}
+            ]
+        }
+    
+    Returns:
+        200: Per-item status (verified, already_verified or not_found)
+        400: Validation error
+    """
+    try:
+        user_id = get_jwt_identity()
+        
+        request_data = VerifyItemsRequest(**request.get_json() or {})
+        
+        results = verification_service.verify_items(
+            user_id=user_id,
+            entries=[
+                (entry.item_id, entry.note)
+                for entry in request_data.verifications
+            ]
+        )
+        
+        response = VerifyItemsResponse(**results)
+        return jsonify(response.model_dump(exclude_none=True)), 200
+        
+    except ValidationError as e:
+        return jsonify({
+            "message": "Validation error",
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            "message": "error occurred during item verification",
+        }), 500
+
+
 @verification_bp.route('/<int:verification_id>', methods=['GET'])
 @jwt_required()
 def get_verification(verification_id: int):
@@ -116,18 +177,27 @@ def get_item_verifications(item_id: int):
     
     Query Parameters:
         limit: Maximum number of verifications to return (default 50, max 200)
+        cursor: ``next_cursor`` of the previous page
+        since: ISO 8601 timestamp; only later verifications are returned
     
     Returns:
-        200: List of verifications with total count
+        200: Page of verifications with total count and next_cursor
+        400: Invalid cursor or since timestamp
     """
     try:
-        # Parse limit parameter
-        limit = request.args.get('limit', 50, type=int)
-        limit = min(limit, 200)  # Cap at 200
+        limit = parse_limit(request.args.get('limit', type=int))
+        raw_cursor = request.args.get('cursor')
+        try:
+            cursor = decode_cursor(raw_cursor) if raw_cursor else None
+            since = parse_since(request.args.get('since'))
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
         
         verifications_data = verification_service.get_item_verifications(
             item_id=item_id,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            since=since
         )
         
         response = ItemVerificationsResponse(**verifications_data)
@@ -149,18 +219,27 @@ def get_user_verifications(user_id: int):
     
     Query Parameters:
         limit: Maximum number of verifications to return (default 50, max 200)
+        cursor: ``next_cursor`` of the previous page
+        since: ISO 8601 timestamp; only later verifications are returned
     
     Returns:
-        200: List of verifications
+        200: Page of verifications and next_cursor
+        400: Invalid cursor or since timestamp
     """
     try:
-        # Parse limit parameter
-        limit = request.args.get('limit', 50, type=int)
-        limit = min(limit, 200)  # Cap at 200
+        limit = parse_limit(request.args.get('limit', type=int))
+        raw_cursor = request.args.get('cursor')
+        try:
+            cursor = decode_cursor(raw_cursor) if raw_cursor else None
+            since = parse_since(request.args.get('since'))
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
         
         verifications_data = verification_service.get_user_verifications(
             user_id=user_id,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            since=since
         )
         
         response = UserVerificationsResponse(**verifications_data)
@@ -170,3 +249,51 @@ def get_user_verifications(user_id: int):
         return jsonify({
             "message": "error occurred while retrieving user verifications",
         }), 500
+
+
+@verification_bp.route('/stats', methods=['GET'])
+@jwt_required()
+def get_city_verification_stats():
+    """
+    Get verification activity for the current user's rotation city.
+    
+    Required: JWT authentication
+    
+    Query Parameters:
+        days: Days of daily/weekly buckets ending today (default 30, max 365)
+        stale_days: Days without verification before an item is stale
+            (default 30, max 365)
+        top: Number of top verifiers (default 10, max 50)
+    
+    Returns:
+        200: Daily and weekly buckets, stale item count and top verifiers
+        304: Nothing changed since the given ETag
+        400: User has no rotation city assigned
+    """
+    try:
+        city_id = get_current_rotation_city_id()
+        if not city_id:
+            return jsonify({"message": "User has no rotation city assigned"}), 400
+        
+        days = max(1, min(request.args.get('days', 30, type=int), MAX_STATS_DAYS))
+        stale_days = max(1, min(request.args.get('stale_days', 30, type=int), MAX_STATS_DAYS))
+        top = max(1, min(request.args.get('top', 10, type=int), MAX_TOP_VERIFIERS))
+        
+        # Any verification or new item changes the city's item version
+        etag = make_etag(
+            'verification-stats', city_id, days, stale_days, top,
+            datetime.utcnow().date().isoformat(),
+            *item_service.get_items_version(city_id)
+        )
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        
+        stats = stats_service.get_city_stats(city_id, days, stale_days, top)
+        response = jsonify(CityVerificationStatsResponse(**stats).model_dump())
+        return with_etag(response, etag), 200
+        
+    except Exception as e:
+        return jsonify({
+            "message": "error occurred while retrieving verification stats",
+        }), 500
@@ -0,0 +1,201 @@
+"""
+CLI Commands
+Maintenance commands registered on the Flask CLI.
+
+Usage:
+    cd backend
+    flask --app run db upgrade
+    flask --app run images migrate
+    flask --app run values compact
+    flask --app run indexes create
+    flask --app run verifications reconcile
+    flask --app run verifications rollup
+    flask --app run items freshness
+    flask --app run items reindex
+    flask --app run items geocode
+"""
+import click
+from flask import Flask
+
+
+@click.group('db')
+def db_cli():
+    """Schema migrations."""
+
+
+@db_cli.command('upgrade')
+@click.option('--to', 'target', default=None, help='Last migration version to apply.')
+def upgrade_db(target):
+    """Apply pending schema migrations."""
+    from app.migrations import MigrationError, MigrationRunner
+
+    try:
+        applied = MigrationRunner().upgrade(target)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+
+    for migration in applied:
+        click.echo(f"Applied {migration.version} {migration.name}")
+    if not applied:
+        click.echo("Database is up to date")
+
+
+@db_cli.command('status')
+def db_status():
+    """List migrations and whether they have been applied."""
+    from app.migrations import MigrationRunner
+
+    for row in MigrationRunner().status():
+        applied_at = row['applied_at'].isoformat() if row['applied_at'] else 'pending'
+        click.echo(f"{row['version']}  {applied_at:<26}  {row['name']}")
+
+
+@click.group('images')
+def images_cli():
+    """Image storage maintenance."""
+
+
+@images_cli.command('migrate')
+@click.option('--batch-size', default=100, show_default=True, help='Rows per commit.')
+def migrate_images(batch_size: int):
+    """Move inline base64 images into the image store."""
+    from app.services.images.migration import migrate_inline_images
+
+    stats = migrate_inline_images(batch_size=batch_size)
+    click.echo(
+        f"Migrated {stats['migrated']} images, {stats['failed']} could not be decoded"
+    )
+
+
+@click.group('values')
+def values_cli():
+    """Tag value maintenance."""
+
+
+@values_cli.command('compact')
+@click.option('--batch-size', default=500, show_default=True, help='Values merged per commit.')
+def compact_values_command(batch_size: int):
+    """Merge duplicate tag values and add the uniqueness indexes."""
+    from app.services.value_compaction import (
+        compact_values,
+        ensure_value_unique_indexes
+    )
+
+    stats = compact_values(batch_size=batch_size)
+    click.echo(
+        f"Merged {stats['merged']} duplicate values, rewrote {stats['links_rewritten']} "
+        f"item links, removed {stats['links_removed']} redundant links"
+    )
+
+    for name in ensure_value_unique_indexes():
+        click.echo(f"Created index {name}")
+
+
+@click.group('indexes')
+def indexes_cli():
+    """Database index maintenance."""
+
+
+@indexes_cli.command('create')
+@click.option('--table', 'tables', multiple=True, help='Only check this table (repeatable).')
+def create_indexes(tables):
+    """Create model indexes missing from the database (concurrently on PostgreSQL)."""
+    from app.services.schema_indexes import ensure_indexes
+
+    created = ensure_indexes(tables or None)
+    for name in created:
+        click.echo(f"Created index {name}")
+    if not created:
+        click.echo("All indexes present")
+
+
+@click.group('verifications')
+def verifications_cli():
+    """Item verification maintenance."""
+
+
+@verifications_cli.command('reconcile')
+@click.option('--batch-size', default=1000, show_default=True, help='Items checked per commit.')
+def reconcile_verifications(batch_size: int):
+    """Recompute item verification counts and last verified dates."""
+    from app.services.verification_counters import reconcile_verification_counters
+
+    stats = reconcile_verification_counters(batch_size=batch_size)
+    click.echo(f"Checked {stats['checked']} items, corrected {stats['corrected']}")
+
+
+@verifications_cli.command('rollup')
+def rebuild_rollups():
+    """Rebuild the per-city verification rollup tables."""
+    from app.services.verification_rollups import rebuild_verification_rollups
+
+    stats = rebuild_verification_rollups()
+    click.echo(
+        f"Wrote {stats['daily_rows']} daily rows and {stats['verifier_rows']} verifier rows"
+    )
+
+
+@click.group('items')
+def items_cli():
+    """Item maintenance."""
+
+
+@items_cli.command('freshness')
+@click.option('--batch-size', default=1000, show_default=True, help='Items recomputed per commit.')
+def decay_freshness(batch_size: int):
+    """Recompute item freshness scores at the current time."""
+    from app.services.item_freshness import decay_freshness_scores
+
+    stats = decay_freshness_scores(batch_size=batch_size)
+    click.echo(f"Checked {stats['checked']} items, updated {stats['updated']}")
+
+
+@items_cli.command('reindex')
+@click.option('--batch-size', default=500, show_default=True, help='Items indexed per commit.')
+def reindex_items(batch_size: int):
+    """Rebuild the item full-text search index."""
+    from app.services.item_search import ensure_item_search_index, rebuild_item_search_index
+
+    ensure_item_search_index()
+    stats = rebuild_item_search_index(batch_size=batch_size)
+    click.echo(f"Indexed {stats['indexed']} items")
+
+
+@items_cli.command('geocode')
+@click.option('--batch-size', default=200, show_default=True, help='Items geocoded per commit.')
+@click.option('--workers', default=None, type=int, help='Concurrent lookups [default: GEOCODER_WORKERS].')
+@click.option('--gazetteer', default=None, help='Gazetteer CSV to use instead of the configured geocoder.')
+@click.option('--retry-misses', is_flag=True, help='Look up addresses cached as not found again.')
+def geocode_items_command(batch_size: int, workers, gazetteer, retry_misses: bool):
+    """Fill in coordinates of items from their location text."""
+    from app.services.geocoding import (
+        GazetteerGeocodingProvider,
+        GeocoderConfigurationError,
+        geocode_items,
+    )
+
+    try:
+        provider = GazetteerGeocodingProvider(gazetteer) if gazetteer else None
+        stats = geocode_items(
+            provider=provider,
+            batch_size=batch_size,
+            workers=workers,
+            retry_misses=retry_misses
+        )
+    except GeocoderConfigurationError as e:
+        raise click.ClickException(str(e))
+    click.echo(
+        f"Checked {stats['checked']} items, geocoded {stats['geocoded']}, "
+        f"{stats['not_found']} not found, {stats['failed']} failed "
+        f"({stats['lookups']} lookups, {stats['cache_hits']} cache hits)"
+    )
+
+
+def register_commands(app: Flask) -> None:
+    """Register all CLI command groups on the app."""
+    app.cli.add_command(db_cli)
+    app.cli.add_command(images_cli)
+    app.cli.add_command(values_cli)
+    app.cli.add_command(indexes_cli)
+    app.cli.add_command(verifications_cli)
+    app.cli.add_command(items_cli)
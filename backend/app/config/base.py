@@ -47,6 +47,32 @@ class Config:
     JWT_ACCESS_TOKEN_EXPIRES = 30 * 60  # 30 minutes
     JWT_ALGORITHM = 'HS256'
 
+    # Image Storage ('local' keeps files under IMAGE_STORAGE_PATH; 'database'
+    # keeps bytes in the image_blob table and uses the path as a cache)
+    IMAGE_STORAGE_BACKEND = os.getenv('IMAGE_STORAGE_BACKEND', 'local')
+    IMAGE_STORAGE_PATH = os.getenv(
+        'IMAGE_STORAGE_PATH',
+        os.path.join(os.path.dirname(__file__), '..', '..', 'instance', 'images')
+    )
+
+    # Geocoding ('gazetteer' looks addresses up in a local CSV file)
+    GEOCODER_BACKEND = os.getenv('GEOCODER_BACKEND', 'gazetteer')
+    GEOCODER_GAZETTEER_PATH = os.getenv(
+        'GEOCODER_GAZETTEER_PATH',
+        os.path.join(os.path.dirname(__file__), '..', '..', 'instance', 'gazetteer.csv')
+    )
+    GEOCODER_WORKERS = get_int_env('GEOCODER_WORKERS', 4)
+
+    # Item List Response Cache ('memory' per worker, or 'redis' shared)
+    ITEM_LIST_CACHE_BACKEND = os.getenv('ITEM_LIST_CACHE_BACKEND', 'memory')
+    ITEM_LIST_CACHE_TTL_SECONDS = get_int_env('ITEM_LIST_CACHE_TTL_SECONDS', 60)
+    ITEM_LIST_CACHE_MAX_ENTRIES = get_int_env('ITEM_LIST_CACHE_MAX_ENTRIES', 256)
+    REDIS_URL = os.getenv('REDIS_URL')
+
+    # Item change feed: changes younger than this are held back so writes
+    # still committing are not skipped by a client's token
+    ITEM_CHANGES_SETTLE_SECONDS = get_int_env('ITEM_CHANGES_SETTLE_SECONDS', 5)
+
     # Email Configuration
     MAIL_SERVER = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
     MAIL_PORT = int(os.getenv('MAIL_PORT', 587))
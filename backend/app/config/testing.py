@@ -1,3 +1,5 @@
+import os
+import tempfile
 from app.config.base import Config
 
 
@@ -6,3 +8,9 @@ class Testing(Config):
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     DEBUG = True
     TESTING = True
+
+    # Keep test uploads out of the working tree
+    IMAGE_STORAGE_PATH = os.path.join(tempfile.gettempdir(), 'rotation-ready-test-images')
+
+    # Let the change feed return items written a moment ago
+    ITEM_CHANGES_SETTLE_SECONDS = 0
@@ -0,0 +1,19 @@
+"""
+Schema Migrations
+
+Versioned, forward-only schema changes applied with ``flask db upgrade``
+instead of at app startup. Each module in ``versions/`` is one migration.
+"""
+from app.migrations.runner import (
+    Migration,
+    MigrationError,
+    MigrationRunner,
+    load_migrations
+)
+
+__all__ = [
+    'Migration',
+    'MigrationError',
+    'MigrationRunner',
+    'load_migrations',
+]
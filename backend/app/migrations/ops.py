@@ -0,0 +1,67 @@
+"""
+Migration Operations
+Schema helpers shared by migration modules. Each one checks the live
+database first, so migrations that use them can be safely re-run.
+
+Migrations pass columns and indexes defined on their own ``Table``
+objects, never the models': the DDL a migration runs must stay what it
+was when the migration was written, whatever the models look like later.
+"""
+from typing import List
+
+from sqlalchemy import Column, Index, inspect, text
+
+from app import db
+from app.services.schema_indexes import create_index_online, existing_indexes
+
+
+def add_missing_columns(*columns: Column) -> List[str]:
+    """Add model columns that an existing table lacks.
+
+    Columns are added as nullable with no server default, which is a
+    metadata-only change on PostgreSQL and SQLite; backfill and constrain
+    them in later steps.
+
+    Args:
+        columns: Columns of the migration's own table definitions to add
+
+    Returns:
+        List of ``table.column`` names that were added
+    """
+    inspector = inspect(db.engine)
+    added = []
+    for column in columns:
+        table = column.table.name
+        existing = {c['name'] for c in inspector.get_columns(table)}
+        if column.name in existing:
+            continue
+        column_type = column.type.compile(dialect=db.engine.dialect)
+        db.session.execute(text(
+            f'ALTER TABLE "{table}" ADD COLUMN {column.name} {column_type}'
+        ))
+        added.append(f"{table}.{column.name}")
+    db.session.commit()
+    return added
+
+
+def create_missing_indexes(*indexes: Index) -> List[str]:
+    """Create indexes that an existing table lacks.
+
+    Indexes are built without blocking writes where the database allows
+    (``CREATE INDEX CONCURRENTLY`` on PostgreSQL). Invalid indexes left by
+    an interrupted concurrent build are rebuilt.
+
+    Args:
+        indexes: Indexes on the migration's own table definitions
+
+    Returns:
+        Names of the indexes that were created
+    """
+    inspector = inspect(db.engine)
+    created = []
+    for index in indexes:
+        if index.name in existing_indexes(inspector, index.table.name):
+            continue
+        create_index_online(index)
+        created.append(index.name)
+    return created
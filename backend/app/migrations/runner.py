@@ -0,0 +1,198 @@
+"""
+Migration Runner
+
+Discovers migrations in ``app.migrations.versions`` and applies the ones
+not yet recorded in the ``schema_migrations`` table, in version order.
+
+A migration module is named ``<version>_<name>.py`` and defines:
+
+    TRANSACTIONAL = True   # False for online operations such as
+                           # CREATE INDEX CONCURRENTLY
+
+    def upgrade():
+        ...
+
+Migrations must be idempotent: a non-transactional migration that fails
+halfway is simply re-run by the next ``upgrade``.
+"""
+
+import importlib
+import logging
+import pkgutil
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, insert, select, text
+
+from app import db
+
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_PACKAGE = 'app.migrations.versions'
+
+# Arbitrary constant shared by every process running migrations
+_ADVISORY_LOCK_KEY = 716_201_262
+
+# Kept out of db.metadata so create_all never touches it
+_metadata = MetaData()
+schema_migrations = Table(
+    'schema_migrations',
+    _metadata,
+    Column('version', String(32), primary_key=True),
+    Column('name', String(200), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+
+class MigrationError(Exception):
+    """Raised when a migration cannot be loaded or fails to apply."""
+
+
+class Migration:
+    """One versioned schema change."""
+
+    def __init__(
+        self,
+        version: str,
+        name: str,
+        upgrade: Callable[[], None],
+        transactional: bool = True
+    ):
+        """
+        Initialize a migration.
+
+        Args:
+            version: Sortable version string (e.g. ``0003``)
+            name: Short description shown by ``flask db status``
+            upgrade: Callable applying the change
+            transactional: Whether the change runs inside one transaction
+        """
+        self.version = version
+        self.name = name
+        self.upgrade = upgrade
+        self.transactional = transactional
+
+    def __repr__(self):
+        return f"<Migration({self.version} {self.name})>"
+
+
+def load_migrations(package: str = VERSIONS_PACKAGE) -> List[Migration]:
+    """Import every migration module in ``package``, sorted by version.
+
+    Raises:
+        MigrationError: If two modules share a version or one has no upgrade()
+    """
+    migrations: Dict[str, Migration] = {}
+    package_module = importlib.import_module(package)
+    for module_info in pkgutil.iter_modules(package_module.__path__):
+        version, _, slug = module_info.name.partition('_')
+        module = importlib.import_module(f"{package}.{module_info.name}")
+        upgrade = getattr(module, 'upgrade', None)
+        if upgrade is None:
+            raise MigrationError(f"Migration {module_info.name} has no upgrade()")
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}")
+        doc = (module.__doc__ or slug.replace('_', ' ')).strip().splitlines()[0]
+        migrations[version] = Migration(
+            version,
+            doc,
+            upgrade,
+            transactional=getattr(module, 'TRANSACTIONAL', True)
+        )
+    return [migrations[version] for version in sorted(migrations)]
+
+
+class MigrationRunner:
+    """
+    Applies pending migrations and reports their status.
+
+    Usage:
+        runner = MigrationRunner()
+        for migration in runner.pending():
+            print(migration.version, migration.name)
+        runner.upgrade()
+    """
+
+    def __init__(self, migrations: Optional[List[Migration]] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            migrations: Migrations to manage; defaults to load_migrations()
+        """
+        self.migrations = migrations if migrations is not None else load_migrations()
+
+    def applied(self) -> Dict[str, datetime]:
+        """Get applied versions and when they were applied."""
+        schema_migrations.create(db.engine, checkfirst=True)
+        rows = db.session.execute(
+            select(schema_migrations.c.version, schema_migrations.c.applied_at)
+        ).all()
+        db.session.commit()
+        return {version: applied_at for version, applied_at in rows}
+
+    def pending(self) -> List[Migration]:
+        """Get migrations not applied yet, in the order they will run."""
+        applied = self.applied()
+        return [m for m in self.migrations if m.version not in applied]
+
+    def status(self) -> List[dict]:
+        """Get every known migration with its applied timestamp (or None)."""
+        applied = self.applied()
+        return [
+            {'version': m.version, 'name': m.name, 'applied_at': applied.get(m.version)}
+            for m in self.migrations
+        ]
+
+    def upgrade(self, target: Optional[str] = None) -> List[Migration]:
+        """
+        Apply pending migrations up to and including ``target``.
+
+        Args:
+            target: Last version to apply; defaults to the newest
+
+        Returns:
+            The migrations that were applied
+
+        Raises:
+            MigrationError: If a migration fails; earlier ones stay applied
+        """
+        done = []
+        with self._lock():
+            for migration in self.pending():
+                if target is not None and migration.version > target:
+                    break
+                self._apply(migration)
+                done.append(migration)
+        return done
+
+    def _apply(self, migration: Migration) -> None:
+        logger.info("Applying migration %s %s", migration.version, migration.name)
+        try:
+            migration.upgrade()
+            db.session.execute(insert(schema_migrations).values(
+                version=migration.version,
+                name=migration.name,
+                applied_at=datetime.utcnow()
+            ))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise MigrationError(
+                f"Migration {migration.version} {migration.name} failed: {e}"
+            ) from e
+
+    @contextmanager
+    def _lock(self):
+        """Serialize concurrent upgrades (e.g. two deploys) on PostgreSQL."""
+        if db.engine.dialect.name != 'postgresql':
+            yield
+            return
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.execute(text('SELECT pg_advisory_lock(:key)'), {'key': _ADVISORY_LOCK_KEY})
+            try:
+                yield
+            finally:
+                conn.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': _ADVISORY_LOCK_KEY})
@@ -0,0 +1,124 @@
+"""Create tables missing from the database"""
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+)
+
+from app import db
+
+TRANSACTIONAL = True
+
+# The schema as the startup create_all() built it before migrations
+# existed. Later schema changes are later migrations, so these tables are
+# never edited to follow the models.
+metadata = MetaData()
+
+Table(
+    'rotation_city', metadata,
+    Column('city_id', Integer, primary_key=True, autoincrement=True),
+    Column('name', String(100), nullable=False, unique=True),
+    Column('time_zone', String(50), nullable=False),
+    Column('res_hall_location', String(200)),
+)
+
+Table(
+    'category', metadata,
+    Column('category_id', Integer, primary_key=True, autoincrement=True),
+    Column('category_name', String(100), nullable=False, unique=True),
+    Column('category_pic', Text),
+)
+
+Table(
+    'tag', metadata,
+    Column('tag_id', Integer, primary_key=True, autoincrement=True),
+    Column('name', String(100), nullable=False, unique=True),
+    Column('value_type', Integer, nullable=False),
+    Column('can_add_new_value', Boolean),
+)
+
+Table(
+    'user', metadata,
+    Column('user_id', Integer, primary_key=True, autoincrement=True),
+    Column('rotation_city_id', Integer, ForeignKey('rotation_city.city_id'), nullable=False),
+    Column('first_name', String(50), nullable=False),
+    Column('last_name', String(50), nullable=False),
+    Column('email', String(100), nullable=False, unique=True),
+    Column('profile_picture', Text),
+    Column('created_at', DateTime),
+    Column('updated_at', DateTime),
+    Column('is_verified', Boolean, nullable=False, index=True),
+    Column('status', Integer, nullable=False),
+)
+
+Table(
+    'value', metadata,
+    Column('value_id', Integer, primary_key=True, autoincrement=True),
+    Column('tag_id', Integer, ForeignKey('tag.tag_id'), nullable=False),
+    Column('boolean_val', Boolean),
+    Column('name_val', String(200)),
+    Column('numerical_value', Float),
+)
+
+Table(
+    'item', metadata,
+    Column('item_id', Integer, primary_key=True, autoincrement=True),
+    Column('added_by_user_id', Integer, ForeignKey('user.user_id'), nullable=False),
+    Column('rotation_city_id', Integer, ForeignKey('rotation_city.city_id'), nullable=False),
+    Column('name', String(200), nullable=False),
+    Column('location', String(500), nullable=False),
+    Column('walking_distance', Float),
+    Column('last_verified_date', DateTime),
+    Column('number_of_verifications', Integer),
+    Column('created_at', DateTime),
+)
+
+Table(
+    'verification_code', metadata,
+    Column('verification_code_id', Integer, primary_key=True, autoincrement=True),
+    Column('user_id', Integer, ForeignKey('user.user_id'), nullable=False, index=True),
+    Column('code_hash', String(255), nullable=False, unique=True),
+    Column('hash_salt', String(255), nullable=False),
+    Column('code_type', Integer, nullable=False),
+    Column('attempts', Integer, nullable=False),
+    Column('is_used', Boolean, nullable=False, index=True),
+    Column('created_at', DateTime, nullable=False, index=True),
+    Column('expires_at', DateTime, nullable=False),
+    Column('used_at', DateTime),
+)
+
+Table(
+    'category_item', metadata,
+    Column('category_item_id', Integer, primary_key=True, autoincrement=True),
+    Column('item_id', Integer, ForeignKey('item.item_id'), nullable=False),
+    Column('category_id', Integer, ForeignKey('category.category_id'), nullable=False),
+)
+
+Table(
+    'item_tag_value', metadata,
+    Column('item_tag_value_id', Integer, primary_key=True, autoincrement=True),
+    Column('item_id', Integer, ForeignKey('item.item_id'), nullable=False),
+    Column('value_id', Integer, ForeignKey('value.value_id'), nullable=False),
+)
+
+Table(
+    'item_verification', metadata,
+    Column('verification_id', Integer, primary_key=True, autoincrement=True),
+    Column('user_id', Integer, ForeignKey('user.user_id'), nullable=False),
+    Column('item_id', Integer, ForeignKey('item.item_id'), nullable=False),
+    Column('note', Text),
+    Column('created_at', DateTime),
+)
+
+
+def upgrade():
+    # checkfirst skips tables that already exist, so databases created by
+    # the old startup create_all() are adopted as-is
+    metadata.create_all(db.engine, checkfirst=True)
@@ -0,0 +1,14 @@
+"""Add image store key columns to user and category"""
+from sqlalchemy import Column, MetaData, String, Table
+
+from app.migrations.ops import add_missing_columns
+
+TRANSACTIONAL = True
+
+_metadata = MetaData()
+_user = Table('user', _metadata, Column('profile_picture_key', String(80)))
+_category = Table('category', _metadata, Column('category_pic_key', String(80)))
+
+
+def upgrade():
+    add_missing_columns(_user.c.profile_picture_key, _category.c.category_pic_key)
@@ -0,0 +1,99 @@
+"""Merge duplicate tag values and add value uniqueness indexes"""
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    select,
+    update,
+)
+
+from app import db
+from app.migrations.ops import create_missing_indexes
+
+# Compaction commits in batches and indexes are built concurrently
+TRANSACTIONAL = False
+
+_BATCH_SIZE = 500
+
+_metadata = MetaData()
+_value = Table(
+    'value', _metadata,
+    Column('value_id', Integer),
+    Column('tag_id', Integer),
+    Column('boolean_val', Boolean),
+    Column('name_val', String(200)),
+    Column('numerical_value', Float),
+)
+_item_tag_value = Table(
+    'item_tag_value', _metadata,
+    Column('item_tag_value_id', Integer),
+    Column('item_id', Integer),
+    Column('value_id', Integer),
+)
+
+_VALUE_COLUMNS = [_value.c.boolean_val, _value.c.name_val, _value.c.numerical_value]
+
+# Created after compaction, or they fail on the remaining duplicates
+INDEXES = [Index('ix_value_tag', _value.c.tag_id)] + [
+    Index(
+        name, _value.c.tag_id, column, unique=True,
+        sqlite_where=column.isnot(None),
+        postgresql_where=column.isnot(None)
+    )
+    for name, column in zip(
+        ['uq_value_tag_boolean', 'uq_value_tag_name', 'uq_value_tag_numeric'],
+        _VALUE_COLUMNS
+    )
+]
+
+
+def upgrade():
+    _merge_duplicate_values()
+    create_missing_indexes(*INDEXES)
+
+
+def _merge_duplicate_values():
+    # Repoint links to the oldest copy of each (tag, typed value)
+    canonical = {}
+    duplicates = {}
+    rows = db.session.execute(
+        select(_value.c.value_id, _value.c.tag_id, *_VALUE_COLUMNS).order_by(_value.c.value_id)
+    )
+    for value_id, tag_id, *typed in rows:
+        key = next(
+            ((tag_id, position, val) for position, val in enumerate(typed) if val is not None),
+            None
+        )
+        if key is None:
+            continue
+        keep_id = canonical.setdefault(key, value_id)
+        if keep_id != value_id:
+            duplicates.setdefault(keep_id, []).append(value_id)
+
+    pending = list(duplicates.items())
+    for start in range(0, len(pending), _BATCH_SIZE):
+        for keep_id, duplicate_ids in pending[start:start + _BATCH_SIZE]:
+            db.session.execute(
+                update(_item_tag_value)
+                .where(_item_tag_value.c.value_id.in_(duplicate_ids))
+                .values(value_id=keep_id)
+            )
+            db.session.execute(delete(_value).where(_value.c.value_id.in_(duplicate_ids)))
+        db.session.commit()
+
+    # An item that carried two copies of a value now links it twice
+    first_links = (
+        select(func.min(_item_tag_value.c.item_tag_value_id))
+        .group_by(_item_tag_value.c.item_id, _item_tag_value.c.value_id)
+    )
+    db.session.execute(
+        delete(_item_tag_value).where(_item_tag_value.c.item_tag_value_id.not_in(first_links))
+    )
+    db.session.commit()
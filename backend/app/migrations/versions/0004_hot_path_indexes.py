@@ -0,0 +1,58 @@
+"""Index hot foreign-key and ordering paths"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, Table
+
+from app.migrations.ops import create_missing_indexes
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction
+TRANSACTIONAL = False
+
+_metadata = MetaData()
+_category_item = Table(
+    'category_item', _metadata,
+    Column('item_id', Integer),
+    Column('category_id', Integer),
+)
+_item = Table(
+    'item', _metadata,
+    Column('item_id', Integer),
+    Column('added_by_user_id', Integer),
+    Column('rotation_city_id', Integer),
+    Column('created_at', DateTime),
+)
+_item_tag_value = Table(
+    'item_tag_value', _metadata,
+    Column('item_id', Integer),
+    Column('value_id', Integer),
+)
+_item_verification = Table(
+    'item_verification', _metadata,
+    Column('user_id', Integer),
+    Column('item_id', Integer),
+    Column('created_at', DateTime),
+)
+
+INDEXES = [
+    Index('ix_category_item_item', _category_item.c.item_id),
+    Index('ix_category_item_category', _category_item.c.category_id, _category_item.c.item_id),
+    Index('ix_item_city_created', _item.c.rotation_city_id, _item.c.created_at, _item.c.item_id),
+    Index('ix_item_user_created', _item.c.added_by_user_id, _item.c.created_at, _item.c.item_id),
+    Index('ix_item_tag_value_item', _item_tag_value.c.item_id),
+    Index('ix_item_tag_value_value', _item_tag_value.c.value_id, _item_tag_value.c.item_id),
+    Index(
+        'ix_item_verification_item_created',
+        _item_verification.c.item_id, _item_verification.c.created_at
+    ),
+    Index(
+        'ix_item_verification_user_created',
+        _item_verification.c.user_id, _item_verification.c.created_at
+    ),
+    Index(
+        'ix_item_verification_user_item_created',
+        _item_verification.c.user_id, _item_verification.c.item_id,
+        _item_verification.c.created_at
+    ),
+]
+
+
+def upgrade():
+    create_missing_indexes(*INDEXES)
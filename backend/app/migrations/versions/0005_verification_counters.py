@@ -0,0 +1,56 @@
+"""Backfill item verification counters and last verified dates"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, func, select, update
+
+from app import db
+
+# Commits once per batch of items
+TRANSACTIONAL = False
+
+_BATCH_SIZE = 1000
+
+_metadata = MetaData()
+_item = Table(
+    'item', _metadata,
+    Column('item_id', Integer),
+    Column('last_verified_date', DateTime),
+    Column('number_of_verifications', Integer),
+)
+_item_verification = Table(
+    'item_verification', _metadata,
+    Column('verification_id', Integer),
+    Column('item_id', Integer),
+    Column('created_at', DateTime),
+)
+
+
+def upgrade():
+    last_id = 0
+    while True:
+        item_ids = db.session.execute(
+            select(_item.c.item_id)
+            .where(_item.c.item_id > last_id)
+            .order_by(_item.c.item_id)
+            .limit(_BATCH_SIZE)
+        ).scalars().all()
+        if not item_ids:
+            break
+        _recount_verifications(item_ids)
+        db.session.commit()
+        last_id = item_ids[-1]
+
+
+def _recount_verifications(item_ids):
+    """Set the counters of items from their verification history."""
+    history = select(_item_verification).where(_item_verification.c.item_id == _item.c.item_id)
+    db.session.execute(
+        update(_item)
+        .where(_item.c.item_id.in_(item_ids))
+        .values(
+            number_of_verifications=history.with_only_columns(
+                func.count(_item_verification.c.verification_id)
+            ).scalar_subquery(),
+            last_verified_date=history.with_only_columns(
+                func.max(_item_verification.c.created_at)
+            ).scalar_subquery()
+        )
+    )
@@ -0,0 +1,117 @@
+"""Enforce one verification per user, item and day"""
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    cast,
+    delete,
+    func,
+    select,
+    update,
+)
+
+from app import db
+from app.migrations.ops import add_missing_columns, create_missing_indexes
+
+# Backfills in batches and builds the unique index concurrently
+TRANSACTIONAL = False
+
+_BATCH_SIZE = 10000
+
+_metadata = MetaData()
+_item = Table(
+    'item', _metadata,
+    Column('item_id', Integer),
+    Column('last_verified_date', DateTime),
+    Column('number_of_verifications', Integer),
+)
+_item_verification = Table(
+    'item_verification', _metadata,
+    Column('verification_id', Integer),
+    Column('user_id', Integer),
+    Column('item_id', Integer),
+    Column('created_at', DateTime),
+    Column('verified_on', Date),
+)
+
+_verified_on = _item_verification.c.verified_on
+UNIQUE_DAY_INDEX = Index(
+    'uq_item_verification_user_item_day',
+    _item_verification.c.user_id, _item_verification.c.item_id, _verified_on,
+    unique=True,
+    sqlite_where=_verified_on.isnot(None),
+    postgresql_where=_verified_on.isnot(None)
+)
+
+
+def upgrade():
+    add_missing_columns(_verified_on)
+    _backfill_verified_on()
+    _remove_same_day_duplicates()
+    create_missing_indexes(UNIQUE_DAY_INDEX)
+
+
+def _backfill_verified_on():
+    created_at = _item_verification.c.created_at
+    if db.engine.dialect.name == 'sqlite':
+        day = func.date(created_at)
+    else:
+        day = cast(created_at, Date)
+
+    verification_id = _item_verification.c.verification_id
+    last_id = db.session.execute(select(func.max(verification_id))).scalar() or 0
+    for start in range(0, last_id, _BATCH_SIZE):
+        db.session.execute(
+            update(_item_verification)
+            .where(
+                verification_id > start,
+                verification_id <= start + _BATCH_SIZE,
+                _verified_on.is_(None)
+            )
+            .values(verified_on=day)
+        )
+        db.session.commit()
+
+
+def _remove_same_day_duplicates():
+    # Keep the first verification of each (user, item, day); the racing
+    # requests this index now rejects could have inserted more
+    first = (
+        select(func.min(_item_verification.c.verification_id))
+        .group_by(
+            _item_verification.c.user_id,
+            _item_verification.c.item_id,
+            _verified_on
+        )
+    )
+    item_ids = db.session.execute(
+        select(_item_verification.c.item_id)
+        .where(_item_verification.c.verification_id.not_in(first))
+        .distinct()
+    ).scalars().all()
+    if not item_ids:
+        return
+
+    db.session.execute(
+        delete(_item_verification)
+        .where(_item_verification.c.verification_id.not_in(first))
+    )
+    # The deleted rows were counted on their items
+    history = select(_item_verification).where(_item_verification.c.item_id == _item.c.item_id)
+    db.session.execute(
+        update(_item)
+        .where(_item.c.item_id.in_(item_ids))
+        .values(
+            number_of_verifications=history.with_only_columns(
+                func.count(_item_verification.c.verification_id)
+            ).scalar_subquery(),
+            last_verified_date=history.with_only_columns(
+                func.max(_item_verification.c.created_at)
+            ).scalar_subquery()
+        )
+    )
+    db.session.commit()
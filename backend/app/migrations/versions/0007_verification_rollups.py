@@ -0,0 +1,100 @@
+"""Add verification rollup tables and fill them from the history"""
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    delete,
+    func,
+    insert,
+    select,
+)
+
+from app import db
+from app.migrations.ops import create_missing_indexes
+
+# The stale-item index on item is built concurrently
+TRANSACTIONAL = False
+
+_metadata = MetaData()
+# Referenced by the rollup foreign keys; never created here
+Table('rotation_city', _metadata, Column('city_id', Integer, primary_key=True))
+Table('user', _metadata, Column('user_id', Integer, primary_key=True))
+_item = Table(
+    'item', _metadata,
+    Column('item_id', Integer),
+    Column('rotation_city_id', Integer),
+    Column('last_verified_date', DateTime),
+)
+_item_verification = Table(
+    'item_verification', _metadata,
+    Column('verification_id', Integer),
+    Column('user_id', Integer),
+    Column('item_id', Integer),
+    Column('created_at', DateTime),
+    Column('verified_on', Date),
+)
+
+_city_verification_daily = Table(
+    'city_verification_daily', _metadata,
+    Column('rotation_city_id', Integer, ForeignKey('rotation_city.city_id'), primary_key=True),
+    Column('day', Date, primary_key=True),
+    Column('verification_count', Integer, nullable=False),
+)
+_city_verifier_total = Table(
+    'city_verifier_total', _metadata,
+    Column('rotation_city_id', Integer, ForeignKey('rotation_city.city_id'), primary_key=True),
+    Column('user_id', Integer, ForeignKey('user.user_id'), primary_key=True),
+    Column('verification_count', Integer, nullable=False),
+    Column('last_verified_at', DateTime),
+    Index('ix_city_verifier_total_rank', 'rotation_city_id', 'verification_count'),
+)
+
+STALE_ITEMS_INDEX = Index(
+    'ix_item_city_last_verified', _item.c.rotation_city_id, _item.c.last_verified_date
+)
+
+
+def upgrade():
+    _metadata.create_all(
+        db.engine,
+        tables=[_city_verification_daily, _city_verifier_total],
+        checkfirst=True
+    )
+    _fill_rollups()
+    create_missing_indexes(STALE_ITEMS_INDEX)
+
+
+def _fill_rollups():
+    verification = _item_verification.c
+    joined = _item_verification.join(_item, _item.c.item_id == verification.item_id)
+    daily = (
+        select(_item.c.rotation_city_id, verification.verified_on, func.count(verification.verification_id))
+        .select_from(joined)
+        .where(verification.verified_on.isnot(None))
+        .group_by(_item.c.rotation_city_id, verification.verified_on)
+    )
+    verifiers = (
+        select(
+            _item.c.rotation_city_id,
+            verification.user_id,
+            func.count(verification.verification_id),
+            func.max(verification.created_at)
+        )
+        .select_from(joined)
+        .group_by(_item.c.rotation_city_id, verification.user_id)
+    )
+
+    db.session.execute(delete(_city_verification_daily))
+    db.session.execute(delete(_city_verifier_total))
+    db.session.execute(insert(_city_verification_daily).from_select(
+        ['rotation_city_id', 'day', 'verification_count'], daily
+    ))
+    db.session.execute(insert(_city_verifier_total).from_select(
+        ['rotation_city_id', 'user_id', 'verification_count', 'last_verified_at'], verifiers
+    ))
+    db.session.commit()
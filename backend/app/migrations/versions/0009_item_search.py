@@ -0,0 +1,129 @@
+"""Add the item full-text search index and fill it"""
+from sqlalchemy import Column, Integer, MetaData, String, Table, select, text
+
+from app import db
+
+# The GIN index is built concurrently and the backfill commits per batch
+TRANSACTIONAL = False
+
+_BATCH_SIZE = 500
+_TEXT_VALUE_TYPE = 1
+
+POSTGRESQL_COLUMN_DDL = 'ALTER TABLE item ADD COLUMN IF NOT EXISTS search_vector tsvector'
+POSTGRESQL_INDEX_DDL = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_item_search_vector '
+    'ON item USING GIN (search_vector)'
+)
+SQLITE_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS item_search "
+    "USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+_metadata = MetaData()
+_item = Table(
+    'item', _metadata,
+    Column('item_id', Integer),
+    Column('name', String(200)),
+    Column('location', String(500)),
+)
+_category = Table(
+    'category', _metadata,
+    Column('category_id', Integer),
+    Column('category_name', String(100)),
+)
+_category_item = Table(
+    'category_item', _metadata,
+    Column('category_item_id', Integer),
+    Column('item_id', Integer),
+    Column('category_id', Integer),
+)
+_tag = Table(
+    'tag', _metadata,
+    Column('tag_id', Integer),
+    Column('value_type', Integer),
+)
+_value = Table(
+    'value', _metadata,
+    Column('value_id', Integer),
+    Column('tag_id', Integer),
+    Column('name_val', String(200)),
+)
+_item_tag_value = Table(
+    'item_tag_value', _metadata,
+    Column('item_tag_value_id', Integer),
+    Column('item_id', Integer),
+    Column('value_id', Integer),
+)
+
+
+def upgrade():
+    engine = db.engine
+    if engine.dialect.name == 'sqlite':
+        with engine.begin() as conn:
+            conn.execute(text(SQLITE_TABLE_DDL))
+        write = text('INSERT INTO item_search (rowid, title, body) VALUES (:item_id, :title, :body)')
+        clear = text('DELETE FROM item_search WHERE rowid = :item_id')
+    elif engine.dialect.name == 'postgresql':
+        with engine.begin() as conn:
+            conn.execute(text(POSTGRESQL_COLUMN_DDL))
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.execute(text(POSTGRESQL_INDEX_DDL))
+        write = text(
+            "UPDATE item SET search_vector = "
+            "setweight(to_tsvector('simple', :title), 'A') || "
+            "setweight(to_tsvector('simple', :body), 'B') "
+            "WHERE item_id = :item_id"
+        )
+        clear = None
+    else:
+        return
+
+    last_id = 0
+    while True:
+        documents = _documents_after(last_id)
+        if not documents:
+            break
+        if clear is not None:
+            db.session.execute(clear, [{'item_id': doc['item_id']} for doc in documents])
+        db.session.execute(write, documents)
+        db.session.commit()
+        last_id = documents[-1]['item_id']
+
+
+def _documents_after(last_id):
+    # Name as the title; location, category names and text tag values as the body
+    items = db.session.execute(
+        select(_item.c.item_id, _item.c.name, _item.c.location)
+        .where(_item.c.item_id > last_id)
+        .order_by(_item.c.item_id)
+        .limit(_BATCH_SIZE)
+    ).all()
+    if not items:
+        return []
+    item_ids = [item_id for item_id, _, _ in items]
+
+    extra = {item_id: [] for item_id in item_ids}
+    categories = db.session.execute(
+        select(_category_item.c.item_id, _category.c.category_name)
+        .join(_category, _category.c.category_id == _category_item.c.category_id)
+        .where(_category_item.c.item_id.in_(item_ids))
+        .order_by(_category_item.c.category_item_id)
+    )
+    text_values = db.session.execute(
+        select(_item_tag_value.c.item_id, _value.c.name_val)
+        .join(_value, _value.c.value_id == _item_tag_value.c.value_id)
+        .join(_tag, _tag.c.tag_id == _value.c.tag_id)
+        .where(
+            _item_tag_value.c.item_id.in_(item_ids),
+            _tag.c.value_type == _TEXT_VALUE_TYPE,
+            _value.c.name_val.isnot(None)
+        )
+        .order_by(_item_tag_value.c.item_tag_value_id)
+    )
+    for item_id, words in [*categories, *text_values]:
+        extra[item_id].append(words)
+
+    return [
+        {'item_id': item_id, 'title': name, 'body': '\n'.join([location or '', *extra[item_id]])}
+        for item_id, name, location in items
+    ]
@@ -0,0 +1,23 @@
+"""Add item coordinates and the geohash cell index"""
+from sqlalchemy import Column, Float, Index, Integer, MetaData, String, Table
+
+from app.migrations.ops import add_missing_columns, create_missing_indexes
+
+# The geohash index is built concurrently
+TRANSACTIONAL = False
+
+_metadata = MetaData()
+_item = Table(
+    'item', _metadata,
+    Column('rotation_city_id', Integer),
+    Column('latitude', Float),
+    Column('longitude', Float),
+    Column('geohash', String(12)),
+)
+
+CELL_INDEX = Index('ix_item_city_geohash', _item.c.rotation_city_id, _item.c.geohash)
+
+
+def upgrade():
+    add_missing_columns(_item.c.latitude, _item.c.longitude, _item.c.geohash)
+    create_missing_indexes(CELL_INDEX)
@@ -0,0 +1,20 @@
+"""Add the geocoding cache table"""
+from sqlalchemy import Column, DateTime, Float, MetaData, String, Table
+
+from app import db
+
+TRANSACTIONAL = True
+
+_metadata = MetaData()
+_geocode_cache = Table(
+    'geocode_cache', _metadata,
+    Column('address_key', String(500), primary_key=True),
+    Column('latitude', Float),
+    Column('longitude', Float),
+    Column('provider', String(50), nullable=False),
+    Column('created_at', DateTime),
+)
+
+
+def upgrade():
+    _metadata.create_all(db.engine, tables=[_geocode_cache], checkfirst=True)
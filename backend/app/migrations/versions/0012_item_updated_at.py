@@ -0,0 +1,49 @@
+"""Add item change timestamps and the change feed index"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, Table, func, select, update
+
+from app import db
+from app.migrations.ops import add_missing_columns, create_missing_indexes
+
+# Backfills in batches and builds the change feed index concurrently
+TRANSACTIONAL = False
+
+_BATCH_SIZE = 1000
+
+_metadata = MetaData()
+_item = Table(
+    'item', _metadata,
+    Column('item_id', Integer),
+    Column('rotation_city_id', Integer),
+    Column('last_verified_date', DateTime),
+    Column('created_at', DateTime),
+    Column('updated_at', DateTime),
+)
+
+CHANGE_FEED_INDEX = Index(
+    'ix_item_city_updated', _item.c.rotation_city_id, _item.c.updated_at, _item.c.item_id
+)
+
+
+def upgrade():
+    add_missing_columns(_item.c.updated_at)
+    # Existing items last changed when they were created or last verified
+    last_id = 0
+    while True:
+        item_ids = db.session.execute(
+            select(_item.c.item_id)
+            .where(_item.c.item_id > last_id, _item.c.updated_at.is_(None))
+            .order_by(_item.c.item_id)
+            .limit(_BATCH_SIZE)
+        ).scalars().all()
+        if not item_ids:
+            break
+        db.session.execute(
+            update(_item)
+            .where(_item.c.item_id.in_(item_ids))
+            .values(updated_at=func.coalesce(
+                _item.c.last_verified_date, _item.c.created_at, func.current_timestamp()
+            ))
+        )
+        db.session.commit()
+        last_id = item_ids[-1]
+    create_missing_indexes(CHANGE_FEED_INDEX)
@@ -0,0 +1,18 @@
+"""Add the image blob table"""
+from sqlalchemy import Column, DateTime, LargeBinary, MetaData, String, Table
+
+from app import db
+
+TRANSACTIONAL = True
+
+_metadata = MetaData()
+_image_blob = Table(
+    'image_blob', _metadata,
+    Column('image_key', String(80), primary_key=True),
+    Column('data', LargeBinary, nullable=False),
+    Column('created_at', DateTime),
+)
+
+
+def upgrade():
+    _metadata.create_all(db.engine, tables=[_image_blob], checkfirst=True)
@@ -0,0 +1,23 @@
+"""Add category change timestamps"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, func, update
+
+from app import db
+from app.migrations.ops import add_missing_columns
+
+TRANSACTIONAL = True
+
+_metadata = MetaData()
+_category = Table(
+    'category', _metadata,
+    Column('category_id', Integer),
+    Column('updated_at', DateTime),
+)
+
+
+def upgrade():
+    add_missing_columns(_category.c.updated_at)
+    db.session.execute(
+        update(_category)
+        .where(_category.c.updated_at.is_(None))
+        .values(updated_at=func.current_timestamp())
+    )
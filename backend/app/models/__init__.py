@@ -9,6 +9,7 @@ from app.models.rotation_city import RotationCity
 from app.models.user import User
 from app.models.category import Category
 from app.models.item import Item
+from app.models import item_search  # noqa: F401 (creates the search index with item)
 from app.models.category_item import CategoryItem
 from app.models.item_verification import ItemVerification
 from app.models.verification_code import VerificationCode, VerificationCodeType
@@ -16,6 +17,10 @@ from app.models.verification_stutus_enum import VerificationStatusEnum
 from app.models.tag import Tag
 from app.models.value import Value
 from app.models.item_tag_value import ItemTagValue
+from app.models.city_verification_daily import CityVerificationDaily
+from app.models.city_verifier_total import CityVerifierTotal
+from app.models.geocode_cache import GeocodeCache
+from app.models.image_blob import ImageBlob
 
 # Export all models
 __all__ = [
@@ -32,5 +37,9 @@ __all__ = [
     'Tag',
     'Value',
     'ItemTagValue',
+    'CityVerificationDaily',
+    'CityVerifierTotal',
+    'GeocodeCache',
+    'ImageBlob',
 ]
 
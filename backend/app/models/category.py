@@ -2,10 +2,13 @@
 Category Model
 Categories for organizing items (e.g., Electronics, Furniture, etc.)
 """
-from sqlalchemy import Column, Integer, String, Text
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app import db
+from app.utils.images import image_url
 
 
 class Category(db.Model):
@@ -17,7 +20,9 @@ class Category(db.Model):
     Attributes:
         category_id (int): Primary key, auto-incrementing
         category_name (str): Unique category name (max 100 chars)
-        category_pic (str): Base64 encoded image data for category icon
+        category_pic (str): Legacy inline base64 image data for category icon
+        category_pic_key (str): Content-addressed key of the stored category icon
+        updated_at (datetime): When the category was created or last changed
         category_items: Relationship to items through junction table
     """
     __tablename__ = 'category'
@@ -27,7 +32,11 @@ class Category(db.Model):
     
     # Category Information
     category_name = Column(String(100), nullable=False, unique=True)
-    category_pic = Column(Text, nullable=True)  # Base64 encoded image data
+    category_pic = Column(Text, nullable=True)  # Legacy base64 encoded image data
+    category_pic_key = Column(String(80), nullable=True)
+    
+    # Part of the category list version, so any edit changes its ETag
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     category_items = relationship(
@@ -36,6 +45,13 @@ class Category(db.Model):
         cascade="all, delete-orphan"
     )
     
+    @property
+    def category_pic_src(self):
+        """Image source for the icon: store URL or legacy base64."""
+        if self.category_pic_key:
+            return image_url(self.category_pic_key)
+        return self.category_pic
+    
     def __repr__(self):
         """Return string representation of Category instance."""
         return (
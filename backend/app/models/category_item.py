@@ -3,7 +3,7 @@ CategoryItem Model
 Junction table linking items to categories (many-to-many relationship).
 An item can belong to multiple categories.
 """
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -39,6 +39,12 @@ class CategoryItem(db.Model):
         nullable=False
     )
     
+    # Loading an item's categories, and finding items in a category
+    __table_args__ = (
+        Index('ix_category_item_item', 'item_id'),
+        Index('ix_category_item_category', 'category_id', 'item_id'),
+    )
+    
     # Relationships
     item = relationship("Item", back_populates="category_items")
     category = relationship("Category", back_populates="category_items")
@@ -0,0 +1,39 @@
+"""
+CityVerificationDaily Model
+Rollup of verifications per rotation city and UTC day.
+"""
+from sqlalchemy import Column, Date, ForeignKey, Integer
+
+from app import db
+
+
+class CityVerificationDaily(db.Model):
+    """Number of verifications recorded in a rotation city on one day.
+    
+    Maintained incrementally alongside each verification insert, so city
+    activity charts read one row per day instead of scanning the raw
+    verification history. Rebuildable from ``item_verification``.
+    
+    Attributes:
+        rotation_city_id (int): Foreign key to the rotation city
+        day (date): UTC day (matches ``ItemVerification.verified_on``)
+        verification_count (int): Verifications in the city that day
+    """
+    __tablename__ = 'city_verification_daily'
+    
+    # Composite primary key: one row per city and day
+    rotation_city_id = Column(
+        Integer,
+        ForeignKey('rotation_city.city_id'),
+        primary_key=True
+    )
+    day = Column(Date, primary_key=True)
+    
+    verification_count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        """Return string representation of CityVerificationDaily instance."""
+        return (
+            f"<CityVerificationDaily(rotation_city_id={self.rotation_city_id}, "
+            f"day={self.day}, verification_count={self.verification_count})>"
+        )
@@ -0,0 +1,50 @@
+"""
+CityVerifierTotal Model
+Rollup of verifications per user within a rotation city.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
+
+from app import db
+
+
+class CityVerifierTotal(db.Model):
+    """How many items a user has verified in a rotation city.
+    
+    Maintained incrementally alongside each verification insert and ranked
+    through an index, so the top verifiers of a city are a short index
+    scan. Rebuildable from ``item_verification``.
+    
+    Attributes:
+        rotation_city_id (int): Foreign key to the rotation city
+        user_id (int): Foreign key to the verifying user
+        verification_count (int): Verifications by the user in the city
+        last_verified_at (datetime): The user's latest verification there
+    """
+    __tablename__ = 'city_verifier_total'
+    
+    # Composite primary key: one row per city and user
+    rotation_city_id = Column(
+        Integer,
+        ForeignKey('rotation_city.city_id'),
+        primary_key=True
+    )
+    user_id = Column(
+        Integer,
+        ForeignKey('user.user_id'),
+        primary_key=True
+    )
+    
+    verification_count = Column(Integer, nullable=False, default=0)
+    last_verified_at = Column(DateTime, nullable=True)
+    
+    # Top verifiers of a city, highest count first
+    __table_args__ = (
+        Index('ix_city_verifier_total_rank', 'rotation_city_id', 'verification_count'),
+    )
+    
+    def __repr__(self):
+        """Return string representation of CityVerifierTotal instance."""
+        return (
+            f"<CityVerifierTotal(rotation_city_id={self.rotation_city_id}, "
+            f"user_id={self.user_id}, verification_count={self.verification_count})>"
+        )
@@ -0,0 +1,38 @@
+"""
+GeocodeCache Model
+Geocoding results keyed by normalized address.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Float, String
+
+from app import db
+
+
+class GeocodeCache(db.Model):
+    """Result of geocoding one normalized address.
+    
+    Shared by every item with the same address, so a backfill looks each
+    address up once however many items carry it and however often it is
+    re-run. Misses are cached too, with NULL coordinates.
+    
+    Attributes:
+        address_key (str): Primary key, the normalized address
+        latitude (float): Latitude in degrees, NULL if not found
+        longitude (float): Longitude in degrees, NULL if not found
+        provider (str): Name of the geocoder that produced the result
+        created_at (datetime): When the address was looked up
+    """
+    __tablename__ = 'geocode_cache'
+    
+    address_key = Column(String(500), primary_key=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    provider = Column(String(50), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        """Return string representation of GeocodeCache instance."""
+        return (
+            f"<GeocodeCache(address_key='{self.address_key}', "
+            f"latitude={self.latitude}, longitude={self.longitude})>"
+        )
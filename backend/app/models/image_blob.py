@@ -0,0 +1,30 @@
+"""
+ImageBlob Model
+Image bytes kept in the database by the ``database`` image store backend.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, LargeBinary, String
+
+from app import db
+
+
+class ImageBlob(db.Model):
+    """Bytes of one content-addressed image.
+    
+    Used where the web service has no persistent disk: the database is the
+    durable copy and files under IMAGE_STORAGE_PATH are only a read cache.
+    
+    Attributes:
+        image_key (str): Primary key, the image's content-addressed key
+        data (bytes): Raw image bytes
+        created_at (datetime): When the image was first stored
+    """
+    __tablename__ = 'image_blob'
+    
+    image_key = Column(String(80), primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        """Return string representation of ImageBlob instance."""
+        return f"<ImageBlob(image_key='{self.image_key}', size={len(self.data or b'')})>"
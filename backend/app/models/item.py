@@ -4,10 +4,11 @@ Items that can be found/verified in rotation cities.
 Each item belongs to categories through the junction table.
 """
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import relationship, validates
 
 from app import db
+from app.utils.geo import encode_geohash
 
 
 class Item(db.Model):
@@ -23,9 +24,15 @@ class Item(db.Model):
         name (str): Item name (max 200 chars)
         location (str): Physical location description (max 500 chars)
         walking_distance (float): Optional walking distance in meters
+        latitude (float): Optional latitude in degrees
+        longitude (float): Optional longitude in degrees
+        geohash (str): Geohash of the coordinates, kept in sync with them
         last_verified_date (datetime): When item was last verified as still available
         number_of_verifications (int): Count of user verifications
+        freshness_score (float): Precomputed ranking score, see app.utils.freshness
         created_at (datetime): Item creation timestamp
+        updated_at (datetime): When the item was created, last changed or
+            last verified; drives the ``GET /item/changes`` feed
         added_by_user: Relationship to User who added the item
         rotation_city: Relationship to RotationCity where item is located
         category_items: Relationship to categories through junction table
@@ -53,11 +60,31 @@ class Item(db.Model):
     name = Column(String(200), nullable=False)
     location = Column(String(500), nullable=False)
     walking_distance = Column(Float, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True)
     last_verified_date = Column(DateTime, nullable=True)
     number_of_verifications = Column(Integer, default=0)
+    # Set on verification and decayed by ``flask items freshness``
+    freshness_score = Column(Float, nullable=False, default=1.0)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Set explicitly by the write paths, not via onupdate, so the daily
+    # freshness decay does not make every item look changed
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    # Match the keyset list queries (filter by owner, newest or freshest
+    # first), the per-city count of items not verified recently, the
+    # geohash cell ranges of nearby searches and the change feed
+    __table_args__ = (
+        Index('ix_item_city_created', 'rotation_city_id', 'created_at', 'item_id'),
+        Index('ix_item_city_freshness', 'rotation_city_id', 'freshness_score', 'item_id'),
+        Index('ix_item_user_created', 'added_by_user_id', 'created_at', 'item_id'),
+        Index('ix_item_city_last_verified', 'rotation_city_id', 'last_verified_date'),
+        Index('ix_item_city_geohash', 'rotation_city_id', 'geohash'),
+        Index('ix_item_city_updated', 'rotation_city_id', 'updated_at', 'item_id'),
+    )
     
     # Relationships
     added_by_user = relationship("User", back_populates="added_items")
@@ -78,6 +105,17 @@ class Item(db.Model):
         cascade="all, delete-orphan"
     )
     
+    @validates('latitude', 'longitude')
+    def _sync_geohash(self, key, value):
+        """Derive the geohash whenever a coordinate is set."""
+        latitude = value if key == 'latitude' else self.latitude
+        longitude = value if key == 'longitude' else self.longitude
+        if latitude is None or longitude is None:
+            self.geohash = None
+        else:
+            self.geohash = encode_geohash(latitude, longitude)
+        return value
+    
     def __repr__(self):
         """Return string representation of Item instance."""
         return (
@@ -0,0 +1,63 @@
+"""
+Item Search Index
+Full-text index over item names, locations, category names and text tag
+values.
+
+Not a mapped model: the index lives in dialect-specific structures that
+are created together with the ``item`` table.
+
+- PostgreSQL: a ``search_vector`` tsvector column on ``item`` with a GIN
+  index; the name is weighted above the other fields.
+- SQLite (development and tests): an FTS5 virtual table ``item_search``
+  whose rowid is the item ID, with the name and the other fields in
+  separate columns.
+"""
+from sqlalchemy import DDL, Integer, Text, column, event, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.models.item import Item
+
+# Language-neutral: items are named in whatever language the city speaks
+SEARCH_CONFIG = 'simple'
+
+# PostgreSQL: the tsvector column on item
+item_search_vector = table(
+    'item',
+    column('item_id', Integer),
+    column('search_vector', TSVECTOR),
+)
+
+# SQLite: the FTS5 table, keyed by item ID
+item_search_fts = table(
+    'item_search',
+    column('rowid', Integer),
+    column('title', Text),
+    column('body', Text),
+)
+
+POSTGRESQL_COLUMN_DDL = 'ALTER TABLE item ADD COLUMN IF NOT EXISTS search_vector tsvector'
+POSTGRESQL_INDEX_DDL = (
+    'CREATE INDEX {concurrently}IF NOT EXISTS ix_item_search_vector '
+    'ON item USING GIN (search_vector)'
+)
+SQLITE_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS item_search "
+    "USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+event.listen(
+    Item.__table__, 'after_create',
+    DDL(POSTGRESQL_COLUMN_DDL).execute_if(dialect='postgresql')
+)
+event.listen(
+    Item.__table__, 'after_create',
+    DDL(POSTGRESQL_INDEX_DDL.format(concurrently='')).execute_if(dialect='postgresql')
+)
+event.listen(
+    Item.__table__, 'after_create',
+    DDL(SQLITE_TABLE_DDL).execute_if(dialect='sqlite')
+)
+event.listen(
+    Item.__table__, 'after_drop',
+    DDL('DROP TABLE IF EXISTS item_search').execute_if(dialect='sqlite')
+)
@@ -3,7 +3,7 @@ ItemTagValue Model
 Junction table linking items to specific tag values.
 Associates items with their tag metadata.
 """
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -40,6 +40,12 @@ class ItemTagValue(db.Model):
         nullable=False
     )
     
+    # Loading an item's tags, and finding items with a value
+    __table_args__ = (
+        Index('ix_item_tag_value_item', 'item_id'),
+        Index('ix_item_tag_value_value', 'value_id', 'item_id'),
+    )
+    
     # Relationships
     item = relationship("Item", back_populates="item_tag_values")
     value = relationship("Value", back_populates="item_tag_values")
@@ -4,8 +4,8 @@ Records when users verify that an item still exists/is available.
 Helps keep item information current.
 """
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, Text
+from sqlalchemy.orm import relationship, validates
 
 from app import db
 
@@ -22,6 +22,8 @@ class ItemVerification(db.Model):
         item_id (int): Foreign key to item being verified
         note (str): Optional text note from verifier
         created_at (datetime): Verification timestamp
+        verified_on (date): UTC day of created_at; a user verifies an item
+            at most once per day, enforced by a partial unique index
         user: Relationship to User model
         item: Relationship to Item model
     """
@@ -48,10 +50,33 @@ class ItemVerification(db.Model):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    # Kept in step with created_at; NULL only on rows that predate it
+    verified_on = Column(Date, nullable=True, default=lambda: datetime.utcnow().date())
+    
+    # Item and user histories (newest first) and the once-a-day rule
+    __table_args__ = (
+        Index('ix_item_verification_item_created', 'item_id', 'created_at'),
+        Index('ix_item_verification_user_created', 'user_id', 'created_at'),
+        Index('ix_item_verification_user_item_created', 'user_id', 'item_id', 'created_at'),
+        Index(
+            'uq_item_verification_user_item_day', 'user_id', 'item_id', 'verified_on',
+            unique=True,
+            sqlite_where=verified_on.isnot(None),
+            postgresql_where=verified_on.isnot(None)
+        ),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="item_verifications")
     item = relationship("Item", back_populates="item_verifications")
     
+    @validates('created_at')
+    def _sync_verified_on(self, key, created_at):
+        """Derive the verification day whenever the timestamp is set."""
+        if created_at is not None:
+            self.verified_on = created_at.date()
+        return created_at
+    
     def __repr__(self):
         """Return string representation of ItemVerification instance."""
         return (
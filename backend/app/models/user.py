@@ -7,6 +7,7 @@ from datetime import datetime
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Boolean, Text
 from sqlalchemy.orm import relationship
 from app.models.verification_stutus_enum import VerificationStatusEnum
+from app.utils.images import image_url
 
 from app import db
 
@@ -23,7 +24,8 @@ class User(db.Model):
         first_name (str): User's first name (max 50 chars)
         last_name (str): User's last name (max 50 chars)
         email (str): Unique email address (max 100 chars)
-        profile_picture (str): Optional profile picture as base64 string
+        profile_picture (str): Legacy inline profile picture as base64 string
+        profile_picture_key (str): Content-addressed key of the stored profile picture
         created_at (datetime): Account creation timestamp
         updated_at (datetime): Last update timestamp
         is_verified (bool): Email verification status
@@ -49,8 +51,9 @@ class User(db.Model):
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
     email = Column(String(100), unique=True, nullable=False)
-    # Optional profile picture stored as base64 for simplicity
+    # Legacy inline base64 picture; new uploads go to the image store
     profile_picture = Column(Text, nullable=True)
+    profile_picture_key = Column(String(80), nullable=True)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -74,6 +77,13 @@ class User(db.Model):
     item_verifications = relationship("ItemVerification", back_populates="user")
     verification_codes = relationship("VerificationCode", back_populates="user")
     
+    @property
+    def profile_picture_src(self):
+        """Image source for the profile picture: store URL or legacy base64."""
+        if self.profile_picture_key:
+            return image_url(self.profile_picture_key)
+        return self.profile_picture
+    
     def __repr__(self):
         """Return string representation of User instance."""
         return (
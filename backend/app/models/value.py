@@ -3,7 +3,7 @@ Value Model
 Possible values for tags. Supports different data types through
 separate columns.
 """
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -16,6 +16,10 @@ class Value(db.Model):
     Only one column (boolean_val, name_val, or numerical_value) should be set
     per value instance, determined by the associated tag's value_type.
     
+    Values are canonical: each (tag, typed value) pair is stored once and
+    shared by every item that uses it, enforced by one partial unique index
+    per value column.
+    
     Attributes:
         value_id (int): Primary key, auto-incrementing
         tag_id (int): Foreign key to tag this value belongs to
@@ -42,6 +46,27 @@ class Value(db.Model):
     name_val = Column(String(200), nullable=True)  # Text values
     numerical_value = Column(Float, nullable=True)
     
+    # Values by tag, and one row per (tag, typed value); NULL columns are
+    # left out of each unique index
+    __table_args__ = (
+        Index('ix_value_tag', 'tag_id'),
+        Index(
+            'uq_value_tag_boolean', 'tag_id', 'boolean_val', unique=True,
+            sqlite_where=boolean_val.isnot(None),
+            postgresql_where=boolean_val.isnot(None)
+        ),
+        Index(
+            'uq_value_tag_name', 'tag_id', 'name_val', unique=True,
+            sqlite_where=name_val.isnot(None),
+            postgresql_where=name_val.isnot(None)
+        ),
+        Index(
+            'uq_value_tag_numeric', 'tag_id', 'numerical_value', unique=True,
+            sqlite_where=numerical_value.isnot(None),
+            postgresql_where=numerical_value.isnot(None)
+        ),
+    )
+    
     # Relationships
     tag = relationship("Tag", back_populates="values")
     item_tag_values = relationship(
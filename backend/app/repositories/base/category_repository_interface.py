@@ -50,3 +50,8 @@ class CategoryRepositoryInterface(ABC):
     def delete_category(self, category_id: int) -> bool:
         """Delete a category."""
         pass
+
+    @abstractmethod
+    def get_categories_version(self) -> tuple:
+        """Get a cheap version token for the category list."""
+        pass
@@ -0,0 +1,114 @@
+"""
+Item List Filters
+Structured filters for item list queries, compiled to SQL criteria.
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+from sqlalchemy import select
+
+from app.models.category_item import CategoryItem
+from app.models.item import Item
+from app.models.item_tag_value import ItemTagValue
+from app.models.tag import TagValueType
+from app.models.value import Value
+
+
+@dataclass
+class TagValueFilter:
+    """Items carrying any of the given values of one tag.
+
+    Attributes:
+        tag_id: The tag the values belong to
+        value_type: The tag's value type, which picks the value column
+        values: Accepted values, already converted to the tag's type
+    """
+    tag_id: int
+    value_type: TagValueType
+    values: List[Any]
+
+
+@dataclass
+class NumericRangeFilter:
+    """Items whose value of a numeric tag lies in an inclusive range.
+
+    Attributes:
+        tag_id: The numeric tag
+        minimum: Lowest accepted value, or None for no lower bound
+        maximum: Highest accepted value, or None for no upper bound
+    """
+    tag_id: int
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+
+@dataclass
+class ItemFilters:
+    """Filters on an item list; every given filter must hold.
+
+    Attributes:
+        category_ids: Items in any of these categories
+        tag_values: One filter per tag; each must match
+        numeric_ranges: One filter per numeric tag; each must match
+        max_walking_distance: Items at most this many meters away;
+            items without a walking distance are excluded
+    """
+    category_ids: List[int] = field(default_factory=list)
+    tag_values: List[TagValueFilter] = field(default_factory=list)
+    numeric_ranges: List[NumericRangeFilter] = field(default_factory=list)
+    max_walking_distance: Optional[float] = None
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.category_ids or self.tag_values or self.numeric_ranges
+            or self.max_walking_distance is not None
+        )
+
+    def criteria(self) -> list:
+        """Build the WHERE criteria for an ``Item`` query.
+
+        Each category or tag filter is an ``item_id IN (...)`` semi-join
+        that starts from the value or category side, so it is served by
+        the (tag_id, value) unique indexes on ``value`` and the
+        (value_id, item_id) and (category_id, item_id) junction indexes.
+        """
+        criteria = []
+        if self.category_ids:
+            criteria.append(Item.item_id.in_(
+                select(CategoryItem.item_id)
+                .where(CategoryItem.category_id.in_(self.category_ids))
+            ))
+        for tag_filter in self.tag_values:
+            column = _VALUE_COLUMNS[tag_filter.value_type]
+            criteria.append(Item.item_id.in_(
+                _items_with_values(
+                    Value.tag_id == tag_filter.tag_id,
+                    column.in_(tag_filter.values)
+                )
+            ))
+        for range_filter in self.numeric_ranges:
+            bounds = [Value.tag_id == range_filter.tag_id]
+            if range_filter.minimum is not None:
+                bounds.append(Value.numerical_value >= range_filter.minimum)
+            if range_filter.maximum is not None:
+                bounds.append(Value.numerical_value <= range_filter.maximum)
+            criteria.append(Item.item_id.in_(_items_with_values(*bounds)))
+        if self.max_walking_distance is not None:
+            criteria.append(Item.walking_distance <= self.max_walking_distance)
+        return criteria
+
+
+_VALUE_COLUMNS = {
+    TagValueType.BOOLEAN: Value.boolean_val,
+    TagValueType.TEXT: Value.name_val,
+    TagValueType.NUMERIC: Value.numerical_value,
+}
+
+
+def _items_with_values(*value_criteria):
+    """Select IDs of items linked to a value matching the criteria."""
+    return (
+        select(ItemTagValue.item_id)
+        .join(Value, Value.value_id == ItemTagValue.value_id)
+        .where(*value_criteria)
+    )
@@ -0,0 +1,20 @@
+"""
+Item Load Strategy
+How item detail queries eagerly load their relationships.
+"""
+from enum import Enum
+
+
+class ItemLoadStrategy(Enum):
+    """How item detail relationships are eagerly loaded.
+
+    Members:
+        SELECTIN: JOIN only many-to-one relationships and batch each
+            collection in a separate ``WHERE ... IN`` query. Row count is
+            items + categories + tags, never their product.
+        JOINED: Single statement that LEFT OUTER JOINs every relationship.
+            Rows grow as categories x tags per item and must be
+            de-duplicated in Python with ``.unique()``.
+    """
+    SELECTIN = "selectin"
+    JOINED = "joined"
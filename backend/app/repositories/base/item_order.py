@@ -0,0 +1,32 @@
+"""
+Item List Orders
+Sort orders for item list queries, each a keyset on (key, item_id).
+"""
+from enum import Enum
+
+from app.models.item import Item
+
+
+class ItemOrder(Enum):
+    """How item lists are sorted.
+
+    Members:
+        CREATED: Newest first, keyset on (created_at, item_id)
+        FRESHNESS: Freshest first, keyset on (freshness_score, item_id)
+
+    Both are descending and served by a (rotation_city_id, key, item_id)
+    index, so a page is an index range scan rather than a sort.
+    """
+    CREATED = "created"
+    FRESHNESS = "freshness"
+
+    @property
+    def column(self):
+        """Item column this order sorts on before item_id."""
+        if self is ItemOrder.FRESHNESS:
+            return Item.freshness_score
+        return Item.created_at
+
+    def key(self, item: Item):
+        """Sort key of an item, the first half of its keyset cursor."""
+        return getattr(item, self.column.key)
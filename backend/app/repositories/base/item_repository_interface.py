@@ -1,7 +1,12 @@
 """Item repository interface."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from sqlalchemy.engine import Row
 from app.models.item import Item
+from app.repositories.base.item_load_strategy import ItemLoadStrategy
+from app.repositories.base.item_filters import ItemFilters
+from app.repositories.base.item_order import ItemOrder
 
 
 class ItemRepositoryInterface(ABC):
@@ -19,6 +24,20 @@ class ItemRepositoryInterface(ABC):
         """Create a new item."""
         pass
 
+    @abstractmethod
+    def add_item(
+        self,
+        name: str,
+        location: str,
+        rotation_city_id: int,
+        added_by_user_id: int,
+        walking_distance: Optional[float] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None
+    ) -> Item:
+        """Stage a new item and flush it without committing."""
+        pass
+
     @abstractmethod
     def get_item_by_id(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
         """Get item by ID (filtered by rotation city)."""
@@ -30,20 +49,128 @@ class ItemRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_items_with_details(self, rotation_city_id: int) -> list[Item]:
-        """Get all items with relationships loaded (filtered by rotation city)."""
+    def get_all_items_with_details(
+        self,
+        rotation_city_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[Any, int]] = None,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = False,
+        order: ItemOrder = ItemOrder.CREATED,
+        filters: Optional[ItemFilters] = None
+    ) -> list[Item]:
+        """Get items with relationships loaded (filtered by rotation city).
+
+        Results are keyset-paginated on (key, item_id) in descending order,
+        where key is created_at or freshness_score depending on ``order``,
+        and narrowed by ``filters`` when given.
+        """
         pass
 
     @abstractmethod
-    def get_item_by_id_with_details(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
+    def get_item_by_id_with_details(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = True
+    ) -> Optional[Item]:
         """Get item by ID with relationships loaded (filtered by rotation city)."""
         pass
 
     @abstractmethod
-    def get_items_by_user(self, user_id: int) -> list[Item]:
+    def get_items_by_user(
+        self,
+        user_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = False
+    ) -> list[Item]:
         """Get all items added by a specific user with relationships loaded."""
         pass
 
+    @abstractmethod
+    def get_items_by_ids_with_details(
+        self,
+        item_ids: list[int],
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = False
+    ) -> list[Item]:
+        """Get items by ID with relationships loaded, in no particular order."""
+        pass
+
+    @abstractmethod
+    def get_changed_items_with_details(
+        self,
+        rotation_city_id: int,
+        until: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> list[Item]:
+        """Get a city's items changed after a position, oldest change first.
+
+        Results are keyset-paginated on (updated_at, item_id) in ascending
+        order and exclude items changed after ``until``.
+        """
+        pass
+
+    @abstractmethod
+    def get_items_in_cells(
+        self,
+        rotation_city_id: int,
+        cells: list[str]
+    ) -> list[Tuple[int, float, float]]:
+        """Get (item_id, latitude, longitude) of a city's items in geohash cells."""
+        pass
+
+    @abstractmethod
+    def get_city_items_version(self, rotation_city_id: int) -> tuple:
+        """Get a cheap version token for the item list of a rotation city.
+
+        Args:
+            rotation_city_id: The ID of the rotation city.
+
+        Returns:
+            Tuple of aggregates that changes whenever the city's list does.
+        """
+        pass
+
+    @abstractmethod
+    def get_staleness_counts(self, rotation_city_id: int, verified_before: datetime) -> Tuple[int, int]:
+        """Count a city's items and those not verified since a cutoff.
+
+        Args:
+            rotation_city_id: The ID of the rotation city.
+            verified_before: Items last verified before this (or never) are stale.
+
+        Returns:
+            Tuple of (item count, stale item count).
+        """
+        pass
+
+    @abstractmethod
+    def get_category_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> list[Row]:
+        """Get (category_id, category_name, count) of a city's matching items."""
+        pass
+
+    @abstractmethod
+    def get_tag_value_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None,
+        tag_ids: Optional[Iterable[int]] = None,
+        exclude_tag_ids: Optional[Iterable[int]] = None
+    ) -> list[Row]:
+        """Get per tag value counts of a city's matching items.
+
+        Rows are (tag_id, name, value_type, boolean_val, name_val,
+        numerical_value, count).
+        """
+        pass
+
     @abstractmethod
     def exists(self, item_id: int) -> bool:
         """Check if an item exists by ID.
@@ -57,17 +184,75 @@ class ItemRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update_verification_count(self, item_id: int, count: int) -> None:
-        """Update the verification count for an item.
+    def get_verification_count(self, item_id: int) -> int:
+        """Read an item's denormalized verification counter.
 
         Args:
-            item_id: The ID of the item whose verification count should be updated.
-            count: The new verification count to set for the item.
+            item_id: The ID of the item.
 
         Returns:
-            None
+            The item's verification count, 0 if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def get_rotation_city_ids(self, item_ids: list[int], lock: bool = False) -> Dict[int, int]:
+        """Look up which of the given items exist.
+
+        Args:
+            item_ids: IDs of the items to look up.
+            lock: Whether to lock the item rows until the transaction ends.
 
-        Raises:
-            ValueError: If the specified item does not exist.
+        Returns:
+            Map of item ID to rotation city ID for the items that exist.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def record_verification(
+        self,
+        item_id: int,
+        verified_at: datetime
+    ) -> Optional[Tuple[int, int]]:
+        """Increment an item's verification counter in place.
+
+        Issues a single ``UPDATE`` (no read of the item or its verification
+        history) and does not commit; run inside a unit of work together
+        with the verification insert.
+
+        Args:
+            item_id: The ID of the verified item.
+            verified_at: Timestamp stored as the item's last verified date.
+
+        Returns:
+            Tuple of (new verification count, rotation city ID), or None if
+            the item does not exist.
+        """
+        pass
+
+
+    @abstractmethod
+    def record_verifications(self, item_ids: list[int], verified_at: datetime) -> Dict[int, int]:
+        """Increment the verification counter of several items at once.
+
+        Args:
+            item_ids: Distinct IDs of the verified items.
+            verified_at: Timestamp stored as the items' last verified date.
+
+        Returns:
+            Map of item ID to new verification count for the items that exist.
+        """
+        pass
+
+    @abstractmethod
+    def mark_items_updated(self, item_ids: list[int], updated_at: datetime) -> Dict[int, int]:
+        """Set ``updated_at`` of items whose listed data changed.
+
+        Args:
+            item_ids: IDs of the changed items.
+            updated_at: Timestamp of the change.
+
+        Returns:
+            Map of item ID to rotation city ID for the items that exist.
+        """
+        pass
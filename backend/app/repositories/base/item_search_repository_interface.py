@@ -0,0 +1,30 @@
+"""Item search repository interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+
+class ItemSearchRepositoryInterface(ABC):
+    """Interface for the item full-text search index."""
+
+    @abstractmethod
+    def index_items(self, documents: List[Tuple[int, str, str]]) -> None:
+        """Write (item_id, title, body) search documents, replacing old ones.
+
+        Does not commit; run inside the unit of work that writes the items.
+        """
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        rotation_city_id: int,
+        terms: List[str],
+        limit: int,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple[int, float]]:
+        """Get (item_id, score) of a city's items matching every term.
+
+        Results are ordered best match first and keyset-paginated on
+        (score, item_id).
+        """
+        pass
@@ -3,7 +3,9 @@ Item Verification Repository Interface
 Defines the contract for verification data access operations.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
+from sqlalchemy.engine import Row
 from app.models.item_verification import ItemVerification
 
 
@@ -30,6 +32,55 @@ class IItemVerificationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def add_verification(
+        self,
+        user_id: int,
+        item_id: int,
+        note: Optional[str] = None,
+        created_at: Optional[datetime] = None
+    ) -> Optional[ItemVerification]:
+        """
+        Stage a new item verification inside the current transaction.
+        
+        Enforces one verification per user, item and day atomically,
+        without a separate lookup. Does not commit.
+        
+        Args:
+            user_id: ID of the user verifying the item
+            item_id: ID of the item being verified
+            note: Optional note about the verification
+            created_at: Verification timestamp (defaults to now)
+            
+        Returns:
+            The pending ItemVerification instance, or None if the user
+            already verified the item that day
+        """
+        pass
+    
+    @abstractmethod
+    def add_verifications(
+        self,
+        user_id: int,
+        entries: List[Tuple[int, Optional[str]]],
+        created_at: Optional[datetime] = None
+    ) -> Dict[int, int]:
+        """
+        Stage one verification per entry with a single INSERT statement.
+        
+        Items the user already verified that day are skipped. Does not
+        commit.
+        
+        Args:
+            user_id: ID of the user verifying the items
+            entries: (item_id, note) pairs with distinct item IDs
+            created_at: Timestamp shared by the batch (defaults to now)
+            
+        Returns:
+            Map of item ID to new verification ID for the accepted entries
+        """
+        pass
+    
     @abstractmethod
     def get_verification_by_id(
         self,
@@ -82,6 +133,65 @@ class IItemVerificationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_verification_row(self, verification_id: int) -> Optional[Row]:
+        """
+        Get one verification as a listing row.
+        
+        Args:
+            verification_id: ID of the verification
+            
+        Returns:
+            Row with the listing columns, or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    def get_verification_rows_by_item_id(
+        self,
+        item_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get an item's verifications as listing rows, newest first.
+        
+        Args:
+            item_id: ID of the item
+            limit: Optional limit on number of results
+            cursor: Optional (created_at, verification_id) of the last row
+                already seen; only older rows are returned
+            since: Optional timestamp; only newer rows are returned
+            
+        Returns:
+            List of rows with the listing columns
+        """
+        pass
+    
+    @abstractmethod
+    def get_verification_rows_by_user_id(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get a user's verifications as listing rows, newest first.
+        
+        Args:
+            user_id: ID of the user
+            limit: Optional limit on number of results
+            cursor: Optional (created_at, verification_id) of the last row
+                already seen; only older rows are returned
+            since: Optional timestamp; only newer rows are returned
+            
+        Returns:
+            List of rows with the listing columns
+        """
+        pass
+    
     @abstractmethod
     def user_verified_item_today(
         self,
@@ -23,4 +23,8 @@ class IRotationCityRepository(ABC):
 
     @abstractmethod
     def validate_city_id(self, city_id) -> int:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_rotation_cities_version(self) -> tuple:
+        pass
@@ -1,6 +1,6 @@
 """Tag repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 from app.models.tag import Tag
 
 
@@ -22,7 +22,27 @@ class TagRepositoryInterface(ABC):
         """Get tag by name."""
         pass
 
+    @abstractmethod
+    def get_tags_by_ids(self, tag_ids: List[int]) -> List[Tag]:
+        """Get all tags with the given IDs in one query."""
+        pass
+
+    @abstractmethod
+    def get_tags_by_names_ci(self, names: List[str]) -> List[Tag]:
+        """Get all tags whose name matches any given name, ignoring case."""
+        pass
+
     @abstractmethod
     def create_tag(self, name: str, value_type: str) -> Tag:
         """Create a new tag."""
         pass
+
+    @abstractmethod
+    def add_tags(self, tags: List[Tuple[str, Union[str, int]]]) -> List[Tag]:
+        """Insert several tags in one batch without committing."""
+        pass
+
+    @abstractmethod
+    def get_tags_version(self) -> tuple:
+        """Get a cheap version token for the tag list."""
+        pass
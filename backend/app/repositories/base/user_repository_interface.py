@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.models.user import User
 
 
@@ -17,6 +17,7 @@ class IUserRepository(ABC):
         email: str,
         rotation_city_id: int,
         profile_picture: Optional[str] = None,
+        profile_picture_key: Optional[str] = None,
     ) -> User:
         pass
     
@@ -28,6 +29,10 @@ class IUserRepository(ABC):
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         pass
     
+    @abstractmethod
+    def get_profile_picture(self, user_id: int) -> Tuple[Optional[str], Optional[str]]:
+        pass
+    
     @abstractmethod
     def get_all_users(self) -> List[User]:
         pass
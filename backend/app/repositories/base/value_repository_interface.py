@@ -1,6 +1,6 @@
 """Value repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 from app.models.value import Value
 
 
@@ -17,6 +17,14 @@ class ValueRepositoryInterface(ABC):
         """Create a new value for a tag."""
         pass
 
+    @abstractmethod
+    def get_or_create_values(
+        self,
+        values: List[Tuple[int, Union[bool, str, float], str]]
+    ) -> List[Value]:
+        """Get the canonical value for each (tag, value), inserting missing ones."""
+        pass
+
     @abstractmethod
     def get_value_by_id(self, value_id: int) -> Optional[Value]:
         """Get value by ID."""
@@ -32,6 +40,11 @@ class ValueRepositoryInterface(ABC):
         """Get all text values for a specific tag."""
         pass
 
+    @abstractmethod
+    def is_value_in_use(self, value_id: int) -> bool:
+        """Check whether any item carries a value."""
+        pass
+
     @abstractmethod
     def update_value(
         self,
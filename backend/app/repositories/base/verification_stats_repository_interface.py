@@ -0,0 +1,52 @@
+"""Verification stats repository interface."""
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List, Tuple
+
+from sqlalchemy.engine import Row
+
+
+class VerificationStatsRepositoryInterface(ABC):
+    """Interface for the verification rollup tables."""
+
+    @abstractmethod
+    def record_verifications(
+        self,
+        verifications: List[Tuple[int, int]],
+        verified_at: datetime
+    ) -> None:
+        """Add new verifications to the daily and per-verifier rollups.
+
+        Does not commit; run inside the unit of work that inserts the
+        verifications.
+
+        Args:
+            verifications: (rotation_city_id, user_id) of each verification
+            verified_at: Timestamp shared by the verifications
+        """
+        pass
+
+    @abstractmethod
+    def get_daily_counts(
+        self,
+        rotation_city_id: int,
+        start_day: date,
+        end_day: date
+    ) -> List[Tuple[date, int]]:
+        """Get (day, count) rows for days with verifications, oldest first."""
+        pass
+
+    @abstractmethod
+    def get_weekly_counts(
+        self,
+        rotation_city_id: int,
+        start_day: date,
+        end_day: date
+    ) -> List[Tuple[date, int]]:
+        """Get (Monday of the week, count) rows, oldest first."""
+        pass
+
+    @abstractmethod
+    def get_top_verifiers(self, rotation_city_id: int, limit: int) -> List[Row]:
+        """Get the users with the most verifications in a city."""
+        pass
@@ -1,4 +1,6 @@
 """Category-Item junction repository."""
+from sqlalchemy import insert, select
+
 from app import db
 from app.models.category_item import CategoryItem
 
@@ -16,7 +18,19 @@ class CategoryItemRepository:
         return category_item
 
     def add_categories_to_item(self, item_id: int, category_ids: list[int]) -> None:
-        """Link multiple categories to an item."""
-        for category_id in category_ids:
-            self.add_category_to_item(item_id, category_id)
-        db.session.commit()
+        """Link multiple categories to an item in one batched INSERT.
+        
+        Does not commit; run inside a unit of work.
+        """
+        if not category_ids:
+            return
+        db.session.execute(
+            insert(CategoryItem),
+            [{'item_id': item_id, 'category_id': category_id} for category_id in category_ids]
+        )
+
+    def get_item_ids(self, category_id: int) -> list[int]:
+        """Get the IDs of the items in a category."""
+        return db.session.execute(
+            select(CategoryItem.item_id).where(CategoryItem.category_id == category_id)
+        ).scalars().all()
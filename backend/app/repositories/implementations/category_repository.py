@@ -134,3 +134,19 @@ class CategoryRepository(CategoryRepositoryInterface):
             db.session.rollback()
             return False
 
+    def get_categories_version(self) -> tuple:
+        """Get a version token for the category list.
+        
+        The token changes when a category is added or removed (count, max
+        ID) or renamed or given a new picture (latest ``updated_at``).
+        
+        Returns:
+            Tuple of (count, max category ID, last updated)
+        """
+        return tuple(db.session.execute(
+            db.select(
+                db.func.count(Category.category_id),
+                db.func.max(Category.category_id),
+                db.func.max(Category.updated_at)
+            )
+        ).one())
@@ -0,0 +1,54 @@
+"""
+Item Loader Strategies
+Eager-loading option sets for item detail queries.
+"""
+from sqlalchemy.orm import defer, joinedload, selectinload
+
+from app.models.item import Item
+from app.models.user import User
+from app.models.category import Category
+from app.models.category_item import CategoryItem
+from app.models.item_tag_value import ItemTagValue
+from app.models.value import Value
+from app.repositories.base.item_load_strategy import ItemLoadStrategy
+
+
+def item_detail_options(
+    strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+    include_images: bool = False
+) -> list:
+    """Build loader options for items with city, author, categories and tags.
+
+    By default the base64 image columns ``User.profile_picture`` and
+    ``Category.category_pic`` are deferred, so list queries don't pull the
+    same multi-KB blobs once per item. Callers that serialize those columns
+    must pass ``include_images=True``; touching a deferred column later
+    costs one extra query per row.
+
+    Args:
+        strategy: Loader strategy to use for the collections
+        include_images: Whether to load the base64 image columns
+
+    Returns:
+        List of loader options to pass to ``Select.options``
+    """
+    author = joinedload(Item.added_by_user)
+    if not include_images:
+        author = author.options(defer(User.profile_picture))
+
+    if strategy is ItemLoadStrategy.JOINED:
+        category = joinedload(Item.category_items).joinedload(CategoryItem.category)
+        tags = joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
+    else:
+        category = selectinload(Item.category_items).joinedload(CategoryItem.category)
+        tags = selectinload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
+
+    if not include_images:
+        category = category.options(defer(Category.category_pic))
+
+    return [
+        joinedload(Item.rotation_city),
+        author,
+        category,
+        tags,
+    ]
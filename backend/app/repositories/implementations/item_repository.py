@@ -1,12 +1,21 @@
 """Item repository implementation."""
-from typing import Optional
-from sqlalchemy.orm import joinedload
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from sqlalchemy import and_, or_
+from sqlalchemy.engine import Row
 from app import db
-from app.models.item import Item
+from app.models.category import Category
 from app.models.category_item import CategoryItem
+from app.models.item import Item
 from app.models.item_tag_value import ItemTagValue
+from app.models.tag import Tag
 from app.models.value import Value
 from app.repositories.base.item_repository_interface import ItemRepositoryInterface
+from app.repositories.base.item_filters import ItemFilters
+from app.repositories.base.item_load_strategy import ItemLoadStrategy
+from app.repositories.base.item_order import ItemOrder
+from app.repositories.implementations.item_load_options import item_detail_options
+from app.utils.freshness import freshness_weight
 
 
 class ItemRepository(ItemRepositoryInterface):
@@ -47,6 +56,46 @@ class ItemRepository(ItemRepositoryInterface):
         db.session.refresh(item)
         return item
 
+    def add_item(
+        self,
+        name: str,
+        location: str,
+        rotation_city_id: int,
+        added_by_user_id: int,
+        walking_distance: Optional[float] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None
+    ) -> Item:
+        """Stage a new item inside the current transaction.
+        
+        Flushes so the item ID is assigned, but does not commit; run inside
+        a unit of work.
+        
+        Args:
+            name: The name/title of the item
+            location: Physical location of the item
+            rotation_city_id: ID of the city where item is located
+            added_by_user_id: ID of the user adding the item
+            walking_distance: Optional walking distance in appropriate units
+            latitude: Optional latitude in degrees
+            longitude: Optional longitude in degrees
+            
+        Returns:
+            Pending Item object with its ID set
+        """
+        item = Item(
+            name=name,
+            location=location,
+            rotation_city_id=rotation_city_id,
+            added_by_user_id=added_by_user_id,
+            walking_distance=walking_distance,
+            latitude=latitude,
+            longitude=longitude
+        )
+        db.session.add(item)
+        db.session.flush()
+        return item
+
     def get_item_by_id(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
         """Retrieve an item by ID if it belongs to the specified city.
         
@@ -76,32 +125,125 @@ class ItemRepository(ItemRepositoryInterface):
             .order_by(Item.created_at.desc())
         ).scalars().all()
 
-    def get_all_items_with_details(self, rotation_city_id: int) -> list[Item]:
-        """Retrieve all items with relationships eagerly loaded.
+    def get_all_items_with_details(
+        self,
+        rotation_city_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[Any, int]] = None,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = False,
+        order: ItemOrder = ItemOrder.CREATED,
+        filters: Optional[ItemFilters] = None
+    ) -> list[Item]:
+        """Retrieve items with relationships eagerly loaded.
         
         Preloads rotation_city, added_by_user, categories, tags and values
-        to avoid N+1 query problems.
+        to avoid N+1 query problems. Items are ordered by ``order`` (newest
+        first by default) with item_id as a tie-breaker, which makes
+        (key, item_id) a stable keyset: passing the last row of a page as
+        ``cursor`` seeks straight to the next page instead of skipping over
+        an OFFSET.
         
         Args:
             rotation_city_id: The rotation city ID to filter by
+            limit: Optional maximum number of items to return
+            cursor: Optional (key, item_id) of the last item already seen,
+                where key is its created_at or freshness_score per ``order``
+            strategy: Loader strategy for the category and tag collections
+            include_images: Whether to load base64 avatar and category pictures
+            order: Sort order of the list
+            filters: Optional category, tag value, range and distance filters
             
         Returns:
             List of Item objects with all relationships loaded
         """
+        key = order.column
+        query = (
+            db.select(Item)
+            .filter_by(rotation_city_id=rotation_city_id)
+            .order_by(key.desc(), Item.item_id.desc())
+        )
+        
+        if filters:
+            query = query.where(*filters.criteria())
+        
+        if cursor is not None:
+            cursor_key, cursor_item_id = cursor
+            query = query.filter(
+                or_(
+                    key < cursor_key,
+                    and_(
+                        key == cursor_key,
+                        Item.item_id < cursor_item_id
+                    )
+                )
+            )
+        
+        if limit:
+            query = query.limit(limit)
+        
         result = db.session.execute(
+            query.options(*item_detail_options(strategy, include_images))
+        )
+        return result.scalars().unique().all()
+
+    def get_changed_items_with_details(
+        self,
+        rotation_city_id: int,
+        until: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN
+    ) -> list[Item]:
+        """Retrieve items changed after a position with relationships loaded.
+        
+        Items are ordered by (updated_at, item_id) ascending, so the last
+        row returned is the position to continue from.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            until: Only items last changed at or before this time
+            after: Optional (updated_at, item_id) of the last item already seen
+            limit: Optional maximum number of items to return
+            strategy: Loader strategy for the category and tag collections
+            
+        Returns:
+            List of Item objects with all relationships loaded
+        """
+        query = (
             db.select(Item)
             .filter_by(rotation_city_id=rotation_city_id)
-            .order_by(Item.created_at.desc())
-            .options(
-                joinedload(Item.rotation_city),
-                joinedload(Item.added_by_user),
-                joinedload(Item.category_items).joinedload(CategoryItem.category),
-                joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
+            .where(Item.updated_at <= until)
+            .order_by(Item.updated_at, Item.item_id)
+        )
+        
+        if after is not None:
+            after_at, after_item_id = after
+            query = query.filter(
+                or_(
+                    Item.updated_at > after_at,
+                    and_(
+                        Item.updated_at == after_at,
+                        Item.item_id > after_item_id
+                    )
+                )
             )
+        
+        if limit:
+            query = query.limit(limit)
+        
+        result = db.session.execute(
+            query.options(*item_detail_options(strategy, include_images=False))
         )
         return result.scalars().unique().all()
 
-    def get_item_by_id_with_details(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
+    def get_item_by_id_with_details(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = True
+    ) -> Optional[Item]:
         """Retrieve an item by ID with all relationships eagerly loaded.
         
         Preloads rotation_city, added_by_user, categories, tags and values.
@@ -110,6 +252,8 @@ class ItemRepository(ItemRepositoryInterface):
         Args:
             item_id: The ID of the item to retrieve
             rotation_city_id: The rotation city ID to filter by
+            strategy: Loader strategy for the category and tag collections
+            include_images: Whether to load base64 avatar and category pictures
             
         Returns:
             Item object with all relationships loaded if found, None otherwise
@@ -117,16 +261,16 @@ class ItemRepository(ItemRepositoryInterface):
         result = db.session.execute(
             db.select(Item)
             .filter_by(item_id=item_id, rotation_city_id=rotation_city_id)
-            .options(
-                joinedload(Item.rotation_city),
-                joinedload(Item.added_by_user),
-                joinedload(Item.category_items).joinedload(CategoryItem.category),
-                joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
-            )
+            .options(*item_detail_options(strategy, include_images))
         )
         return result.unique().scalar_one_or_none()
 
-    def get_items_by_user(self, user_id: int) -> list[Item]:
+    def get_items_by_user(
+        self,
+        user_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = False
+    ) -> list[Item]:
         """Retrieve all items added by a specific user.
         
         Preloads all relationships for efficient access.
@@ -134,6 +278,8 @@ class ItemRepository(ItemRepositoryInterface):
         
         Args:
             user_id: The ID of the user who added the items
+            strategy: Loader strategy for the category and tag collections
+            include_images: Whether to load base64 avatar and category pictures
             
         Returns:
             List of Item objects with all relationships loaded
@@ -141,24 +287,324 @@ class ItemRepository(ItemRepositoryInterface):
         result = db.session.execute(
             db.select(Item)
             .filter_by(added_by_user_id=user_id)
-            .order_by(Item.created_at.desc())
-            .options(
-                joinedload(Item.rotation_city),
-                joinedload(Item.added_by_user),
-                joinedload(Item.category_items).joinedload(CategoryItem.category),
-                joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
-            )
+            .order_by(Item.created_at.desc(), Item.item_id.desc())
+            .options(*item_detail_options(strategy, include_images))
+        )
+        return result.scalars().unique().all()
+
+    def get_items_by_ids_with_details(
+        self,
+        item_ids: list[int],
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        include_images: bool = False
+    ) -> list[Item]:
+        """Retrieve items by primary key with relationships eagerly loaded.
+        
+        Args:
+            item_ids: IDs of the items to load
+            strategy: Loader strategy for the category and tag collections
+            include_images: Whether to load base64 avatar and category pictures
+            
+        Returns:
+            List of the Item objects found, in no particular order
+        """
+        if not item_ids:
+            return []
+        result = db.session.execute(
+            db.select(Item)
+            .where(Item.item_id.in_(item_ids))
+            .options(*item_detail_options(strategy, include_images))
         )
         return result.scalars().unique().all()
+
+    def get_items_in_cells(
+        self,
+        rotation_city_id: int,
+        cells: list[str]
+    ) -> list[Tuple[int, float, float]]:
+        """Get a city's items located in any of the given geohash cells.
+        
+        Each cell is a prefix range on the (rotation_city_id, geohash)
+        index, so only items in or near the cells are read.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            cells: Geohash prefixes
+            
+        Returns:
+            List of (item_id, latitude, longitude) tuples
+        """
+        if not cells:
+            return []
+        # Base32 geohash characters all sort below '~'
+        ranges = [and_(Item.geohash >= cell, Item.geohash < cell + '~') for cell in cells]
+        rows = db.session.execute(
+            db.select(Item.item_id, Item.latitude, Item.longitude)
+            .where(Item.rotation_city_id == rotation_city_id, or_(*ranges))
+        ).all()
+        return [tuple(row) for row in rows]
+
+    def get_city_items_version(self, rotation_city_id: int) -> tuple:
+        """Get a version token for the item list of a rotation city.
+        
+        One aggregate query over the item table: the token changes when an
+        item is added or removed (count, max ID), verified (verification
+        total, latest verification date), edited (latest ``updated_at``) or
+        its freshness score decays.
+        
+        Args:
+            rotation_city_id: The ID of the rotation city
+            
+        Returns:
+            Tuple of (count, max item ID, verification total, last verified,
+            freshness total, last updated)
+        """
+        return tuple(db.session.execute(
+            db.select(
+                db.func.count(Item.item_id),
+                db.func.max(Item.item_id),
+                db.func.sum(Item.number_of_verifications),
+                db.func.max(Item.last_verified_date),
+                db.func.sum(Item.freshness_score),
+                db.func.max(Item.updated_at)
+            ).filter_by(rotation_city_id=rotation_city_id)
+        ).one())
+
+    def get_staleness_counts(self, rotation_city_id: int, verified_before: datetime) -> Tuple[int, int]:
+        """Count a city's items and those not verified since a cutoff.
+        
+        Answered from the (rotation_city_id, last_verified_date) index
+        without reading item rows.
+        
+        Args:
+            rotation_city_id: The ID of the rotation city
+            verified_before: Items last verified before this (or never) are stale
+            
+        Returns:
+            Tuple of (item count, stale item count)
+        """
+        stale = or_(Item.last_verified_date.is_(None), Item.last_verified_date < verified_before)
+        total, stale_count = db.session.execute(
+            db.select(
+                db.func.count(),
+                db.func.count(db.case((stale, 1)))
+            )
+            .select_from(Item)
+            .where(Item.rotation_city_id == rotation_city_id)
+        ).one()
+        return total, stale_count
+
+    def get_category_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> list[Row]:
+        """Count a city's matching items per category.
+        
+        One grouped query; categories without matching items are left out.
+        
+        Args:
+            rotation_city_id: The ID of the rotation city
+            filters: Optional filters the counted items must match
+            
+        Returns:
+            Rows of (category_id, category_name, count), largest count first
+        """
+        count = db.func.count(db.distinct(CategoryItem.item_id))
+        query = (
+            db.select(Category.category_id, Category.category_name, count.label('count'))
+            .select_from(Item)
+            .join(CategoryItem, CategoryItem.item_id == Item.item_id)
+            .join(Category, Category.category_id == CategoryItem.category_id)
+            .where(Item.rotation_city_id == rotation_city_id)
+            .group_by(Category.category_id, Category.category_name)
+            .order_by(count.desc(), Category.category_name)
+        )
+        if filters:
+            query = query.where(*filters.criteria())
+        return db.session.execute(query).all()
+
+    def get_tag_value_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None,
+        tag_ids: Optional[Iterable[int]] = None,
+        exclude_tag_ids: Optional[Iterable[int]] = None
+    ) -> list[Row]:
+        """Count a city's matching items per tag value.
+        
+        One grouped query over the item to value links; values without
+        matching items are left out.
+        
+        Args:
+            rotation_city_id: The ID of the rotation city
+            filters: Optional filters the counted items must match
+            tag_ids: Only count values of these tags
+            exclude_tag_ids: Skip values of these tags
+            
+        Returns:
+            Rows of (tag_id, name, value_type, boolean_val, name_val,
+            numerical_value, count), by tag then largest count first
+        """
+        count = db.func.count(db.distinct(ItemTagValue.item_id))
+        query = (
+            db.select(
+                Tag.tag_id,
+                Tag.name,
+                Tag.value_type,
+                Value.boolean_val,
+                Value.name_val,
+                Value.numerical_value,
+                count.label('count')
+            )
+            .select_from(Item)
+            .join(ItemTagValue, ItemTagValue.item_id == Item.item_id)
+            .join(Value, Value.value_id == ItemTagValue.value_id)
+            .join(Tag, Tag.tag_id == Value.tag_id)
+            .where(Item.rotation_city_id == rotation_city_id)
+            .group_by(
+                Tag.tag_id, Tag.name, Tag.value_type, Value.value_id,
+                Value.boolean_val, Value.name_val, Value.numerical_value
+            )
+            .order_by(Tag.name, Tag.tag_id, count.desc(), Value.value_id)
+        )
+        if tag_ids is not None:
+            query = query.where(Tag.tag_id.in_(list(tag_ids)))
+        if exclude_tag_ids:
+            query = query.where(Tag.tag_id.not_in(list(exclude_tag_ids)))
+        if filters:
+            query = query.where(*filters.criteria())
+        return db.session.execute(query).all()
+
     def exists(self, item_id: int) -> bool:
         """Check if item exists regardless of rotation city."""
         return db.session.query(
             db.session.query(Item).filter_by(item_id=item_id).exists()
         ).scalar()
 
-    def update_verification_count(self, item_id: int, count: int) -> None:
-        """Update the number of verifications for an item."""
-        item = db.session.get(Item, item_id)
-        if item:
-            item.number_of_verifications = count
-            db.session.commit()
+    def get_verification_count(self, item_id: int) -> int:
+        """Read an item's denormalized verification counter.
+        
+        A primary-key lookup, unlike counting the item's verifications.
+        
+        Args:
+            item_id: The ID of the item
+            
+        Returns:
+            The item's verification count, 0 if it does not exist
+        """
+        return db.session.execute(
+            db.select(Item.number_of_verifications).where(Item.item_id == item_id)
+        ).scalar() or 0
+
+    def get_rotation_city_ids(self, item_ids: list[int], lock: bool = False) -> Dict[int, int]:
+        """Look up which of the given items exist, with a single IN query.
+        
+        Args:
+            item_ids: IDs of the items to look up
+            lock: Lock the rows until the transaction ends (``FOR UPDATE``,
+                in item ID order), as record_verification does, so
+                concurrent verifications of an item queue up instead of
+                deadlocking
+            
+        Returns:
+            Map of item ID to rotation city ID for the items that exist
+        """
+        if not item_ids:
+            return {}
+        stmt = (
+            db.select(Item.item_id, Item.rotation_city_id)
+            .where(Item.item_id.in_(item_ids))
+            .order_by(Item.item_id)
+        )
+        if lock:
+            stmt = stmt.with_for_update()
+        rows = db.session.execute(stmt)
+        return {item_id: city_id for item_id, city_id in rows}
+
+    def record_verification(
+        self,
+        item_id: int,
+        verified_at: datetime
+    ) -> Optional[Tuple[int, int]]:
+        """Increment an item's verification counter in place.
+        
+        A single ``UPDATE item SET number_of_verifications =
+        number_of_verifications + 1 ... RETURNING`` so the cost does not
+        grow with the item's verification history. Does not commit; run
+        inside a unit of work together with the verification insert.
+        
+        Args:
+            item_id: The ID of the verified item
+            verified_at: Timestamp stored as the item's last verified date
+            
+        Returns:
+            Tuple of (new verification count, rotation city ID), or None if
+            the item does not exist
+        """
+        for _, count, city_id in self._increment_verifications([item_id], verified_at):
+            return count, city_id
+        return None
+
+    def record_verifications(self, item_ids: list[int], verified_at: datetime) -> Dict[int, int]:
+        """Increment the verification counter of several items at once.
+        
+        One ``UPDATE ... WHERE item_id IN (...) RETURNING`` adding one
+        verification to each item. Does not commit.
+        
+        Args:
+            item_ids: Distinct IDs of the verified items
+            verified_at: Timestamp stored as the items' last verified date
+            
+        Returns:
+            Map of item ID to new verification count for the items that exist
+        """
+        if not item_ids:
+            return {}
+        rows = self._increment_verifications(item_ids, verified_at)
+        return {item_id: count for item_id, count, _ in rows}
+
+    def mark_items_updated(self, item_ids: list[int], updated_at: datetime) -> Dict[int, int]:
+        """Set ``updated_at`` of items whose listed data changed.
+        
+        Puts the items back into the ``GET /item/changes`` feed and moves
+        their cities' list version token. One ``UPDATE ... RETURNING``;
+        does not commit.
+        
+        Args:
+            item_ids: IDs of the changed items
+            updated_at: Timestamp of the change
+            
+        Returns:
+            Map of item ID to rotation city ID for the items that exist
+        """
+        if not item_ids:
+            return {}
+        rows = db.session.execute(
+            db.update(Item)
+            .where(Item.item_id.in_(item_ids))
+            .values(updated_at=updated_at)
+            .returning(Item.item_id, Item.rotation_city_id)
+            .execution_options(synchronize_session='fetch')
+        )
+        return {item_id: city_id for item_id, city_id in rows}
+
+    def _increment_verifications(self, item_ids: list[int], verified_at: datetime):
+        """Add one verification to each item, returning (id, count, city) rows.
+
+        The freshness score is reset to the undecayed weight of the new
+        count in the same statement, since the item was just seen.
+        """
+        count = db.func.coalesce(Item.number_of_verifications, 0) + 1
+        return db.session.execute(
+            db.update(Item)
+            .where(Item.item_id.in_(item_ids))
+            .values(
+                number_of_verifications=count,
+                last_verified_date=verified_at,
+                freshness_score=freshness_weight(count),
+                updated_at=verified_at
+            )
+            .returning(Item.item_id, Item.number_of_verifications, Item.rotation_city_id)
+            .execution_options(synchronize_session='fetch')
+        ).all()
@@ -0,0 +1,153 @@
+"""Item search repository implementation."""
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    Float, and_, bindparam, cast, delete, func, insert, literal_column, or_, select, update
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app import db
+from app.models.item import Item
+from app.models.item_search import SEARCH_CONFIG, item_search_fts, item_search_vector
+from app.repositories.base.item_search_repository_interface import (
+    ItemSearchRepositoryInterface
+)
+
+# Name matches count double towards the rank on both backends
+_TITLE_WEIGHT = 2.0
+
+
+class ItemSearchRepository(ItemSearchRepositoryInterface):
+    """Repository for the item full-text search index.
+    
+    Queries go to the PostgreSQL tsvector column (GIN index) or to the
+    SQLite FTS5 table, depending on the database in use; see
+    ``app.models.item_search``. Every term is matched as a prefix, so
+    partial words typed into a search box already find items.
+    """
+
+    @property
+    def _sqlite(self) -> bool:
+        return db.session.get_bind().dialect.name == 'sqlite'
+
+    def index_items(self, documents: List[Tuple[int, str, str]]) -> None:
+        """Write search documents for items, replacing any previous ones.
+        
+        One executemany statement per backend whatever the number of
+        items. Does not commit.
+        
+        Args:
+            documents: (item_id, title, body) per item; the title is the
+                item name, the body everything else that is searchable
+        """
+        if not documents:
+            return
+        if self._sqlite:
+            db.session.execute(
+                delete(item_search_fts).where(
+                    item_search_fts.c.rowid.in_([item_id for item_id, _, _ in documents])
+                )
+            )
+            db.session.execute(
+                insert(item_search_fts),
+                [
+                    {'rowid': item_id, 'title': title, 'body': body}
+                    for item_id, title, body in documents
+                ]
+            )
+            return
+
+        vector = func.setweight(
+            func.to_tsvector(SEARCH_CONFIG, bindparam('b_title')), 'A'
+        ).op('||')(func.setweight(
+            func.to_tsvector(SEARCH_CONFIG, bindparam('b_body')), 'B'
+        ))
+        db.session.execute(
+            update(item_search_vector)
+            .where(item_search_vector.c.item_id == bindparam('b_item_id'))
+            .values(search_vector=vector),
+            [
+                {'b_item_id': item_id, 'b_title': title, 'b_body': body}
+                for item_id, title, body in documents
+            ]
+        )
+
+    def search(
+        self,
+        rotation_city_id: int,
+        terms: List[str],
+        limit: int,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple[int, float]]:
+        """Find a city's items matching every term, best match first.
+        
+        The full-text index finds the matches and the city filter is
+        applied to them by primary key. Scores are ``ts_rank_cd`` on
+        PostgreSQL and negated ``bm25`` on SQLite, so higher is better on
+        both; (score, item_id) forms the keyset for ``cursor``.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            terms: Search words, each matched as a prefix
+            limit: Maximum number of results
+            cursor: Optional (score, item_id) of the last result already seen
+            
+        Returns:
+            List of (item_id, score) tuples
+        """
+        if not terms:
+            return []
+        ranked = (self._sqlite_matches if self._sqlite else self._postgresql_matches)(
+            rotation_city_id, terms
+        ).subquery('ranked')
+
+        query = (
+            select(ranked.c.item_id, ranked.c.score)
+            .order_by(ranked.c.score.desc(), ranked.c.item_id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            cursor_score, cursor_item_id = cursor
+            query = query.where(
+                or_(
+                    ranked.c.score < cursor_score,
+                    and_(ranked.c.score == cursor_score, ranked.c.item_id < cursor_item_id)
+                )
+            )
+        return [tuple(row) for row in db.session.execute(query).all()]
+
+    @staticmethod
+    def _sqlite_matches(rotation_city_id: int, terms: List[str]):
+        # Quoted prefix phrases, implicitly ANDed: "term"* "other"*
+        match = ' '.join(f'"{term}"*' for term in terms)
+        fts = literal_column(item_search_fts.name)
+        return (
+            select(
+                item_search_fts.c.rowid.label('item_id'),
+                (-func.bm25(fts, _TITLE_WEIGHT, 1.0)).label('score')
+            )
+            .join(Item, Item.item_id == item_search_fts.c.rowid)
+            .where(
+                fts.op('MATCH')(match),
+                Item.rotation_city_id == rotation_city_id
+            )
+        )
+
+    @staticmethod
+    def _postgresql_matches(rotation_city_id: int, terms: List[str]):
+        query = func.to_tsquery(SEARCH_CONFIG, ' & '.join(f'{term}:*' for term in terms))
+        # The column is not mapped on Item, so name it against Item's table
+        vector = literal_column(f'{Item.__tablename__}.search_vector', TSVECTOR)
+        # ts_rank_cd returns real; the driver reads its shortest text form
+        # into a double that no longer equals the real, so cursors built
+        # from it would repeat or skip rows. Rank in double precision.
+        return (
+            select(
+                Item.item_id,
+                cast(func.ts_rank_cd(vector, query), Float(53)).label('score')
+            )
+            .where(
+                vector.op('@@')(query),
+                Item.rotation_city_id == rotation_city_id
+            )
+        )
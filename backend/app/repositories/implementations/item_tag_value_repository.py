@@ -1,6 +1,9 @@
 """Item-Tag-Value junction repository."""
+from sqlalchemy import delete, insert, select
+
 from app import db
 from app.models.item_tag_value import ItemTagValue
+from app.models.value import Value
 
 
 class ItemTagValueRepository:
@@ -16,7 +19,30 @@ class ItemTagValueRepository:
         return item_tag_value
 
     def add_tag_values_to_item(self, item_id: int, value_ids: list[int]) -> None:
-        """Link multiple tag values to an item."""
-        for value_id in value_ids:
-            self.add_tag_value_to_item(item_id, value_id)
-        db.session.commit()
+        """Link multiple tag values to an item in one batched INSERT.
+        
+        Does not commit; run inside a unit of work.
+        """
+        if not value_ids:
+            return
+        db.session.execute(
+            insert(ItemTagValue),
+            [{'item_id': item_id, 'value_id': value_id} for value_id in value_ids]
+        )
+
+    def set_item_tag_value(self, item_id: int, tag_id: int, value_id: int) -> None:
+        """Point an item's tag at another value, leaving other items alone.
+        
+        Values are shared between items, so the item's link rows for the
+        tag are replaced instead of the value being edited. Does not commit;
+        run inside a unit of work.
+        """
+        db.session.execute(
+            delete(ItemTagValue)
+            .where(ItemTagValue.item_id == item_id)
+            .where(ItemTagValue.value_id.in_(
+                select(Value.value_id).where(Value.tag_id == tag_id)
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        self.add_tag_values_to_item(item_id, [value_id])
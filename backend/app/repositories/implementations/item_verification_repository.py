@@ -2,10 +2,15 @@
 Item Verification Repository Implementation
 Implements verification data access operations using SQLAlchemy.
 """
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import func, and_
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from app.models.item import Item
 from app.models.item_verification import ItemVerification
+from app.models.user import User
 from app.repositories.base.item_verification_repository_interface import (
     IItemVerificationRepository
 )
@@ -42,6 +47,124 @@ class ItemVerificationRepository(IItemVerificationRepository):
         db.session.refresh(verification)
         return verification
     
+    def add_verification(
+        self,
+        user_id: int,
+        item_id: int,
+        note: Optional[str] = None,
+        created_at: Optional[datetime] = None
+    ) -> Optional[ItemVerification]:
+        """
+        Stage a new item verification inside the current transaction.
+        
+        A single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` against the
+        (user, item, day) unique index, so the once-a-day rule holds under
+        concurrent requests without a separate lookup. Does not commit;
+        run inside a unit of work.
+        
+        Args:
+            user_id: ID of the user verifying the item
+            item_id: ID of the item being verified
+            note: Optional note about the verification
+            created_at: Verification timestamp (defaults to now)
+            
+        Returns:
+            The pending ItemVerification instance, or None if the user
+            already verified the item that day
+        """
+        created_at = created_at or datetime.utcnow()
+        values = dict(
+            user_id=user_id,
+            item_id=item_id,
+            note=note,
+            created_at=created_at,
+            verified_on=created_at.date()
+        )
+        
+        stmt = self._insert_once_per_day([values])
+        if stmt is not None:
+            return db.session.execute(
+                stmt.returning(ItemVerification)
+            ).scalar_one_or_none()
+        
+        verification = ItemVerification(**values)
+        try:
+            with db.session.begin_nested():
+                db.session.add(verification)
+        except IntegrityError:
+            return None
+        return verification
+    
+    def add_verifications(
+        self,
+        user_id: int,
+        entries: List[Tuple[int, Optional[str]]],
+        created_at: Optional[datetime] = None
+    ) -> Dict[int, int]:
+        """
+        Stage one verification per entry with a single INSERT statement.
+        
+        Items the user already verified that day are skipped by the same
+        ``ON CONFLICT DO NOTHING`` as add_verification. Does not commit;
+        run inside a unit of work.
+        
+        Args:
+            user_id: ID of the user verifying the items
+            entries: (item_id, note) pairs with distinct item IDs
+            created_at: Timestamp shared by the batch (defaults to now)
+            
+        Returns:
+            Map of item ID to new verification ID for the accepted entries
+        """
+        if not entries:
+            return {}
+        created_at = created_at or datetime.utcnow()
+        rows = [
+            dict(
+                user_id=user_id,
+                item_id=item_id,
+                note=note,
+                created_at=created_at,
+                verified_on=created_at.date()
+            )
+            for item_id, note in entries
+        ]
+        
+        stmt = self._insert_once_per_day(rows)
+        if stmt is None:
+            added = {}
+            for row in rows:
+                verification = self.add_verification(**{
+                    key: row[key] for key in ('user_id', 'item_id', 'note', 'created_at')
+                })
+                if verification is not None:
+                    added[row['item_id']] = verification.verification_id
+            return added
+        
+        result = db.session.execute(stmt.returning(
+            ItemVerification.item_id,
+            ItemVerification.verification_id
+        ))
+        return {item_id: verification_id for item_id, verification_id in result}
+    
+    def _insert_once_per_day(self, rows: List[dict]):
+        """Build an INSERT that skips rows hitting the (user, item, day) index.
+        
+        Returns None on dialects without ``ON CONFLICT`` support.
+        """
+        dialect = db.session.get_bind().dialect.name
+        if dialect not in ('postgresql', 'sqlite'):
+            return None
+        dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        return dialect_insert(ItemVerification).values(rows).on_conflict_do_nothing(
+            index_elements=[
+                ItemVerification.user_id,
+                ItemVerification.item_id,
+                ItemVerification.verified_on
+            ],
+            index_where=ItemVerification.verified_on.isnot(None)
+        )
+    
     def get_verification_by_id(
         self,
         verification_id: int
@@ -107,6 +230,121 @@ class ItemVerificationRepository(IItemVerificationRepository):
         
         return query.all()
     
+    def get_verification_row(self, verification_id: int) -> Optional[Row]:
+        """
+        Get one verification as a listing row.
+        
+        Args:
+            verification_id: ID of the verification
+            
+        Returns:
+            Row with the listing columns, or None if not found
+        """
+        return db.session.execute(
+            self._listing_query()
+            .where(ItemVerification.verification_id == verification_id)
+        ).first()
+    
+    def get_verification_rows_by_item_id(
+        self,
+        item_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get an item's verifications as listing rows, newest first.
+        
+        Args:
+            item_id: ID of the item
+            limit: Optional limit on number of results
+            cursor: Optional (created_at, verification_id) of the last row
+                already seen; only older rows are returned
+            since: Optional timestamp; only newer rows are returned
+            
+        Returns:
+            List of rows with the listing columns
+        """
+        return self._list(ItemVerification.item_id == item_id, limit, cursor, since)
+    
+    def get_verification_rows_by_user_id(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """
+        Get a user's verifications as listing rows, newest first.
+        
+        Args:
+            user_id: ID of the user
+            limit: Optional limit on number of results
+            cursor: Optional (created_at, verification_id) of the last row
+                already seen; only older rows are returned
+            since: Optional timestamp; only newer rows are returned
+            
+        Returns:
+            List of rows with the listing columns
+        """
+        return self._list(ItemVerification.user_id == user_id, limit, cursor, since)
+    
+    def _listing_query(self):
+        """Select only the columns verification responses need, in one join.
+        
+        Rows carry the verification columns plus ``first_name``,
+        ``last_name``, ``profile_picture_key``, ``profile_picture`` and
+        ``item_name``. The base64 ``profile_picture`` is only sent for
+        users whose picture has not been moved to the image store.
+        """
+        return (
+            select(
+                ItemVerification.verification_id,
+                ItemVerification.user_id,
+                ItemVerification.item_id,
+                ItemVerification.note,
+                ItemVerification.created_at,
+                User.first_name,
+                User.last_name,
+                User.profile_picture_key,
+                case(
+                    (User.profile_picture_key.is_(None), User.profile_picture)
+                ).label('profile_picture'),
+                Item.name.label('item_name')
+            )
+            .join(User, User.user_id == ItemVerification.user_id)
+            .join(Item, Item.item_id == ItemVerification.item_id)
+        )
+    
+    def _list(
+        self,
+        condition,
+        limit: Optional[int],
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """Run the listing query as a keyset page on (created_at, id)."""
+        query = self._listing_query().where(condition).order_by(
+            ItemVerification.created_at.desc(),
+            ItemVerification.verification_id.desc()
+        )
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            query = query.where(
+                or_(
+                    ItemVerification.created_at < cursor_created_at,
+                    and_(
+                        ItemVerification.created_at == cursor_created_at,
+                        ItemVerification.verification_id < cursor_id
+                    )
+                )
+            )
+        if since is not None:
+            query = query.where(ItemVerification.created_at > since)
+        if limit:
+            query = query.limit(limit)
+        return db.session.execute(query).all()
+    
     def user_verified_item_today(
         self,
         user_id: int,
@@ -86,4 +86,17 @@ class RotationCityRepository(IRotationCityRepository):
             raise ValueError("rotation_city_id must be an integer")
         if not self.check_city_exists(city_id):
             raise ValueError(f"rotation_city_id {city_id} does not exist")
-        return city_id
\ No newline at end of file
+        return city_id
+
+    def get_rotation_cities_version(self) -> tuple:
+        """Get a version token for the rotation city list.
+        
+        Returns:
+            Tuple of (count, max city ID)
+        """
+        return tuple(db.session.execute(
+            db.select(
+                db.func.count(RotationCity.city_id),
+                db.func.max(RotationCity.city_id)
+            )
+        ).one())
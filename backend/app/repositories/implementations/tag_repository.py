@@ -1,5 +1,6 @@
 """Tag repository implementation."""
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+from sqlalchemy import insert
 from app import db
 from app.models.tag import Tag, TagValueType
 from app.repositories.base.tag_repository_interface import TagRepositoryInterface
@@ -47,6 +48,38 @@ class TagRepository(TagRepositoryInterface):
             db.select(Tag).filter(Tag.name.ilike(name))
         ).scalar_one_or_none()
 
+    def get_tags_by_ids(self, tag_ids: List[int]) -> List[Tag]:
+        """Retrieve all tags with the given IDs in a single query.
+        
+        Args:
+            tag_ids: IDs of the tags to retrieve
+            
+        Returns:
+            List of the Tag objects that exist (missing IDs are skipped)
+        """
+        if not tag_ids:
+            return []
+        return db.session.execute(
+            db.select(Tag).filter(Tag.tag_id.in_(set(tag_ids)))
+        ).scalars().all()
+
+    def get_tags_by_names_ci(self, names: List[str]) -> List[Tag]:
+        """Retrieve all tags matching any of the names, case-insensitively.
+        
+        Args:
+            names: Tag names to look up
+            
+        Returns:
+            List of the Tag objects that exist
+        """
+        if not names:
+            return []
+        return db.session.execute(
+            db.select(Tag).filter(
+                db.func.lower(Tag.name).in_({name.lower() for name in names})
+            )
+        ).scalars().all()
+
     def create_tag(self, name: str, value_type: Union[str, int]) -> Tag:
         """Create a new tag in the database.
         
@@ -67,3 +100,44 @@ class TagRepository(TagRepositoryInterface):
         db.session.commit()
         db.session.refresh(tag)
         return tag
+
+    def add_tags(self, tags: List[Tuple[str, Union[str, int]]]) -> List[Tag]:
+        """Insert several tags with one batched INSERT ... RETURNING.
+        
+        Does not commit; run inside a unit of work.
+        
+        Args:
+            tags: List of (name, value_type) pairs; value_type is a code
+                  or a label as in create_tag
+                  
+        Returns:
+            Created Tag objects in the same order as ``tags``
+        """
+        if not tags:
+            return []
+        rows = [
+            {
+                'name': name,
+                'value_type': (
+                    TagValueType.from_label(value_type).code
+                    if isinstance(value_type, str) else value_type
+                )
+            }
+            for name, value_type in tags
+        ]
+        return db.session.scalars(
+            insert(Tag).returning(Tag, sort_by_parameter_order=True),
+            rows
+        ).all()
+
+    def get_tags_version(self) -> tuple:
+        """Get a version token for the tag list.
+        
+        Tags are only ever inserted, so count and max ID identify the list.
+        
+        Returns:
+            Tuple of (count, max tag ID)
+        """
+        return tuple(db.session.execute(
+            db.select(db.func.count(Tag.tag_id), db.func.max(Tag.tag_id))
+        ).one())
@@ -0,0 +1,39 @@
+"""
+Unit of Work
+Groups several repository writes into one database transaction.
+"""
+from contextlib import contextmanager
+
+from app import db
+
+
+@contextmanager
+def unit_of_work(expire_on_commit: bool = False):
+    """Run the enclosed repository writes in a single transaction.
+
+    Repository ``add_*`` methods only ``flush`` (so generated IDs are
+    available to later statements); this context manager issues the one
+    ``COMMIT`` on success and rolls everything back if any step raises,
+    so a failure partway through leaves no orphan rows behind.
+
+    By default objects are not expired on commit, so the caller can build
+    its response from the in-memory objects without reloading them.
+
+    Args:
+        expire_on_commit: Whether to expire loaded objects after commit
+
+    Yields:
+        The current SQLAlchemy session
+    """
+    session = db.session()
+    try:
+        yield session
+        previous = session.expire_on_commit
+        session.expire_on_commit = expire_on_commit
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = previous
+    except Exception:
+        session.rollback()
+        raise
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.models.user import User
 from app import db
 from app.models.verification_stutus_enum import VerificationStatusEnum
@@ -32,7 +32,8 @@ class UserRepository(IUserRepository):
         last_name: str,
         email: str,
         rotation_city_id: int,
-        profile_picture: Optional[str] = None
+        profile_picture: Optional[str] = None,
+        profile_picture_key: Optional[str] = None
     ) -> User:
         """Create a new user in the database.
         
@@ -40,8 +41,9 @@ class UserRepository(IUserRepository):
             first_name: User's first name
             last_name: User's last name
             email: User's email address
-            profile_picture: Optional profile picture as base64 string
+            profile_picture: Optional legacy profile picture as base64 string
             rotation_city_id: ID of the user's rotation city
+            profile_picture_key: Optional image store key of the profile picture
             
         Returns:
             Created User object with status set to PENDING
@@ -51,6 +53,7 @@ class UserRepository(IUserRepository):
             last_name=last_name,
             email=email,
             profile_picture=profile_picture,
+            profile_picture_key=profile_picture_key,
             rotation_city_id=rotation_city_id,
             is_verified=False,
             status=VerificationStatusEnum.PENDING.code
@@ -88,6 +91,24 @@ class UserRepository(IUserRepository):
         """
         return User.query.options(joinedload(User.rotation_city)).filter_by(user_id=user_id).first()
     
+    def get_profile_picture(self, user_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """Retrieve only a user's profile picture columns.
+        
+        Selects just these columns so the rest of the row is never loaded.
+        
+        Args:
+            user_id: The ID of the user
+            
+        Returns:
+            Tuple of (image store key, legacy base64 picture); both None
+            if unset or user not found
+        """
+        row = db.session.execute(
+            db.select(User.profile_picture_key, User.profile_picture)
+            .filter_by(user_id=user_id)
+        ).one_or_none()
+        return (row[0], row[1]) if row else (None, None)
+    
     def get_all_users(self) -> List[User]:
         """Retrieve all users from the database.
         
@@ -115,7 +136,10 @@ class UserRepository(IUserRepository):
         if not user:
             raise ValueError("User not found")
         
-        allowed_fields = ['first_name', 'last_name','rotation_city_id', 'profile_picture']
+        allowed_fields = [
+            'first_name', 'last_name', 'rotation_city_id',
+            'profile_picture', 'profile_picture_key'
+        ]
 
         for field in allowed_fields:
             if field in kwargs:
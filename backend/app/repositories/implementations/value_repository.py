@@ -1,6 +1,10 @@
 """Value repository implementation."""
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
+from sqlalchemy import insert, or_, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from app import db
+from app.models.item_tag_value import ItemTagValue
 from app.models.value import Value
 from app.models.tag import Tag, TagValueType
 from app.repositories.base.value_repository_interface import ValueRepositoryInterface
@@ -11,8 +15,17 @@ class ValueRepository(ValueRepositoryInterface):
     
     Handles all database operations related to tag values.
     Values can be boolean, text, or numeric depending on their associated tag.
+    Each (tag, typed value) pair is stored once; creating a value that
+    already exists returns the existing row.
     """
 
+    # value_type label -> column holding values of that type
+    _VALUE_COLUMNS = {
+        'boolean': 'boolean_val',
+        'text': 'name_val',
+        'numeric': 'numerical_value',
+    }
+
     def create_value(
         self,
         tag_id: int,
@@ -27,22 +40,112 @@ class ValueRepository(ValueRepositoryInterface):
             value_type: Type of value ('boolean', 'text', or 'numeric')
             
         Returns:
-            Created Value object with appropriate column set
+            The Value object for this tag and value, existing or new
+        """
+        value_obj = self.get_or_create_values([(tag_id, value, value_type)])[0]
+        db.session.commit()
+        return value_obj
+
+    def get_or_create_values(
+        self,
+        values: List[Tuple[int, Union[bool, str, float], str]]
+    ) -> List[Value]:
+        """Get the canonical Value for each (tag, value), inserting missing ones.
+        
+        Looks every value up with one query, inserts the missing ones with
+        ``INSERT ... ON CONFLICT DO NOTHING`` (so a concurrent insert of the
+        same value is not an error) and fetches those back with a second
+        query. Does not commit; run inside a unit of work.
+        
+        Args:
+            values: List of (tag_id, value, value_type) triples, where
+                    value_type is 'boolean', 'text' or 'numeric'
+                    
+        Returns:
+            Value objects in the same order as ``values``; equal inputs
+            share one object
+            
+        Raises:
+            ValueError: If a value_type is not recognised
         """
-        value_obj = Value(tag_id=tag_id)
+        keys = [self._value_key(tag_id, value, value_type) for tag_id, value, value_type in values]
+        found = self._find_values(set(keys))
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
         
-        # Set the appropriate column based on value_type
+        if missing:
+            self._insert_missing(missing)
+            found.update(self._find_values(set(missing)))
+        
+        return [found[key] for key in keys]
+
+    def _value_key(
+        self,
+        tag_id: int,
+        value: Union[bool, str, float],
+        value_type: str
+    ) -> Tuple[int, str, Union[bool, str, float]]:
+        """Build the (tag_id, column, typed value) identity of a value."""
+        column = self._VALUE_COLUMNS.get(value_type)
+        if column is None:
+            raise ValueError(f"Invalid value_type: {value_type}")
+        return tag_id, column, self._typed_columns(value, value_type)[column]
+
+    def _find_values(self, keys: Set[tuple]) -> Dict[tuple, Value]:
+        """Load existing values for the given keys with a single query."""
+        if not keys:
+            return {}
+        by_column: Dict[str, list] = {}
+        for tag_id, column, typed in keys:
+            by_column.setdefault(column, []).append((tag_id, typed))
+        
+        conditions = [
+            tuple_(Value.tag_id, getattr(Value, column)).in_(pairs)
+            for column, pairs in by_column.items()
+        ]
+        rows = db.session.execute(
+            db.select(Value).filter(or_(*conditions))
+        ).scalars().all()
+        
+        found = {}
+        for row in rows:
+            for column in by_column:
+                typed = getattr(row, column)
+                if typed is not None:
+                    found[(row.tag_id, column, typed)] = row
+        return found
+
+    def _insert_missing(self, keys: List[tuple]) -> None:
+        """Insert values, skipping any that a concurrent writer just added."""
+        by_column: Dict[str, list] = {}
+        for tag_id, column, typed in keys:
+            row = {'boolean_val': None, 'name_val': None, 'numerical_value': None}
+            row.update(tag_id=tag_id, **{column: typed})
+            by_column.setdefault(column, []).append(row)
+        
+        dialect = db.session.get_bind().dialect.name
+        for column_name, rows in by_column.items():
+            column = getattr(Value, column_name)
+            if dialect in ('postgresql', 'sqlite'):
+                dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+                stmt = dialect_insert(Value.__table__).on_conflict_do_nothing(
+                    index_elements=[Value.tag_id, column],
+                    index_where=column.isnot(None)
+                )
+            else:
+                stmt = insert(Value.__table__)
+            db.session.execute(stmt, rows)
+
+    @staticmethod
+    def _typed_columns(value: Union[bool, str, float], value_type: str) -> dict:
+        """Map a value to the column matching its value_type."""
+        columns = {'boolean_val': None, 'name_val': None, 'numerical_value': None}
         if value_type == 'boolean':
-            value_obj.boolean_val = bool(value)
+            columns['boolean_val'] = bool(value)
         elif value_type == 'text':
-            value_obj.name_val = str(value)
+            columns['name_val'] = str(value)
         elif value_type == 'numeric':
-            value_obj.numerical_value = float(value)
-        
-        db.session.add(value_obj)
-        db.session.commit()
-        db.session.refresh(value_obj)
-        return value_obj
+            columns['numerical_value'] = float(value)
+        return columns
 
     def get_value_by_id(self, value_id: int) -> Optional[Value]:
         """Retrieve a value by its ID.
@@ -89,6 +192,23 @@ class ValueRepository(ValueRepositoryInterface):
         
         return db.session.execute(query).scalars().all()
 
+    def is_value_in_use(self, value_id: int) -> bool:
+        """Check whether any item carries a value.
+        
+        Args:
+            value_id: ID of the value
+            
+        Returns:
+            True if at least one item links to the value
+        """
+        return db.session.execute(
+            db.select(
+                db.select(ItemTagValue.item_tag_value_id)
+                .filter_by(value_id=value_id)
+                .exists()
+            )
+        ).scalar()
+
     def update_value(
         self,
         value_id: int,
@@ -131,7 +251,11 @@ class ValueRepository(ValueRepositoryInterface):
                 value.boolean_val = None
                 value.name_val = None
 
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError("An identical value already exists for this tag")
         db.session.refresh(value)
         return value
 
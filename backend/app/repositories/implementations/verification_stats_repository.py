@@ -0,0 +1,170 @@
+"""Verification stats repository implementation."""
+from collections import Counter
+from datetime import date, datetime
+from typing import List, Tuple
+
+from sqlalchemy import Date, cast, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+
+from app import db
+from app.models.city_verification_daily import CityVerificationDaily
+from app.models.city_verifier_total import CityVerifierTotal
+from app.models.user import User
+from app.repositories.base.verification_stats_repository_interface import (
+    VerificationStatsRepositoryInterface
+)
+
+
+class VerificationStatsRepository(VerificationStatsRepositoryInterface):
+    """Repository for the verification rollup tables.
+    
+    Rollups are incremented with ``INSERT ... ON CONFLICT DO UPDATE`` in
+    the verifying transaction, so readers never aggregate raw
+    verification rows.
+    """
+
+    def record_verifications(
+        self,
+        verifications: List[Tuple[int, int]],
+        verified_at: datetime
+    ) -> None:
+        """Add new verifications to the daily and per-verifier rollups.
+        
+        Issues at most two upserts whatever the number of verifications.
+        Rows are written in key order so concurrent batches lock them in
+        the same order. Does not commit.
+        
+        Args:
+            verifications: (rotation_city_id, user_id) of each verification
+            verified_at: Timestamp shared by the verifications
+        """
+        if not verifications:
+            return
+        day = verified_at.date()
+        per_city = Counter(city_id for city_id, _ in verifications)
+        per_verifier = Counter(verifications)
+        
+        self._increment(
+            CityVerificationDaily,
+            ['rotation_city_id', 'day'],
+            [
+                {'rotation_city_id': city_id, 'day': day, 'verification_count': count}
+                for city_id, count in sorted(per_city.items())
+            ]
+        )
+        self._increment(
+            CityVerifierTotal,
+            ['rotation_city_id', 'user_id'],
+            [
+                {
+                    'rotation_city_id': city_id,
+                    'user_id': user_id,
+                    'verification_count': count,
+                    'last_verified_at': verified_at
+                }
+                for (city_id, user_id), count in sorted(per_verifier.items())
+            ]
+        )
+
+    def get_daily_counts(
+        self,
+        rotation_city_id: int,
+        start_day: date,
+        end_day: date
+    ) -> List[Tuple[date, int]]:
+        """Get (day, count) rows for days with verifications, oldest first.
+        
+        A primary-key range scan over at most one row per day.
+        """
+        rows = db.session.execute(
+            db.select(CityVerificationDaily.day, CityVerificationDaily.verification_count)
+            .where(
+                CityVerificationDaily.rotation_city_id == rotation_city_id,
+                CityVerificationDaily.day.between(start_day, end_day)
+            )
+            .order_by(CityVerificationDaily.day)
+        )
+        return [tuple(row) for row in rows]
+
+    def get_weekly_counts(
+        self,
+        rotation_city_id: int,
+        start_day: date,
+        end_day: date
+    ) -> List[Tuple[date, int]]:
+        """Get (Monday of the week, count) rows, oldest first.
+        
+        Groups the daily rollup rows of the range by ISO week in SQL.
+        """
+        week_start = self._week_start(CityVerificationDaily.day)
+        rows = db.session.execute(
+            db.select(week_start, func.sum(CityVerificationDaily.verification_count))
+            .where(
+                CityVerificationDaily.rotation_city_id == rotation_city_id,
+                CityVerificationDaily.day.between(start_day, end_day)
+            )
+            .group_by(week_start)
+            .order_by(week_start)
+        )
+        return [(week, int(count)) for week, count in rows]
+
+    def get_top_verifiers(self, rotation_city_id: int, limit: int) -> List[Row]:
+        """Get the users with the most verifications in a city.
+        
+        Walks the rank index from the top, so the cost depends on
+        ``limit`` rather than on the number of verifiers.
+        
+        Returns:
+            Rows with user_id, first_name, last_name, verification_count
+            and last_verified_at, highest count first
+        """
+        return db.session.execute(
+            db.select(
+                CityVerifierTotal.user_id,
+                User.first_name,
+                User.last_name,
+                CityVerifierTotal.verification_count,
+                CityVerifierTotal.last_verified_at
+            )
+            .join(User, User.user_id == CityVerifierTotal.user_id)
+            .where(CityVerifierTotal.rotation_city_id == rotation_city_id)
+            .order_by(
+                CityVerifierTotal.verification_count.desc(),
+                CityVerifierTotal.user_id
+            )
+            .limit(limit)
+        ).all()
+
+    def _increment(self, model, key_columns: List[str], rows: List[dict]) -> None:
+        """Upsert rows, adding their counts to existing ones."""
+        dialect = db.session.get_bind().dialect.name
+        if dialect not in ('postgresql', 'sqlite'):
+            for row in rows:
+                existing = db.session.get(model, tuple(row[key] for key in key_columns))
+                if existing is None:
+                    db.session.add(model(**row))
+                    continue
+                existing.verification_count += row['verification_count']
+                if 'last_verified_at' in row:
+                    existing.last_verified_at = row['last_verified_at']
+            db.session.flush()
+            return
+        
+        dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        stmt = dialect_insert(model.__table__).values(rows)
+        updates = {
+            'verification_count': model.__table__.c.verification_count
+            + stmt.excluded.verification_count
+        }
+        if 'last_verified_at' in rows[0]:
+            updates['last_verified_at'] = stmt.excluded.last_verified_at
+        db.session.execute(
+            stmt.on_conflict_do_update(index_elements=key_columns, set_=updates)
+        )
+
+    def _week_start(self, day_column):
+        """SQL expression for the Monday starting the week of a date."""
+        if db.session.get_bind().dialect.name == 'sqlite':
+            return func.date(day_column, '-6 days', 'weekday 1', type_=Date)
+        return cast(func.date_trunc('week', day_column), Date)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 from app.repositories.implementations.user_repository import UserRepository
 from app.repositories.implementations.verification_code_repository import (
     VerificationCodeRepository
@@ -11,6 +11,7 @@ from app.repositories.implementations.rotation_city_repository import (
     RotationCityRepository
 )
 from app.services.auth.notification_service import NotificationService
+from app.services.images import ImageService
 from app.models.user import User
 from flask import current_app
 
@@ -27,7 +28,8 @@ class RegistrationService:
         self,
         user_repository: UserRepository = None,
         verification_code_repository: VerificationCodeRepository = None,
-        rotation_city_repository: RotationCityRepository = None
+        rotation_city_repository: RotationCityRepository = None,
+        image_service: ImageService = None
     ):
         """Initialize service with optional dependency injection.
         
@@ -35,6 +37,7 @@ class RegistrationService:
             user_repository: Optional UserRepository instance for testing/DI
             verification_code_repository: Optional VerificationCodeRepository for testing/DI
             rotation_city_repository: Optional RotationCityRepository for city validation
+            image_service: Optional ImageService for storing profile pictures
         """
         self.user_repo = user_repository or UserRepository()
         verification_repo = (
@@ -47,6 +50,7 @@ class RegistrationService:
             verification_repo
         )
         self.notification_service = NotificationService()
+        self.image_service = image_service or ImageService()
     
     def register_user(
         self,
@@ -73,35 +77,45 @@ class RegistrationService:
             
         Raises:
             ValueError: If user already exists and is verified
+            InvalidImageError: If the profile picture is not a valid image
         """
         existing_user = self.user_repo.get_user_by_email(email)
+        if existing_user and existing_user.is_verified:
+            raise ValueError(
+                "User with this email already exists. Login instead."
+            )
 
         # validate rotation_city_id
         rotation_city_id = self.rotation_city_repo.validate_city_id(rotation_city_id)
 
+        # Reject a bad picture now, but only write it to the image store
+        # once the request can no longer be refused
+        picture = (
+            self.image_service.decode_base64(profile_picture)
+            if profile_picture else None
+        )
+
         if existing_user:
-            if existing_user.is_verified:
-                raise ValueError(
-                    "User with this email already exists. Login instead."
-                )
-            else:
-                self._handle_expired_user(
-                    existing_user,
-                    {
-                        'first_name': first_name,
-                        'last_name': last_name,
-                        'rotation_city_id': rotation_city_id,
-                        'profile_picture': profile_picture
-                    }
-                )
-                return None
+            self._handle_expired_user(
+                existing_user,
+                {
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'rotation_city_id': rotation_city_id,
+                    'profile_picture': None
+                },
+                picture
+            )
+            return None
         
         new_user = self.user_repo.create_user(
             first_name=first_name,
             last_name=last_name,
             email=email,
             rotation_city_id=rotation_city_id,
-            profile_picture=profile_picture
+            profile_picture_key=(
+                self.image_service.store(*picture) if picture else None
+            )
         )
 
         verification_code, code = (
@@ -119,24 +133,37 @@ class RegistrationService:
 
         return new_user
 
-    def _handle_expired_user(self, user: User, updates: dict):
+    def _handle_expired_user(
+        self,
+        user: User,
+        updates: dict,
+        picture: Optional[Tuple[bytes, str]] = None
+    ):
         """Handle logic for expired unverified users.
         
-        Updates user information and resends verification code.
+        Creates the new verification code first, so a rate-limited request
+        changes nothing, then updates user information and resends the code.
         
         Args:
             user: The existing unverified User object
             updates: Dictionary of fields to update
+            picture: Optional validated (bytes, content type) profile picture
             
         Returns:
             Updated User object
+            
+        Raises:
+            RateLimitExceededError: If too many codes were requested
         """
-        self.user_repo.update(user.user_id, **updates)
-
         verification_code, code = (
             self.verification_service.create_registration_code(user)
         )
 
+        updates['profile_picture_key'] = (
+            self.image_service.store(*picture) if picture else None
+        )
+        self.user_repo.update(user.user_id, **updates)
+
         self.notification_service.send_verification_code(
             user_email=user.email,
             name=user.first_name,
@@ -7,6 +7,20 @@ from flask import current_app
 class TokenService:
     """Service for generating and managing JWT tokens."""
 
+    @staticmethod
+    def _access_claims(user: User) -> dict:
+        """Build the additional claims carried by access tokens.
+        
+        ``rotation_city_id`` lets item routes scope queries without
+        loading the user; tokens must be re-issued when it changes.
+        """
+        return {
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'rotation_city_id': user.rotation_city_id
+        }
+
     @staticmethod
     def generate_tokens(user: User) -> dict:
         """Generate access and refresh tokens for user.
@@ -19,11 +33,7 @@ class TokenService:
         """
         access_token = create_access_token(
             identity=str(user.user_id),
-            additional_claims={
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name
-            }
+            additional_claims=TokenService._access_claims(user)
         )
         
         refresh_token = create_refresh_token(identity=str(user.user_id))
@@ -45,9 +55,5 @@ class TokenService:
         """
         return create_access_token(
             identity=str(user.user_id),
-            additional_claims={
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name
-            }
+            additional_claims=TokenService._access_claims(user)
         )
@@ -0,0 +1,23 @@
+"""
+Response Cache Module
+
+Pluggable caching of serialized API responses with explicit invalidation.
+"""
+
+from app.services.cache.item_list_cache import ItemListCache, get_item_list_cache
+from app.services.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from app.services.cache.exceptions import CacheError, CacheConfigurationError
+
+__all__ = [
+    'ItemListCache',
+    'get_item_list_cache',
+    'CacheBackend',
+    'MemoryCacheBackend',
+    'RedisCacheBackend',
+    'CacheError',
+    'CacheConfigurationError',
+]
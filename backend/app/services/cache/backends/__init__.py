@@ -0,0 +1,15 @@
+"""
+Cache Backends Module
+
+Contains implementations for different cache stores.
+"""
+
+from app.services.cache.backends.base import CacheBackend
+from app.services.cache.backends.memory_backend import MemoryCacheBackend
+from app.services.cache.backends.redis_backend import RedisCacheBackend
+
+__all__ = [
+    'CacheBackend',
+    'MemoryCacheBackend',
+    'RedisCacheBackend',
+]
@@ -0,0 +1,77 @@
+"""
+Cache Backend Interface
+
+Abstract base class for response cache backends.
+Enables swapping between an in-process LRU and a shared store.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheBackend(ABC):
+    """
+    Abstract base class for cache backends.
+    
+    Values are opaque bytes (pre-serialized response bodies). Counters are
+    kept apart from values so they are never evicted before their TTL.
+    """
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached bytes, or None on miss or expiry
+        """
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Store a value with a time-to-live.
+        
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time-to-live in seconds
+        """
+        pass
+    
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        """
+        Read an integer counter (0 if never incremented).
+        
+        Args:
+            key: Counter key
+        """
+        pass
+    
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """
+        Atomically increment a counter.
+        
+        Args:
+            key: Counter key
+            
+        Returns:
+            The new counter value
+        """
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every value and counter."""
+        pass
+    
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the backend name for logging and stats."""
+        pass
@@ -0,0 +1,77 @@
+"""
+In-Memory Backend
+
+Per-process LRU cache with time-to-live expiry.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.services.cache.backends.base import CacheBackend
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Cache backend that keeps entries in process memory.
+    
+    Least recently used entries are evicted beyond ``max_entries``. Each
+    gunicorn worker has its own copy, so invalidations only reach the worker
+    that performed the write; other workers converge within the TTL. Use
+    RedisCacheBackend when workers must agree immediately.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the memory backend.
+        
+        Args:
+            max_entries: Maximum number of cached values
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._counters: dict = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def name(self) -> str:
+        return "memory"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value, dropping it if expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value, evicting the least recently used beyond capacity."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_counter(self, key: str) -> int:
+        """Read a counter."""
+        with self._lock:
+            return self._counters.get(key, 0)
+    
+    def incr(self, key: str) -> int:
+        """Increment a counter under the lock."""
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+    
+    def clear(self) -> None:
+        """Remove every value and counter."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
@@ -0,0 +1,75 @@
+"""
+Redis Backend
+
+Cache shared by every gunicorn worker through a Redis server.
+"""
+
+from typing import Optional
+
+from app.services.cache.backends.base import CacheBackend
+from app.services.cache.exceptions import CacheConfigurationError
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend backed by Redis.
+    
+    All workers read and invalidate the same keys, so a write in one worker
+    is visible to the others on their next request. The ``redis`` package
+    is listed in requirements.txt but only imported when this backend is
+    configured.
+    """
+    
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = 'rr:'):
+        """
+        Initialize the Redis backend.
+        
+        Args:
+            client: Optional Redis client (anything with get/set/incr/scan_iter/delete)
+            url: Redis URL used to build a client when none is given
+            prefix: Namespace prepended to every key
+            
+        Raises:
+            CacheConfigurationError: If no client can be built
+        """
+        if client is None:
+            if not url:
+                raise CacheConfigurationError("REDIS_URL is required for the redis cache backend")
+            try:
+                import redis
+            except ImportError as e:
+                raise CacheConfigurationError(
+                    "The redis package is not installed; install requirements.txt "
+                    "or set ITEM_LIST_CACHE_BACKEND=memory", e
+                )
+            client = redis.Redis.from_url(url)
+        
+        self._client = client
+        self.prefix = prefix
+    
+    @property
+    def name(self) -> str:
+        return "redis"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value; Redis handles expiry."""
+        return self._client.get(self.prefix + key)
+    
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value with an expiry."""
+        self._client.set(self.prefix + key, value, ex=ttl)
+    
+    def get_counter(self, key: str) -> int:
+        """Read a counter."""
+        value = self._client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+    
+    def incr(self, key: str) -> int:
+        """Increment a counter with Redis INCR."""
+        return int(self._client.incr(self.prefix + key))
+    
+    def clear(self) -> None:
+        """Remove every key under this backend's prefix."""
+        keys = list(self._client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self._client.delete(*keys)
@@ -0,0 +1,24 @@
+"""
+Cache Exceptions
+
+Custom exceptions for cache-related errors.
+"""
+
+
+class CacheError(Exception):
+    """Base exception for cache-related errors."""
+    
+    def __init__(self, message: str, original_error: Exception = None):
+        super().__init__(message)
+        self.message = message
+        self.original_error = original_error
+    
+    def __str__(self):
+        if self.original_error:
+            return f"{self.message}: {str(self.original_error)}"
+        return self.message
+
+
+class CacheConfigurationError(CacheError):
+    """Raised when the cache configuration is invalid or incomplete."""
+    pass
@@ -0,0 +1,175 @@
+"""
+Item List Cache
+
+Caches serialized ``GET /item/`` response bodies per rotation city.
+
+Each city has a version counter that is part of every cache key. Writes
+bump the version instead of deleting keys, which invalidates every cached
+variant (full list, each page) of that city in one atomic step and lets
+old entries simply age out.
+
+The counter only sees writes made through a cache that shares its backend;
+with the per-process memory backend, other gunicorn workers and CLI jobs
+bump their own copy. Keys therefore also carry the response's ETag, which
+is derived from the database version token, so a body is never served
+under a version it wasn't built from.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from flask import current_app
+
+from app.services.cache.backends.base import CacheBackend
+from app.services.cache.backends.memory_backend import MemoryCacheBackend
+from app.services.cache.backends.redis_backend import RedisCacheBackend
+from app.services.cache.exceptions import CacheConfigurationError
+
+
+logger = logging.getLogger(__name__)
+
+_EXTENSION_KEY = 'item_list_cache'
+_create_lock = threading.Lock()
+
+
+class ItemListCache:
+    """
+    Per-city cache of item list response bodies.
+    
+    Usage:
+        cache = get_item_list_cache()
+        key = cache.key(city_id, 'all', etag)   # read the version before querying
+        body = cache.get(key)
+        if body is None:
+            body = build_response_body()
+            cache.set(key, body)
+        
+        # On any write that changes the city's items
+        cache.invalidate_city(city_id)
+    """
+    
+    def __init__(self, backend: CacheBackend, ttl: int = 60):
+        """
+        Initialize the cache.
+        
+        Args:
+            backend: Storage backend
+            ttl: Time-to-live for cached bodies in seconds
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._stats_lock = threading.Lock()
+    
+    @staticmethod
+    def _version_key(rotation_city_id: int) -> str:
+        return f"item-list:{rotation_city_id}:version"
+    
+    def version(self, rotation_city_id: int) -> int:
+        """Get the current version of a city's item list."""
+        return self.backend.get_counter(self._version_key(rotation_city_id))
+    
+    def key(self, rotation_city_id: int, variant: str, etag: str = '') -> str:
+        """
+        Build the cache key for one response variant of a city's list.
+        
+        Call this before loading from the database: a body built from data
+        read before a concurrent write is stored under the old version and
+        is never served once the write has bumped it.
+        
+        Args:
+            rotation_city_id: City the list belongs to
+            variant: Distinguishes pages and query options (e.g. ``all``)
+            etag: ETag of the response, built from the database version
+                token, so writes from other processes also change the key
+        """
+        version = self.version(rotation_city_id)
+        return f"item-list:{rotation_city_id}:v{version}:{variant}:{etag}"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached body and record a hit or miss."""
+        body = self.backend.get(key)
+        with self._stats_lock:
+            if body is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return body
+    
+    def set(self, key: str, body: bytes) -> None:
+        """Cache a response body under a key from ``key()``."""
+        self.backend.set(key, body, self.ttl)
+    
+    def invalidate_city(self, rotation_city_id: int) -> int:
+        """
+        Invalidate every cached list of a city.
+        
+        Returns:
+            The city's new version
+        """
+        with self._stats_lock:
+            self._invalidations += 1
+        return self.backend.incr(self._version_key(rotation_city_id))
+    
+    def stats(self) -> dict:
+        """Get hit/miss/invalidation counters for this worker."""
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                'backend': self.backend.name,
+                'hits': self._hits,
+                'misses': self._misses,
+                'invalidations': self._invalidations,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+    
+    def clear(self) -> None:
+        """Drop every entry and reset counters."""
+        self.backend.clear()
+        with self._stats_lock:
+            self._hits = self._misses = self._invalidations = 0
+
+
+def build_cache_backend(config) -> CacheBackend:
+    """
+    Build the cache backend selected by ITEM_LIST_CACHE_BACKEND.
+    
+    Raises:
+        CacheConfigurationError: If the backend name is unknown
+    """
+    backend = config.get('ITEM_LIST_CACHE_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemoryCacheBackend(config.get('ITEM_LIST_CACHE_MAX_ENTRIES', 256))
+    if backend == 'redis':
+        return RedisCacheBackend(url=config.get('REDIS_URL'))
+    raise CacheConfigurationError(f"Unknown cache backend: {backend}")
+
+
+def get_item_list_cache() -> ItemListCache:
+    """Get the item list cache of the current app, creating it on first use.
+    
+    A misconfigured backend is logged and replaced by the memory backend,
+    so a cache problem never fails the requests it should speed up.
+    """
+    extensions = current_app.extensions
+    cache = extensions.get(_EXTENSION_KEY)
+    if cache is None:
+        with _create_lock:
+            cache = extensions.get(_EXTENSION_KEY)
+            if cache is None:
+                try:
+                    backend = build_cache_backend(current_app.config)
+                except CacheConfigurationError as e:
+                    logger.error("Item list cache falls back to memory: %s", e)
+                    backend = MemoryCacheBackend(
+                        current_app.config.get('ITEM_LIST_CACHE_MAX_ENTRIES', 256)
+                    )
+                cache = ItemListCache(
+                    backend,
+                    ttl=current_app.config.get('ITEM_LIST_CACHE_TTL_SECONDS', 60)
+                )
+                extensions[_EXTENSION_KEY] = cache
+    return cache
@@ -5,6 +5,8 @@ Business logic layer for category operations.
 from typing import List, Optional
 from app.models.category import Category
 from app.repositories.implementations.category_repository import CategoryRepository
+from app.repositories.implementations.category_item_repository import CategoryItemRepository
+from app.services.item_service import ItemService
 
 
 class CategoryService:
@@ -16,6 +18,8 @@ class CategoryService:
     def __init__(self):
         """Initialize service with CategoryRepository."""
         self.repository = CategoryRepository()
+        self.category_item_repository = CategoryItemRepository()
+        self.item_service = ItemService()
 
     def get_all_categories(self) -> List[Category]:
         """Retrieve all categories.
@@ -25,6 +29,14 @@ class CategoryService:
         """
         return self.repository.get_all_categories()
 
+    def get_categories_version(self) -> tuple:
+        """Get a cheap version token for the category list.
+        
+        Returns:
+            Tuple that changes when categories are added or removed
+        """
+        return self.repository.get_categories_version()
+
     def get_category_by_id(self, category_id: int) -> Optional[Category]:
         """Retrieve a category by its ID.
         
@@ -56,6 +68,9 @@ class CategoryService:
     ) -> Optional[Category]:
         """Update an existing category.
         
+        Items embed their categories, so every item in the category is
+        marked as changed.
+        
         Args:
             category_id: The ID of the category to update
             category_name: Optional new name for the category
@@ -64,7 +79,12 @@ class CategoryService:
         Returns:
             Updated Category object if found, None otherwise
         """
-        return self.repository.update_category(category_id, category_name, category_pic)
+        category = self.repository.update_category(category_id, category_name, category_pic)
+        if category:
+            self.item_service.mark_items_changed(
+                self.category_item_repository.get_item_ids(category_id)
+            )
+        return category
 
     def delete_category(self, category_id: int) -> bool:
         """Delete a category.
@@ -75,4 +95,8 @@ class CategoryService:
         Returns:
             True if deletion was successful, False otherwise
         """
-        return self.repository.delete_category(category_id)
+        item_ids = self.category_item_repository.get_item_ids(category_id)
+        deleted = self.repository.delete_category(category_id)
+        if deleted:
+            self.item_service.mark_items_changed(item_ids)
+        return deleted
@@ -0,0 +1,27 @@
+"""
+Geocoding Module
+
+Turns free-text item locations into coordinates with a pluggable
+geocoder, caching results by normalized address.
+"""
+
+from app.services.geocoding.addresses import normalize_address
+from app.services.geocoding.backfill import geocode_items, get_geocoding_provider
+from app.services.geocoding.exceptions import (
+    GeocodingError,
+    GeocoderConfigurationError,
+)
+from app.services.geocoding.providers import (
+    GeocodingProvider,
+    GazetteerGeocodingProvider,
+)
+
+__all__ = [
+    'normalize_address',
+    'geocode_items',
+    'get_geocoding_provider',
+    'GeocodingError',
+    'GeocoderConfigurationError',
+    'GeocodingProvider',
+    'GazetteerGeocodingProvider',
+]
@@ -0,0 +1,34 @@
+"""
+Address Normalization
+
+Canonical form of free-text addresses, used as the geocoding cache key
+and as the gazetteer lookup key.
+"""
+
+import re
+import unicodedata
+
+_NON_WORD = re.compile(r'[^\w,]+')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_address(address: str) -> str:
+    """
+    Normalize an address so trivially different spellings share a key.
+    
+    Lowercases, strips accents, turns punctuation other than commas into
+    spaces and collapses whitespace around commas, so
+    ``"Av. Santa Fé  1860,Buenos Aires"`` becomes
+    ``"av santa fe 1860, buenos aires"``.
+    
+    Args:
+        address: Free-text address
+        
+    Returns:
+        Normalized address (empty if nothing is left)
+    """
+    decomposed = unicodedata.normalize('NFKD', address or '')
+    ascii_only = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    words = _NON_WORD.sub(' ', ascii_only.lower()).replace('_', ' ')
+    parts = (_SPACES.sub(' ', part).strip() for part in words.split(','))
+    return ', '.join(part for part in parts if part)
@@ -0,0 +1,220 @@
+"""
+Item Geocoding Backfill
+
+Fills ``Item.latitude`` and ``Item.longitude`` for items created before
+coordinates were collected, by geocoding their ``location`` text. Each
+distinct address is looked up once: results, misses included, are kept in
+``geocode_cache`` under the normalized address, so re-runs only look up
+addresses they have not seen. Items keep NULL coordinates while the job
+runs, so an interrupted run resumes where it stopped when started again.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import db
+from app.models.geocode_cache import GeocodeCache
+from app.models.item import Item
+from app.services.cache import get_item_list_cache
+from app.services.geocoding.addresses import normalize_address
+from app.services.geocoding.exceptions import GeocoderConfigurationError, GeocodingError
+from app.services.geocoding.providers import GazetteerGeocodingProvider, GeocodingProvider
+from app.utils.geo import encode_geohash
+
+
+logger = logging.getLogger(__name__)
+
+Coordinates = Optional[Tuple[float, float]]
+
+_ADDRESS_KEY_LENGTH = GeocodeCache.__table__.c.address_key.type.length
+
+
+def get_geocoding_provider() -> GeocodingProvider:
+    """Create the geocoder selected by ``GEOCODER_BACKEND``.
+    
+    Raises:
+        GeocoderConfigurationError: If the backend is unknown or its
+            configuration is unusable
+    """
+    backend = current_app.config.get('GEOCODER_BACKEND', 'gazetteer')
+    if backend != 'gazetteer':
+        raise GeocoderConfigurationError(f"Unknown geocoder backend: {backend}")
+    
+    return GazetteerGeocodingProvider(current_app.config['GEOCODER_GAZETTEER_PATH'])
+
+
+def geocode_items(
+    provider: Optional[GeocodingProvider] = None,
+    batch_size: int = 200,
+    workers: Optional[int] = None,
+    retry_misses: bool = False
+) -> Dict[str, int]:
+    """Geocode the locations of items that have no coordinates.
+    
+    Items without coordinates are scanned in primary-key order. For each
+    batch the cached results are read in one query, the remaining
+    addresses are looked up by ``workers`` threads, and the new results
+    and item coordinates are written and committed together. Worker
+    threads only call the provider; all database work stays on the
+    calling thread. Item updates are guarded by ``latitude IS NULL`` so
+    coordinates set by a user while the job runs are kept.
+    
+    Args:
+        provider: Geocoder to use (defaults to the configured one)
+        batch_size: Number of items handled per commit
+        workers: Number of concurrent lookups (defaults to
+            ``GEOCODER_WORKERS``)
+        retry_misses: Look up again addresses cached as not found, e.g.
+            after the gazetteer was extended
+    
+    Returns:
+        Dict with counts of ``checked``, ``geocoded``, ``not_found`` and
+        ``failed`` items, and of address ``lookups`` and ``cache_hits``
+    """
+    provider = provider or get_geocoding_provider()
+    workers = workers or current_app.config.get('GEOCODER_WORKERS', 4)
+    stats = {
+        'checked': 0, 'geocoded': 0, 'not_found': 0, 'failed': 0,
+        'lookups': 0, 'cache_hits': 0,
+    }
+    cities = set()
+    table = Item.__table__
+    statement = (
+        update(table)
+        .where(table.c.item_id == bindparam('b_item_id'), table.c.latitude.is_(None))
+        .values(
+            latitude=bindparam('b_latitude'),
+            longitude=bindparam('b_longitude'),
+            geohash=bindparam('b_geohash'),
+            updated_at=bindparam('b_updated_at')
+        )
+    )
+    
+    last_id = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            rows = db.session.execute(
+                select(Item.item_id, Item.rotation_city_id, Item.location)
+                .where(Item.item_id > last_id, Item.latitude.is_(None))
+                .order_by(Item.item_id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            
+            keys = {
+                item_id: normalize_address(location)[:_ADDRESS_KEY_LENGTH]
+                for item_id, _, location in rows
+            }
+            results = _cached_results({key for key in keys.values() if key}, retry_misses)
+            pending = sorted({key for key in keys.values() if key} - results.keys())
+            found = dict(
+                (address, coordinates)
+                for address, coordinates in pool.map(lambda a: _lookup(provider, a), pending)
+                if coordinates is not False
+            )
+            _store_results(found, provider.name)
+            results.update(found)
+            
+            params = []
+            changed_at = datetime.utcnow()
+            for item_id, city_id, _ in rows:
+                key = keys[item_id]
+                if key and key not in results:
+                    stats['failed'] += 1
+                elif results.get(key) is None:
+                    stats['not_found'] += 1
+                else:
+                    latitude, longitude = results[key]
+                    params.append({
+                        'b_item_id': item_id,
+                        'b_latitude': latitude,
+                        'b_longitude': longitude,
+                        'b_geohash': encode_geohash(latitude, longitude),
+                        'b_updated_at': changed_at,
+                    })
+                    cities.add(city_id)
+            if params:
+                db.session.execute(statement, params)
+            db.session.commit()
+            
+            stats['checked'] += len(rows)
+            stats['geocoded'] += len(params)
+            stats['lookups'] += len(pending)
+            stats['cache_hits'] += len(results) - len(found)
+            last_id = rows[-1][0]
+    
+    cache = get_item_list_cache()
+    for city_id in cities:
+        cache.invalidate_city(city_id)
+    
+    logger.info("Item geocoding finished: %s", stats)
+    return stats
+
+
+def _lookup(provider: GeocodingProvider, address: str):
+    """Geocode one address on a worker thread.
+    
+    Returns:
+        (address, coordinates), with coordinates False if the lookup
+        failed and should be retried on a later run
+    """
+    try:
+        return address, provider.geocode(address)
+    except GeocodingError as e:
+        logger.warning("Geocoding %r failed: %s", address, e)
+        return address, False
+
+
+def _cached_results(keys: Iterable[str], retry_misses: bool) -> Dict[str, Coordinates]:
+    """Load cached results for the given normalized addresses."""
+    keys = list(keys)
+    if not keys:
+        return {}
+    query = select(
+        GeocodeCache.address_key, GeocodeCache.latitude, GeocodeCache.longitude
+    ).where(GeocodeCache.address_key.in_(keys))
+    if retry_misses:
+        query = query.where(GeocodeCache.latitude.isnot(None))
+    return {
+        key: None if latitude is None else (latitude, longitude)
+        for key, latitude, longitude in db.session.execute(query)
+    }
+
+
+def _store_results(results: Dict[str, Coordinates], provider_name: str) -> None:
+    """Upsert looked-up results into the cache. Does not commit."""
+    if not results:
+        return
+    rows = [
+        {
+            'address_key': key,
+            'latitude': coordinates[0] if coordinates else None,
+            'longitude': coordinates[1] if coordinates else None,
+            'provider': provider_name,
+        }
+        for key, coordinates in results.items()
+    ]
+    dialect = db.session.get_bind().dialect.name
+    if dialect not in ('postgresql', 'sqlite'):
+        for row in rows:
+            db.session.merge(GeocodeCache(**row))
+        db.session.flush()
+        return
+    
+    dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    stmt = dialect_insert(GeocodeCache.__table__).values(rows)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=[GeocodeCache.address_key],
+        set_={
+            'latitude': stmt.excluded.latitude,
+            'longitude': stmt.excluded.longitude,
+            'provider': stmt.excluded.provider,
+        }
+    ))
@@ -0,0 +1,19 @@
+"""
+Geocoding Exceptions
+
+Custom exceptions for geocoding errors.
+"""
+
+
+class GeocodingError(Exception):
+    """Base exception for geocoding errors.
+    
+    Raised by providers for lookups that failed and may succeed on a
+    later run (as opposed to an address that simply has no match).
+    """
+    pass
+
+
+class GeocoderConfigurationError(GeocodingError):
+    """Raised when the geocoder configuration is invalid or incomplete."""
+    pass
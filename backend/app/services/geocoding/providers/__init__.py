@@ -0,0 +1,13 @@
+"""
+Geocoding Providers Module
+
+Contains implementations for different geocoders.
+"""
+
+from app.services.geocoding.providers.base import GeocodingProvider
+from app.services.geocoding.providers.gazetteer_provider import GazetteerGeocodingProvider
+
+__all__ = [
+    'GeocodingProvider',
+    'GazetteerGeocodingProvider',
+]
@@ -0,0 +1,39 @@
+"""
+Geocoding Provider Interface
+
+Abstract base class for geocoders.
+Enables swapping between an offline gazetteer and online services.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class GeocodingProvider(ABC):
+    """
+    Abstract base class for geocoding providers.
+    
+    Providers receive addresses already normalized by
+    ``normalize_address``. Backfills call ``geocode`` from several worker
+    threads at once, so implementations must be thread-safe and must not
+    touch the database session.
+    """
+    
+    #: Recorded with each cached result
+    name = 'base'
+    
+    @abstractmethod
+    def geocode(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        Look up the coordinates of an address.
+        
+        Args:
+            address: Normalized address
+            
+        Returns:
+            (latitude, longitude) in degrees, or None if there is no match
+            
+        Raises:
+            GeocodingError: If the lookup failed and may be retried later
+        """
+        pass
@@ -0,0 +1,63 @@
+"""
+Gazetteer Geocoding Provider
+
+Offline geocoder backed by a local CSV file of known addresses.
+"""
+
+import csv
+from typing import Dict, Optional, Tuple
+
+from app.services.geocoding.addresses import normalize_address
+from app.services.geocoding.exceptions import GeocoderConfigurationError
+from app.services.geocoding.providers.base import GeocodingProvider
+
+
+class GazetteerGeocodingProvider(GeocodingProvider):
+    """
+    Geocoder that matches addresses against a gazetteer file.
+    
+    The file is a CSV with ``address``, ``latitude`` and ``longitude``
+    columns. It is read once into a dict keyed by normalized address, so
+    lookups are exact matches, need no network and are thread-safe.
+    """
+    
+    name = 'gazetteer'
+    
+    def __init__(self, path: str):
+        """
+        Load the gazetteer.
+        
+        Args:
+            path: Path to the gazetteer CSV file
+            
+        Raises:
+            GeocoderConfigurationError: If the file is missing or malformed
+        """
+        self.path = path
+        self._entries = self._load(path)
+    
+    @staticmethod
+    def _load(path: str) -> Dict[str, Tuple[float, float]]:
+        entries = {}
+        try:
+            with open(path, newline='', encoding='utf-8') as handle:
+                for line, row in enumerate(csv.DictReader(handle), start=2):
+                    try:
+                        coordinates = (float(row['latitude']), float(row['longitude']))
+                        if not (-90 <= coordinates[0] <= 90 and -180 <= coordinates[1] <= 180):
+                            raise ValueError(coordinates)
+                        entries[normalize_address(row['address'])] = coordinates
+                    except (KeyError, TypeError, ValueError):
+                        raise GeocoderConfigurationError(
+                            f"Invalid gazetteer row {line} in {path}"
+                        )
+        except OSError as e:
+            raise GeocoderConfigurationError(f"Cannot read gazetteer {path}: {e}")
+        return entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def geocode(self, address: str) -> Optional[Tuple[float, float]]:
+        """Look up an address in the gazetteer."""
+        return self._entries.get(address)
@@ -0,0 +1,20 @@
+"""
+Image Storage Module
+
+Content-addressed storage for user avatars and category icons, replacing
+base64 images stored inline in database rows.
+"""
+
+from app.services.images.image_service import ImageService
+from app.services.images.exceptions import (
+    ImageStorageError,
+    InvalidImageError,
+    ImageNotFoundError,
+)
+
+__all__ = [
+    'ImageService',
+    'ImageStorageError',
+    'InvalidImageError',
+    'ImageNotFoundError',
+]
@@ -0,0 +1,24 @@
+"""
+Image Storage Exceptions
+
+Custom exceptions for image storage errors.
+"""
+
+
+class ImageStorageError(Exception):
+    """Base exception for image storage errors."""
+    pass
+
+
+class InvalidImageError(ImageStorageError, ValueError):
+    """Raised when image data cannot be decoded or has an unsupported type.
+    
+    Also a ValueError, so routes report it as a client error like other
+    input validation failures.
+    """
+    pass
+
+
+class ImageNotFoundError(ImageStorageError):
+    """Raised when no image is stored under the requested key."""
+    pass
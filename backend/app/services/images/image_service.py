@@ -0,0 +1,178 @@
+"""
+Image Service
+
+Content-addressed image storage. Images are keyed by the SHA-256 of their
+bytes, so identical uploads share one file, keys never change meaning, and
+responses for a key can be cached forever.
+"""
+
+import hashlib
+import logging
+import mimetypes
+from typing import Optional, Tuple
+
+from flask import current_app
+
+from app.services.images.exceptions import ImageNotFoundError, ImageStorageError, InvalidImageError
+from app.services.images.providers.base import ImageStorageProvider
+from app.services.images.providers.database_provider import DatabaseImageStorageProvider
+from app.services.images.providers.local_provider import LocalImageStorageProvider
+from app.utils.images import decode_image_data, sniff_image_type
+
+
+logger = logging.getLogger(__name__)
+
+# Extensions for the image types the frontend uploads. Raster only: images
+# are served from the API's origin, where an SVG could run script.
+_EXTENSIONS = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+}
+
+
+class ImageService:
+    """
+    Service for storing and locating images by content hash.
+    
+    Usage:
+        image_service = ImageService()
+        key = image_service.store_base64(profile_picture)
+        path = image_service.path(key)
+    """
+    
+    def __init__(self, provider: Optional[ImageStorageProvider] = None):
+        """
+        Initialize the image service.
+        
+        Args:
+            provider: Optional storage provider. If not provided, one is built
+                     from the IMAGE_STORAGE_* configuration.
+        """
+        self._provider = provider
+    
+    @property
+    def provider(self) -> ImageStorageProvider:
+        """Get the configured storage provider."""
+        if self._provider:
+            return self._provider
+        
+        backend = current_app.config.get('IMAGE_STORAGE_BACKEND', 'local')
+        if backend == 'local':
+            return LocalImageStorageProvider(current_app.config['IMAGE_STORAGE_PATH'])
+        if backend == 'database':
+            return DatabaseImageStorageProvider(current_app.config['IMAGE_STORAGE_PATH'])
+        raise ImageStorageError(f"Unknown image storage backend: {backend}")
+    
+    @staticmethod
+    def build_key(data: bytes, mimetype: str) -> str:
+        """
+        Compute the content-addressed key for image bytes.
+        
+        Args:
+            data: Raw image bytes
+            mimetype: Image content type
+            
+        Returns:
+            Key of the form ``<sha256 hex><extension>``
+            
+        Raises:
+            InvalidImageError: If the mimetype is not a supported image type
+        """
+        extension = _EXTENSIONS.get(mimetype)
+        if not extension:
+            raise InvalidImageError(f"Unsupported image type: {mimetype}")
+        return hashlib.sha256(data).hexdigest() + extension
+    
+    def validate(self, data: bytes, mimetype: str) -> None:
+        """
+        Check that bytes are a supported image of the given type.
+        
+        Raises:
+            InvalidImageError: If the data is empty, of an unsupported type
+                or not actually an image of the given type
+        """
+        if not data:
+            raise InvalidImageError("Image data is empty")
+        if mimetype not in _EXTENSIONS:
+            raise InvalidImageError(f"Unsupported image type: {mimetype}")
+        if sniff_image_type(data) != mimetype:
+            raise InvalidImageError(f"Image data is not a valid {mimetype} file")
+    
+    def store(self, data: bytes, mimetype: str) -> str:
+        """
+        Store image bytes and return their key.
+        
+        Args:
+            data: Raw image bytes
+            mimetype: Image content type
+            
+        Returns:
+            Content-addressed key
+            
+        Raises:
+            InvalidImageError: If the data is empty, of an unsupported type
+                or not actually an image of the given type
+            ImageStorageError: If the provider fails to write the image
+        """
+        self.validate(data, mimetype)
+        key = self.build_key(data, mimetype)
+        self.provider.save(key, data)
+        return key
+    
+    def decode_base64(self, data: str) -> Tuple[bytes, str]:
+        """
+        Decode and validate a base64 string or data URL without storing it.
+        
+        Args:
+            data: Base64 image string as sent by clients
+            
+        Returns:
+            Tuple of (image bytes, content type)
+            
+        Raises:
+            InvalidImageError: If the string is not a valid image
+        """
+        try:
+            image_bytes, mimetype = decode_image_data(data)
+        except ValueError as e:
+            raise InvalidImageError(str(e))
+        if not data.startswith('data:'):
+            # Bare base64 declares no type of its own
+            mimetype = sniff_image_type(image_bytes) or mimetype
+        self.validate(image_bytes, mimetype)
+        return image_bytes, mimetype
+    
+    def store_base64(self, data: str) -> str:
+        """
+        Decode a base64 string or data URL and store the image.
+        
+        Args:
+            data: Base64 image string as sent by clients
+            
+        Returns:
+            Content-addressed key
+            
+        Raises:
+            InvalidImageError: If the string is not a valid image
+        """
+        return self.store(*self.decode_base64(data))
+    
+    def path(self, key: str) -> str:
+        """
+        Get the local file path for a stored image.
+        
+        Raises:
+            ImageNotFoundError: If no image is stored under the key, or the
+                key is not of a supported image type
+        """
+        if self.mimetype_for_key(key) not in _EXTENSIONS:
+            raise ImageNotFoundError(f"Image {key} not found")
+        return self.provider.path(key)
+    
+    @staticmethod
+    def mimetype_for_key(key: str) -> str:
+        """Get the content type implied by a key's extension."""
+        mimetype, _ = mimetypes.guess_type(key)
+        return mimetype or 'application/octet-stream'
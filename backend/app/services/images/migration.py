@@ -0,0 +1,82 @@
+"""
+Inline Image Migration
+
+Moves base64 images stored in ``user.profile_picture`` and
+``category.category_pic`` into the image store, records the resulting
+keys and clears the inline columns, so row fetches no longer carry them.
+"""
+
+import logging
+from typing import Dict, Optional
+
+from app import db
+from app.models.user import User
+from app.models.category import Category
+from app.services.images.image_service import ImageService
+from app.services.images.exceptions import InvalidImageError
+
+
+logger = logging.getLogger(__name__)
+
+# (model, primary key column, inline base64 column, key column)
+_IMAGE_COLUMNS = [
+    (User, User.user_id, User.profile_picture, User.profile_picture_key),
+    (Category, Category.category_id, Category.category_pic, Category.category_pic_key),
+]
+
+
+def migrate_inline_images(
+    image_service: Optional[ImageService] = None,
+    batch_size: int = 100
+) -> Dict[str, int]:
+    """Move every inline base64 image into the image store.
+
+    Rows are processed in primary-key batches, selecting only the id and
+    image columns, and committed per batch so the job can be interrupted
+    and re-run. Rows whose data cannot be decoded are left untouched.
+
+    Args:
+        image_service: Optional ImageService (defaults to configured store)
+        batch_size: Number of rows per batch
+
+    Returns:
+        Dict with ``migrated`` and ``failed`` row counts
+    """
+    image_service = image_service or ImageService()
+    stats = {'migrated': 0, 'failed': 0}
+
+    for model, id_column, inline_column, key_column in _IMAGE_COLUMNS:
+        last_id = 0
+        while True:
+            rows = db.session.execute(
+                db.select(id_column, inline_column)
+                .filter(id_column > last_id)
+                .filter(inline_column.isnot(None))
+                .filter(key_column.is_(None))
+                .order_by(id_column)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            for row_id, data in rows:
+                last_id = row_id
+                try:
+                    key = image_service.store_base64(data)
+                except InvalidImageError as e:
+                    logger.warning(
+                        "Skipping %s %s: %s", model.__tablename__, row_id, e
+                    )
+                    stats['failed'] += 1
+                    continue
+
+                db.session.execute(
+                    db.update(model)
+                    .where(id_column == row_id)
+                    .values({key_column: key, inline_column: None})
+                )
+                stats['migrated'] += 1
+
+            db.session.commit()
+
+    return stats
@@ -0,0 +1,15 @@
+"""
+Image Storage Providers Module
+
+Contains implementations for different image storage backends.
+"""
+
+from app.services.images.providers.base import ImageStorageProvider
+from app.services.images.providers.local_provider import LocalImageStorageProvider
+from app.services.images.providers.database_provider import DatabaseImageStorageProvider
+
+__all__ = [
+    'ImageStorageProvider',
+    'LocalImageStorageProvider',
+    'DatabaseImageStorageProvider',
+]
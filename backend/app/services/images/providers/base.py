@@ -0,0 +1,66 @@
+"""
+Image Storage Provider Interface
+
+Abstract base class for image storage backends.
+Enables swapping between local disk, object storage, etc.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ImageStorageProvider(ABC):
+    """
+    Abstract base class for image storage providers.
+    
+    Providers store opaque bytes under a key chosen by ImageService. Keys
+    are content hashes, so a key is written at most once and never changes.
+    """
+    
+    @abstractmethod
+    def save(self, key: str, data: bytes) -> None:
+        """
+        Store image bytes under a key. Saving an existing key is a no-op.
+        
+        Args:
+            key: Content-addressed storage key
+            data: Raw image bytes
+            
+        Raises:
+            ImageStorageError: If the image could not be written
+        """
+        pass
+    
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """
+        Check whether an image is stored under a key.
+        
+        Args:
+            key: Content-addressed storage key
+            
+        Returns:
+            True if the image exists
+        """
+        pass
+    
+    @abstractmethod
+    def path(self, key: str) -> str:
+        """
+        Return a local filesystem path for the stored image.
+        
+        Args:
+            key: Content-addressed storage key
+            
+        Returns:
+            Absolute path suitable for send_file
+            
+        Raises:
+            ImageNotFoundError: If no image is stored under the key
+        """
+        pass
+    
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the provider name for logging purposes."""
+        pass
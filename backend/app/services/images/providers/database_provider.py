@@ -0,0 +1,79 @@
+"""
+Database Provider
+
+Stores image bytes in the ``image_blob`` table, for hosts without a
+persistent disk.
+"""
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import db
+from app.models.image_blob import ImageBlob
+from app.services.images.providers.base import ImageStorageProvider
+from app.services.images.providers.local_provider import LocalImageStorageProvider
+from app.services.images.exceptions import ImageNotFoundError
+
+
+class DatabaseImageStorageProvider(ImageStorageProvider):
+    """
+    Image provider backed by the application database.
+    
+    The database row is the durable copy. ``path`` writes the bytes to a
+    local cache directory on first use so responses are still streamed
+    from a file; the cache may be wiped on every restart.
+    
+    ``save`` does not commit: the image becomes visible in the same commit
+    as the row that references its key, and disappears with it on rollback.
+    """
+    
+    def __init__(self, cache_root: str):
+        """
+        Initialize the database provider.
+        
+        Args:
+            cache_root: Directory for the local file cache
+        """
+        self.cache = LocalImageStorageProvider(cache_root)
+    
+    @property
+    def name(self) -> str:
+        return "Database"
+    
+    def save(self, key: str, data: bytes) -> None:
+        """Insert the image unless a row with the key already exists."""
+        row = {'image_key': key, 'data': data}
+        dialect = db.session.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+            db.session.execute(
+                dialect_insert(ImageBlob.__table__).on_conflict_do_nothing(
+                    index_elements=[ImageBlob.image_key]
+                ),
+                row
+            )
+        elif not self.exists(key):
+            db.session.execute(insert(ImageBlob.__table__), row)
+    
+    def exists(self, key: str) -> bool:
+        """Check whether a row holds the image."""
+        return db.session.execute(
+            db.select(
+                db.select(ImageBlob.image_key).filter_by(image_key=key).exists()
+            )
+        ).scalar()
+    
+    def path(self, key: str) -> str:
+        """Return the cached file for an image, filling the cache from the row."""
+        try:
+            return self.cache.path(key)
+        except ImageNotFoundError:
+            pass
+        
+        data = db.session.execute(
+            db.select(ImageBlob.data).filter_by(image_key=key)
+        ).scalar_one_or_none()
+        if data is None:
+            raise ImageNotFoundError(f"Image {key} not found")
+        self.cache.save(key, data)
+        return self.cache.path(key)
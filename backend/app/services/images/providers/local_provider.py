@@ -0,0 +1,75 @@
+"""
+Local Filesystem Provider
+
+Stores images as files under a root directory, sharded by key prefix.
+"""
+
+import os
+import tempfile
+
+from app.services.images.providers.base import ImageStorageProvider
+from app.services.images.exceptions import ImageNotFoundError, ImageStorageError
+
+
+class LocalImageStorageProvider(ImageStorageProvider):
+    """
+    Image provider backed by the local filesystem.
+    
+    Files live at ``<root>/<key[:2]>/<key>`` so no single directory grows
+    too large. Writes go through a temporary file and an atomic rename, so
+    concurrent workers storing the same image never expose a partial file.
+    """
+    
+    def __init__(self, root: str):
+        """
+        Initialize the local provider.
+        
+        Args:
+            root: Directory under which images are stored
+        """
+        self.root = os.path.abspath(root)
+    
+    @property
+    def name(self) -> str:
+        return "Local Filesystem"
+    
+    def _file_path(self, key: str) -> str:
+        """Build the sharded file path for a key."""
+        if not key or os.sep in key or '/' in key or key.startswith('.'):
+            raise ImageNotFoundError(f"Invalid image key: {key}")
+        return os.path.join(self.root, key[:2], key)
+    
+    def save(self, key: str, data: bytes) -> None:
+        """Write image bytes atomically unless the key already exists."""
+        target = self._file_path(key)
+        if os.path.exists(target):
+            return
+        
+        directory = os.path.dirname(target)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, target)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            raise ImageStorageError(f"Could not store image {key}: {e}")
+    
+    def exists(self, key: str) -> bool:
+        """Check whether the image file exists."""
+        try:
+            return os.path.isfile(self._file_path(key))
+        except ImageNotFoundError:
+            return False
+    
+    def path(self, key: str) -> str:
+        """Return the absolute file path for a stored image."""
+        target = self._file_path(key)
+        if not os.path.isfile(target):
+            raise ImageNotFoundError(f"Image {key} not found")
+        return target
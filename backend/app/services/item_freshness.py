@@ -0,0 +1,91 @@
+"""
+Item Freshness
+
+``Item.freshness_score`` is reset by ``VerificationService`` whenever an
+item is verified. Between verifications it only decays with time, so this
+periodic job recomputes every score at the current time (see
+``app.utils.freshness``). Run it daily; scores in a list are comparable
+with each other once a run has finished.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, func, select, update
+
+from app import db
+from app.models.item import Item
+from app.services.cache import get_item_list_cache
+from app.utils.freshness import compute_freshness
+
+
+logger = logging.getLogger(__name__)
+
+
+def decay_freshness_scores(batch_size: int = 1000, now: Optional[datetime] = None) -> Dict[str, int]:
+    """Recompute every item's freshness score at the given time.
+
+    Items are scanned in primary-key order and written back with one
+    executemany ``UPDATE`` per batch. Each row's update is guarded by the
+    verification count it was computed from, so an item verified while
+    the job runs keeps the score its verification set.
+
+    Args:
+        batch_size: Number of items recomputed per commit
+        now: Time to score at (defaults to the current UTC time)
+
+    Returns:
+        Dict with counts of ``checked`` and ``updated`` items
+    """
+    now = now or datetime.utcnow()
+    stats = {'checked': 0, 'updated': 0}
+    cities = set()
+    table = Item.__table__
+    statement = (
+        update(table)
+        .where(
+            table.c.item_id == bindparam('b_item_id'),
+            func.coalesce(table.c.number_of_verifications, 0) == bindparam('b_count')
+        )
+        .values(freshness_score=bindparam('b_score'))
+    )
+
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            select(
+                Item.item_id,
+                Item.rotation_city_id,
+                Item.number_of_verifications,
+                Item.last_verified_date,
+                Item.created_at,
+                Item.freshness_score
+            )
+            .where(Item.item_id > last_id)
+            .order_by(Item.item_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        params = []
+        for item_id, city_id, count, last_verified, created_at, stored in rows:
+            score = compute_freshness(count, last_verified, created_at, now)
+            if stored != score:
+                params.append({'b_item_id': item_id, 'b_count': count or 0, 'b_score': score})
+                cities.add(city_id)
+        if params:
+            db.session.execute(statement, params)
+        db.session.commit()
+
+        stats['checked'] += len(rows)
+        stats['updated'] += len(params)
+        last_id = rows[-1][0]
+
+    cache = get_item_list_cache()
+    for city_id in cities:
+        cache.invalidate_city(city_id)
+
+    logger.info("Freshness decay finished: %s", stats)
+    return stats
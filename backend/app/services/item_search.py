@@ -0,0 +1,140 @@
+"""
+Item Search
+
+Builds the documents behind ``GET /item/search`` and maintains the
+full-text index (see ``app.models.item_search``). ``ItemService`` indexes
+items as it creates them; ``rebuild_item_search_index`` fills the index
+for existing databases and refreshes it after edits made elsewhere.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import select, text
+
+from app import db
+from app.models.item import Item
+from app.models.item_search import (
+    POSTGRESQL_COLUMN_DDL,
+    POSTGRESQL_INDEX_DDL,
+    SQLITE_TABLE_DDL,
+)
+from app.models.tag import TagValueType
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.item_search_repository import ItemSearchRepository
+
+
+logger = logging.getLogger(__name__)
+
+MAX_SEARCH_TERMS = 8
+
+# Letters and digits only, so terms are safe inside tsquery and FTS5 syntax
+_TERM = re.compile(r'[^\W_]+')
+
+
+def search_terms(query: str) -> List[str]:
+    """Split a search query into lowercase words.
+
+    Args:
+        query: Raw ``q`` parameter
+
+    Returns:
+        Up to MAX_SEARCH_TERMS words
+
+    Raises:
+        ValueError: If the query contains no words
+    """
+    terms = _TERM.findall((query or '').lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    return terms
+
+
+def search_document(
+    item: Item,
+    category_names: Iterable[str],
+    text_values: Iterable[str]
+) -> Tuple[int, str, str]:
+    """Build the (item_id, title, body) search document of an item.
+
+    Args:
+        item: The item; its name is the title
+        category_names: Names of the item's categories
+        text_values: The item's text tag values
+
+    Returns:
+        Document tuple for ``ItemSearchRepository.index_items``
+    """
+    body = '\n'.join([item.location or '', *category_names, *text_values])
+    return item.item_id, item.name, body
+
+
+def item_search_document(item: Item) -> Tuple[int, str, str]:
+    """Build the search document of an item with its relationships loaded."""
+    return search_document(
+        item,
+        [ci.category.category_name for ci in item.category_items],
+        [
+            itv.value.name_val
+            for itv in item.item_tag_values
+            if itv.value.tag.value_type_label == TagValueType.TEXT.label and itv.value.name_val
+        ]
+    )
+
+
+def index_items(item_ids: List[int]) -> None:
+    """Rebuild the search documents of the given items. Does not commit."""
+    items = ItemRepository().get_items_by_ids_with_details(item_ids)
+    ItemSearchRepository().index_items([item_search_document(item) for item in items])
+
+
+def ensure_item_search_index() -> None:
+    """Create the search column and index or table on an existing database.
+
+    New databases get them with the ``item`` table. On PostgreSQL the GIN
+    index is built concurrently so the table stays writable.
+    """
+    engine = db.engine
+    if engine.dialect.name == 'sqlite':
+        with engine.begin() as conn:
+            conn.execute(text(SQLITE_TABLE_DDL))
+    elif engine.dialect.name == 'postgresql':
+        with engine.begin() as conn:
+            conn.execute(text(POSTGRESQL_COLUMN_DDL))
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.execute(text(POSTGRESQL_INDEX_DDL.format(concurrently='CONCURRENTLY ')))
+
+
+def rebuild_item_search_index(batch_size: int = 500) -> Dict[str, int]:
+    """Rewrite the search document of every item.
+
+    Items are processed in primary-key order and each batch is committed
+    on its own.
+
+    Args:
+        batch_size: Number of items indexed per commit
+
+    Returns:
+        Dict with the count of ``indexed`` items
+    """
+    stats = {'indexed': 0}
+    last_id = 0
+    while True:
+        item_ids = db.session.execute(
+            select(Item.item_id)
+            .where(Item.item_id > last_id)
+            .order_by(Item.item_id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not item_ids:
+            break
+
+        index_items(item_ids)
+        db.session.commit()
+
+        stats['indexed'] += len(item_ids)
+        last_id = item_ids[-1]
+
+    logger.info("Item search index rebuild finished: %s", stats)
+    return stats
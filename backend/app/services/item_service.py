@@ -1,13 +1,31 @@
 """Item service for business logic."""
-from typing import Union
+import math
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+from flask import current_app
+from app.models.category import Category
 from app.models.item import Item
-from app.models.tag import TagValueType
+from app.models.tag import Tag, TagValueType
+from app.models.value import Value
 from app.repositories.implementations.item_repository import ItemRepository
 from app.repositories.implementations.category_repository import CategoryRepository
 from app.repositories.implementations.category_item_repository import CategoryItemRepository
 from app.repositories.implementations.tag_repository import TagRepository
 from app.repositories.implementations.value_repository import ValueRepository
 from app.repositories.implementations.item_tag_value_repository import ItemTagValueRepository
+from app.repositories.base.item_filters import (
+    ItemFilters,
+    NumericRangeFilter,
+    TagValueFilter
+)
+from app.repositories.base.item_order import ItemOrder
+from app.repositories.implementations.item_search_repository import ItemSearchRepository
+from app.repositories.implementations.unit_of_work import unit_of_work
+from app.services.cache import ItemListCache, get_item_list_cache
+from app.services.item_search import index_items, search_document, search_terms
+from app.utils.geo import MAX_RADIUS_METERS, covering_cells, distance_meters
+from app.utils.pagination import encode_cursor, encode_score_cursor
 
 
 class ItemService:
@@ -24,7 +42,9 @@ class ItemService:
         category_item_repository: CategoryItemRepository = None,
         tag_repository: TagRepository = None,
         value_repository: ValueRepository = None,
-        item_tag_value_repository: ItemTagValueRepository = None
+        item_tag_value_repository: ItemTagValueRepository = None,
+        item_list_cache: ItemListCache = None,
+        item_search_repository: ItemSearchRepository = None
     ):
         """Initialize service with optional dependency injection.
         
@@ -35,6 +55,8 @@ class ItemService:
             tag_repository: Optional TagRepository for testing/DI
             value_repository: Optional ValueRepository for testing/DI
             item_tag_value_repository: Optional ItemTagValueRepository for testing/DI
+            item_list_cache: Optional ItemListCache (defaults to the app's cache)
+            item_search_repository: Optional ItemSearchRepository for testing/DI
         """
         self.item_repo = item_repository or ItemRepository()
         self.category_repo = category_repository or CategoryRepository()
@@ -42,6 +64,13 @@ class ItemService:
         self.tag_repo = tag_repository or TagRepository()
         self.value_repo = value_repository or ValueRepository()
         self.item_tag_value_repo = item_tag_value_repository or ItemTagValueRepository()
+        self._item_list_cache = item_list_cache
+        self.search_repo = item_search_repository or ItemSearchRepository()
+
+    @property
+    def item_list_cache(self) -> ItemListCache:
+        """Get the item list cache to invalidate on writes."""
+        return self._item_list_cache or get_item_list_cache()
 
     def create_item(
         self,
@@ -52,11 +81,18 @@ class ItemService:
         category_ids: list[int],
         existing_tags: list[dict],
         new_tags: list[dict],
-        walking_distance: float = None
+        walking_distance: float = None,
+        latitude: float = None,
+        longitude: float = None
     ) -> Item:
         """
         Create a new item with categories and tags.
         
+        All input is validated before anything is written. The item, new
+        tags, values and junction rows are then inserted in batches and
+        committed once, so a failure leaves no orphan tags or values. The
+        returned item is built from the in-memory objects, not reloaded.
+        
         Args:
             name: Item name
             location: Item location
@@ -66,6 +102,8 @@ class ItemService:
             existing_tags: List of dicts with tag_id and value
             new_tags: List of dicts with name, value_type, and value
             walking_distance: Optional walking distance
+            latitude: Optional latitude in degrees
+            longitude: Optional longitude in degrees
             
         Returns:
             Created Item object
@@ -73,102 +111,195 @@ class ItemService:
         Raises:
             ValueError: If validation fails
         """
-        # Validate categories exist
-        self._validate_categories(category_ids)
-        
-        # Validate and process tags
-        self._validate_tags(existing_tags, new_tags)
-        
-        # Create the item
-        item = self.item_repo.create_item(
-            name=name,
-            location=location,
-            rotation_city_id=rotation_city_id,
-            added_by_user_id=added_by_user_id,
-            walking_distance=walking_distance
-        )
-        
-        # Link categories to item
-        self.category_item_repo.add_categories_to_item(item.item_id, category_ids)
+        # Validate everything up front so nothing is written on bad input
+        categories = self._validate_categories(category_ids)
+        tags_by_id = self._validate_tags(existing_tags, new_tags)
         
-        # Process tags
-        value_ids = []
-        
-        # Handle existing tags
+        # Check values against the tags looked up during validation
+        tag_values = []
         for existing_tag in existing_tags:
-            tag_id = existing_tag['tag_id']
+            tag = tags_by_id[existing_tag['tag_id']]
             value = existing_tag['value']
             
-            # Get tag to know its value_type
-            tag = self.tag_repo.get_tag_by_id(tag_id)
-            if not tag:
-                raise ValueError(f"Tag with ID {tag_id} not found")
-            
             # Validate value matches tag's value_type
             self._validate_value_type(value, tag.value_type)
-            
-            # Get the value_type label for repository methods (they expect strings)
-            value_type_label = tag.value_type_label
-            value_obj = self.value_repo.create_value(tag_id, value, value_type_label)
-            
-            value_ids.append(value_obj.value_id)
+            tag_values.append((tag, value))
         
-        # Handle new tags
         for new_tag in new_tags:
-            tag_name = new_tag['name']
-            value_type = new_tag['value_type']
-            value = new_tag['value']
-            
             # Validate value matches specified value_type
-            self._validate_value_type(value, value_type)
+            self._validate_value_type(new_tag['value'], new_tag['value_type'])
+        
+        # Write item, tags, values and links in one transaction
+        with unit_of_work():
+            item = self.item_repo.add_item(
+                name=name,
+                location=location,
+                rotation_city_id=rotation_city_id,
+                added_by_user_id=added_by_user_id,
+                walking_distance=walking_distance,
+                latitude=latitude,
+                longitude=longitude
+            )
             
-            # Check if tag name already exists
-            existing_tag = self.tag_repo.get_tag_by_name(tag_name)
-            if existing_tag:
-                raise ValueError(
-                    f"Tag '{tag_name}' already exists. "
-                    f"Use existing_tags with tag_id {existing_tag.tag_id} instead."
-                )
+            created_tags = self.tag_repo.add_tags(
+                [(new_tag['name'], new_tag['value_type']) for new_tag in new_tags]
+            )
+            tag_values.extend(
+                (tag, new_tag['value']) for tag, new_tag in zip(created_tags, new_tags)
+            )
+            
+            # Reuse the existing row for values other items already carry
+            values = self.value_repo.get_or_create_values(
+                [(tag.tag_id, value, tag.value_type_label) for tag, value in tag_values]
+            )
             
-            # Create new tag
-            tag = self.tag_repo.create_tag(tag_name, value_type)
+            self.category_item_repo.add_categories_to_item(item.item_id, category_ids)
+            self.item_tag_value_repo.add_tag_values_to_item(
+                item.item_id, [value.value_id for value in values]
+            )
             
-            # Create value for the new tag
-            value_obj = self.value_repo.create_value(tag.tag_id, value, value_type)
-            value_ids.append(value_obj.value_id)
+            # Searchable in the same commit that makes the item visible
+            self.search_repo.index_items([search_document(
+                item,
+                [category.category_name for category in categories],
+                [
+                    value
+                    for tag, value in tag_values
+                    if tag.value_type_label == TagValueType.TEXT.label
+                ]
+            )])
         
-        # Link tag values to item
-        if value_ids:
-            self.item_tag_value_repo.add_tag_values_to_item(item.item_id, value_ids)
+        # Cached city lists no longer include every item
+        self.item_list_cache.invalidate_city(rotation_city_id)
         
-        # Reload item with all relationships for response
-        return self.get_item_by_id_with_details(item.item_id, rotation_city_id)
+        # Build the response from the objects already in memory
+        categories_by_id = {category.category_id: category for category in categories}
+        item.categories = [categories_by_id[category_id] for category_id in category_ids]
+        item.tags = [
+            self._tag_with_value(tag, value)
+            for (tag, _), value in zip(tag_values, values)
+        ]
+        return item
 
-    def _validate_categories(self, category_ids: list[int]) -> None:
-        """Validate all category IDs exist."""
+    def set_item_tag_value(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        tag_id: int,
+        value: Union[bool, str, float]
+    ) -> Item:
+        """
+        Set the value of one tag on one item.
+        
+        Values are shared between items, so the item is re-pointed at the
+        canonical value for (tag, value), created if needed, and no other
+        item changes. The item's ``updated_at`` and search document are
+        updated in the same transaction and its city's cached lists are
+        invalidated.
+        
+        Args:
+            item_id: ID of the item to change
+            rotation_city_id: City the item must belong to
+            tag_id: ID of the tag to set
+            value: New value, matching the tag's value_type
+            
+        Returns:
+            The item with relationships loaded and transformed
+            
+        Raises:
+            ValueError: If the item, tag or value is invalid
+        """
+        if not self.item_repo.get_item_by_id(item_id, rotation_city_id):
+            raise ValueError(f"Item with ID {item_id} not found in your rotation city")
+        tag = self.tag_repo.get_tag_by_id(tag_id)
+        if not tag:
+            raise ValueError(f"Tag with ID {tag_id} not found")
+        self._validate_value_type(value, tag.value_type_label)
+        
+        with unit_of_work():
+            value_obj = self.value_repo.get_or_create_values(
+                [(tag.tag_id, value, tag.value_type_label)]
+            )[0]
+            self.item_tag_value_repo.set_item_tag_value(item_id, tag_id, value_obj.value_id)
+            self.item_repo.mark_items_updated([item_id], datetime.utcnow())
+            index_items([item_id])
+        
+        self.item_list_cache.invalidate_city(rotation_city_id)
+        return self.get_item_by_id_with_details(item_id, rotation_city_id)
+
+    def mark_items_changed(self, item_ids: list[int]) -> None:
+        """
+        Publish edits made to data that items show but do not own.
+        
+        Renaming a category, for instance, changes every item in it. Bumps
+        the items' ``updated_at`` so the change feed and list version
+        token pick them up, rebuilds their search documents and invalidates
+        their cities' cached lists.
+        
+        Args:
+            item_ids: IDs of the affected items
+        """
+        if not item_ids:
+            return
+        with unit_of_work():
+            city_ids = self.item_repo.mark_items_updated(item_ids, datetime.utcnow())
+            index_items(item_ids)
+        
+        for city_id in set(city_ids.values()):
+            self.item_list_cache.invalidate_city(city_id)
+
+    def _validate_categories(self, category_ids: list[int]) -> list[Category]:
+        """Validate all category IDs exist and return the categories."""
         categories = self.category_repo.get_categories_by_ids(category_ids)
         found_ids = {cat.category_id for cat in categories}
         missing_ids = set(category_ids) - found_ids
         
         if missing_ids:
             raise ValueError(f"Categories not found: {sorted(missing_ids)}")
+        
+        return categories
 
-    def _validate_tags(self, existing_tags: list[dict], new_tags: list[dict]) -> None:
-        """Validate tag data structure and uniqueness."""
+    def _validate_tags(self, existing_tags: list[dict], new_tags: list[dict]) -> dict[int, Tag]:
+        """Validate tag data structure and uniqueness.
+        
+        Looks up every referenced tag ID and every new tag name with one
+        query each, however many tags the item carries.
+        
+        Returns:
+            Map of tag ID to Tag for the existing tags, reused by create_item
+        """
         # Validate existing tags reference valid tag IDs
+        tag_ids = []
         for existing_tag in existing_tags:
             tag_id = existing_tag.get('tag_id')
             if not tag_id:
                 raise ValueError("existing_tags must include tag_id")
-            
-            tag = self.tag_repo.get_tag_by_id(tag_id)
-            if not tag:
+            tag_ids.append(tag_id)
+        
+        tags_by_id = {tag.tag_id: tag for tag in self.tag_repo.get_tags_by_ids(tag_ids)}
+        for tag_id in tag_ids:
+            if tag_id not in tags_by_id:
                 raise ValueError(f"Tag with ID {tag_id} not found")
         
         # Check for duplicate tag names in new_tags
         new_tag_names = [tag['name'].lower() for tag in new_tags]
         if len(new_tag_names) != len(set(new_tag_names)):
             raise ValueError("Duplicate tag names in new_tags are not allowed")
+        
+        # New tag names must not already exist
+        taken = {
+            tag.name.lower(): tag
+            for tag in self.tag_repo.get_tags_by_names_ci(new_tag_names)
+        }
+        for new_tag in new_tags:
+            existing_tag = taken.get(new_tag['name'].lower())
+            if existing_tag:
+                raise ValueError(
+                    f"Tag '{new_tag['name']}' already exists. "
+                    f"Use existing_tags with tag_id {existing_tag.tag_id} instead."
+                )
+        
+        return tags_by_id
 
     def _validate_value_type(self, value: Union[bool, str, float], value_type: Union[int, str]) -> None:
         """Validate that value matches the expected value_type.
@@ -239,42 +370,393 @@ class ItemService:
         item.categories = [ci.category for ci in item.category_items]
         
         # Transform item_tag_values to tags list with tag info + values
-        tags = []
-        for itv in item.item_tag_values:
-            if itv.value and itv.value.tag:
-                tag_dict = {
-                    'tag_id': itv.value.tag.tag_id,
-                    'name': itv.value.tag.name,
-                    'value_type': itv.value.tag.value_type_label,
-                }
-                
-                # Get the actual value based on value_type (using correct field names)
-                value_type_label = itv.value.tag.value_type_label
-                if value_type_label == 'boolean':
-                    tag_dict['value'] = itv.value.boolean_val
-                elif value_type_label == 'text':
-                    tag_dict['value'] = itv.value.name_val
-                elif value_type_label == 'numeric':
-                    tag_dict['value'] = itv.value.numerical_value
-                
-                tags.append(tag_dict)
-        
-        item.tags = tags
+        item.tags = [
+            self._tag_with_value(itv.value.tag, itv.value)
+            for itv in item.item_tag_values
+            if itv.value and itv.value.tag
+        ]
         return item
 
-    def get_all_items_with_details(self, rotation_city_id: int) -> list[Item]:
+    @staticmethod
+    def _tag_with_value(tag: Tag, value: Value) -> dict:
+        """Build the response dict for a tag and one of its values."""
+        tag_dict = {
+            'tag_id': tag.tag_id,
+            'name': tag.name,
+            'value_type': tag.value_type_label,
+        }
+        
+        # Get the actual value based on value_type (using correct field names)
+        value_type_label = tag.value_type_label
+        if value_type_label == 'boolean':
+            tag_dict['value'] = value.boolean_val
+        elif value_type_label == 'text':
+            tag_dict['value'] = value.name_val
+        elif value_type_label == 'numeric':
+            tag_dict['value'] = value.numerical_value
+        
+        return tag_dict
+
+    def get_all_items_with_details(
+        self,
+        rotation_city_id: int,
+        order: ItemOrder = ItemOrder.CREATED,
+        filters: Optional[ItemFilters] = None
+    ) -> list[Item]:
         """
         Get all items from rotation city with full relationship data.
         
         Args:
             rotation_city_id: ID of the rotation city to filter by
+            order: Sort order (newest or freshest first)
+            filters: Optional filters built by build_item_filters
         
         Returns:
             List of Item objects with relationships loaded and transformed
         """
-        items = self.item_repo.get_all_items_with_details(rotation_city_id)
+        items = self.item_repo.get_all_items_with_details(
+            rotation_city_id, order=order, filters=filters
+        )
         return [self._transform_item_for_response(item) for item in items]
 
+    def build_item_filters(
+        self,
+        category_ids: Optional[List[int]] = None,
+        tag_values: Optional[Dict[int, List[str]]] = None,
+        numeric_ranges: Optional[Dict[int, Tuple[Optional[float], Optional[float]]]] = None,
+        max_walking_distance: Optional[float] = None
+    ) -> ItemFilters:
+        """
+        Build typed item list filters from query string values.
+        
+        Looks up every referenced tag with one query and converts each raw
+        value to the tag's type, so the SQL compares against the typed
+        value columns.
+        
+        Args:
+            category_ids: Items must be in one of these categories
+            tag_values: Map of tag ID to raw values; an item must carry one
+                of the values of every listed tag
+            numeric_ranges: Map of numeric tag ID to an inclusive
+                (minimum, maximum) range; either bound may be None
+            max_walking_distance: Maximum walking distance in meters
+        
+        Returns:
+            ItemFilters (empty when nothing was given)
+        
+        Raises:
+            ValueError: If a tag does not exist, a value does not match its
+                tag's type or a range is on a non-numeric tag
+        """
+        tag_values = tag_values or {}
+        numeric_ranges = numeric_ranges or {}
+        
+        tag_ids = sorted(set(tag_values) | set(numeric_ranges))
+        tags_by_id = {tag.tag_id: tag for tag in self.tag_repo.get_tags_by_ids(tag_ids)}
+        for tag_id in tag_ids:
+            if tag_id not in tags_by_id:
+                raise ValueError(f"Tag with ID {tag_id} not found")
+        
+        value_filters = []
+        for tag_id, raw_values in tag_values.items():
+            value_type = tags_by_id[tag_id].value_type_enum
+            value_filters.append(TagValueFilter(
+                tag_id=tag_id,
+                value_type=value_type,
+                values=[self._parse_filter_value(raw, value_type) for raw in raw_values]
+            ))
+        
+        range_filters = []
+        for tag_id, (minimum, maximum) in numeric_ranges.items():
+            if tags_by_id[tag_id].value_type_enum is not TagValueType.NUMERIC:
+                raise ValueError(f"Tag with ID {tag_id} is not numeric")
+            range_filters.append(NumericRangeFilter(tag_id, minimum, maximum))
+        
+        return ItemFilters(
+            category_ids=list(category_ids or []),
+            tag_values=value_filters,
+            numeric_ranges=range_filters,
+            max_walking_distance=max_walking_distance
+        )
+
+    @staticmethod
+    def _parse_filter_value(raw: str, value_type: TagValueType) -> Union[bool, str, float]:
+        """Convert a query string value to a tag's value type."""
+        if value_type is TagValueType.BOOLEAN:
+            lowered = raw.strip().lower()
+            if lowered in ('true', '1', 'yes'):
+                return True
+            if lowered in ('false', '0', 'no'):
+                return False
+            raise ValueError(f"Invalid boolean value: {raw}")
+        if value_type is TagValueType.NUMERIC:
+            try:
+                value = float(raw)
+            except ValueError:
+                value = None
+            if value is None or not math.isfinite(value):
+                raise ValueError(f"Invalid numeric value: {raw}")
+            return value
+        return raw
+
+    def get_item_facets(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> dict:
+        """
+        Count a city's items per category and per tag value.
+        
+        Each facet honors every active filter except its own, so the
+        counts show how many items selecting another option would add:
+        category counts ignore the category filter and each filtered tag's
+        counts ignore that tag's value filter. Costs one grouped query for
+        the categories, one for all unfiltered tags and one per filtered
+        tag.
+        
+        Args:
+            rotation_city_id: ID of the rotation city
+            filters: Optional filters built by build_item_filters
+        
+        Returns:
+            Dict with ``categories`` [{category_id, category_name, count}]
+            and ``tags`` [{tag_id, name, value_type, values: [{value, count}]}]
+        """
+        filters = filters or ItemFilters()
+        
+        categories = [
+            {'category_id': category_id, 'category_name': name, 'count': count}
+            for category_id, name, count in self.item_repo.get_category_counts(
+                rotation_city_id, replace(filters, category_ids=[])
+            )
+        ]
+        
+        filtered_tag_ids = [tag_filter.tag_id for tag_filter in filters.tag_values]
+        rows = list(self.item_repo.get_tag_value_counts(
+            rotation_city_id, filters, exclude_tag_ids=filtered_tag_ids
+        ))
+        for tag_id in filtered_tag_ids:
+            others = replace(filters, tag_values=[
+                tag_filter for tag_filter in filters.tag_values if tag_filter.tag_id != tag_id
+            ])
+            rows.extend(self.item_repo.get_tag_value_counts(
+                rotation_city_id, others, tag_ids=[tag_id]
+            ))
+        
+        tags = {}
+        for tag_id, name, value_type, boolean_val, name_val, numerical_value, count in rows:
+            label = TagValueType.from_code(value_type).label
+            tag = tags.setdefault(tag_id, {
+                'tag_id': tag_id, 'name': name, 'value_type': label, 'values': []
+            })
+            value = {'boolean': boolean_val, 'text': name_val, 'numeric': numerical_value}[label]
+            tag['values'].append({'value': value, 'count': count})
+        
+        return {
+            'categories': categories,
+            'tags': sorted(tags.values(), key=lambda tag: (tag['name'], tag['tag_id'])),
+        }
+
+    def get_items_version(self, rotation_city_id: int) -> tuple:
+        """
+        Get a cheap version token for a rotation city's item list.
+        
+        Runs a single aggregate query and loads no Item objects, so callers
+        can answer conditional requests before building a response.
+        
+        Args:
+            rotation_city_id: ID of the rotation city
+        
+        Returns:
+            Tuple that changes when an item is created, removed, verified or edited
+        """
+        return self.item_repo.get_city_items_version(rotation_city_id)
+
+    def get_items_page_with_details(
+        self,
+        rotation_city_id: int,
+        limit: int,
+        cursor: Optional[Tuple[Any, int]] = None,
+        order: ItemOrder = ItemOrder.CREATED,
+        filters: Optional[ItemFilters] = None
+    ) -> Tuple[list[Item], Optional[str]]:
+        """
+        Get one keyset page of items from rotation city with full relationship data.
+        
+        Fetches one extra row to find out whether another page exists, so no
+        COUNT query is needed.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to filter by
+            limit: Maximum number of items on the page
+            cursor: Optional decoded (key, item_id) of the previous page's last
+                item; key is created_at or freshness_score per ``order``
+            order: Sort order (newest or freshest first)
+            filters: Optional filters built by build_item_filters
+        
+        Returns:
+            Tuple of (transformed items, next_cursor or None on the last page)
+        """
+        items = self.item_repo.get_all_items_with_details(
+            rotation_city_id, limit=limit + 1, cursor=cursor, order=order, filters=filters
+        )
+        
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            encode = encode_score_cursor if order is ItemOrder.FRESHNESS else encode_cursor
+            next_cursor = encode(order.key(last), last.item_id)
+        
+        return [self._transform_item_for_response(item) for item in items], next_cursor
+
+    def get_item_changes(
+        self,
+        rotation_city_id: int,
+        limit: int,
+        since: Optional[Tuple[datetime, int]] = None
+    ) -> Tuple[list[Item], str, bool]:
+        """
+        Get a city's items created, changed or verified since a sync token.
+        
+        Items come oldest change first, each at most once per call; an item
+        changed again later shows up again in a later call. Changes newer
+        than ``ITEM_CHANGES_SETTLE_SECONDS`` are held back: a change is
+        stamped before its transaction commits, so returning the newest
+        changes could move a client's token past one still committing.
+        
+        Args:
+            rotation_city_id: ID of the rotation city
+            limit: Maximum number of items to return
+            since: Optional decoded (updated_at, item_id) of the previous
+                call's token; None for a full initial sync
+        
+        Returns:
+            Tuple of (transformed items, next token, whether more changes
+            are waiting beyond ``limit``)
+        """
+        settle = current_app.config.get('ITEM_CHANGES_SETTLE_SECONDS', 5)
+        until = datetime.utcnow() - timedelta(seconds=settle)
+        items = self.item_repo.get_changed_items_with_details(
+            rotation_city_id, until, after=since, limit=limit + 1
+        )
+        
+        has_more = len(items) > limit
+        items = items[:limit]
+        if items:
+            next_token = encode_cursor(items[-1].updated_at, items[-1].item_id)
+        elif since is not None:
+            next_token = encode_cursor(*since)
+        else:
+            # Nothing settled in the city yet; later changes are newer
+            next_token = encode_cursor(until, 0)
+        
+        return [self._transform_item_for_response(item) for item in items], next_token, has_more
+
+    def search_items(
+        self,
+        rotation_city_id: int,
+        query: str,
+        limit: int,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> Tuple[list[Item], Optional[str]]:
+        """
+        Search a rotation city's items, best match first.
+        
+        Matches every word of the query as a prefix against item names,
+        locations, category names and text tag values. Ranks come from the
+        full-text index; only the page's items are then loaded with their
+        relationships.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to search
+            query: Free-text search query
+            limit: Maximum number of items on the page
+            cursor: Optional decoded (score, item_id) of the previous page's last item
+        
+        Returns:
+            Tuple of (transformed items, next_cursor or None on the last page)
+        
+        Raises:
+            ValueError: If the query contains no words
+        """
+        matches = self.search_repo.search(
+            rotation_city_id, search_terms(query), limit + 1, cursor
+        )
+        
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            last_id, last_score = matches[-1]
+            next_cursor = encode_score_cursor(last_score, last_id)
+        
+        items_by_id = {
+            item.item_id: item
+            for item in self.item_repo.get_items_by_ids_with_details(
+                [item_id for item_id, _ in matches]
+            )
+        }
+        items = [items_by_id[item_id] for item_id, _ in matches if item_id in items_by_id]
+        return [self._transform_item_for_response(item) for item in items], next_cursor
+
+    def get_nearby_items(
+        self,
+        rotation_city_id: int,
+        latitude: float,
+        longitude: float,
+        radius_meters: float,
+        limit: int
+    ) -> list[Item]:
+        """
+        Get a city's items within a radius of a point, closest first.
+        
+        Candidates come from the geohash cells covering the circle (an
+        index range scan), distances are computed for those candidates
+        only, and just the closest ``limit`` items are loaded with their
+        relationships. Items without coordinates are never returned.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to search
+            latitude: Latitude of the point in degrees
+            longitude: Longitude of the point in degrees
+            radius_meters: Search radius, at most MAX_RADIUS_METERS
+            limit: Maximum number of items
+        
+        Returns:
+            Transformed items, each with a ``distance_meters`` attribute
+        
+        Raises:
+            ValueError: If the point or radius is out of range
+        """
+        if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+            raise ValueError("Coordinates are out of range")
+        if not 0 < radius_meters <= MAX_RADIUS_METERS:
+            raise ValueError(f"radius must be between 0 and {MAX_RADIUS_METERS} meters")
+        
+        candidates = self.item_repo.get_items_in_cells(
+            rotation_city_id, covering_cells(latitude, longitude, radius_meters)
+        )
+        nearest = sorted(
+            (distance_meters(latitude, longitude, item_lat, item_lng), item_id)
+            for item_id, item_lat, item_lng in candidates
+        )
+        nearest = [(distance, item_id) for distance, item_id in nearest if distance <= radius_meters]
+        nearest = nearest[:limit]
+        
+        items_by_id = {
+            item.item_id: item
+            for item in self.item_repo.get_items_by_ids_with_details(
+                [item_id for _, item_id in nearest]
+            )
+        }
+        items = []
+        for distance, item_id in nearest:
+            item = items_by_id.get(item_id)
+            if item is not None:
+                item.distance_meters = distance
+                items.append(self._transform_item_for_response(item))
+        return items
+
     def get_item_by_id_with_details(self, item_id: int, rotation_city_id: int) -> Item:
         """
         Get item by ID with full relationship data (must belong to rotation city).
@@ -44,6 +44,14 @@ class RotationCityService:
         """
         return self.rotation_city_repo.get_all_rotation_cities()
 
+    def get_rotation_cities_version(self) -> tuple:
+        """Get a cheap version token for the rotation city list.
+        
+        Returns:
+            Tuple that changes when cities are added or removed
+        """
+        return self.rotation_city_repo.get_rotation_cities_version()
+
     def get_rotation_city_by_name(self, name: str) -> Optional[RotationCity]:
         """Retrieve a rotation city by its name.
         
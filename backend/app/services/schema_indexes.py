@@ -0,0 +1,119 @@
+"""
+Schema Indexes
+
+Creates indexes declared on the models that an existing database lacks.
+``db.create_all()`` only creates missing tables, so indexes added to a
+model after its table exists need this to reach production.
+
+On PostgreSQL indexes are built with ``CREATE INDEX CONCURRENTLY`` so the
+table stays writable while the index builds. A concurrent build that
+fails or is interrupted leaves an INVALID index behind; such indexes
+count as missing and are dropped and rebuilt, so re-running is enough.
+"""
+
+import logging
+import re
+from typing import Iterable, List, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from app import db
+
+
+logger = logging.getLogger(__name__)
+
+
+def existing_indexes(inspector, table_name: str) -> set:
+    """Get the names of a table's usable indexes.
+
+    Args:
+        inspector: SQLAlchemy inspector on the database
+        table_name: Table to list
+
+    Returns:
+        Set of index names, without indexes PostgreSQL marks invalid
+    """
+    names = {index['name'] for index in inspector.get_indexes(table_name)}
+    return names - _invalid_indexes(table_name)
+
+
+def _invalid_indexes(table_name: str) -> set:
+    """Get the names of a table's invalid PostgreSQL indexes."""
+    engine = db.engine
+    if engine.dialect.name != 'postgresql':
+        return set()
+    with engine.connect() as conn:
+        return set(conn.execute(text(
+            "SELECT index_class.relname FROM pg_index "
+            "JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid "
+            "WHERE pg_index.indrelid = CAST(quote_ident(:table_name) AS regclass) "
+            "AND NOT pg_index.indisvalid"
+        ), {'table_name': table_name}).scalars())
+
+
+def missing_indexes(tables: Optional[Iterable[str]] = None) -> list:
+    """List declared indexes that do not exist in the database.
+
+    Args:
+        tables: Table names to check; defaults to every model table
+
+    Returns:
+        List of ``sqlalchemy.Index`` objects to create
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    wanted = set(tables) if tables is not None else None
+
+    missing = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        if wanted is not None and table.name not in wanted:
+            continue
+        existing = existing_indexes(inspector, table.name)
+        missing.extend(
+            index for index in sorted(table.indexes, key=lambda index: index.name)
+            if index.name not in existing
+        )
+    return missing
+
+
+def create_index_online(index) -> None:
+    """Create one index without blocking writes where the database allows.
+
+    PostgreSQL cannot build an index concurrently inside a transaction,
+    so the statement runs on its own autocommit connection. An invalid
+    index left under the same name by an earlier failed build is dropped
+    first.
+    """
+    engine = db.engine
+    ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+    if engine.dialect.name == 'postgresql':
+        ddl = re.sub(r'^CREATE (UNIQUE )?INDEX', r'CREATE \1INDEX CONCURRENTLY', ddl)
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            if index.name in _invalid_indexes(index.table.name):
+                name = engine.dialect.identifier_preparer.quote(index.name)
+                conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS {name}'))
+                logger.info("Dropped invalid index %s", index.name)
+            conn.execute(text(ddl))
+    else:
+        with engine.begin() as conn:
+            conn.execute(text(ddl))
+    logger.info("Created index %s", index.name)
+
+
+def ensure_indexes(tables: Optional[Iterable[str]] = None) -> List[str]:
+    """Create every declared index missing from the database.
+
+    Args:
+        tables: Table names to check; defaults to every model table
+
+    Returns:
+        Names of the indexes that were created
+    """
+    created = []
+    for index in missing_indexes(tables):
+        create_index_online(index)
+        created.append(index.name)
+    return created
@@ -25,3 +25,11 @@ class TagService:
             List of all Tag objects ordered alphabetically by name
         """
         return self.tag_repository.get_all_tags()
+
+    def get_tags_version(self) -> tuple:
+        """Get a cheap version token for the tag list.
+        
+        Returns:
+            Tuple that changes when a tag is created
+        """
+        return self.tag_repository.get_tags_version()
@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from app.repositories.implementations.user_repository import UserRepository
 from app.repositories.implementations.rotation_city_repository import RotationCityRepository
+from app.services.images import ImageService
 from app.models.user import User
 
 class UserService:
@@ -14,16 +15,19 @@ class UserService:
     def __init__(
             self,
             user_repository: UserRepository = None,
-            rotation_city_repository: RotationCityRepository = None
+            rotation_city_repository: RotationCityRepository = None,
+            image_service: ImageService = None
         ):
         """Initialize service with optional dependency injection.
         
         Args:
             user_repository: Optional UserRepository instance for testing/DI
             rotation_city_repository: Optional RotationCityRepository for city validation
+            image_service: Optional ImageService for storing profile pictures
         """
         self.user_repository = user_repository or UserRepository()
         self.rotation_city_repository = rotation_city_repository or RotationCityRepository()
+        self.image_service = image_service or ImageService()
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Retrieve a user by their ID.
@@ -47,6 +51,17 @@ class UserService:
         """
         return self.user_repository.get_user_by_email(email)
     
+    def get_profile_picture(self, user_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """Retrieve a user's stored profile picture.
+        
+        Args:
+            user_id: The ID of the user
+            
+        Returns:
+            Tuple of (image store key, legacy base64 picture)
+        """
+        return self.user_repository.get_profile_picture(user_id)
+    
     def update_user(self, user_id: int, data: dict) -> Optional[User]:
         """Update user information.
         
@@ -64,10 +79,31 @@ class UserService:
         if "rotation_city_id" in data:
             data["rotation_city_id"] = \
                 self.rotation_city_repository.validate_city_id(data["rotation_city_id"])
+        
+        if "profile_picture" in data:
+            data = dict(data)
+            data["profile_picture_key"] = self.store_profile_picture(data["profile_picture"])
+            data["profile_picture"] = None
             
         self.user_repository.update(user_id, **data)
         return user
     
+    def store_profile_picture(self, picture: Optional[str]) -> Optional[str]:
+        """Move an uploaded base64 profile picture into the image store.
+        
+        Args:
+            picture: Base64 string or data URL, or None/empty to clear
+            
+        Returns:
+            Image store key, or None when the picture is cleared
+            
+        Raises:
+            InvalidImageError: If the picture is not a valid image
+        """
+        if not picture:
+            return None
+        return self.image_service.store_base64(picture)
+    
     def get_verified_user_by_id(self, user_id: int) -> Optional[User]:
         """Retrieve a verified user by their ID.
         
@@ -0,0 +1,92 @@
+"""
+Value Compaction
+
+One-off maintenance that merges duplicate tag values created before values
+became canonical. Every item link is repointed at the oldest copy of each
+(tag, typed value), the other copies are deleted, and the partial unique
+indexes declared on ``Value`` are created so duplicates cannot come back.
+"""
+
+import logging
+from typing import Dict, List
+
+from sqlalchemy import delete, func, select, update
+
+from app import db
+from app.models.item_tag_value import ItemTagValue
+from app.models.value import Value
+from app.services.schema_indexes import ensure_indexes
+
+
+logger = logging.getLogger(__name__)
+
+_VALUE_COLUMNS = ('boolean_val', 'name_val', 'numerical_value')
+
+
+def compact_values(batch_size: int = 500) -> Dict[str, int]:
+    """Merge duplicate values and rewrite the item links that use them.
+
+    Args:
+        batch_size: Number of canonical values handled per commit
+
+    Returns:
+        Dict with counts of ``merged`` values, ``links_rewritten`` and
+        ``links_removed`` (links made redundant by the merge)
+    """
+    canonical = {}
+    duplicates: Dict[int, List[int]] = {}
+    rows = db.session.execute(
+        select(Value.value_id, Value.tag_id, *[getattr(Value, c) for c in _VALUE_COLUMNS])
+        .order_by(Value.value_id)
+    )
+    for value_id, tag_id, *typed in rows:
+        key = next(
+            ((tag_id, column, val) for column, val in zip(_VALUE_COLUMNS, typed) if val is not None),
+            None
+        )
+        if key is None:
+            continue
+        keep_id = canonical.setdefault(key, value_id)
+        if keep_id != value_id:
+            duplicates.setdefault(keep_id, []).append(value_id)
+
+    stats = {'merged': 0, 'links_rewritten': 0, 'links_removed': 0}
+    pending = list(duplicates.items())
+    for start in range(0, len(pending), batch_size):
+        for keep_id, duplicate_ids in pending[start:start + batch_size]:
+            result = db.session.execute(
+                update(ItemTagValue)
+                .where(ItemTagValue.value_id.in_(duplicate_ids))
+                .values(value_id=keep_id)
+            )
+            stats['links_rewritten'] += result.rowcount
+            db.session.execute(delete(Value).where(Value.value_id.in_(duplicate_ids)))
+            stats['merged'] += len(duplicate_ids)
+        db.session.commit()
+
+    # An item that carried two copies of a value now links it twice
+    first_links = (
+        select(func.min(ItemTagValue.item_tag_value_id))
+        .group_by(ItemTagValue.item_id, ItemTagValue.value_id)
+    )
+    result = db.session.execute(
+        delete(ItemTagValue).where(ItemTagValue.item_tag_value_id.not_in(first_links))
+    )
+    stats['links_removed'] = result.rowcount
+    db.session.commit()
+
+    logger.info("Value compaction finished: %s", stats)
+    return stats
+
+
+def ensure_value_unique_indexes() -> List[str]:
+    """Create the value uniqueness indexes on databases that predate them.
+
+    ``db.create_all()`` only creates missing tables, never indexes on
+    existing ones. Run after ``compact_values`` or creation will fail on
+    the remaining duplicates.
+
+    Returns:
+        Names of the indexes that were created
+    """
+    return ensure_indexes([Value.__tablename__])
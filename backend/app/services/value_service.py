@@ -106,6 +106,10 @@ class ValueService:
     ) -> Optional[Value]:
         """Update an existing value.
         
+        Values are shared by every item carrying them, so only values no
+        item uses yet can be edited in place; change an item's tag with
+        ``ItemService.set_item_tag_value`` instead.
+        
         Args:
             value_id: ID of the value to update
             boolean_val: New boolean value (optional)
@@ -114,12 +118,22 @@ class ValueService:
             
         Returns:
             Updated Value object or None if not found
+            
+        Raises:
+            ValueError: If items use the value, or the tag already has an
+                identical value
         """
         value = self.value_repository.get_value_by_id(value_id)
 
         if not value:
             return None
 
+        if self.value_repository.is_value_in_use(value_id):
+            raise ValueError(
+                "Value is shared by items; set it per item with "
+                "PUT /item/<item_id>/tags/<tag_id> instead"
+            )
+
         value_type = self.tag_repository.get_tag_by_id(value.tag_id).value_type
 
         return self.value_repository.update_value(
@@ -0,0 +1,126 @@
+"""
+Verification Counters
+
+``Item.number_of_verifications`` and ``Item.last_verified_date`` are
+maintained incrementally by ``VerificationService.verify_item``. This
+maintenance job recomputes them in bulk from ``item_verification`` for
+rows that have drifted (older databases never set ``last_verified_date``,
+and rows inserted or deleted outside the service skip the counter).
+Corrected items also get a new freshness score and ``updated_at``, as a
+verification would give them, so rankings and the change feed follow.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import bindparam, func, select, update
+
+from app import db
+from app.models.item import Item
+from app.models.item_verification import ItemVerification
+from app.services.cache import get_item_list_cache
+from app.utils.freshness import compute_freshness
+
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_verification_counters(batch_size: int = 1000) -> Dict[str, int]:
+    """Recompute item verification counters that disagree with the history.
+
+    Items are scanned in primary-key order, one aggregate query per batch.
+    Only drifted rows are updated; the new values are computed inside the
+    ``UPDATE`` itself, so a verification recorded while the job runs is
+    not overwritten with a stale count. Freshness scores are then written
+    from the returned counters, guarded by the count like the decay job.
+
+    Args:
+        batch_size: Number of items checked per commit
+
+    Returns:
+        Dict with counts of ``checked`` and ``corrected`` items
+    """
+    stats = {'checked': 0, 'corrected': 0}
+    cities = set()
+    table = Item.__table__
+    freshness_statement = (
+        update(table)
+        .where(
+            table.c.item_id == bindparam('b_item_id'),
+            func.coalesce(table.c.number_of_verifications, 0) == bindparam('b_count')
+        )
+        .values(freshness_score=bindparam('b_score'))
+    )
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            select(
+                Item.item_id,
+                Item.number_of_verifications,
+                Item.last_verified_date,
+                func.count(ItemVerification.verification_id),
+                func.max(ItemVerification.created_at)
+            )
+            .outerjoin(ItemVerification, ItemVerification.item_id == Item.item_id)
+            .where(Item.item_id > last_id)
+            .group_by(Item.item_id)
+            .order_by(Item.item_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        drifted = [
+            item_id
+            for item_id, stored_count, stored_last, count, last in rows
+            if (stored_count or 0) != count or stored_last != last
+        ]
+        if drifted:
+            history = select(ItemVerification).where(
+                ItemVerification.item_id == Item.item_id
+            )
+            now = datetime.utcnow()
+            corrected = db.session.execute(
+                update(Item)
+                .where(Item.item_id.in_(drifted))
+                .values(
+                    number_of_verifications=history.with_only_columns(
+                        func.count(ItemVerification.verification_id)
+                    ).scalar_subquery(),
+                    last_verified_date=history.with_only_columns(
+                        func.max(ItemVerification.created_at)
+                    ).scalar_subquery(),
+                    updated_at=now
+                )
+                .returning(
+                    Item.item_id,
+                    Item.rotation_city_id,
+                    Item.number_of_verifications,
+                    Item.last_verified_date,
+                    Item.created_at
+                )
+                .execution_options(synchronize_session=False)
+            ).all()
+            if corrected:
+                db.session.execute(freshness_statement, [
+                    {
+                        'b_item_id': item_id,
+                        'b_count': count or 0,
+                        'b_score': compute_freshness(count, last_verified, created_at, now)
+                    }
+                    for item_id, _, count, last_verified, created_at in corrected
+                ])
+            cities.update(city_id for _, city_id, _, _, _ in corrected)
+        db.session.commit()
+
+        stats['checked'] += len(rows)
+        stats['corrected'] += len(drifted)
+        last_id = rows[-1][0]
+
+    cache = get_item_list_cache()
+    for city_id in cities:
+        cache.invalidate_city(city_id)
+
+    logger.info("Verification counter reconciliation finished: %s", stats)
+    return stats
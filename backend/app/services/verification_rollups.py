@@ -0,0 +1,79 @@
+"""
+Verification Rollups
+
+``city_verification_daily`` and ``city_verifier_total`` are maintained
+incrementally by ``VerificationService``. This maintenance job rebuilds
+them from ``item_verification`` with grouped SQL, for databases that
+predate the rollups or whose verifications were changed outside the
+service (e.g. items deleted with their history).
+"""
+
+import logging
+from typing import Dict
+
+from sqlalchemy import delete, func, insert, select
+
+from app import db
+from app.models.city_verification_daily import CityVerificationDaily
+from app.models.city_verifier_total import CityVerifierTotal
+from app.models.item import Item
+from app.models.item_verification import ItemVerification
+
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_verification_rollups() -> Dict[str, int]:
+    """Recompute both rollup tables in one transaction.
+
+    The tables are replaced inside a single transaction, so readers never
+    see them half-built. A verification that creates a new rollup row
+    while the rebuild runs can make it fail with a unique violation; it
+    rolls back cleanly and can simply be re-run.
+
+    Returns:
+        Dict with the number of ``daily_rows`` and ``verifier_rows`` written
+    """
+    daily = (
+        select(
+            Item.rotation_city_id,
+            ItemVerification.verified_on,
+            func.count(ItemVerification.verification_id)
+        )
+        .join(Item, Item.item_id == ItemVerification.item_id)
+        .where(ItemVerification.verified_on.isnot(None))
+        .group_by(Item.rotation_city_id, ItemVerification.verified_on)
+    )
+    verifiers = (
+        select(
+            Item.rotation_city_id,
+            ItemVerification.user_id,
+            func.count(ItemVerification.verification_id),
+            func.max(ItemVerification.created_at)
+        )
+        .join(Item, Item.item_id == ItemVerification.item_id)
+        .group_by(Item.rotation_city_id, ItemVerification.user_id)
+    )
+
+    try:
+        db.session.execute(delete(CityVerificationDaily))
+        db.session.execute(delete(CityVerifierTotal))
+        daily_rows = db.session.execute(
+            insert(CityVerificationDaily).from_select(
+                ['rotation_city_id', 'day', 'verification_count'], daily
+            )
+        ).rowcount
+        verifier_rows = db.session.execute(
+            insert(CityVerifierTotal).from_select(
+                ['rotation_city_id', 'user_id', 'verification_count', 'last_verified_at'],
+                verifiers
+            )
+        ).rowcount
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    stats = {'daily_rows': daily_rows, 'verifier_rows': verifier_rows}
+    logger.info("Verification rollups rebuilt: %s", stats)
+    return stats
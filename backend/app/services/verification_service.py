@@ -2,12 +2,20 @@
 Item Verification Service
 Business logic for item verification operations.
 """
-from typing import Optional, Dict, Any
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy.engine import Row
 from app.repositories.implementations.item_verification_repository import (
     ItemVerificationRepository
 )
 from app.repositories.implementations.item_repository import ItemRepository
-from app.models.item_verification import ItemVerification
+from app.repositories.implementations.unit_of_work import unit_of_work
+from app.repositories.implementations.verification_stats_repository import (
+    VerificationStatsRepository
+)
+from app.services.cache import get_item_list_cache
+from app.utils.images import image_url
+from app.utils.pagination import encode_cursor
 
 
 class ItemNotFoundError(Exception):
@@ -31,6 +39,7 @@ class VerificationService:
     def __init__(self):
         self.verification_repo = ItemVerificationRepository()
         self.item_repo = ItemRepository()
+        self.stats_repo = VerificationStatsRepository()
     
     def verify_item(
         self,
@@ -59,30 +68,31 @@ class VerificationService:
             ItemNotFoundError: If item doesn't exist
             AlreadyVerifiedTodayError: If user already verified this item today
         """
-        # Check if item exists (repository handles the database query)
-        if not self.item_repo.exists(item_id):
-            raise ItemNotFoundError(f"Item with id {item_id} not found")
-        
-        # Check if user already verified this item today
-        if self.verification_repo.user_verified_item_today(user_id, item_id):
-            raise AlreadyVerifiedTodayError(
-                f"You have already verified item {item_id} today"
+        # Bump the item's counter and insert the verification atomically:
+        # the UPDATE finds missing items and the INSERT ... ON CONFLICT
+        # enforces once a day, so no separate checks are needed
+        verified_at = datetime.utcnow()
+        with unit_of_work():
+            recorded = self.item_repo.record_verification(item_id, verified_at)
+            if recorded is None:
+                raise ItemNotFoundError(f"Item with id {item_id} not found")
+            verification_count, city_id = recorded
+            
+            verification = self.verification_repo.add_verification(
+                user_id=user_id,
+                item_id=item_id,
+                note=note,
+                created_at=verified_at
             )
+            if verification is None:
+                raise AlreadyVerifiedTodayError(
+                    f"You have already verified item {item_id} today"
+                )
+            
+            self.stats_repo.record_verifications([(city_id, user_id)], verified_at)
         
-        # Create verification
-        verification = self.verification_repo.create_verification(
-            user_id=user_id,
-            item_id=item_id,
-            note=note
-        )
-        
-        # Get updated verification count and update item
-        verification_count = (
-            self.verification_repo.get_verification_count_for_item(
-                item_id
-            )
-        )
-        self.item_repo.update_verification_count(item_id, verification_count)
+        # Cached city lists carry the old verification count
+        get_item_list_cache().invalidate_city(city_id)
         
         # Get user and item names
         user_name = (
@@ -102,6 +112,74 @@ class VerificationService:
             "verification_count": verification_count
         }
     
+    def verify_items(
+        self,
+        user_id: int,
+        entries: List[Tuple[int, Optional[str]]]
+    ) -> Dict[str, Any]:
+        """
+        Verify several items at once, e.g. confirmations collected offline.
+        
+        Runs a fixed number of statements whatever the batch size: one
+        ``IN`` lookup (locking the items), one multi-row verification
+        insert, one counter update and the rollup upserts, committed
+        together.
+        
+        Args:
+            user_id: ID of the user verifying the items
+            entries: (item_id, note) pairs; repeated item IDs keep the
+                first note
+            
+        Returns:
+            Dict with:
+                - user_id: ID of the user
+                - results: One dict per distinct item, in request order,
+                  with item_id, status (``verified``, ``already_verified``
+                  or ``not_found``) and, when verified, verification_id
+                  and verification_count
+                - verified_count: Number of items verified
+        """
+        notes: Dict[int, Optional[str]] = {}
+        for item_id, note in entries:
+            notes.setdefault(item_id, note)
+        
+        verified_at = datetime.utcnow()
+        with unit_of_work():
+            cities = self.item_repo.get_rotation_city_ids(list(notes), lock=True)
+            added = self.verification_repo.add_verifications(
+                user_id,
+                [(item_id, notes[item_id]) for item_id in notes if item_id in cities],
+                created_at=verified_at
+            )
+            counts = self.item_repo.record_verifications(list(added), verified_at)
+            self.stats_repo.record_verifications(
+                [(cities[item_id], user_id) for item_id in added], verified_at
+            )
+        
+        cache = get_item_list_cache()
+        for city_id in {cities[item_id] for item_id in added}:
+            cache.invalidate_city(city_id)
+        
+        results = []
+        for item_id in notes:
+            if item_id not in cities:
+                results.append({"item_id": item_id, "status": "not_found"})
+            elif item_id not in added:
+                results.append({"item_id": item_id, "status": "already_verified"})
+            else:
+                results.append({
+                    "item_id": item_id,
+                    "status": "verified",
+                    "verification_id": added[item_id],
+                    "verification_count": counts[item_id]
+                })
+        
+        return {
+            "user_id": user_id,
+            "results": results,
+            "verified_count": len(added)
+        }
+    
     def get_verification(self, verification_id: int) -> Dict[str, Any]:
         """
         Get a single verification by ID.
@@ -115,7 +193,7 @@ class VerificationService:
         Raises:
             VerificationNotFoundError: If verification doesn't exist
         """
-        verification = self.verification_repo.get_verification_by_id(
+        verification = self.verification_repo.get_verification_row(
             verification_id
         )
         if not verification:
@@ -128,26 +206,30 @@ class VerificationService:
     def get_item_verifications(
         self,
         item_id: int,
-        limit: Optional[int] = 50
+        limit: Optional[int] = 50,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
-        Get all verifications for an item.
+        Get a page of verifications for an item, newest first.
         
         Args:
             item_id: ID of the item
             limit: Maximum number of verifications to return (default 50)
+            cursor: Optional decoded (created_at, verification_id) of the
+                previous page's last verification
+            since: Optional timestamp; only later verifications are returned
             
         Returns:
             Dict with:
                 - verifications: List of verification dicts
-                - total_count: Total verification count
+                - total_count: Total verification count (item counter)
                 - item_id: ID of the item
+                - next_cursor: Cursor for the next page, None on the last
         """
-        verifications = self.verification_repo.get_verifications_by_item_id(
-            item_id, limit
-        )
-        total_count = self.verification_repo.get_verification_count_for_item(
-            item_id
+        verifications, next_cursor = self._page(
+            self.verification_repo.get_verification_rows_by_item_id,
+            item_id, limit, cursor, since
         )
         
         return {
@@ -155,30 +237,38 @@ class VerificationService:
             "verifications": [
                 self._format_verification(v) for v in verifications
             ],
-            "total_count": total_count,
-            "returned_count": len(verifications)
+            "total_count": self.item_repo.get_verification_count(item_id),
+            "returned_count": len(verifications),
+            "next_cursor": next_cursor
         }
     
     def get_user_verifications(
         self,
         user_id: int,
-        limit: Optional[int] = 50
+        limit: Optional[int] = 50,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        since: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
-        Get all verifications by a user.
+        Get a page of verifications by a user, newest first.
         
         Args:
             user_id: ID of the user
             limit: Maximum number of verifications to return (default 50)
+            cursor: Optional decoded (created_at, verification_id) of the
+                previous page's last verification
+            since: Optional timestamp; only later verifications are returned
             
         Returns:
             Dict with:
                 - verifications: List of verification dicts
                 - user_id: ID of the user
                 - count: Number of verifications returned
+                - next_cursor: Cursor for the next page, None on the last
         """
-        verifications = self.verification_repo.get_verifications_by_user_id(
-            user_id, limit
+        verifications, next_cursor = self._page(
+            self.verification_repo.get_verification_rows_by_user_id,
+            user_id, limit, cursor, since
         )
         
         return {
@@ -186,37 +276,47 @@ class VerificationService:
             "verifications": [
                 self._format_verification(v) for v in verifications
             ],
-            "count": len(verifications)
+            "count": len(verifications),
+            "next_cursor": next_cursor
         }
     
-    def _format_verification(
+    def _page(
         self,
-        verification: ItemVerification
-    ) -> Dict[str, Any]:
+        fetch,
+        owner_id: int,
+        limit: Optional[int],
+        cursor: Optional[Tuple[datetime, int]],
+        since: Optional[datetime]
+    ) -> Tuple[List[Row], Optional[str]]:
+        """Fetch one extra row to learn whether another page follows."""
+        if not limit:
+            return fetch(owner_id, None, cursor, since), None
+        
+        rows = fetch(owner_id, limit + 1, cursor, since)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].created_at, rows[-1].verification_id)
+    
+    def _format_verification(self, row: Row) -> Dict[str, Any]:
         """
-        Format a verification model instance as a dict.
+        Format a verification listing row as a dict.
         
         Args:
-            verification: ItemVerification instance
+            row: Row from the repository's verification listing queries
             
         Returns:
             Dict with verification data
         """
-        user_photo = verification.user.profile_picture if verification.user.profile_picture else None
-        user_name = (
-            f"{verification.user.first_name} "
-            f"{verification.user.last_name}"
-        )
-        item_name = verification.item.name
+        user_photo = image_url(row.profile_picture_key) or row.profile_picture or None
         
         return {
-            "verification_id": verification.verification_id,
-            "user_id": verification.user_id,
-            "user_name": user_name,
-            "item_id": verification.item_id,
-            "item_name": item_name,
-            "note": verification.note,
-            "created_at": verification.created_at.isoformat(),
+            "verification_id": row.verification_id,
+            "user_id": row.user_id,
+            "user_name": f"{row.first_name} {row.last_name}",
+            "item_id": row.item_id,
+            "item_name": row.item_name,
+            "note": row.note,
+            "created_at": row.created_at.isoformat(),
             "user_photo": user_photo
-
         }
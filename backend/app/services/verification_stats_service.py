@@ -0,0 +1,96 @@
+"""Verification stats service for city freshness dashboards"""
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.verification_stats_repository import (
+    VerificationStatsRepository
+)
+
+
+class VerificationStatsService:
+    """Service for per-city verification activity.
+    
+    Reads the rollup tables maintained by VerificationService, so the cost
+    of a dashboard depends on the requested range, not on how many
+    verifications a city has accumulated.
+    """
+
+    def __init__(
+        self,
+        stats_repository: VerificationStatsRepository = None,
+        item_repository: ItemRepository = None
+    ):
+        """Initialize service with optional dependency injection.
+        
+        Args:
+            stats_repository: Optional VerificationStatsRepository instance for testing/DI
+            item_repository: Optional ItemRepository instance for testing/DI
+        """
+        self.stats_repo = stats_repository or VerificationStatsRepository()
+        self.item_repo = item_repository or ItemRepository()
+
+    def get_city_stats(
+        self,
+        rotation_city_id: int,
+        days: int = 30,
+        stale_days: int = 30,
+        top: int = 10,
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Get verification activity for a rotation city.
+        
+        Args:
+            rotation_city_id: The ID of the rotation city
+            days: Number of days (ending today, UTC) to bucket
+            stale_days: Items not verified for this many days count as stale
+            top: Number of top verifiers to return
+            today: Last day of the range (defaults to the current UTC day)
+            
+        Returns:
+            Dict with daily buckets (every day of the range, zero-filled),
+            weekly buckets (weeks starting Monday), total verifications in
+            the range, item and stale item counts, and top verifiers
+        """
+        end_day = today or datetime.utcnow().date()
+        start_day = end_day - timedelta(days=days - 1)
+        
+        counts = dict(self.stats_repo.get_daily_counts(rotation_city_id, start_day, end_day))
+        daily = [
+            {"day": day.isoformat(), "verification_count": counts.get(day, 0)}
+            for day in (start_day + timedelta(days=offset) for offset in range(days))
+        ]
+        weekly = [
+            {"week_start": week.isoformat(), "verification_count": count}
+            for week, count in self.stats_repo.get_weekly_counts(
+                rotation_city_id, start_day, end_day
+            )
+        ]
+        
+        cutoff = datetime.combine(end_day, datetime.min.time()) - timedelta(days=stale_days - 1)
+        item_count, stale_count = self.item_repo.get_staleness_counts(rotation_city_id, cutoff)
+        
+        top_verifiers = [
+            {
+                "user_id": row.user_id,
+                "user_name": f"{row.first_name} {row.last_name}",
+                "verification_count": row.verification_count,
+                "last_verified_at": (
+                    row.last_verified_at.isoformat() if row.last_verified_at else None
+                )
+            }
+            for row in self.stats_repo.get_top_verifiers(rotation_city_id, top)
+        ]
+        
+        return {
+            "rotation_city_id": rotation_city_id,
+            "start_day": start_day.isoformat(),
+            "end_day": end_day.isoformat(),
+            "daily": daily,
+            "weekly": weekly,
+            "total_verifications": sum(counts.values()),
+            "item_count": item_count,
+            "stale_days": stale_days,
+            "stale_item_count": stale_count,
+            "top_verifiers": top_verifiers
+        }
@@ -0,0 +1,53 @@
+"""
+Conditional Request Helpers
+ETag / If-None-Match support for collection endpoints.
+
+Endpoints derive an ETag from a cheap version token (a single aggregate
+query such as ``COUNT(*)`` and ``MAX(id)``) and answer ``304 Not Modified``
+before any ORM objects are loaded or serialized.
+"""
+import hashlib
+from typing import Optional
+
+from flask import Response, current_app, request
+
+
+def make_etag(*parts) -> str:
+    """Build an opaque ETag from version token parts.
+
+    Args:
+        *parts: Values identifying the representation (resource name,
+            version token, query variant, ...)
+
+    Returns:
+        Hex digest usable as a strong ETag
+    """
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def not_modified(etag: str, cache_control: str = 'private, no-cache') -> Optional[Response]:
+    """Build a 304 response if the client already has this representation.
+
+    Args:
+        etag: ETag of the current representation
+        cache_control: Cache-Control header value for the response
+
+    Returns:
+        An empty 304 response, or None when the client copy is stale
+    """
+    if not request.if_none_match.contains(etag):
+        return None
+    response = current_app.response_class(status=304)
+    return with_etag(response, etag, cache_control)
+
+
+def with_etag(response: Response, etag: str, cache_control: str = 'private, no-cache') -> Response:
+    """Attach the ETag and revalidation headers to a response.
+
+    ``no-cache`` lets the browser store the body but makes it revalidate
+    with ``If-None-Match`` on every use, so writes show up immediately.
+    """
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
@@ -0,0 +1,57 @@
+"""
+Freshness Score
+How likely an item is to still be where it was reported.
+
+An item's score is its verification weight decayed by the time since it
+was last confirmed::
+
+    score = (1 + n / (n + 3)) * 0.5 ** (age_days / HALF_LIFE_DAYS)
+
+``n`` is ``number_of_verifications`` and the age runs from
+``last_verified_date`` (``created_at`` for items never verified). The
+weight grows from 1 towards 2 with diminishing returns, so a handful of
+confirmations counts for more than one but a long history can't outrank
+a recent sighting for long.
+"""
+from datetime import datetime
+from typing import Optional
+
+HALF_LIFE_DAYS = 14
+_SECONDS_PER_DAY = 86400
+
+
+def freshness_weight(verification_count):
+    """Score of an item confirmed just now.
+
+    Plain arithmetic, so it accepts an int or a SQL column expression and
+    the verification ``UPDATE`` can compute the new score in the database.
+
+    Args:
+        verification_count: Number of verifications (int or SQL expression)
+
+    Returns:
+        Weight between 1 and 2 (float or SQL expression)
+    """
+    return 1.0 + verification_count / (verification_count + 3.0)
+
+
+def compute_freshness(
+    verification_count: Optional[int],
+    last_verified_date: Optional[datetime],
+    created_at: Optional[datetime],
+    now: datetime
+) -> float:
+    """Compute an item's freshness score at a point in time.
+
+    Args:
+        verification_count: ``Item.number_of_verifications`` (None counts as 0)
+        last_verified_date: When the item was last verified, if ever
+        created_at: When the item was added
+        now: Time to score at
+
+    Returns:
+        Freshness score; higher is fresher
+    """
+    seen_at = last_verified_date or created_at or now
+    age_days = max((now - seen_at).total_seconds(), 0) / _SECONDS_PER_DAY
+    return freshness_weight(verification_count or 0) * 0.5 ** (age_days / HALF_LIFE_DAYS)
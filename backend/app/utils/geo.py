@@ -0,0 +1,106 @@
+"""
+Geo Helpers
+Geohash cells and great-circle distances for nearby item queries.
+
+A geohash names a rectangular cell of the globe; every prefix of it names
+the enclosing, larger cell. Items store a full-precision geohash in an
+indexed column, so "items in cell X" is an index range scan on the prefix
+and works on any database.
+"""
+import math
+from typing import List, Tuple
+
+GEOHASH_PRECISION = 9  # cells of about 5 x 5 meters
+MAX_RADIUS_METERS = 20000
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_EARTH_RADIUS_METERS = 6371008.8
+_METERS_PER_DEGREE_LAT = 110574.0
+_METERS_PER_DEGREE_LNG = 111320.0
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a geohash of the given length.
+
+    Args:
+        latitude: Latitude in degrees (-90 to 90)
+        longitude: Longitude in degrees (-180 to 180)
+        precision: Number of characters
+
+    Returns:
+        Geohash string
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        # Bits alternate between longitude and latitude, longitude first
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """Get the (height, width) in degrees of geohash cells of a length."""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def covering_cells(latitude: float, longitude: float, radius_meters: float) -> List[str]:
+    """Get geohash prefixes whose cells together cover a circle.
+
+    Picks the longest prefix whose cells are at least ``radius_meters``
+    in both directions at this latitude; the cell containing the center
+    and its eight neighbours then contain the whole circle.
+
+    Args:
+        latitude: Center latitude in degrees
+        longitude: Center longitude in degrees
+        radius_meters: Circle radius
+
+    Returns:
+        Distinct geohash prefixes (up to nine)
+    """
+    lng_scale = _METERS_PER_DEGREE_LNG * max(math.cos(math.radians(latitude)), 1e-6)
+    precision = GEOHASH_PRECISION
+    while precision > 1:
+        height, width = cell_size_degrees(precision)
+        if min(height * _METERS_PER_DEGREE_LAT, width * lng_scale) >= radius_meters:
+            break
+        precision -= 1
+    height, width = cell_size_degrees(precision)
+
+    cells = []
+    for dlat in (-height, 0.0, height):
+        for dlng in (-width, 0.0, width):
+            lat = min(max(latitude + dlat, -90.0), 90.0)
+            lng = (longitude + dlng + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(lat, lng, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def distance_meters(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle (haversine) distance between two coordinates in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * _EARTH_RADIUS_METERS * math.asin(min(1.0, math.sqrt(a)))
@@ -0,0 +1,88 @@
+"""
+Image Helpers
+Decoding of the base64 image strings stored on users and categories.
+"""
+import base64
+import binascii
+from typing import Optional, Tuple
+
+from flask import has_request_context, url_for
+
+DEFAULT_IMAGE_MIMETYPE = 'image/png'
+
+# Leading bytes of the raster types clients upload; WebP is checked apart
+# because its signature has a length field in the middle
+_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def decode_image_data(data: str) -> Tuple[bytes, str]:
+    """Decode a stored base64 image into raw bytes and a mimetype.
+
+    Accepts both data URLs (``data:image/jpeg;base64,...``) as sent by the
+    frontend and bare base64 strings as written by the seed script.
+
+    Args:
+        data: Stored image string
+
+    Returns:
+        Tuple of (image bytes, mimetype)
+
+    Raises:
+        ValueError: If the string is not valid base64 image data
+    """
+    mimetype = DEFAULT_IMAGE_MIMETYPE
+    payload = data
+    if data.startswith('data:'):
+        header, _, payload = data.partition(',')
+        declared = header[len('data:'):].split(';', 1)[0]
+        if declared:
+            mimetype = declared
+
+    try:
+        return base64.b64decode(payload, validate=True), mimetype
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid base64 image data")
+
+
+def sniff_image_type(data: bytes) -> Optional[str]:
+    """Detect a raster image type from its leading bytes.
+
+    Clients declare the type of their data URLs themselves, so the bytes
+    are checked before an image is stored or served as that type.
+
+    Args:
+        data: Raw image bytes
+
+    Returns:
+        The PNG, JPEG, GIF or WebP mimetype, or None for anything else
+    """
+    for signature, mimetype in _SIGNATURES:
+        if data.startswith(signature):
+            return mimetype
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def image_url(key: Optional[str]) -> Optional[str]:
+    """Build the public URL for a stored image key.
+
+    Inside a request the URL is absolute, so it works as an ``<img src>``
+    on a frontend served from another origin.
+
+    Args:
+        key: Content-addressed image key, or None
+
+    Returns:
+        Image URL, or None when there is no key
+    """
+    if not key:
+        return None
+    if has_request_context():
+        return url_for('api.images.get_image', key=key, _external=True)
+    return f"/api/v1/images/{key}"
@@ -0,0 +1,34 @@
+"""
+JWT Claim Helpers
+Request-scoped accessors for data carried in the access token.
+"""
+from typing import Optional
+
+from flask import g
+from flask_jwt_extended import get_jwt, get_jwt_identity
+
+from app.repositories.implementations.user_repository import UserRepository
+
+ROTATION_CITY_CLAIM = 'rotation_city_id'
+
+
+def get_current_rotation_city_id() -> Optional[int]:
+    """Get the rotation city of the authenticated user.
+
+    Reads the ``rotation_city_id`` claim so hot routes don't need a user
+    query. Tokens issued before the claim existed fall back to a single
+    database lookup, memoized for the rest of the request.
+
+    Must be called inside a ``@jwt_required()`` view.
+
+    Returns:
+        The user's rotation city ID, or None if the user has none
+    """
+    claims = get_jwt()
+    if ROTATION_CITY_CLAIM in claims:
+        return claims[ROTATION_CITY_CLAIM]
+
+    if 'rotation_city_id' not in g:
+        user = UserRepository().get_user_by_id(int(get_jwt_identity()))
+        g.rotation_city_id = user.rotation_city_id if user else None
+    return g.rotation_city_id
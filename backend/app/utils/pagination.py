@@ -0,0 +1,128 @@
+"""
+Pagination Helpers
+Opaque keyset cursors shared by paginated list endpoints.
+"""
+import base64
+import binascii
+import math
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor.
+
+    Args:
+        created_at: Timestamp of the last row on the current page
+        row_id: Primary key of the last row on the current page
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        created_at, row_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def encode_score_cursor(score: float, row_id: int) -> str:
+    """Encode a (score, id) keyset position as an opaque cursor.
+
+    The score is written with ``repr`` so it decodes to the exact same
+    float and the next page resumes right after the last row. Queries
+    must compute the score in double precision: a ``real`` column would
+    not compare equal to the decoded value.
+
+    Args:
+        score: Sort score of the last row on the current page
+        row_id: Primary key of the last row on the current page
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = f"{score!r}|{row_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, int]:
+    """Decode a cursor produced by encode_score_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+
+    Returns:
+        Tuple of (score, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        score, row_id = raw.rsplit('|', 1)
+        score = float(score)
+        if not math.isfinite(score):
+            raise ValueError
+        return score, int(row_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def parse_limit(value: Optional[int]) -> int:
+    """Clamp a requested page size to the allowed range.
+
+    Args:
+        value: Requested limit from the query string (may be None)
+
+    Returns:
+        Limit between 1 and MAX_PAGE_LIMIT
+    """
+    if value is None:
+        return DEFAULT_PAGE_LIMIT
+    return max(1, min(value, MAX_PAGE_LIMIT))
+
+
+def parse_since(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 ``since`` timestamp from the query string.
+
+    Timestamps with an offset are converted to naive UTC, matching the
+    stored ``created_at`` columns.
+
+    Args:
+        value: Raw query string value (may be None or empty)
+
+    Returns:
+        Naive UTC datetime, or None when not given
+
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    if not value:
+        return None
+    try:
+        since = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError("Invalid since timestamp")
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
@@ -0,0 +1,146 @@
+"""
+Item Loader Benchmark
+Compares the JOINED and SELECTIN item loader strategies on items that
+carry many categories and tags.
+
+Reports, per strategy, the number of SQL statements issued, the number of
+result rows the database sends back and the wall time of the list query.
+
+Usage:
+    cd backend
+    python benchmarks/item_loading.py
+    python benchmarks/item_loading.py --items 200 --categories 6 --tags 12
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import event, text
+
+from app import create_app, db
+from app.models.rotation_city import RotationCity
+from app.models.user import User
+from app.models.category import Category
+from app.models.item import Item
+from app.models.category_item import CategoryItem
+from app.models.tag import Tag, TagValueType
+from app.models.value import Value
+from app.models.item_tag_value import ItemTagValue
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.base.item_load_strategy import ItemLoadStrategy
+
+
+def seed(item_count: int, category_count: int, tag_count: int) -> int:
+    """Create one city whose items all carry every category and tag.
+
+    Returns:
+        The rotation city ID
+    """
+    city = RotationCity(name='Benchmark City', time_zone='UTC')
+    db.session.add(city)
+    db.session.flush()
+
+    user = User(
+        first_name='Bench',
+        last_name='Mark',
+        email='bench@example.com',
+        rotation_city_id=city.city_id
+    )
+    categories = [Category(category_name=f'Category {i}') for i in range(category_count)]
+    tags = [
+        Tag(name=f'Tag {i}', value_type=TagValueType.TEXT.code)
+        for i in range(tag_count)
+    ]
+    db.session.add_all([user, *categories, *tags])
+    db.session.flush()
+
+    for i in range(item_count):
+        item = Item(
+            name=f'Item {i}',
+            location=f'Street {i}',
+            rotation_city_id=city.city_id,
+            added_by_user_id=user.user_id
+        )
+        db.session.add(item)
+        db.session.flush()
+        for category in categories:
+            db.session.add(CategoryItem(item_id=item.item_id, category_id=category.category_id))
+        for tag in tags:
+            value = Value(tag_id=tag.tag_id, name_val=f'value {i}')
+            db.session.add(value)
+            db.session.flush()
+            db.session.add(ItemTagValue(item_id=item.item_id, value_id=value.value_id))
+
+    db.session.commit()
+    return city.city_id
+
+
+def measure(city_id: int, strategy: ItemLoadStrategy) -> dict:
+    """Run the list query once with the given strategy and collect stats."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', capture)
+    db.session.expunge_all()
+    start = time.perf_counter()
+    try:
+        items = ItemRepository().get_all_items_with_details(city_id, strategy=strategy)
+        for item in items:
+            # Touch every loaded relationship as the response builder does
+            [ci.category.category_name for ci in item.category_items]
+            [itv.value.tag.name for itv in item.item_tag_values]
+    finally:
+        elapsed = time.perf_counter() - start
+        event.remove(engine, 'before_cursor_execute', capture)
+
+    # Re-run the captured statements to count the rows each one returned
+    rows = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows += len(conn.exec_driver_sql(statement, parameters).fetchall())
+
+    return {
+        'items': len(items),
+        'statements': len(statements),
+        'rows': rows,
+        'seconds': elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--categories', type=int, default=5)
+    parser.add_argument('--tags', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        city_id = seed(args.items, args.categories, args.tags)
+        db.session.execute(text('ANALYZE'))
+
+        print(
+            f"{args.items} items x {args.categories} categories x {args.tags} tags "
+            f"(best of {args.repeat})"
+        )
+        print(f"{'strategy':<10} {'items':>6} {'queries':>8} {'rows':>8} {'ms':>9}")
+        for strategy in ItemLoadStrategy:
+            runs = [measure(city_id, strategy) for _ in range(args.repeat)]
+            best = min(runs, key=lambda run: run['seconds'])
+            print(
+                f"{strategy.value:<10} {best['items']:>6} {best['statements']:>8} "
+                f"{best['rows']:>8} {best['seconds'] * 1000:>9.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,7 @@ Usage:
 """
 import os
 import sys
-import base64
+import mimetypes
 
 # Add backend directory to path so we can import app modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -25,22 +25,25 @@ from app.models.item import Item
 from app.models.category_item import CategoryItem
 from app.models.item_tag_value import ItemTagValue
 from app.models.user import User
+from app.services.images import ImageService
+from app.repositories.implementations.value_repository import ValueRepository
 
 
-def load_image_as_base64(image_path):
-    """Load an image file and convert to base64 string."""
+def store_seed_image(image_path):
+    """Store an image file in the image store and return its key."""
     try:
         # Get the path relative to seed directory
         full_path = os.path.join(os.path.dirname(__file__), image_path)
         if os.path.exists(full_path):
             with open(full_path, 'rb') as f:
                 image_data = f.read()
-                return base64.b64encode(image_data).decode('utf-8')
+            mimetype = mimetypes.guess_type(full_path)[0] or 'image/png'
+            return ImageService().store(image_data, mimetype)
         else:
             print(f"⚠️  Image not found: {full_path}")
             return None
     except Exception as e:
-        print(f"⚠️  Error loading image {image_path}: {str(e)}")
+        print(f"⚠️  Error storing image {image_path}: {str(e)}")
         return None
 
 
@@ -102,15 +105,9 @@ def seed_rotation_cities():
 
 
 def seed_categories():
-    """Populate item categories with images stored in database."""
+    """Populate item categories with icons stored in the image store."""
     print("📂 Seeding item categories with images...")
     
-    # Check if categories already exist
-    existing_count = db.session.query(Category).count()
-    if existing_count > 0:
-        print(f"ℹ️  {existing_count} categories already exist. Skipping.")
-        return
-    
     # Define categories with image paths to be loaded
     categories = [
         {
@@ -147,17 +144,23 @@ def seed_categories():
         },
     ]
     
+    # Check if categories already exist
+    existing = {category.category_name: category for category in db.session.query(Category).all()}
+    if existing:
+        restored = restore_category_icons(existing, categories)
+        print(f"ℹ️  {len(existing)} categories already exist. Restored {restored} missing icons.")
+        return
+    
     # Create and add categories
     for cat_data in categories:
         image_path = cat_data.pop('image_path')
         
-        # Load image as base64
-        image_base64 = load_image_as_base64(image_path)
+        # Store icon bytes; the row only keeps the content-addressed key
+        image_key = store_seed_image(image_path)
         
-        # Create category with base64 encoded image
         category = Category(
             category_name=cat_data['category_name'],
-            category_pic=image_base64
+            category_pic_key=image_key
         )
         db.session.add(category)
     
@@ -166,10 +169,35 @@ def seed_categories():
     
     # Print added categories
     for i, category in enumerate(db.session.query(Category).all(), 1):
-        has_image = "✓" if category.category_pic else "✗"
+        has_image = "✓" if category.category_pic_key else "✗"
         print(f"   {i}. {category.category_name} (ID: {category.category_id}) [{has_image} image]")
 
 
+def restore_category_icons(existing, categories):
+    """Store the icons of seeded categories whose image is missing.
+    
+    An image store that did not survive a redeploy would otherwise leave
+    the existing categories without icons for good.
+    
+    Returns:
+        Number of categories whose icon was stored again
+    """
+    image_service = ImageService()
+    restored = 0
+    for cat_data in categories:
+        category = existing.get(cat_data['category_name'])
+        if not category or category.category_pic:
+            continue
+        if category.category_pic_key and image_service.provider.exists(category.category_pic_key):
+            continue
+        image_key = store_seed_image(cat_data['image_path'])
+        if image_key:
+            category.category_pic_key = image_key
+            restored += 1
+    db.session.commit()
+    return restored
+
+
 def seed_tags():
     """Populate tags with different value types."""
     print("🏷️  Seeding tags...")
@@ -277,8 +305,7 @@ def seed_items_argentina():
     # Get categories and tags
     categories = {cat.category_name: cat for cat in db.session.query(Category).all()}
     tags = {tag.name: tag for tag in db.session.query(Tag).all()}
-    values = db.session.query(Value).all()
-    value_dict = {val.name_val: val for val in values if val.name_val}
+    value_repo = ValueRepository()
     
     # Define items for Argentina
     items_data = [
@@ -374,28 +401,10 @@ def seed_items_argentina():
             if tag_name in tags:
                 tag_obj = tags[tag_name]
                 
-                # Create value if needed (for boolean/numeric)
-                if isinstance(tag_value, bool):
-                    value = Value(
-                        tag_id=tag_obj.tag_id,
-                        boolean_val=tag_value
-                    )
-                elif isinstance(tag_value, (int, float)):
-                    value = Value(
-                        tag_id=tag_obj.tag_id,
-                        numerical_value=tag_value
-                    )
-                else:
-                    # Use existing value if available
-                    value = value_dict.get(tag_value)
-                    if not value:
-                        value = Value(
-                            tag_id=tag_obj.tag_id,
-                            name_val=tag_value
-                        )
-                
-                db.session.add(value)
-                db.session.flush()
+                # Values are canonical: reuse the row if it already exists
+                value = value_repo.get_or_create_values(
+                    [(tag_obj.tag_id, tag_value, tag_obj.value_type_label)]
+                )[0]
                 
                 # Link value to item
                 itv = ItemTagValue(
@@ -5,6 +5,7 @@ All model-specific fixtures are in tests/fixtures/ directory.
 """
 import pytest
 from app import create_app, db
+from app.services.cache import get_item_list_cache
 
 # Import all fixtures from the fixtures package
 from tests.fixtures.user_fixtures import *  # noqa
@@ -26,7 +27,7 @@ def setup_database(app):
     """Create a fresh database for each test.
     
     This fixture runs before each test and:
-    1. Creates all tables
+    1. Creates all tables and empties the item list cache
     2. Yields control to the test
     3. Drops all tables after the test
     
@@ -34,6 +35,7 @@ def setup_database(app):
     """
     with app.app_context():
         db.create_all()
+        get_item_list_cache().clear()
         yield
         db.session.remove()
         db.drop_all()
@@ -0,0 +1,118 @@
+-- SQLite schema built by db.create_all() before versioned migrations
+-- existed (the baseline commit). Used to test upgrades of old databases.
+
+CREATE TABLE category (
+	category_id INTEGER NOT NULL,
+	category_name VARCHAR(100) NOT NULL,
+	category_pic TEXT,
+	PRIMARY KEY (category_id),
+	UNIQUE (category_name)
+);
+
+CREATE TABLE rotation_city (
+	city_id INTEGER NOT NULL,
+	name VARCHAR(100) NOT NULL,
+	time_zone VARCHAR(50) NOT NULL,
+	res_hall_location VARCHAR(200),
+	PRIMARY KEY (city_id),
+	UNIQUE (name)
+);
+
+CREATE TABLE tag (
+	tag_id INTEGER NOT NULL,
+	name VARCHAR(100) NOT NULL,
+	value_type INTEGER NOT NULL,
+	can_add_new_value BOOLEAN,
+	PRIMARY KEY (tag_id),
+	UNIQUE (name)
+);
+
+CREATE TABLE user (
+	user_id INTEGER NOT NULL,
+	rotation_city_id INTEGER NOT NULL,
+	first_name VARCHAR(50) NOT NULL,
+	last_name VARCHAR(50) NOT NULL,
+	email VARCHAR(100) NOT NULL,
+	profile_picture TEXT,
+	created_at DATETIME,
+	updated_at DATETIME,
+	is_verified BOOLEAN NOT NULL,
+	status INTEGER NOT NULL,
+	PRIMARY KEY (user_id),
+	FOREIGN KEY(rotation_city_id) REFERENCES rotation_city (city_id),
+	UNIQUE (email)
+);
+CREATE INDEX ix_user_is_verified ON user (is_verified);
+
+CREATE TABLE value (
+	value_id INTEGER NOT NULL,
+	tag_id INTEGER NOT NULL,
+	boolean_val BOOLEAN,
+	name_val VARCHAR(200),
+	numerical_value FLOAT,
+	PRIMARY KEY (value_id),
+	FOREIGN KEY(tag_id) REFERENCES tag (tag_id)
+);
+
+CREATE TABLE item (
+	item_id INTEGER NOT NULL,
+	added_by_user_id INTEGER NOT NULL,
+	rotation_city_id INTEGER NOT NULL,
+	name VARCHAR(200) NOT NULL,
+	location VARCHAR(500) NOT NULL,
+	walking_distance FLOAT,
+	last_verified_date DATETIME,
+	number_of_verifications INTEGER,
+	created_at DATETIME,
+	PRIMARY KEY (item_id),
+	FOREIGN KEY(added_by_user_id) REFERENCES user (user_id),
+	FOREIGN KEY(rotation_city_id) REFERENCES rotation_city (city_id)
+);
+
+CREATE TABLE verification_code (
+	verification_code_id INTEGER NOT NULL,
+	user_id INTEGER NOT NULL,
+	code_hash VARCHAR(255) NOT NULL,
+	hash_salt VARCHAR(255) NOT NULL,
+	code_type INTEGER NOT NULL,
+	attempts INTEGER NOT NULL,
+	is_used BOOLEAN NOT NULL,
+	created_at DATETIME NOT NULL,
+	expires_at DATETIME NOT NULL,
+	used_at DATETIME,
+	PRIMARY KEY (verification_code_id),
+	FOREIGN KEY(user_id) REFERENCES user (user_id),
+	UNIQUE (code_hash)
+);
+CREATE INDEX ix_verification_code_created_at ON verification_code (created_at);
+CREATE INDEX ix_verification_code_is_used ON verification_code (is_used);
+CREATE INDEX ix_verification_code_user_id ON verification_code (user_id);
+
+CREATE TABLE category_item (
+	category_item_id INTEGER NOT NULL,
+	item_id INTEGER NOT NULL,
+	category_id INTEGER NOT NULL,
+	PRIMARY KEY (category_item_id),
+	FOREIGN KEY(item_id) REFERENCES item (item_id),
+	FOREIGN KEY(category_id) REFERENCES category (category_id)
+);
+
+CREATE TABLE item_tag_value (
+	item_tag_value_id INTEGER NOT NULL,
+	item_id INTEGER NOT NULL,
+	value_id INTEGER NOT NULL,
+	PRIMARY KEY (item_tag_value_id),
+	FOREIGN KEY(item_id) REFERENCES item (item_id),
+	FOREIGN KEY(value_id) REFERENCES value (value_id)
+);
+
+CREATE TABLE item_verification (
+	verification_id INTEGER NOT NULL,
+	user_id INTEGER NOT NULL,
+	item_id INTEGER NOT NULL,
+	note TEXT,
+	created_at DATETIME,
+	PRIMARY KEY (verification_id),
+	FOREIGN KEY(user_id) REFERENCES user (user_id),
+	FOREIGN KEY(item_id) REFERENCES item (item_id)
+);
@@ -2,10 +2,17 @@
 Item Verification Fixtures
 """
 import pytest
-from app.models import ItemVerification
+from app.models import Item, ItemVerification
 from datetime import datetime, timedelta
 
 
+def _count_verifications(db_session, item_id, verifications):
+    """Keep the item's denormalized counters in step, as verify_item does."""
+    item = db_session.get(Item, item_id)
+    item.number_of_verifications = (item.number_of_verifications or 0) + len(verifications)
+    item.last_verified_date = max(v.created_at for v in verifications)
+
+
 @pytest.fixture
 def item_verification(db_session, user, item):
     """Create a test item verification."""
@@ -15,6 +22,8 @@ def item_verification(db_session, user, item):
         note="Item verified and in good condition"
     )
     db_session.add(verification)
+    db_session.flush()
+    _count_verifications(db_session, item.item_id, [verification])
     db_session.commit()
     db_session.refresh(verification)
     return verification
@@ -29,6 +38,8 @@ def item_verification_no_note(db_session, verified_user, item):
         note=None
     )
     db_session.add(verification)
+    db_session.flush()
+    _count_verifications(db_session, item.item_id, [verification])
     db_session.commit()
     db_session.refresh(verification)
     return verification
@@ -48,6 +59,7 @@ def old_verification(db_session, user, item):
     # Manually set created_at to yesterday
     yesterday = datetime.utcnow() - timedelta(days=1)
     verification.created_at = yesterday
+    _count_verifications(db_session, item.item_id, [verification])
     db_session.commit()
     db_session.refresh(verification)
     return verification
@@ -80,11 +92,14 @@ def multiple_verifications(db_session, user, verified_user, item):
     v3 = ItemVerification(
         user_id=user.user_id,
         item_id=item.item_id,
-        note="Third verification"
+        note="Third verification",
+        created_at=datetime.utcnow() - timedelta(days=1)
     )
     db_session.add(v3)
     verifications.append(v3)
     
+    db_session.flush()
+    _count_verifications(db_session, item.item_id, verifications)
     db_session.commit()
     for v in verifications:
         db_session.refresh(v)
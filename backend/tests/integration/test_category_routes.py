@@ -3,6 +3,7 @@ Integration tests for category routes
 """
 import pytest
 from app.services.auth.token_service import TokenService
+from app.services.category_service import CategoryService
 
 
 @pytest.mark.integration
@@ -173,3 +174,45 @@ class TestCategoryRoutes:
         )
         
         assert response.status_code == 401
+
+    def test_get_categories_not_modified(
+        self, client, category, verified_user, app_context
+    ):
+        """Test GET /api/v1/category/ answers a matching ETag with 304"""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        response = client.get('/api/v1/category/', headers=headers)
+        etag = response.headers['ETag']
+
+        cached = client.get(
+            '/api/v1/category/',
+            headers={**headers, 'If-None-Match': etag}
+        )
+        without_images = client.get(
+            '/api/v1/category/?no_images=true',
+            headers={**headers, 'If-None-Match': etag}
+        )
+
+        assert cached.status_code == 304
+        assert without_images.status_code == 200
+        assert without_images.headers['ETag'] != etag
+
+    def test_get_categories_modified_after_rename(
+        self, client, category, verified_user, app_context
+    ):
+        """Test GET /api/v1/category/ serves the new name after an edit"""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        etag = client.get('/api/v1/category/', headers=headers).headers['ETag']
+        CategoryService().update_category(category.category_id, category_name="Gadgets")
+
+        response = client.get(
+            '/api/v1/category/',
+            headers={**headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert response.get_json()[0]['category_name'] == "Gadgets"
@@ -1,10 +1,13 @@
 """Integration tests for Item API endpoints."""
 import pytest
 from flask import json
+from flask_jwt_extended import create_access_token
 from app.repositories.implementations.tag_repository import TagRepository
 from app.repositories.implementations.category_repository import CategoryRepository
 from app.models.category import Category
+from app.models.item import Item
 from app.services.auth.token_service import TokenService
+from app.services.verification_service import VerificationService
 from app import db
 
 
@@ -379,6 +382,7 @@ class TestItemRoutes:
         assert all('item_id' in item for item in data)
         assert all('name' in item for item in data)
         assert all('location' in item for item in data)
+        assert all('profile_picture' not in item['added_by_user'] for item in data)
 
     def test_get_item_by_id_requires_authentication(self, client):
         """Test that GET /api/v1/item/<id> requires JWT token."""
@@ -600,3 +604,532 @@ class TestItemRoutes:
         assert data[1]['name'] == "Item 1"
         assert data[2]['name'] == "Item 0"
 
+
+    def test_get_all_items_paginated(self, client, verified_user, app_context, db_session):
+        """Test that limit/cursor return pages with a next_cursor until exhausted."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Paged")
+        db.session.add(category)
+        db.session.commit()
+        
+        for i in range(3):
+            client.post('/api/v1/item/', headers=headers, json={
+                "name": f"Item {i}",
+                "location": f"Location {i}",
+                "category_ids": [category.category_id]
+            })
+        
+        response = client.get('/api/v1/item/?limit=2', headers=headers)
+        assert response.status_code == 200
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Item 2", "Item 1"]
+        assert page['next_cursor'] is not None
+        
+        response = client.get(
+            f'/api/v1/item/?limit=2&cursor={page["next_cursor"]}', headers=headers
+        )
+        assert response.status_code == 200
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Item 0"]
+        assert page['next_cursor'] is None
+
+    def test_get_all_items_ordered_by_freshness(self, client, verified_user, app_context, db_session):
+        """Test that order_by=freshness pages by score with its own cursors."""
+        from app.models.item import Item
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Fresh")
+        db.session.add(category)
+        db.session.commit()
+        
+        for i, score in enumerate([0.9, 0.2, 1.6]):
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": f"Item {i}",
+                "location": f"Location {i}",
+                "category_ids": [category.category_id]
+            })
+            item_id = json.loads(response.data)['item_id']
+            db.session.get(Item, item_id).freshness_score = score
+        db.session.commit()
+        
+        response = client.get('/api/v1/item/?order_by=freshness&limit=2', headers=headers)
+        assert response.status_code == 200
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Item 2", "Item 0"]
+        
+        response = client.get(
+            f'/api/v1/item/?order_by=freshness&limit=2&cursor={page["next_cursor"]}',
+            headers=headers
+        )
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Item 1"]
+        
+        response = client.get('/api/v1/item/?order_by=freshness', headers=headers)
+        assert [item['name'] for item in json.loads(response.data)] == ["Item 2", "Item 0", "Item 1"]
+
+    def test_get_all_items_rejects_invalid_order(self, client, verified_user, app_context):
+        """Test that an unknown order_by is rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/?order_by=name', headers=headers)
+        
+        assert response.status_code == 400
+
+    def test_get_all_items_filtered(self, client, verified_user, app_context, db_session):
+        """Test category, tag value, numeric range and distance filters."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        pharmacy = Category(category_name="Pharmacy")
+        grocery = Category(category_name="Groceries")
+        db.session.add_all([pharmacy, grocery])
+        db.session.commit()
+        tag_repo = TagRepository()
+        hours = tag_repo.create_tag(name="Hours", value_type="text")
+        open_now = tag_repo.create_tag(name="Open now", value_type="boolean")
+        rating = tag_repo.create_tag(name="Rating", value_type="numeric")
+        
+        for name, category, hours_value, is_open, stars, distance in [
+            ("Night Pharmacy", pharmacy, "24/7", True, 4.5, 300.0),
+            ("Day Pharmacy", pharmacy, "9-5", False, 3.0, 200.0),
+            ("Far Pharmacy", pharmacy, "24/7", True, 5.0, 900.0),
+            ("Corner Shop", grocery, "24/7", True, 4.0, 100.0),
+        ]:
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Downtown",
+                "walking_distance": distance,
+                "category_ids": [category.category_id],
+                "existing_tags": [
+                    {"tag_id": hours.tag_id, "value": hours_value},
+                    {"tag_id": open_now.tag_id, "value": is_open},
+                    {"tag_id": rating.tag_id, "value": stars},
+                ]
+            })
+            assert response.status_code == 201
+        
+        def names(query):
+            response = client.get(f'/api/v1/item/?{query}', headers=headers)
+            assert response.status_code == 200
+            return [item['name'] for item in json.loads(response.data)['items']]
+        
+        assert names(
+            f'category_id={pharmacy.category_id}&tag={hours.tag_id}:24/7'
+            f'&max_walking_distance=500'
+        ) == ["Night Pharmacy"]
+        assert names(
+            f'tag={hours.tag_id}:24/7&tag={hours.tag_id}:9-5&tag={open_now.tag_id}:false'
+        ) == ["Day Pharmacy"]
+        assert names(
+            f'category_id={grocery.category_id}&category_id={pharmacy.category_id}'
+            f'&tag_min={rating.tag_id}:4&tag_max={rating.tag_id}:4.5'
+        ) == ["Corner Shop", "Night Pharmacy"]
+
+    def test_get_all_items_rejects_invalid_filters(self, client, verified_user, app_context):
+        """Test that malformed filters and unknown tags are rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        hours = TagRepository().create_tag(name="Hours", value_type="text")
+        
+        for query in [
+            'category_id=abc',
+            'tag=24/7',
+            'tag=9999:yes',
+            f'tag_min={hours.tag_id}:1',
+            'max_walking_distance=far',
+        ]:
+            response = client.get(f'/api/v1/item/?{query}', headers=headers)
+            assert response.status_code == 400, query
+
+    def test_get_item_facets(self, client, verified_user, app_context, db_session):
+        """Test facet counts, each ignoring only its own filter."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        pharmacy = Category(category_name="Pharmacy")
+        grocery = Category(category_name="Groceries")
+        db.session.add_all([pharmacy, grocery])
+        db.session.commit()
+        hours = TagRepository().create_tag(name="Hours", value_type="text")
+        
+        for name, category, hours_value in [
+            ("Night Pharmacy", pharmacy, "24/7"),
+            ("Day Pharmacy", pharmacy, "9-5"),
+            ("Corner Shop", grocery, "24/7"),
+        ]:
+            client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Downtown",
+                "category_ids": [category.category_id],
+                "existing_tags": [{"tag_id": hours.tag_id, "value": hours_value}]
+            })
+        
+        response = client.get('/api/v1/item/facets', headers=headers)
+        assert response.status_code == 200
+        facets = json.loads(response.data)
+        assert [(c['category_name'], c['count']) for c in facets['categories']] == [
+            ("Pharmacy", 2), ("Groceries", 1)
+        ]
+        assert facets['tags'][0]['value_type'] == 'text'
+        assert [(v['value'], v['count']) for v in facets['tags'][0]['values']] == [
+            ("24/7", 2), ("9-5", 1)
+        ]
+        
+        response = client.get(
+            f'/api/v1/item/facets?category_id={pharmacy.category_id}&tag={hours.tag_id}:24/7',
+            headers=headers
+        )
+        facets = json.loads(response.data)
+        # Categories apply the tag filter, the tag applies the category filter
+        assert [(c['category_name'], c['count']) for c in facets['categories']] == [
+            ("Groceries", 1), ("Pharmacy", 1)
+        ]
+        assert [(v['value'], v['count']) for v in facets['tags'][0]['values']] == [
+            ("24/7", 1), ("9-5", 1)
+        ]
+        
+        etag = response.headers['ETag']
+        response = client.get(
+            f'/api/v1/item/facets?category_id={pharmacy.category_id}&tag={hours.tag_id}:24/7',
+            headers={**headers, 'If-None-Match': etag}
+        )
+        assert response.status_code == 304
+
+    def test_get_nearby_items(self, client, verified_user, app_context, db_session):
+        """Test nearby items are limited to the radius and sorted by distance."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Places")
+        db.session.add(category)
+        db.session.commit()
+        
+        # Roughly 110 m per 0.001 degrees of latitude
+        for name, latitude in [("Far", -34.6000), ("Near", -34.5960), ("Nearest", -34.5957)]:
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Av. Santa Fe",
+                "latitude": latitude,
+                "longitude": -58.3972,
+                "category_ids": [category.category_id]
+            })
+            assert response.status_code == 201
+        client.post('/api/v1/item/', headers=headers, json={
+            "name": "Unplaced",
+            "location": "Somewhere",
+            "category_ids": [category.category_id]
+        })
+        
+        response = client.get(
+            '/api/v1/item/nearby?lat=-34.5956&lng=-58.3972&radius=300', headers=headers
+        )
+        assert response.status_code == 200
+        items = json.loads(response.data)['items']
+        assert [item['name'] for item in items] == ["Nearest", "Near"]
+        assert items[0]['distance_meters'] < items[1]['distance_meters'] < 300
+        assert items[0]['latitude'] == -34.5957
+        
+        response = client.get(
+            '/api/v1/item/nearby?lat=-34.5956&lng=-58.3972&radius=1000&limit=1', headers=headers
+        )
+        assert [item['name'] for item in json.loads(response.data)['items']] == ["Nearest"]
+
+    def test_get_nearby_items_rejects_invalid_point(self, client, verified_user, app_context):
+        """Test that missing coordinates or a bad radius are rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        for query in ['lat=1', 'lat=91&lng=0', 'lat=0&lng=0&radius=0', 'lat=0&lng=0&radius=50000']:
+            response = client.get(f'/api/v1/item/nearby?{query}', headers=headers)
+            assert response.status_code == 400, query
+
+    def test_create_item_requires_both_coordinates(self, client, verified_user, app_context, db_session):
+        """Test that a latitude without a longitude is rejected."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.post('/api/v1/item/', headers=headers, json={
+            "name": "Half placed",
+            "location": "Somewhere",
+            "latitude": 10.0,
+            "category_ids": [1]
+        })
+        
+        assert response.status_code == 400
+
+    def test_search_items_ranks_and_pages(self, client, verified_user, app_context, db_session):
+        """Test that search matches names, categories and text tag values, names first."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Pharmacy")
+        other = Category(category_name="Groceries")
+        db.session.add_all([category, other])
+        db.session.commit()
+        hours = TagRepository().create_tag(name="Hours", value_type="text")
+        
+        for name, category_id, value in [
+            ("Corner Store", other.category_id, "Pharmacy counter open late"),
+            ("Main Street Pharmacy", category.category_id, "24/7"),
+            ("Bakery", other.category_id, "Mornings"),
+        ]:
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Downtown",
+                "category_ids": [category_id],
+                "existing_tags": [{"tag_id": hours.tag_id, "value": value}]
+            })
+            assert response.status_code == 201
+        
+        response = client.get('/api/v1/item/search?q=pharm&limit=1', headers=headers)
+        assert response.status_code == 200
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Main Street Pharmacy"]
+        assert page['items'][0]['categories']
+        
+        response = client.get(
+            f'/api/v1/item/search?q=pharm&limit=1&cursor={page["next_cursor"]}',
+            headers=headers
+        )
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Corner Store"]
+        assert page['next_cursor'] is None
+        
+        response = client.get('/api/v1/item/search?q=downtown+mornings', headers=headers)
+        assert [item['name'] for item in json.loads(response.data)['items']] == ["Bakery"]
+
+    def test_search_items_requires_words(self, client, verified_user, app_context):
+        """Test that a query without words is rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/search?q=%2A', headers=headers)
+        
+        assert response.status_code == 400
+
+    def test_get_item_changes_since_token(self, client, verified_user, app_context, db_session):
+        """Test that the change feed returns only items created or verified since a token."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Places")
+        db.session.add(category)
+        db.session.commit()
+        item_ids = []
+        for name in ["First", "Second", "Third"]:
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Downtown",
+                "category_ids": [category.category_id]
+            })
+            item_ids.append(json.loads(response.data)['item_id'])
+        
+        response = client.get('/api/v1/item/changes?limit=2', headers=headers)
+        assert response.status_code == 200
+        feed = json.loads(response.data)
+        assert [item['name'] for item in feed['items']] == ["First", "Second"]
+        assert feed['has_more'] is True
+        
+        response = client.get(f'/api/v1/item/changes?since={feed["next_token"]}', headers=headers)
+        feed = json.loads(response.data)
+        assert [item['name'] for item in feed['items']] == ["Third"]
+        assert feed['has_more'] is False
+        
+        # Nothing changed: no items and a token that still works
+        response = client.get(f'/api/v1/item/changes?since={feed["next_token"]}', headers=headers)
+        unchanged = json.loads(response.data)
+        assert unchanged['items'] == []
+        assert unchanged['next_token'] == feed['next_token']
+        
+        VerificationService().verify_item(verified_user.user_id, item_ids[0])
+        response = client.get(f'/api/v1/item/changes?since={feed["next_token"]}', headers=headers)
+        items = json.loads(response.data)['items']
+        assert [item['name'] for item in items] == ["First"]
+        assert items[0]['number_of_verifications'] == 1
+
+    def test_set_item_tag_value_changes_only_that_item(self, client, verified_user, app_context, db_session):
+        """Test that setting a shared tag value re-points one item and refreshes list, search and feed."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Stalls")
+        db.session.add(category)
+        db.session.commit()
+        color = TagRepository().create_tag(name="Color", value_type="text")
+        item_ids = []
+        for name in ["First", "Second"]:
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Market",
+                "category_ids": [category.category_id],
+                "existing_tags": [{"tag_id": color.tag_id, "value": "Red"}]
+            })
+            item_ids.append(json.loads(response.data)['item_id'])
+        client.get('/api/v1/item/', headers=headers)
+        feed = json.loads(client.get('/api/v1/item/changes', headers=headers).data)
+        
+        response = client.put(
+            f'/api/v1/item/{item_ids[0]}/tags/{color.tag_id}',
+            headers=headers,
+            json={"value": "Blue"}
+        )
+        
+        assert response.status_code == 200
+        assert [tag['value'] for tag in json.loads(response.data)['tags']] == ["Blue"]
+        listed = {
+            item['name']: [tag['value'] for tag in item['tags']]
+            for item in json.loads(client.get('/api/v1/item/', headers=headers).data)
+        }
+        assert listed == {"First": ["Blue"], "Second": ["Red"]}
+        response = client.get('/api/v1/item/search?q=blue', headers=headers)
+        assert [item['name'] for item in json.loads(response.data)['items']] == ["First"]
+        response = client.get(f'/api/v1/item/changes?since={feed["next_token"]}', headers=headers)
+        assert [item['name'] for item in json.loads(response.data)['items']] == ["First"]
+
+    def test_set_item_tag_value_rejects_wrong_type(self, client, verified_user, app_context, db_session):
+        """Test that a value not matching the tag's value_type is rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Typed")
+        db.session.add(category)
+        db.session.commit()
+        working = TagRepository().create_tag(name="Working", value_type="boolean")
+        response = client.post('/api/v1/item/', headers=headers, json={
+            "name": "Printer",
+            "location": "Library",
+            "category_ids": [category.category_id],
+            "existing_tags": [{"tag_id": working.tag_id, "value": True}]
+        })
+        item_id = json.loads(response.data)['item_id']
+        
+        response = client.put(
+            f'/api/v1/item/{item_id}/tags/{working.tag_id}',
+            headers=headers,
+            json={"value": "broken"}
+        )
+        
+        assert response.status_code == 400
+
+    def test_get_item_changes_rejects_invalid_token(self, client, verified_user, app_context):
+        """Test that a malformed sync token is rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/changes?since=not-a-token', headers=headers)
+        
+        assert response.status_code == 400
+
+    def test_get_all_items_rejects_invalid_cursor(self, client, verified_user, app_context):
+        """Test that a malformed cursor is rejected with 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/?cursor=not-a-cursor', headers=headers)
+        
+        assert response.status_code == 400
+
+    def test_get_all_items_served_from_cache_until_item_created(self, client, verified_user, app_context, db_session):
+        """Test the city list is cached and a new item invalidates it."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Cached")
+        db.session.add(category)
+        db.session.commit()
+        item_data = {
+            "name": "First",
+            "location": "Somewhere",
+            "category_ids": [category.category_id]
+        }
+        client.post('/api/v1/item/', headers=headers, json=item_data)
+        
+        client.get('/api/v1/item/', headers=headers)
+        response = client.get('/api/v1/item/', headers=headers)
+        stats = json.loads(client.get('/api/v1/cache-stats', headers=headers).data)['item_list']
+        
+        assert len(json.loads(response.data)) == 1
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        
+        client.post('/api/v1/item/', headers=headers, json={**item_data, "name": "Second"})
+        response = client.get('/api/v1/item/', headers=headers)
+        
+        assert [item['name'] for item in json.loads(response.data)] == ["Second", "First"]
+
+    def test_get_all_items_cache_sees_writes_from_other_processes(self, client, verified_user, app_context, db_session):
+        """Test an item written without bumping this worker's cache version is still listed."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        category = Category(category_name="Shared")
+        db.session.add(category)
+        db.session.commit()
+        client.post('/api/v1/item/', headers=headers, json={
+            "name": "First",
+            "location": "Somewhere",
+            "category_ids": [category.category_id]
+        })
+        first = client.get('/api/v1/item/', headers=headers)
+
+        # Another worker or a CLI job writes through its own cache instance
+        db.session.add(Item(
+            name="Second",
+            location="Elsewhere",
+            added_by_user_id=verified_user.user_id,
+            rotation_city_id=verified_user.rotation_city_id
+        ))
+        db.session.commit()
+        response = client.get('/api/v1/item/', headers=headers)
+
+        assert response.headers['ETag'] != first.headers['ETag']
+        assert sorted(item['name'] for item in json.loads(response.data)) == ["First", "Second"]
+
+    def test_cache_stats_requires_authentication(self, client):
+        """Test that GET /api/v1/cache-stats requires JWT token."""
+        response = client.get('/api/v1/cache-stats')
+
+        assert response.status_code == 401
+
+    def test_get_all_items_not_modified_until_item_created(self, client, verified_user, app_context, db_session):
+        """Test GET /item/ answers a matching ETag with 304 until the city's list changes."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Conditional")
+        db.session.add(category)
+        db.session.commit()
+        item_data = {
+            "name": "First",
+            "location": "Somewhere",
+            "category_ids": [category.category_id]
+        }
+        client.post('/api/v1/item/', headers=headers, json=item_data)
+        
+        response = client.get('/api/v1/item/', headers=headers)
+        etag = response.headers['ETag']
+        page_etag = client.get('/api/v1/item/?limit=10', headers=headers).headers['ETag']
+        
+        cached = client.get('/api/v1/item/', headers={**headers, 'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert page_etag != etag
+        
+        client.post('/api/v1/item/', headers=headers, json={**item_data, "name": "Second"})
+        response = client.get('/api/v1/item/', headers={**headers, 'If-None-Match': etag})
+        
+        assert response.status_code == 200
+        assert len(json.loads(response.data)) == 2
+
+    def test_get_all_items_accepts_token_without_city_claim(self, client, verified_user, app_context):
+        """Test that tokens issued before the rotation_city_id claim still resolve the city."""
+        token = create_access_token(identity=str(verified_user.user_id))
+        headers = {'Authorization': f'Bearer {token}'}
+        
+        response = client.get('/api/v1/item/', headers=headers)
+        
+        assert response.status_code == 200
+        assert json.loads(response.data) == []
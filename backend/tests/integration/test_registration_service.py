@@ -4,14 +4,25 @@ Integration Tests for RegistrationService
 Tests ACTUAL user registration, verification, and re-registration flows.
 Uses real database and service instances - tests actual business logic, not mocks.
 """
+import base64
+import os
+
 import pytest
 from unittest.mock import patch
 from app.services.auth.registration_service import RegistrationService
+from app.services.auth.verification_code_service import RateLimitExceededError
+from app.services.images import ImageService
+from app.services.images.providers.local_provider import LocalImageStorageProvider
 from app.models.user import User, VerificationStatusEnum
 from app.models.verification_code import VerificationCodeType, VerificationCode
 from app import db
 
 
+PICTURE = 'data:image/png;base64,' + base64.b64encode(
+    b'\x89PNG\r\n\x1a\n' + b'png-bytes'
+).decode('ascii')
+
+
 @pytest.mark.integration
 @pytest.mark.service
 class TestRegistrationServiceIntegration:
@@ -167,6 +178,74 @@ class TestRegistrationServiceIntegration:
         ).first()
         assert first_code is not None
 
+    def test_register_verified_user_stores_no_picture(
+        self,
+        rotation_city,
+        db_session,
+        tmp_path
+    ):
+        """Test that a rejected registration leaves nothing in the image store."""
+        with patch('app.services.auth.registration_service.NotificationService'):
+            service = RegistrationService(
+                image_service=ImageService(provider=LocalImageStorageProvider(str(tmp_path)))
+            )
+        user = service.register_user(
+            first_name='John',
+            last_name='Doe',
+            email='john@example.com',
+            rotation_city_id=rotation_city.city_id
+        )
+        user.is_verified = True
+        db_session.commit()
+
+        with pytest.raises(ValueError, match="User with this email already exists"):
+            service.register_user(
+                first_name='John',
+                last_name='Doe',
+                email='john@example.com',
+                rotation_city_id=rotation_city.city_id,
+                profile_picture=PICTURE
+            )
+
+        assert os.listdir(tmp_path) == []
+
+    def test_register_rate_limited_user_stores_no_picture(
+        self,
+        rotation_city,
+        db_session,
+        tmp_path
+    ):
+        """Test that a rate-limited re-registration changes nothing."""
+        with patch('app.services.auth.registration_service.NotificationService'):
+            service = RegistrationService(
+                image_service=ImageService(provider=LocalImageStorageProvider(str(tmp_path)))
+            )
+        service.register_user(
+            first_name='John',
+            last_name='Doe',
+            email='john@example.com',
+            rotation_city_id=rotation_city.city_id
+        )
+
+        with patch.object(
+            service.verification_service,
+            'create_registration_code',
+            side_effect=RateLimitExceededError("Too many codes")
+        ):
+            with pytest.raises(RateLimitExceededError):
+                service.register_user(
+                    first_name='Jane',
+                    last_name='Smith',
+                    email='john@example.com',
+                    rotation_city_id=rotation_city.city_id,
+                    profile_picture=PICTURE
+                )
+
+        assert os.listdir(tmp_path) == []
+        db_user = db_session.query(User).filter_by(email='john@example.com').first()
+        assert db_user.first_name == 'John'
+        assert db_user.profile_picture_key is None
+
     # ============================================================================
     # Tests for verify_user_email()
     # ============================================================================
@@ -87,3 +87,18 @@ class TestRotationCityRoutes:
         assert "San Francisco" in city_names
         assert "Berlin" in city_names
         assert "Seoul" in city_names
+
+    def test_get_all_rotation_cities_not_modified(self, client, rotation_city, db_session):
+        """Test GET /api/v1/rotation-city/ answers a matching ETag with 304"""
+        response = client.get('/api/v1/rotation-city/')
+        etag = response.headers['ETag']
+        
+        cached = client.get('/api/v1/rotation-city/', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        
+        db_session.add(RotationCity(name="Berlin", time_zone="Europe/Berlin"))
+        db_session.commit()
+        response = client.get('/api/v1/rotation-city/', headers={'If-None-Match': etag})
+        
+        assert response.status_code == 200
+        assert len(response.get_json()) == 2
@@ -116,3 +116,25 @@ class TestTagRoutes:
         data2 = json.loads(response2.data)
         
         assert data1 == data2
+
+    def test_get_all_tags_not_modified_until_tag_created(self, client, verified_user, app_context, db_session):
+        """Test that a matching If-None-Match gets 304 until the tag list changes."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        tag_repo = TagRepository()
+        tag_repo.create_tag(name="Condition", value_type="text")
+        
+        response = client.get('/api/v1/tag/', headers=headers)
+        etag = response.headers['ETag']
+        
+        cached = client.get('/api/v1/tag/', headers={**headers, 'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+        
+        tag_repo.create_tag(name="Price", value_type="numeric")
+        response = client.get('/api/v1/tag/', headers={**headers, 'If-None-Match': etag})
+        
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert len(json.loads(response.data)) == 2
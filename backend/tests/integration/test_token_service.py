@@ -30,6 +30,7 @@ class TestTokenService:
         assert decoded['email'] == verified_user.email
         assert decoded['first_name'] == verified_user.first_name
         assert decoded['last_name'] == verified_user.last_name
+        assert decoded['rotation_city_id'] == verified_user.rotation_city_id
 
     def test_refresh_token_contains_user_id(self, verified_user, app_context):
         tokens = TokenService.generate_tokens(verified_user)
@@ -1,8 +1,15 @@
 """Integration tests for user routes."""
+import base64
+
 import pytest
+from flask_jwt_extended import decode_token
 from app.services.auth.token_service import TokenService
 from app.models import User, VerificationStatusEnum
 
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'png-bytes'
+PNG_DATA_URL = 'data:image/png;base64,' + base64.b64encode(PNG_BYTES).decode('ascii')
+JPEG_BYTES = b'\xff\xd8\xff\xe0' + b'jpeg-bytes'
+
 
 @pytest.mark.integration
 class TestGetCurrentUserRoute:
@@ -172,6 +179,146 @@ class TestGetUserByIdRoute:
         data = response.get_json()
         assert data['message'] == 'User not found.'
 
+@pytest.mark.integration
+class TestGetUserAvatarRoute:
+    """Tests for the GET /api/v1/user/<user_id>/avatar endpoint."""
+
+    def test_get_user_avatar_returns_image_with_etag(
+        self,
+        client,
+        verified_user,
+        db_session,
+        app_context
+    ):
+        """Test the avatar is served as bytes and revalidates with 304."""
+        db_user = db_session.get(User, verified_user.user_id)
+        db_user.profile_picture = (
+            'data:image/jpeg;base64,' + base64.b64encode(JPEG_BYTES).decode('ascii')
+        )
+        db_session.commit()
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        response = client.get(
+            f'/api/v1/user/{verified_user.user_id}/avatar',
+            headers=headers
+        )
+        assert response.status_code == 200
+        assert response.data == JPEG_BYTES
+        assert response.mimetype == 'image/jpeg'
+        assert 'private' in response.headers['Cache-Control']
+        assert response.headers['X-Content-Type-Options'] == 'nosniff'
+        etag = response.headers['ETag']
+
+        response = client.get(
+            f'/api/v1/user/{verified_user.user_id}/avatar',
+            headers={**headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 304
+
+    def test_get_user_avatar_ignores_declared_type(
+        self,
+        client,
+        verified_user,
+        db_session,
+        app_context
+    ):
+        """Test legacy pictures are served as their real raster type, and others not at all."""
+        db_user = db_session.get(User, verified_user.user_id)
+        db_user.profile_picture = (
+            'data:image/svg+xml;base64,' + base64.b64encode(PNG_BYTES).decode('ascii')
+        )
+        db_session.commit()
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        response = client.get(f'/api/v1/user/{verified_user.user_id}/avatar', headers=headers)
+        assert response.status_code == 200
+        assert response.mimetype == 'image/png'
+
+        db_user.profile_picture = (
+            'data:image/svg+xml;base64,'
+            + base64.b64encode(b'<svg onload="alert(1)"/>').decode('ascii')
+        )
+        db_session.commit()
+
+        response = client.get(f'/api/v1/user/{verified_user.user_id}/avatar', headers=headers)
+        assert response.status_code == 404
+
+    def test_get_user_avatar_redirects_to_image_store(
+        self,
+        client,
+        verified_user,
+        app_context
+    ):
+        """Test uploaded avatars are stored and served immutably by key."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        response = client.put(
+            '/api/v1/user/me',
+            json={'profile_picture': PNG_DATA_URL},
+            headers=headers
+        )
+        assert response.status_code == 200
+        image_url = response.get_json()['profile_picture']
+        assert '/api/v1/images/' in image_url
+
+        response = client.get(
+            f'/api/v1/user/{verified_user.user_id}/avatar',
+            headers=headers
+        )
+        assert response.status_code == 302
+        assert response.headers['Location'] == image_url
+
+        response = client.get(image_url)
+        assert response.status_code == 200
+        assert response.data == PNG_BYTES
+        assert 'immutable' in response.headers['Cache-Control']
+        assert response.headers['X-Content-Type-Options'] == 'nosniff'
+
+        response = client.get(
+            image_url,
+            headers={'If-None-Match': response.headers['ETag']}
+        )
+        assert response.status_code == 304
+
+    def test_update_profile_picture_rejects_svg(
+        self,
+        client,
+        verified_user,
+        app_context
+    ):
+        """Test SVG uploads are refused instead of being served from the API origin."""
+        tokens = TokenService.generate_tokens(verified_user)
+        svg = base64.b64encode(b'<svg onload="alert(1)"/>').decode('ascii')
+
+        response = client.put(
+            '/api/v1/user/me',
+            json={'profile_picture': f'data:image/svg+xml;base64,{svg}'},
+            headers={'Authorization': f'Bearer {tokens["access_token"]}'}
+        )
+
+        assert response.status_code == 400
+
+    def test_get_user_avatar_returns_404_without_picture(
+        self,
+        client,
+        verified_user,
+        app_context
+    ):
+        """Test 404 when the user has no profile picture."""
+        tokens = TokenService.generate_tokens(verified_user)
+
+        response = client.get(
+            f'/api/v1/user/{verified_user.user_id}/avatar',
+            headers={'Authorization': f'Bearer {tokens["access_token"]}'}
+        )
+
+        assert response.status_code == 404
+
+
 @pytest.mark.integration
 class TestUpdateCurrentUserRoute:
     """Tests for the PUT /api/v1/user/me endpoint."""
@@ -246,6 +393,29 @@ class TestUpdateCurrentUserRoute:
         assert data['rotation_city']['city_id'] == new_city.city_id
         assert data['rotation_city']['name'] == 'Berlin'
 
+        # Tokens carrying the new city are re-issued
+        claims = decode_token(data['access_token'])
+        assert claims['rotation_city_id'] == new_city.city_id
+        assert 'refresh_token' in data
+
+    def test_update_current_user_keeps_tokens_when_city_unchanged(
+        self,
+        client,
+        verified_user,
+        app_context
+    ):
+        """Test that no tokens are re-issued when the city stays the same."""
+        tokens = TokenService.generate_tokens(verified_user)
+
+        response = client.put(
+            '/api/v1/user/me',
+            json={'first_name': 'Updated'},
+            headers={'Authorization': f'Bearer {tokens["access_token"]}'}
+        )
+
+        assert response.status_code == 200
+        assert 'access_token' not in response.get_json()
+
     def test_update_current_user_requires_auth(self, client):
         """Test that authentication is required."""
         update_data = {'first_name': 'Updated'}
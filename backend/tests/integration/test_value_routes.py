@@ -3,6 +3,7 @@ import pytest
 from flask import json
 from app.repositories.implementations.tag_repository import TagRepository
 from app.repositories.implementations.value_repository import ValueRepository
+from app.repositories.implementations.item_tag_value_repository import ItemTagValueRepository
 from app.services.auth.token_service import TokenService
 from app.models.tag import TagValueType
 
@@ -100,3 +101,31 @@ class TestValueRoutes:
         assert response.status_code == 404
         data = json.loads(response.data)
         assert 'error' in data
+
+    def test_update_value_without_items(self, client, verified_user, app_context, db_session):
+        """Test that a value no item uses can be edited in place."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        tag = TagRepository().create_tag(name="Brand", value_type=TagValueType.TEXT.code)
+        value = ValueRepository().create_value(tag_id=tag.tag_id, value="Aple", value_type="text")
+        
+        response = client.put(f'/api/v1/value/{value.value_id}', headers=headers, json={'name_val': 'Apple'})
+        
+        assert response.status_code == 200
+        assert json.loads(response.data)['name_val'] == 'Apple'
+
+    def test_update_value_used_by_items_is_rejected(self, client, verified_user, item, app_context, db_session):
+        """Test that a value shared by items cannot be rewritten for all of them at once."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        tag = TagRepository().create_tag(name="Brand", value_type=TagValueType.TEXT.code)
+        value = ValueRepository().create_value(tag_id=tag.tag_id, value="Apple", value_type="text")
+        ItemTagValueRepository().add_tag_values_to_item(item.item_id, [value.value_id])
+        db_session.commit()
+        
+        response = client.put(f'/api/v1/value/{value.value_id}', headers=headers, json={'name_val': 'Samsung'})
+        
+        assert response.status_code == 409
+        assert ValueRepository().get_value_by_id(value.value_id).name_val == 'Apple'
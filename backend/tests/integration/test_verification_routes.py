@@ -179,6 +179,45 @@ class TestVerificationRoutes:
         data = json.loads(response.data)
         assert 'message' in data
 
+    # POST /api/v1/verification/items/batch tests
+
+    def test_verify_items_batch(self, client, verified_user, item, book, app_context):
+        """Test verifying several items in one request."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.post(
+            '/api/v1/verification/items/batch',
+            headers=headers,
+            json={'verifications': [
+                {'item_id': item.item_id, 'note': 'Still here'},
+                {'item_id': book.item_id},
+                {'item_id': 99999},
+            ]}
+        )
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['verified_count'] == 2
+        assert [r['status'] for r in data['results']] == [
+            'verified', 'verified', 'not_found'
+        ]
+        assert data['results'][0]['verification_count'] == 1
+        assert 'verification_id' not in data['results'][2]
+
+    def test_verify_items_batch_validation(self, client, verified_user, app_context):
+        """Test an empty batch is rejected."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.post(
+            '/api/v1/verification/items/batch',
+            headers=headers,
+            json={'verifications': []}
+        )
+        
+        assert response.status_code == 400
+
     # GET /api/v1/verification/<verification_id> tests
 
     def test_get_verification_success(
@@ -290,6 +329,44 @@ class TestVerificationRoutes:
         assert data['total_count'] == 0
         assert data['verifications'] == []
 
+    def test_get_item_verifications_cursor_pages(
+        self,
+        client,
+        verified_user,
+        item,
+        multiple_verifications,
+        app_context
+    ):
+        """Test following next_cursor through the item history."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        url = f'/api/v1/verification/items/{item.item_id}'
+        
+        first = json.loads(client.get(f'{url}?limit=2', headers=headers).data)
+        second = json.loads(client.get(
+            f'{url}?limit=2&cursor={first["next_cursor"]}', headers=headers
+        ).data)
+        
+        assert first['total_count'] == 3
+        assert len(first['verifications']) == 2
+        assert len(second['verifications']) == 1
+        assert second['next_cursor'] is None
+
+    def test_get_item_verifications_invalid_params(
+        self,
+        client,
+        verified_user,
+        item,
+        app_context
+    ):
+        """Test a malformed cursor or since returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        url = f'/api/v1/verification/items/{item.item_id}'
+        
+        assert client.get(f'{url}?cursor=bogus', headers=headers).status_code == 400
+        assert client.get(f'{url}?since=yesterday', headers=headers).status_code == 400
+
     def test_get_item_verifications_limit_capped_at_200(
         self,
         client,
@@ -422,3 +499,33 @@ class TestVerificationRoutes:
         assert user_verifs_response.status_code == 200
         user_verifs_data = json.loads(user_verifs_response.data)
         assert user_verifs_data['count'] == 1
+
+    # GET /api/v1/verification/stats tests
+
+    def test_get_city_verification_stats(
+        self,
+        client,
+        verified_user,
+        item,
+        app_context
+    ):
+        """Test city stats reflect a new verification and support ETags."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        client.post(f'/api/v1/verification/items/{item.item_id}', headers=headers, json={})
+        
+        response = client.get('/api/v1/verification/stats?days=7', headers=headers)
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert len(data['daily']) == 7
+        assert data['daily'][-1]['verification_count'] == 1
+        assert data['total_verifications'] == 1
+        assert data['stale_item_count'] == 0
+        assert data['top_verifiers'][0]['user_id'] == verified_user.user_id
+        
+        cached = client.get(
+            '/api/v1/verification/stats?days=7',
+            headers={**headers, 'If-None-Match': response.headers['ETag']}
+        )
+        assert cached.status_code == 304
@@ -106,3 +106,21 @@ class TestItem:
         session.commit()
 
         assert item.added_by_user.email == "test@example.com"
+
+    def test_geohash_follows_coordinates(self, session, user):
+        """Test the geohash is derived from and cleared with the coordinates"""
+        item = Item(
+            added_by_user_id=user.user_id,
+            rotation_city_id=user.rotation_city_id,
+            name="Pharmacy",
+            location="Av. Santa Fe 1860",
+            latitude=57.64911,
+            longitude=10.40744
+        )
+        session.add(item)
+        session.commit()
+
+        assert item.geohash == "u4pruydqq"
+
+        item.longitude = None
+        assert item.geohash is None
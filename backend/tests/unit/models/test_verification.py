@@ -2,8 +2,9 @@
 Unit tests for Verification model
 """
 import pytest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from app import db
@@ -119,13 +120,48 @@ class TestVerification:
         )
         ver2 = ItemVerification(
             user_id=test_data['user'].user_id,
-            item_id=test_data['item'].item_id
+            item_id=test_data['item'].item_id,
+            created_at=datetime.utcnow() - timedelta(days=1)
         )
         session.add_all([ver1, ver2])
         session.commit()
 
         assert ver1.verification_id != ver2.verification_id
 
+    def test_verified_on_follows_created_at(self, session, test_data):
+        """Test that verified_on is the day of created_at"""
+        verification = ItemVerification(
+            user_id=test_data['user'].user_id,
+            item_id=test_data['item'].item_id,
+            created_at=datetime(2024, 3, 1, 23, 59)
+        )
+        session.add(verification)
+        session.commit()
+
+        assert verification.verified_on == date(2024, 3, 1)
+
+        verification.created_at = datetime(2024, 3, 2, 0, 1)
+        assert verification.verified_on == date(2024, 3, 2)
+
+    def test_one_verification_per_user_item_day(self, session, test_data):
+        """Test that a second verification on the same day is rejected"""
+        session.add_all([
+            ItemVerification(
+                user_id=test_data['user'].user_id,
+                item_id=test_data['item'].item_id,
+                created_at=datetime(2024, 3, 1, 8, 0)
+            ),
+            ItemVerification(
+                user_id=test_data['user'].user_id,
+                item_id=test_data['item'].item_id,
+                created_at=datetime(2024, 3, 1, 18, 0)
+            ),
+        ])
+
+        with pytest.raises(IntegrityError):
+            session.commit()
+        session.rollback()
+
     def test_timestamp_auto_set(self, session, test_data):
         """Test that created_at is set automatically"""
         verification = ItemVerification(
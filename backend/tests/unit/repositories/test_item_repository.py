@@ -88,3 +88,136 @@ class TestItemRepository:
         assert item1.item_id != item2.item_id
         assert item1.name == "Item 1"
         assert item2.name == "Item 2"
+
+    def test_get_all_items_with_details_keyset_pages(self, db_session, verified_user, rotation_city):
+        """Test cursor pagination walks every item once, newest first."""
+        from datetime import datetime
+        repo = ItemRepository()
+        
+        # Same timestamp for all items so item_id must break the tie
+        same_time = datetime(2025, 1, 1, 12, 0, 0)
+        for i in range(5):
+            item = repo.create_item(
+                name=f"Item {i}",
+                location=f"Location {i}",
+                rotation_city_id=rotation_city.city_id,
+                added_by_user_id=verified_user.user_id
+            )
+            item.created_at = same_time
+        db_session.commit()
+        
+        first_page = repo.get_all_items_with_details(rotation_city.city_id, limit=2)
+        last = first_page[-1]
+        second_page = repo.get_all_items_with_details(
+            rotation_city.city_id, limit=2, cursor=(last.created_at, last.item_id)
+        )
+        last = second_page[-1]
+        third_page = repo.get_all_items_with_details(
+            rotation_city.city_id, limit=2, cursor=(last.created_at, last.item_id)
+        )
+        
+        names = [item.name for item in first_page + second_page + third_page]
+        assert names == ["Item 4", "Item 3", "Item 2", "Item 1", "Item 0"]
+        assert len(third_page) == 1
+
+    def test_get_all_items_with_details_freshness_pages(self, db_session, verified_user, rotation_city):
+        """Test freshness order pages by score, highest first, ties by item_id."""
+        from app.repositories.base.item_order import ItemOrder
+        repo = ItemRepository()
+        
+        for i, score in enumerate([0.5, 1.5, 0.5, 1.0]):
+            item = repo.create_item(
+                name=f"Item {i}",
+                location=f"Location {i}",
+                rotation_city_id=rotation_city.city_id,
+                added_by_user_id=verified_user.user_id
+            )
+            item.freshness_score = score
+        db_session.commit()
+        
+        order = ItemOrder.FRESHNESS
+        first_page = repo.get_all_items_with_details(rotation_city.city_id, limit=3, order=order)
+        last = first_page[-1]
+        second_page = repo.get_all_items_with_details(
+            rotation_city.city_id, limit=3, cursor=(order.key(last), last.item_id), order=order
+        )
+        
+        names = [item.name for item in first_page + second_page]
+        assert names == ["Item 1", "Item 3", "Item 2", "Item 0"]
+
+    def test_load_strategies_return_same_items(self, db_session, verified_user, rotation_city):
+        """Test SELECTIN and JOINED loaders produce identical item graphs."""
+        from app.models.category import Category
+        from app.models.category_item import CategoryItem
+        from app.models.tag import Tag, TagValueType
+        from app.models.value import Value
+        from app.models.item_tag_value import ItemTagValue
+        from app.repositories.base.item_load_strategy import ItemLoadStrategy
+        repo = ItemRepository()
+        
+        categories = [Category(category_name=f"Category {i}") for i in range(3)]
+        tags = [Tag(name=f"Tag {i}", value_type=TagValueType.TEXT.code) for i in range(4)]
+        db_session.add_all(categories + tags)
+        db_session.commit()
+        
+        for i in range(2):
+            item = repo.create_item(
+                name=f"Item {i}",
+                location=f"Location {i}",
+                rotation_city_id=rotation_city.city_id,
+                added_by_user_id=verified_user.user_id
+            )
+            for category in categories:
+                db_session.add(CategoryItem(item_id=item.item_id, category_id=category.category_id))
+            for tag in tags:
+                value = Value(tag_id=tag.tag_id, name_val=f"v{i}")
+                db_session.add(value)
+                db_session.flush()
+                db_session.add(ItemTagValue(item_id=item.item_id, value_id=value.value_id))
+        db_session.commit()
+        
+        def snapshot(items):
+            return [
+                (
+                    item.item_id,
+                    sorted(ci.category.category_name for ci in item.category_items),
+                    sorted((itv.value.tag.name, itv.value.name_val) for itv in item.item_tag_values)
+                )
+                for item in items
+            ]
+        
+        city_id = rotation_city.city_id
+        db_session.expunge_all()
+        selectin = snapshot(repo.get_all_items_with_details(
+            city_id, strategy=ItemLoadStrategy.SELECTIN
+        ))
+        db_session.expunge_all()
+        joined = snapshot(repo.get_all_items_with_details(
+            city_id, strategy=ItemLoadStrategy.JOINED
+        ))
+        
+        assert selectin == joined
+        assert len(selectin) == 2
+        assert len(selectin[0][1]) == 3
+        assert len(selectin[0][2]) == 4
+
+    def test_record_verification_increments_counter(self, db_session, item):
+        """Should bump the count and last verified date in one update."""
+        from datetime import datetime
+        repo = ItemRepository()
+        verified_at = datetime(2024, 5, 1, 12, 0)
+        
+        assert repo.record_verification(item.item_id, verified_at) == (1, item.rotation_city_id)
+        assert repo.record_verification(item.item_id, verified_at) == (2, item.rotation_city_id)
+        db_session.commit()
+        
+        db_session.expire_all()
+        stored = repo.get_item_by_id(item.item_id, item.rotation_city_id)
+        assert stored.number_of_verifications == 2
+        assert stored.last_verified_date == verified_at
+        assert stored.freshness_score == pytest.approx(1.4)
+
+    def test_record_verification_missing_item(self, db_session):
+        """Should return None when the item does not exist."""
+        from datetime import datetime
+        assert ItemRepository().record_verification(99999, datetime.utcnow()) is None
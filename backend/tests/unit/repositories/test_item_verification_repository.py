@@ -42,6 +42,26 @@ class TestItemVerificationRepository:
         assert verification.verification_id is not None
         assert verification.note is None
 
+    def test_add_verification_once_per_day(self, db_session, user, item):
+        """Test a second verification on the same day is skipped."""
+        repo = ItemVerificationRepository()
+        morning = datetime(2024, 3, 1, 8, 0)
+        
+        first = repo.add_verification(user.user_id, item.item_id, "Morning", morning)
+        second = repo.add_verification(
+            user.user_id, item.item_id, "Evening", morning + timedelta(hours=10)
+        )
+        next_day = repo.add_verification(
+            user.user_id, item.item_id, None, morning + timedelta(days=1)
+        )
+        db_session.commit()
+        
+        assert first.verification_id is not None
+        assert first.verified_on == morning.date()
+        assert second is None
+        assert next_day is not None
+        assert repo.get_verification_count_for_item(item.item_id) == 2
+
     def test_get_verification_by_id_success(
         self,
         db_session,
@@ -0,0 +1,257 @@
+"""
+Query Plan Regression Tests
+
+Runs the hot repository queries, captures the SQL they issue and checks
+with ``EXPLAIN QUERY PLAN`` that none of them falls back to a full table
+scan. A failure here means a query shape changed or an index was dropped.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models.category import Category
+from app.models.category_item import CategoryItem
+from app.models.item import Item
+from app.models.item_tag_value import ItemTagValue
+from app.models.item_verification import ItemVerification
+from app.models.tag import Tag, TagValueType
+from app.models.user import User
+from app.models.value import Value
+from app.repositories.base.item_filters import (
+    ItemFilters,
+    NumericRangeFilter,
+    TagValueFilter
+)
+from app.repositories.base.item_order import ItemOrder
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.item_verification_repository import ItemVerificationRepository
+from app.repositories.implementations.value_repository import ValueRepository
+from app.repositories.implementations.verification_stats_repository import (
+    VerificationStatsRepository
+)
+from app.utils.geo import covering_cells
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def capture_statements(action):
+    """Run ``action`` and return the (statement, parameters) it executed."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        action()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+    return statements
+
+
+def full_scans(statements):
+    """Return the plan lines of every full table scan in ``statements``."""
+    scans = []
+    with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            scans.extend(
+                f"{row[3]}  <-  {statement.split(chr(10))[0][:80]}"
+                for row in plan
+                if row[3].startswith('SCAN ') and not row[3].startswith('SCAN CONSTANT')
+            )
+    return scans
+
+
+@pytest.fixture
+def populated(db_session, rotation_city):
+    """A city with a few items, each with categories, tags and verifications."""
+    if db.engine.dialect.name != 'sqlite':
+        pytest.skip("Plan assertions are written for SQLite EXPLAIN QUERY PLAN")
+
+    user = User(
+        first_name='Ada',
+        last_name='Lovelace',
+        email='ada@uni.minerva.edu',
+        rotation_city_id=rotation_city.city_id
+    )
+    category = Category(category_name='Food')
+    tag = Tag(name='Condition', value_type=TagValueType.TEXT.code)
+    db_session.add_all([user, category, tag])
+    db_session.flush()
+
+    value = Value(tag_id=tag.tag_id, name_val='Good')
+    db_session.add(value)
+    db_session.flush()
+
+    for i in range(5):
+        item = Item(
+            name=f'Item {i}',
+            location='Main St',
+            rotation_city_id=rotation_city.city_id,
+            added_by_user_id=user.user_id
+        )
+        db_session.add(item)
+        db_session.flush()
+        db_session.add_all([
+            CategoryItem(item_id=item.item_id, category_id=category.category_id),
+            ItemTagValue(item_id=item.item_id, value_id=value.value_id),
+            ItemVerification(user_id=user.user_id, item_id=item.item_id),
+        ])
+    db_session.commit()
+    return {
+        'city_id': rotation_city.city_id,
+        'user_id': user.user_id,
+        'item_id': item.item_id,
+        'tag_id': tag.tag_id,
+        'category_id': category.category_id,
+        'item': item,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+class TestHotQueryPlans:
+    """Hot read paths must be served by indexes."""
+
+    def test_city_item_list(self, populated):
+        """City listing, its keyset pages and its version token use indexes."""
+        repo = ItemRepository()
+        item = populated['item']
+        cursor = decode_cursor(encode_cursor(item.created_at, item.item_id))
+
+        statements = capture_statements(lambda: (
+            repo.get_all_items_with_details(populated['city_id']),
+            repo.get_all_items_with_details(populated['city_id'], limit=2, cursor=cursor),
+            repo.get_city_items_version(populated['city_id']),
+        ))
+
+        assert statements
+        assert full_scans(statements) == []
+
+    def test_city_item_list_by_freshness(self, populated):
+        """Freshness-ordered listing and its keyset pages use an index."""
+        repo = ItemRepository()
+        order = ItemOrder.FRESHNESS
+
+        statements = capture_statements(lambda: (
+            repo.get_all_items_with_details(populated['city_id'], order=order),
+            repo.get_all_items_with_details(
+                populated['city_id'], limit=2, cursor=(1.0, populated['item_id']), order=order
+            ),
+        ))
+
+        assert statements
+        assert full_scans(statements) == []
+
+    def test_city_item_list_filtered(self, populated):
+        """Category, tag value, range and distance filters use indexes."""
+        filters = ItemFilters(
+            category_ids=[populated['category_id']],
+            tag_values=[TagValueFilter(populated['tag_id'], TagValueType.TEXT, ['Good'])],
+            numeric_ranges=[NumericRangeFilter(populated['tag_id'], 1.0, 5.0)],
+            max_walking_distance=500.0
+        )
+
+        statements = capture_statements(
+            lambda: ItemRepository().get_all_items_with_details(
+                populated['city_id'], limit=2, filters=filters
+            )
+        )
+
+        assert statements
+        assert full_scans(statements) == []
+
+    def test_item_changes(self, populated):
+        """The change feed and its continuation use an index."""
+        repo = ItemRepository()
+        item = populated['item']
+
+        statements = capture_statements(lambda: (
+            repo.get_changed_items_with_details(populated['city_id'], datetime.utcnow(), limit=2),
+            repo.get_changed_items_with_details(
+                populated['city_id'], datetime.utcnow(),
+                after=(item.updated_at, item.item_id), limit=2
+            ),
+        ))
+
+        assert statements
+        assert full_scans(statements) == []
+
+    def test_facet_counts(self, populated):
+        """Category and tag value counts of a city use indexes."""
+        repo = ItemRepository()
+        filters = ItemFilters(category_ids=[populated['category_id']])
+
+        statements = capture_statements(lambda: (
+            repo.get_category_counts(populated['city_id']),
+            repo.get_tag_value_counts(populated['city_id'], filters),
+        ))
+
+        assert full_scans(statements) == []
+
+    def test_nearby_candidates(self, populated):
+        """Nearby candidates are geohash range scans on an index."""
+        cells = covering_cells(-34.5956, -58.3972, 500)
+
+        statements = capture_statements(
+            lambda: ItemRepository().get_items_in_cells(populated['city_id'], cells)
+        )
+
+        assert full_scans(statements) == []
+
+    def test_user_item_list(self, populated):
+        """Items added by a user use an index."""
+        statements = capture_statements(
+            lambda: ItemRepository().get_items_by_user(populated['user_id'])
+        )
+
+        assert full_scans(statements) == []
+
+    def test_verification_queries(self, populated):
+        """Verification history, count and the daily check use indexes."""
+        repo = ItemVerificationRepository()
+
+        statements = capture_statements(lambda: (
+            repo.get_verifications_by_item_id(populated['item_id'], limit=10),
+            repo.get_verifications_by_user_id(populated['user_id'], limit=10),
+            repo.get_verification_rows_by_item_id(populated['item_id'], limit=10),
+            repo.get_verification_rows_by_user_id(populated['user_id'], limit=10),
+            repo.get_verification_rows_by_item_id(
+                populated['item_id'], limit=10, cursor=(datetime.utcnow(), 10**6)
+            ),
+            repo.get_verification_rows_by_user_id(
+                populated['user_id'], limit=10, since=datetime(2024, 1, 1)
+            ),
+            repo.user_verified_item_today(populated['user_id'], populated['item_id']),
+            repo.get_verification_count_for_item(populated['item_id']),
+        ))
+
+        assert full_scans(statements) == []
+
+    def test_city_verification_stats(self, populated):
+        """Rollup reads and the stale item count use indexes."""
+        repo = VerificationStatsRepository()
+        start, end = datetime(2024, 1, 1).date(), datetime.utcnow().date()
+
+        statements = capture_statements(lambda: (
+            repo.get_daily_counts(populated['city_id'], start, end),
+            repo.get_weekly_counts(populated['city_id'], start, end),
+            repo.get_top_verifiers(populated['city_id'], 10),
+            ItemRepository().get_staleness_counts(populated['city_id'], datetime.utcnow()),
+        ))
+
+        assert full_scans(statements) == []
+
+    def test_tag_value_lookups(self, populated):
+        """Value autocomplete and get-or-create lookups use indexes."""
+        repo = ValueRepository()
+
+        statements = capture_statements(lambda: (
+            repo.get_text_values_by_tag(populated['tag_id']),
+            repo.get_or_create_values([(populated['tag_id'], 'Good', 'text')]),
+        ))
+
+        assert full_scans(statements) == []
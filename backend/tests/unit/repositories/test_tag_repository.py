@@ -96,3 +96,36 @@ class TestTagRepository:
         assert tag.tag_id is not None
         assert tag.name == "Price"
         assert tag.value_type == TagValueType.NUMERIC.code
+
+    def test_add_tags_returns_tags_in_input_order(self, db_session):
+        """Test batch insert assigns IDs and keeps the input order."""
+        repo = TagRepository()
+        
+        tags = repo.add_tags([("Zebra", "text"), ("Apple", TagValueType.NUMERIC.code)])
+        db_session.commit()
+        
+        assert [tag.name for tag in tags] == ["Zebra", "Apple"]
+        assert all(tag.tag_id for tag in tags)
+        assert tags[1].value_type == TagValueType.NUMERIC.code
+        assert len(repo.get_all_tags()) == 2
+
+    def test_get_tags_by_ids_skips_missing(self, db_session):
+        """Test batch lookup by ID returns only existing tags."""
+        repo = TagRepository()
+        tag1 = repo.create_tag(name="Wifi", value_type="boolean")
+        tag2 = repo.create_tag(name="Price", value_type="numeric")
+        
+        tags = repo.get_tags_by_ids([tag1.tag_id, tag2.tag_id, 9999])
+        
+        assert {tag.tag_id for tag in tags} == {tag1.tag_id, tag2.tag_id}
+        assert repo.get_tags_by_ids([]) == []
+
+    def test_get_tags_by_names_ci_ignores_case(self, db_session):
+        """Test batch lookup by name matches regardless of case."""
+        repo = TagRepository()
+        repo.create_tag(name="Wifi", value_type="boolean")
+        repo.create_tag(name="Price", value_type="numeric")
+        
+        tags = repo.get_tags_by_names_ci(["WIFI", "price", "Noise"])
+        
+        assert sorted(tag.name for tag in tags) == ["Price", "Wifi"]
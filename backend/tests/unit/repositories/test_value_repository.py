@@ -177,3 +177,45 @@ class TestValueRepository:
         results = value_repo.find_similar_text_values(bool_tag.tag_id, "Sam")
         
         assert len(results) == 0
+
+    def test_create_value_returns_existing_duplicate(self, db_session):
+        """Test creating an identical value reuses the existing row."""
+        tag_repo = TagRepository()
+        value_repo = ValueRepository()
+        
+        tag = tag_repo.create_tag(name="Condition", value_type="text")
+        first = value_repo.create_value(tag.tag_id, "Good", "text")
+        second = value_repo.create_value(tag.tag_id, "Good", "text")
+        
+        assert second.value_id == first.value_id
+        assert len(value_repo.get_all_values()) == 1
+
+    def test_get_or_create_values_mixes_existing_and_new(self, db_session):
+        """Test batch get-or-create keeps input order and inserts only missing values."""
+        tag_repo = TagRepository()
+        value_repo = ValueRepository()
+        
+        text_tag = tag_repo.create_tag(name="Condition", value_type="text")
+        bool_tag = tag_repo.create_tag(name="Wifi", value_type="boolean")
+        existing = value_repo.create_value(text_tag.tag_id, "Good", "text")
+        
+        values = value_repo.get_or_create_values([
+            (bool_tag.tag_id, True, "boolean"),
+            (text_tag.tag_id, "Good", "text"),
+            (bool_tag.tag_id, True, "boolean"),
+            (text_tag.tag_id, "Fair", "text"),
+        ])
+        db_session.commit()
+        
+        assert values[1].value_id == existing.value_id
+        assert values[0].value_id == values[2].value_id
+        assert values[0].boolean_val is True
+        assert values[3].name_val == "Fair"
+        assert len(value_repo.get_all_values()) == 3
+
+    def test_get_or_create_values_rejects_unknown_type(self, db_session):
+        """Test an unknown value_type raises ValueError."""
+        tag = TagRepository().create_tag(name="Condition", value_type="text")
+        
+        with pytest.raises(ValueError):
+            ValueRepository().get_or_create_values([(tag.tag_id, "Good", "colour")])
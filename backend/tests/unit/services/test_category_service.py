@@ -0,0 +1,39 @@
+"""Unit tests for CategoryService."""
+import pytest
+from app.repositories.implementations.item_search_repository import ItemSearchRepository
+from app.services.category_service import CategoryService
+from app.services.item_service import ItemService
+from app.utils.pagination import decode_cursor
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestCategoryService:
+    """Test CategoryService write paths that reach items."""
+
+    def test_update_category_marks_items_changed(self, db_session, item, category):
+        """Test that renaming a category puts its items in the change feed and search."""
+        item_service = ItemService()
+        _, token, _ = item_service.get_item_changes(item.rotation_city_id, limit=10)
+
+        CategoryService().update_category(category.category_id, category_name="Gadgets")
+
+        items, _, _ = item_service.get_item_changes(
+            item.rotation_city_id, limit=10, since=decode_cursor(token)
+        )
+        assert [changed.item_id for changed in items] == [item.item_id]
+        matches = ItemSearchRepository().search(item.rotation_city_id, ['gadgets'], 10)
+        assert [row[0] for row in matches] == [item.item_id]
+
+    def test_delete_category_marks_items_changed(self, db_session, item, category):
+        """Test that deleting a category puts the items that lost it in the change feed."""
+        item_service = ItemService()
+        _, token, _ = item_service.get_item_changes(item.rotation_city_id, limit=10)
+
+        assert CategoryService().delete_category(category.category_id) is True
+
+        items, _, _ = item_service.get_item_changes(
+            item.rotation_city_id, limit=10, since=decode_cursor(token)
+        )
+        assert [changed.item_id for changed in items] == [item.item_id]
+        assert items[0].categories == []
@@ -0,0 +1,180 @@
+"""
+Unit Tests for Image Storage Module
+
+Tests for ImageService, the local filesystem provider and the inline
+base64 image migration.
+"""
+import base64
+import hashlib
+import os
+
+import pytest
+
+from app.models import ImageBlob, User
+from app.repositories.implementations.category_repository import CategoryRepository
+from app.services.images import ImageService, InvalidImageError, ImageNotFoundError
+from app.services.images.migration import migrate_inline_images
+from app.services.images.providers.database_provider import DatabaseImageStorageProvider
+from app.services.images.providers.local_provider import LocalImageStorageProvider
+
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'png-bytes'
+JPEG_BYTES = b'\xff\xd8\xff\xe0' + b'jpeg-bytes'
+
+
+def data_url(mimetype, data):
+    """Encode bytes the way the frontend sends images."""
+    return f"data:{mimetype};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+@pytest.fixture
+def image_service(tmp_path):
+    """ImageService backed by a temporary directory."""
+    return ImageService(provider=LocalImageStorageProvider(str(tmp_path)))
+
+
+class TestImageService:
+    """Tests for content-addressed image storage."""
+    
+    def test_store_uses_content_hash_key(self, image_service):
+        """Should key images by SHA-256 plus extension."""
+        key = image_service.store(PNG_BYTES, 'image/png')
+        
+        assert key == hashlib.sha256(PNG_BYTES).hexdigest() + '.png'
+        with open(image_service.path(key), 'rb') as f:
+            assert f.read() == PNG_BYTES
+    
+    def test_store_same_bytes_twice_returns_same_key(self, image_service):
+        """Should deduplicate identical images."""
+        first = image_service.store(JPEG_BYTES, 'image/jpeg')
+        second = image_service.store(JPEG_BYTES, 'image/jpeg')
+        
+        assert first == second
+    
+    def test_store_base64_data_url(self, image_service):
+        """Should decode data URLs using their declared type."""
+        key = image_service.store_base64(data_url('image/jpeg', JPEG_BYTES))
+        
+        assert key.endswith('.jpg')
+        assert image_service.mimetype_for_key(key) == 'image/jpeg'
+    
+    def test_store_base64_bare_string_uses_content_type(self, image_service):
+        """Should take the type of undeclared base64 from its bytes."""
+        key = image_service.store_base64(base64.b64encode(JPEG_BYTES).decode('ascii'))
+        
+        assert key.endswith('.jpg')
+    
+    def test_store_rejects_content_not_matching_type(self, image_service):
+        """Should refuse bytes that are not an image of the declared type."""
+        with pytest.raises(InvalidImageError):
+            image_service.store(b'<html><script>', 'image/png')
+        with pytest.raises(InvalidImageError):
+            image_service.store(JPEG_BYTES, 'image/png')
+    
+    def test_store_rejects_svg(self, image_service):
+        """Should not store SVG, which could run script from the API origin."""
+        with pytest.raises(InvalidImageError):
+            image_service.store_base64(data_url('image/svg+xml', b'<svg onload="alert(1)"/>'))
+    
+    def test_store_base64_rejects_invalid_data(self, image_service):
+        """Should raise InvalidImageError (a ValueError) for bad input."""
+        with pytest.raises(ValueError):
+            image_service.store_base64('data:image/png;base64,@@@')
+    
+    def test_store_rejects_unsupported_type(self, image_service):
+        """Should only accept known image types."""
+        with pytest.raises(InvalidImageError):
+            image_service.store(b'<html>', 'text/html')
+    
+    def test_path_missing_key(self, image_service):
+        """Should raise ImageNotFoundError for unknown or unsafe keys."""
+        with pytest.raises(ImageNotFoundError):
+            image_service.path('0' * 64 + '.png')
+        with pytest.raises(ImageNotFoundError):
+            image_service.path('../secret')
+    
+    def test_path_unsupported_type(self, image_service, tmp_path):
+        """Should not serve files of types that are no longer accepted."""
+        key = '0' * 64 + '.svg'
+        (tmp_path / key[:2]).mkdir()
+        (tmp_path / key[:2] / key).write_bytes(b'<svg/>')
+        
+        with pytest.raises(ImageNotFoundError):
+            image_service.path(key)
+
+
+class TestDatabaseImageStorage:
+    """Tests for keeping image bytes in the database."""
+    
+    def test_image_survives_losing_the_cache(self, db_session, tmp_path):
+        """Should serve the image again after the cache directory is wiped."""
+        service = ImageService(provider=DatabaseImageStorageProvider(str(tmp_path / 'cache')))
+        key = service.store(PNG_BYTES, 'image/png')
+        db_session.commit()
+        
+        first = service.path(key)
+        os.remove(first)
+        
+        with open(service.path(key), 'rb') as f:
+            assert f.read() == PNG_BYTES
+    
+    def test_store_twice_keeps_one_row(self, db_session, tmp_path):
+        """Should deduplicate identical images."""
+        service = ImageService(provider=DatabaseImageStorageProvider(str(tmp_path)))
+        
+        first = service.store(PNG_BYTES, 'image/png')
+        second = service.store(PNG_BYTES, 'image/png')
+        db_session.commit()
+        
+        assert first == second
+        assert db_session.query(ImageBlob).count() == 1
+    
+    def test_image_rolled_back_with_its_row(self, db_session, tmp_path):
+        """Should not keep an image whose transaction failed."""
+        service = ImageService(provider=DatabaseImageStorageProvider(str(tmp_path)))
+        key = service.store(PNG_BYTES, 'image/png')
+        db_session.rollback()
+        
+        with pytest.raises(ImageNotFoundError):
+            service.path(key)
+
+
+class TestInlineImageMigration:
+    """Tests for moving base64 columns into the image store."""
+    
+    def test_migrate_moves_profile_pictures(self, db_session, user, image_service):
+        """Should store the image, set the key and clear the inline column."""
+        db_user = db_session.get(User, user.user_id)
+        db_user.profile_picture = data_url('image/png', PNG_BYTES)
+        db_session.commit()
+        
+        stats = migrate_inline_images(image_service=image_service)
+        
+        db_session.expire_all()
+        db_user = db_session.get(User, user.user_id)
+        assert stats == {'migrated': 1, 'failed': 0}
+        assert db_user.profile_picture is None
+        assert db_user.profile_picture_key == hashlib.sha256(PNG_BYTES).hexdigest() + '.png'
+    
+    def test_migrate_changes_category_list_version(self, db_session, category, image_service):
+        """Should give the category list a new ETag once its icons move."""
+        category.category_pic = data_url('image/png', PNG_BYTES)
+        db_session.commit()
+        repository = CategoryRepository()
+        version = repository.get_categories_version()
+        
+        migrate_inline_images(image_service=image_service)
+        
+        assert repository.get_categories_version() != version
+    
+    def test_migrate_skips_undecodable_rows(self, db_session, user, image_service):
+        """Should leave rows it cannot decode untouched."""
+        db_user = db_session.get(User, user.user_id)
+        db_user.profile_picture = 'not base64!'
+        db_session.commit()
+        
+        stats = migrate_inline_images(image_service=image_service)
+        
+        db_session.expire_all()
+        assert stats == {'migrated': 0, 'failed': 1}
+        assert db_session.get(User, user.user_id).profile_picture == 'not base64!'
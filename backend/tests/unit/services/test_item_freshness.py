@@ -0,0 +1,86 @@
+"""
+Unit Tests for Item Freshness
+
+Tests the freshness score formula and the periodic decay job.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.item import Item
+from app.services.item_freshness import decay_freshness_scores
+from app.utils.freshness import HALF_LIFE_DAYS, compute_freshness, freshness_weight
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestComputeFreshness:
+    """Tests for the freshness score formula."""
+    
+    def test_weight_grows_with_diminishing_returns(self):
+        """Should start at 1 and approach 2 as verifications accumulate."""
+        weights = [freshness_weight(n) for n in range(5)]
+        
+        assert weights[0] == 1.0
+        assert weights == sorted(weights)
+        assert weights[1] - weights[0] > weights[4] - weights[3]
+        assert freshness_weight(1000) < 2.0
+    
+    def test_halves_every_half_life(self):
+        """Should halve the score once per half-life since the last sighting."""
+        now = datetime(2025, 6, 1)
+        seen = now - timedelta(days=HALF_LIFE_DAYS)
+        
+        assert compute_freshness(1, seen, None, now) == pytest.approx(freshness_weight(1) / 2)
+    
+    def test_unverified_items_age_from_creation(self):
+        """Should measure age from created_at when never verified."""
+        now = datetime(2025, 6, 1)
+        created = now - timedelta(days=2 * HALF_LIFE_DAYS)
+        
+        assert compute_freshness(None, None, created, now) == pytest.approx(0.25)
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestDecayFreshnessScores:
+    """Tests for decay_freshness_scores."""
+    
+    def test_decays_scores_to_now(self, db_session, item):
+        """Should recompute stored scores at the given time."""
+        stored = db_session.get(Item, item.item_id)
+        stored.number_of_verifications = 1
+        stored.last_verified_date = datetime(2025, 6, 1)
+        db_session.commit()
+        
+        now = datetime(2025, 6, 1) + timedelta(days=HALF_LIFE_DAYS)
+        stats = decay_freshness_scores(batch_size=1, now=now)
+        
+        db_session.expire_all()
+        assert stats == {'checked': 1, 'updated': 1}
+        assert db_session.get(Item, item.item_id).freshness_score == pytest.approx(0.625)
+    
+    def test_second_run_is_a_no_op(self, db_session, item):
+        """Should skip rows whose score is already current."""
+        now = datetime.utcnow()
+        decay_freshness_scores(now=now)
+        
+        assert decay_freshness_scores(now=now) == {'checked': 1, 'updated': 0}
+    
+    def test_keeps_score_of_item_verified_meanwhile(self, db_session, item, monkeypatch):
+        """Should not overwrite a score set by a verification after the read."""
+        from app.repositories.implementations.item_repository import ItemRepository
+        from app.services import item_freshness
+        
+        real = item_freshness.compute_freshness
+        
+        def verify_during_run(*args):
+            # A verification lands between the job's read and its write
+            ItemRepository().record_verification(item.item_id, datetime.utcnow())
+            return real(*args)
+        
+        monkeypatch.setattr(item_freshness, 'compute_freshness', verify_during_run)
+        decay_freshness_scores(now=datetime.utcnow() + timedelta(days=60))
+        
+        db_session.expire_all()
+        assert db_session.get(Item, item.item_id).freshness_score == pytest.approx(freshness_weight(1))
@@ -0,0 +1,180 @@
+"""
+Unit Tests for Item Geocoding
+
+Tests address normalization, the gazetteer geocoder and the item
+geocoding backfill.
+"""
+import threading
+
+import pytest
+
+from app.models.geocode_cache import GeocodeCache
+from app.models.item import Item
+from app.services.geocoding import (
+    GazetteerGeocodingProvider,
+    GeocoderConfigurationError,
+    GeocodingError,
+    GeocodingProvider,
+    geocode_items,
+    normalize_address,
+)
+from app.utils.geo import encode_geohash
+
+
+class CountingProvider(GeocodingProvider):
+    """Geocoder over a dict that records every lookup."""
+    
+    name = 'counting'
+    
+    def __init__(self, entries, failing=()):
+        self.entries = entries
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+    
+    def geocode(self, address):
+        with self._lock:
+            self.calls.append(address)
+        if address in self.failing:
+            raise GeocodingError("service unavailable")
+        return self.entries.get(address)
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    """Write a small gazetteer CSV and return its path."""
+    path = tmp_path / 'gazetteer.csv'
+    path.write_text(
+        'address,latitude,longitude\n'
+        'Library Floor 2,-34.6037,-58.3816\n'
+        '"Science Building, Campus",-34.6090,-58.3920\n',
+        encoding='utf-8'
+    )
+    return str(path)
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestNormalizeAddress:
+    """Tests for normalize_address."""
+    
+    def test_ignores_case_accents_and_punctuation(self):
+        """Should map trivially different spellings to the same key."""
+        assert normalize_address('Av. Santa Fé  1860,Buenos Aires') == 'av santa fe 1860, buenos aires'
+        assert normalize_address('AV SANTA FE 1860 , BUENOS AIRES') == 'av santa fe 1860, buenos aires'
+    
+    def test_blank_address(self):
+        """Should normalize punctuation-only text to an empty key."""
+        assert normalize_address(' ., ') == ''
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestGazetteerGeocodingProvider:
+    """Tests for the gazetteer geocoder."""
+    
+    def test_matches_normalized_addresses(self, gazetteer):
+        """Should find entries by normalized address only."""
+        provider = GazetteerGeocodingProvider(gazetteer)
+        
+        assert len(provider) == 2
+        assert provider.geocode('science building, campus') == (-34.6090, -58.3920)
+        assert provider.geocode('science building') is None
+    
+    def test_rejects_missing_and_malformed_files(self, tmp_path):
+        """Should raise a configuration error instead of geocoding nothing."""
+        with pytest.raises(GeocoderConfigurationError):
+            GazetteerGeocodingProvider(str(tmp_path / 'missing.csv'))
+        
+        path = tmp_path / 'bad.csv'
+        path.write_text('address,latitude,longitude\nSomewhere,north,-58\n', encoding='utf-8')
+        with pytest.raises(GeocoderConfigurationError):
+            GazetteerGeocodingProvider(str(path))
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestGeocodeItems:
+    """Tests for geocode_items."""
+    
+    def _add_item(self, db_session, user, location):
+        item = Item(
+            name='Lamp',
+            location=location,
+            added_by_user_id=user.user_id,
+            rotation_city_id=user.rotation_city_id
+        )
+        db_session.add(item)
+        db_session.commit()
+        return item
+    
+    def test_fills_coordinates_from_gazetteer(self, db_session, item, book, gazetteer):
+        """Should set coordinates and geohash of matched items only."""
+        stats = geocode_items(GazetteerGeocodingProvider(gazetteer), batch_size=1, workers=2)
+        
+        db_session.expire_all()
+        laptop = db_session.get(Item, item.item_id)
+        assert (laptop.latitude, laptop.longitude) == (-34.6037, -58.3816)
+        assert laptop.geohash == encode_geohash(-34.6037, -58.3816)
+        assert db_session.get(Item, book.item_id).latitude is None
+        assert stats == {
+            'checked': 2, 'geocoded': 1, 'not_found': 1, 'failed': 0,
+            'lookups': 2, 'cache_hits': 0,
+        }
+    
+    def test_looks_up_each_address_once(self, db_session, user, item):
+        """Should reuse cached results, misses included, across items and runs."""
+        self._add_item(db_session, user, 'library floor 2!')
+        self._add_item(db_session, user, 'Nowhere')
+        provider = CountingProvider({'library floor 2': (1.0, 2.0)})
+        
+        geocode_items(provider, batch_size=10)
+        self._add_item(db_session, user, 'LIBRARY FLOOR 2')
+        stats = geocode_items(provider, batch_size=10)
+        
+        assert sorted(provider.calls) == ['library floor 2', 'nowhere']
+        assert stats['checked'] == 2
+        assert stats['geocoded'] == 1
+        assert stats['not_found'] == 1
+        assert stats['cache_hits'] == 2
+        assert db_session.get(GeocodeCache, 'nowhere').latitude is None
+    
+    def test_resumes_with_unfinished_items(self, db_session, item, book):
+        """Should skip geocoded items and retry failed lookups on the next run."""
+        provider = CountingProvider(
+            {'library floor 2': (1.0, 2.0), 'science building': (3.0, 4.0)},
+            failing={'science building'}
+        )
+        
+        first = geocode_items(provider)
+        provider.failing.clear()
+        second = geocode_items(provider)
+        
+        assert (first['geocoded'], first['failed']) == (1, 1)
+        assert (second['checked'], second['geocoded']) == (1, 1)
+        assert provider.calls == ['library floor 2', 'science building', 'science building']
+    
+    def test_retry_misses(self, db_session, item):
+        """Should look cached misses up again only when asked to."""
+        provider = CountingProvider({})
+        geocode_items(provider)
+        geocode_items(provider)
+        
+        provider.entries['library floor 2'] = (1.0, 2.0)
+        stats = geocode_items(provider, retry_misses=True)
+        
+        assert provider.calls == ['library floor 2', 'library floor 2']
+        assert stats['geocoded'] == 1
+        assert db_session.get(GeocodeCache, 'library floor 2').latitude == 1.0
+    
+    def test_keeps_coordinates_set_by_users(self, db_session, item):
+        """Should not overwrite items that already have coordinates."""
+        stored = db_session.get(Item, item.item_id)
+        stored.latitude, stored.longitude = 5.0, 6.0
+        db_session.commit()
+        
+        stats = geocode_items(CountingProvider({'library floor 2': (1.0, 2.0)}))
+        
+        db_session.expire_all()
+        assert stats['checked'] == 0
+        assert db_session.get(Item, item.item_id).latitude == 5.0
@@ -0,0 +1,142 @@
+"""
+Unit Tests for Response Cache Module
+
+Tests for the cache backends and the per-city ItemListCache.
+"""
+import fnmatch
+import time
+
+import pytest
+
+from app.services.cache import (
+    ItemListCache,
+    get_item_list_cache,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    CacheConfigurationError,
+)
+
+
+class LocalRedisStandIn:
+    """Minimal in-process stand-in for the redis client calls we use."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+    
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+    
+    def scan_iter(self, match):
+        return [key for key in self.data if fnmatch.fnmatch(key, match)]
+    
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class TestMemoryCacheBackend:
+    """Tests for the in-process LRU backend."""
+    
+    def test_evicts_least_recently_used(self):
+        """Should drop the oldest untouched entry beyond capacity."""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set('a', b'1', ttl=60)
+        backend.set('b', b'2', ttl=60)
+        backend.get('a')
+        backend.set('c', b'3', ttl=60)
+        
+        assert backend.get('a') == b'1'
+        assert backend.get('b') is None
+        assert backend.get('c') == b'3'
+    
+    def test_expires_after_ttl(self, monkeypatch):
+        """Should treat entries past their TTL as misses."""
+        backend = MemoryCacheBackend()
+        backend.set('a', b'1', ttl=10)
+        
+        now = time.monotonic()
+        monkeypatch.setattr(time, 'monotonic', lambda: now + 11)
+        
+        assert backend.get('a') is None
+    
+    def test_counters_survive_eviction(self):
+        """Should never evict version counters with values."""
+        backend = MemoryCacheBackend(max_entries=1)
+        backend.incr('version')
+        backend.set('a', b'1', ttl=60)
+        backend.set('b', b'2', ttl=60)
+        
+        assert backend.get_counter('version') == 1
+
+
+class TestItemListCache:
+    """Tests for per-city versioned caching."""
+    
+    @pytest.fixture(params=['memory', 'redis'])
+    def cache(self, request):
+        """ItemListCache over each backend."""
+        if request.param == 'memory':
+            backend = MemoryCacheBackend()
+        else:
+            backend = RedisCacheBackend(client=LocalRedisStandIn())
+        return ItemListCache(backend, ttl=60)
+    
+    def test_hit_after_set(self, cache):
+        """Should return the stored body and count hits and misses."""
+        key = cache.key(1, 'all')
+        assert cache.get(key) is None
+        cache.set(key, b'[]')
+        
+        assert cache.get(cache.key(1, 'all')) == b'[]'
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+    
+    def test_invalidate_city_only_affects_that_city(self, cache):
+        """Should drop every variant of one city and keep the others."""
+        cache.set(cache.key(1, 'all'), b'city-1')
+        cache.set(cache.key(1, 'page:50:'), b'city-1-page')
+        cache.set(cache.key(2, 'all'), b'city-2')
+        
+        cache.invalidate_city(1)
+        
+        assert cache.get(cache.key(1, 'all')) is None
+        assert cache.get(cache.key(1, 'page:50:')) is None
+        assert cache.get(cache.key(2, 'all')) == b'city-2'
+    
+    def test_body_built_before_write_is_not_served(self, cache):
+        """Should ignore a body stored under a key taken before invalidation."""
+        stale_key = cache.key(1, 'all')
+        cache.invalidate_city(1)
+        cache.set(stale_key, b'stale')
+        
+        assert cache.get(cache.key(1, 'all')) is None
+
+    def test_key_changes_with_etag(self, cache):
+        """Should miss when the database version moved without an invalidation."""
+        cache.set(cache.key(1, 'all', 'etag-1'), b'old')
+
+        assert cache.get(cache.key(1, 'all', 'etag-2')) is None
+        assert cache.get(cache.key(1, 'all', 'etag-1')) == b'old'
+
+
+def test_redis_backend_requires_url():
+    """Should fail fast when redis is selected without a URL."""
+    with pytest.raises(CacheConfigurationError):
+        RedisCacheBackend()
+
+
+def test_misconfigured_backend_falls_back_to_memory(app, monkeypatch):
+    """Should serve from memory instead of failing requests when redis can't be used."""
+    monkeypatch.setitem(app.config, 'ITEM_LIST_CACHE_BACKEND', 'redis')
+    monkeypatch.setitem(app.config, 'REDIS_URL', None)
+    monkeypatch.delitem(app.extensions, 'item_list_cache')
+    
+    assert get_item_list_cache().backend.name == 'memory'
@@ -0,0 +1,86 @@
+"""
+Unit Tests for Item Search
+
+Tests query parsing, the search index rebuild and ranked search.
+"""
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.implementations.item_search_repository import ItemSearchRepository
+from app.services.item_search import rebuild_item_search_index, search_terms
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestSearchTerms:
+    """Tests for search_terms."""
+    
+    def test_splits_into_lowercase_words(self):
+        """Should drop punctuation and query syntax characters."""
+        assert search_terms('Lap-top "floor" 2*') == ['lap', 'top', 'floor', '2']
+    
+    def test_rejects_query_without_words(self):
+        """Should raise ValueError when nothing searchable is left."""
+        with pytest.raises(ValueError):
+            search_terms(' "*" ')
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestItemSearchIndex:
+    """Tests for rebuild_item_search_index and ItemSearchRepository.search."""
+    
+    def test_rebuild_indexes_existing_items(self, db_session, item, book, category):
+        """Should make items created outside the service searchable."""
+        city_id = item.rotation_city_id
+        repo = ItemSearchRepository()
+        assert repo.search(city_id, ['laptop'], 10) == []
+        
+        stats = rebuild_item_search_index(batch_size=1)
+        
+        assert stats == {'indexed': 2}
+        assert [row[0] for row in repo.search(city_id, ['lap'], 10)] == [item.item_id]
+        assert [row[0] for row in repo.search(city_id, ['science'], 10)] == [book.item_id]
+        category_word = search_terms(category.category_name)[0]
+        assert len(repo.search(city_id, [category_word], 10)) == 2
+    
+    def test_every_term_must_match(self, db_session, item, book):
+        """Should AND the terms together."""
+        rebuild_item_search_index()
+        
+        matches = ItemSearchRepository().search(item.rotation_city_id, ['library', 'floor'], 10)
+        
+        assert [row[0] for row in matches] == [item.item_id]
+        assert ItemSearchRepository().search(item.rotation_city_id, ['library', 'science'], 10) == []
+    
+    def test_scoped_to_city(self, db_session, item):
+        """Should not return items of another city."""
+        rebuild_item_search_index()
+        
+        assert ItemSearchRepository().search(item.rotation_city_id + 1, ['laptop'], 10) == []
+    
+    def test_rebuild_replaces_documents(self, db_session, item):
+        """Should index an item once however often it is rebuilt."""
+        rebuild_item_search_index()
+        item.name = 'Monitor'
+        db_session.commit()
+        rebuild_item_search_index()
+        
+        repo = ItemSearchRepository()
+        assert repo.search(item.rotation_city_id, ['laptop'], 10) == []
+        assert len(repo.search(item.rotation_city_id, ['monitor'], 10)) == 1
+    
+    def test_postgresql_rank_is_double_precision(self):
+        """Should rank in double precision so score cursors round-trip.
+        
+        ts_rank_cd returns real on PostgreSQL; a cursor built from the
+        driver's double would not compare equal to it. SQLite's bm25 is
+        already a double, so only the compiled SQL can show this here.
+        """
+        sql = str(
+            ItemSearchRepository._postgresql_matches(1, ['lamp'])
+            .compile(dialect=postgresql.dialect())
+        )
+        
+        assert 'CAST(ts_rank_cd(' in sql
+        assert 'AS FLOAT(53)) AS score' in sql
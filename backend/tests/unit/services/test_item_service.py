@@ -5,9 +5,14 @@ from app.repositories.implementations.item_repository import ItemRepository
 from app.repositories.implementations.category_repository import CategoryRepository
 from app.repositories.implementations.rotation_city_repository import RotationCityRepository
 from app.repositories.implementations.user_repository import UserRepository
+from app.repositories.implementations.item_tag_value_repository import ItemTagValueRepository
 from app.models.category import Category
+from app.models.item import Item
+from app.models.tag import Tag
+from app.models.value import Value
 from app.models.rotation_city import RotationCity
 from app.models.user import User
+from app.utils.pagination import decode_cursor
 
 
 @pytest.mark.unit
@@ -121,3 +126,79 @@ class TestItemService:
             service.get_item_by_id_with_details(12345, rotation_city.city_id)
         
         assert "not found" in str(exc_info.value).lower()
+
+    def test_create_item_rolls_back_on_failure(self, db_session, rotation_city, monkeypatch):
+        """Test a failure after the first inserts leaves no item, tag or value behind."""
+        user = User(
+            first_name="Ada",
+            last_name="Lovelace",
+            email="ada@uni.minerva.edu",
+            rotation_city_id=rotation_city.city_id
+        )
+        category = Category(category_name="Food")
+        db_session.add_all([user, category])
+        db_session.commit()
+        
+        def fail(*args, **kwargs):
+            raise RuntimeError("link failed")
+        
+        monkeypatch.setattr(ItemTagValueRepository, 'add_tag_values_to_item', fail)
+        service = ItemService()
+        
+        with pytest.raises(RuntimeError):
+            service.create_item(
+                name="Cafe",
+                location="Main St",
+                rotation_city_id=rotation_city.city_id,
+                added_by_user_id=user.user_id,
+                category_ids=[category.category_id],
+                existing_tags=[],
+                new_tags=[{'name': 'Wifi', 'value_type': 'boolean', 'value': True}]
+            )
+        
+        assert db_session.query(Item).count() == 0
+        assert db_session.query(Tag).count() == 0
+        assert db_session.query(Value).count() == 0
+
+    def test_create_item_rejects_existing_tag_name_case_insensitively(self, db_session, rotation_city):
+        """Test new_tags may not reuse an existing tag name in any case."""
+        user = User(
+            first_name="Ada",
+            last_name="Lovelace",
+            email="ada@uni.minerva.edu",
+            rotation_city_id=rotation_city.city_id
+        )
+        category = Category(category_name="Food")
+        tag = Tag(name="Wifi", value_type=0)
+        db_session.add_all([user, category, tag])
+        db_session.commit()
+        
+        with pytest.raises(ValueError, match=f"tag_id {tag.tag_id}"):
+            ItemService().create_item(
+                name="Cafe",
+                location="Main St",
+                rotation_city_id=rotation_city.city_id,
+                added_by_user_id=user.user_id,
+                category_ids=[category.category_id],
+                existing_tags=[],
+                new_tags=[{'name': 'WIFI', 'value_type': 'boolean', 'value': True}]
+            )
+        
+        assert db_session.query(Item).count() == 0
+
+    def test_get_item_changes_holds_back_unsettled_changes(self, app, db_session, item, monkeypatch):
+        """Test that changes inside the settle window wait for a later sync."""
+        service = ItemService()
+        monkeypatch.setitem(app.config, 'ITEM_CHANGES_SETTLE_SECONDS', 60)
+        
+        items, token, has_more = service.get_item_changes(item.rotation_city_id, limit=10)
+        
+        assert items == []
+        assert has_more is False
+        
+        monkeypatch.setitem(app.config, 'ITEM_CHANGES_SETTLE_SECONDS', 0)
+        items, _, _ = service.get_item_changes(
+            item.rotation_city_id, limit=10, since=decode_cursor(token)
+        )
+        
+        assert [changed.item_id for changed in items] == [item.item_id]
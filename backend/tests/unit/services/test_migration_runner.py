@@ -0,0 +1,204 @@
+"""
+Unit Tests for the Migration Runner
+
+Tests applying versioned migrations and recording them in schema_migrations.
+"""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app import db
+from app.migrations import Migration, MigrationError, MigrationRunner, load_migrations
+from app.migrations.runner import schema_migrations
+from app.repositories.implementations.item_repository import ItemRepository
+from app.services.item_service import ItemService
+from app.services.schema_indexes import missing_indexes
+
+BASELINE_SCHEMA = Path(__file__).parents[2] / 'fixtures' / 'baseline_schema.sql'
+
+
+@pytest.fixture
+def runner_db(db_session):
+    """Drop the schema_migrations table the runner creates outside db.metadata."""
+    yield db_session
+    db_session.remove()
+    schema_migrations.drop(db.engine, checkfirst=True)
+
+
+@pytest.fixture
+def baseline_db(runner_db):
+    """Replace the schema with the one built before migrations existed."""
+    db.drop_all()
+    with db.engine.begin() as conn:
+        for statement in BASELINE_SCHEMA.read_text().split(';'):
+            if statement.strip():
+                conn.exec_driver_sql(statement)
+    yield runner_db
+
+
+def assert_schema_matches_models():
+    """Check every model table has exactly its model's columns and indexes."""
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        columns = {column['name'] for column in inspector.get_columns(table.name)}
+        assert columns == set(table.columns.keys()), table.name
+    assert missing_indexes() == []
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestMigrationRunner:
+    """Tests for MigrationRunner."""
+    
+    def test_load_migrations_sorted_by_version(self):
+        """Should discover the bundled migrations in version order."""
+        versions = [migration.version for migration in load_migrations()]
+        
+        assert versions[0] == '0001'
+        assert versions == sorted(versions)
+        assert len(set(versions)) == len(versions)
+    
+    def test_upgrade_empty_database(self, runner_db):
+        """Should create every table and record each migration once."""
+        db.drop_all()
+        runner = MigrationRunner()
+        
+        applied = runner.upgrade()
+        
+        assert [m.version for m in applied] == [m.version for m in runner.migrations]
+        assert_schema_matches_models()
+        assert runner.pending() == []
+        assert runner.upgrade() == []
+    
+    def test_upgrade_baseline_database(self, baseline_db):
+        """Should bring a database from before migrations up to the models."""
+        baseline_db.execute(text(
+            "INSERT INTO rotation_city VALUES (1, 'Buenos Aires', 'America/Buenos_Aires', NULL);"
+        ))
+        for statement in [
+            "INSERT INTO \"user\" VALUES (1, 1, 'Ada', 'L', 'ada@example.com', NULL,"
+            " '2024-01-01 00:00:00.000000', '2024-01-01 00:00:00.000000', 1, 0)",
+            "INSERT INTO \"user\" VALUES (2, 1, 'Alan', 'T', 'alan@example.com', NULL,"
+            " '2024-01-01 00:00:00.000000', '2024-01-01 00:00:00.000000', 1, 0)",
+            "INSERT INTO category VALUES (1, 'Electronics', NULL)",
+            "INSERT INTO tag VALUES (1, 'Color', 1, 1)",
+            # The same value stored twice, as item creation used to
+            "INSERT INTO value VALUES (1, 1, NULL, 'Blue', NULL)",
+            "INSERT INTO value VALUES (2, 1, NULL, 'Blue', NULL)",
+            "INSERT INTO item VALUES (1, 1, 1, 'Laptop', 'Library Floor 2', 150.0, NULL, 0,"
+            " '2024-03-01 07:00:00.000000')",
+            "INSERT INTO category_item VALUES (1, 1, 1)",
+            "INSERT INTO item_tag_value VALUES (1, 1, 1)",
+            "INSERT INTO item_tag_value VALUES (2, 1, 2)",
+            # Two same-day verifications by one user, then another user's
+            "INSERT INTO item_verification VALUES (1, 1, 1, NULL, '2024-03-01 08:00:00.000000')",
+            "INSERT INTO item_verification VALUES (2, 1, 1, NULL, '2024-03-01 09:00:00.000000')",
+            "INSERT INTO item_verification VALUES (3, 2, 1, NULL, '2024-03-02 10:00:00.000000')",
+        ]:
+            baseline_db.execute(text(statement))
+        baseline_db.commit()
+        
+        runner = MigrationRunner()
+        applied = runner.upgrade()
+        
+        assert [m.version for m in applied] == [m.version for m in runner.migrations]
+        assert_schema_matches_models()
+        
+        def rows(sql):
+            return baseline_db.execute(text(sql)).all()
+        
+        assert rows('SELECT value_id FROM value') == [(1,)]
+        assert rows('SELECT value_id FROM item_tag_value') == [(1,)]
+        assert rows('SELECT verification_id, verified_on FROM item_verification') == [
+            (1, '2024-03-01'), (3, '2024-03-02')
+        ]
+        assert rows('SELECT number_of_verifications, last_verified_date, updated_at FROM item') == [
+            (2, '2024-03-02 10:00:00.000000', '2024-03-02 10:00:00.000000')
+        ]
+        assert rows('SELECT COUNT(*) FROM city_verification_daily') == [(2,)]
+        assert rows('SELECT COUNT(*) FROM city_verifier_total') == [(2,)]
+        
+        # The upgraded database serves the current models
+        item = ItemRepository().get_all_items_with_details(1)[0]
+        assert item.freshness_score > 0
+        items, _ = ItemService().search_items(1, 'blue electronics', limit=10)
+        assert [found.item_id for found in items] == [1]
+    
+    def test_upgrade_adopts_existing_schema(self, runner_db):
+        """Should apply cleanly to a database created by create_all."""
+        runner = MigrationRunner()
+        
+        runner.upgrade()
+        
+        assert all(row['applied_at'] is not None for row in runner.status())
+    
+    def test_upgrade_stops_at_target(self, runner_db):
+        """Should leave migrations after the target pending."""
+        runner = MigrationRunner()
+        
+        applied = runner.upgrade('0002')
+        
+        assert [m.version for m in applied] == ['0001', '0002']
+        assert [m.version for m in runner.pending()][0] == '0003'
+    
+    def test_failed_migration_not_recorded(self, runner_db):
+        """Should stop at a failing migration and leave it pending."""
+        calls = []
+        
+        def fail():
+            raise RuntimeError('boom')
+        
+        runner = MigrationRunner([
+            Migration('0001', 'first', lambda: calls.append('0001')),
+            Migration('0002', 'broken', fail),
+            Migration('0003', 'after', lambda: calls.append('0003')),
+        ])
+        
+        with pytest.raises(MigrationError, match='0002 broken'):
+            runner.upgrade()
+        
+        assert calls == ['0001']
+        assert [m.version for m in runner.pending()] == ['0002', '0003']
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestVerificationDayMigration:
+    """Tests for the 0006 verification day migration."""
+    
+    def test_backfills_and_dedupes_legacy_rows(self, db_session, user, item):
+        """Should fill verified_on, drop same-day duplicates and add the index."""
+        from sqlalchemy import text
+        from app.models.item_verification import ItemVerification
+        
+        index = next(
+            index for index in ItemVerification.__table__.indexes
+            if index.name == 'uq_item_verification_user_item_day'
+        )
+        index.drop(db.engine)
+        db_session.execute(text('ALTER TABLE item_verification DROP COLUMN verified_on'))
+        for hour in (8, 9):
+            db_session.execute(
+                text(
+                    'INSERT INTO item_verification (user_id, item_id, created_at) '
+                    'VALUES (:user_id, :item_id, :created_at)'
+                ),
+                {'user_id': user.user_id, 'item_id': item.item_id,
+                 'created_at': f'2024-03-01 0{hour}:00:00.000000'}
+            )
+        db_session.commit()
+        
+        migration = next(m for m in load_migrations() if m.version == '0006')
+        migration.upgrade()
+        
+        rows = db_session.execute(
+            text('SELECT created_at, verified_on FROM item_verification')
+        ).all()
+        assert rows == [('2024-03-01 08:00:00.000000', '2024-03-01')]
+        counters = db_session.execute(
+            text('SELECT number_of_verifications, last_verified_date FROM item')
+        ).all()
+        assert counters == [(1, '2024-03-01 08:00:00.000000')]
+        names = {existing['name'] for existing in inspect(db.engine).get_indexes('item_verification')}
+        assert 'uq_item_verification_user_item_day' in names
@@ -0,0 +1,46 @@
+"""
+Unit Tests for Schema Index Maintenance
+
+Tests creating model indexes that an existing database lacks.
+"""
+import pytest
+from sqlalchemy import inspect
+
+from app import db
+from app.migrations.ops import create_missing_indexes
+from app.models.item import Item
+from app.services import schema_indexes
+from app.services.schema_indexes import ensure_indexes, missing_indexes
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestEnsureIndexes:
+    """Tests for ensure_indexes."""
+    
+    def test_nothing_missing_on_fresh_database(self, db_session):
+        """Should find every declared index after create_all."""
+        assert missing_indexes() == []
+        assert ensure_indexes() == []
+    
+    def test_creates_dropped_index(self, db_session):
+        """Should recreate an index missing from an existing table."""
+        index = next(index for index in Item.__table__.indexes if index.name == 'ix_item_city_created')
+        index.drop(db.engine)
+        
+        assert [missing.name for missing in missing_indexes(['item'])] == ['ix_item_city_created']
+        assert ensure_indexes(['item']) == ['ix_item_city_created']
+        names = {existing['name'] for existing in inspect(db.engine).get_indexes('item')}
+        assert 'ix_item_city_created' in names
+    
+    def test_invalid_index_counts_as_missing(self, db_session, monkeypatch):
+        """Should rebuild an index a failed concurrent build left invalid."""
+        monkeypatch.setattr(
+            schema_indexes, '_invalid_indexes',
+            lambda table_name: {'ix_item_city_created'} if table_name == 'item' else set()
+        )
+        index = next(index for index in Item.__table__.indexes if index.name == 'ix_item_city_created')
+        
+        assert [missing.name for missing in missing_indexes(['item'])] == ['ix_item_city_created']
+        assert ensure_indexes(['item']) == ['ix_item_city_created']
+        assert create_missing_indexes(index) == ['ix_item_city_created']
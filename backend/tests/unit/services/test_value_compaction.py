@@ -0,0 +1,84 @@
+"""
+Unit Tests for Value Compaction
+
+Tests merging duplicate tag values created before values were canonical.
+"""
+import pytest
+from sqlalchemy import inspect
+
+from app import db
+from app.models.category import Category
+from app.models.item import Item
+from app.models.item_tag_value import ItemTagValue
+from app.models.tag import Tag, TagValueType
+from app.models.user import User
+from app.models.value import Value
+from app.services.value_compaction import compact_values, ensure_value_unique_indexes
+
+
+@pytest.fixture
+def legacy_values(db_session, rotation_city):
+    """Database without value indexes holding duplicate values."""
+    for index in Value.__table__.indexes:
+        index.drop(db.engine)
+    
+    user = User(
+        first_name='Ada',
+        last_name='Lovelace',
+        email='ada@uni.minerva.edu',
+        rotation_city_id=rotation_city.city_id
+    )
+    tag = Tag(name='Condition', value_type=TagValueType.TEXT.code)
+    db_session.add_all([user, tag, Category(category_name='Food')])
+    db_session.flush()
+    
+    items = [
+        Item(
+            name=f'Item {i}',
+            location='Main St',
+            rotation_city_id=rotation_city.city_id,
+            added_by_user_id=user.user_id
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(items)
+    db_session.flush()
+    
+    good = [Value(tag_id=tag.tag_id, name_val='Good') for _ in range(3)]
+    fair = Value(tag_id=tag.tag_id, name_val='Fair')
+    db_session.add_all([*good, fair])
+    db_session.flush()
+    
+    links = [ItemTagValue(item_id=item.item_id, value_id=value.value_id) for item, value in zip(items, good)]
+    # The first item carried two copies of "Good"
+    links.append(ItemTagValue(item_id=items[0].item_id, value_id=good[1].value_id))
+    links.append(ItemTagValue(item_id=items[1].item_id, value_id=fair.value_id))
+    db_session.add_all(links)
+    db_session.commit()
+    return {'good_id': good[0].value_id, 'fair_id': fair.value_id}
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestValueCompaction:
+    """Tests for compact_values and ensure_value_unique_indexes."""
+    
+    def test_merges_duplicates_and_rewrites_links(self, db_session, legacy_values):
+        """Should keep the oldest copy and point every link at it."""
+        stats = compact_values(batch_size=1)
+        
+        assert stats == {'merged': 2, 'links_rewritten': 3, 'links_removed': 1}
+        assert db_session.query(Value).count() == 2
+        linked = sorted(link.value_id for link in db_session.query(ItemTagValue))
+        assert linked == sorted([legacy_values['good_id']] * 3 + [legacy_values['fair_id']])
+    
+    def test_creates_indexes_after_compaction(self, db_session, legacy_values):
+        """Should add the missing unique indexes once duplicates are gone."""
+        compact_values()
+        
+        created = ensure_value_unique_indexes()
+        
+        assert sorted(created) == sorted(index.name for index in Value.__table__.indexes)
+        names = {index['name'] for index in inspect(db.engine).get_indexes('value')}
+        assert set(created) <= names
+        assert ensure_value_unique_indexes() == []
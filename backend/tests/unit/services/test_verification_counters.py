@@ -0,0 +1,86 @@
+"""
+Unit Tests for Verification Counter Reconciliation
+
+Tests recomputing item verification counters from the verification history.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.item import Item
+from app.models.item_verification import ItemVerification
+from app.services.item_service import ItemService
+from app.services.verification_counters import reconcile_verification_counters
+from app.utils.freshness import freshness_weight
+from app.utils.pagination import decode_cursor
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestReconcileVerificationCounters:
+    """Tests for reconcile_verification_counters."""
+    
+    def test_consistent_items_untouched(self, db_session, multiple_verifications):
+        """Should leave counters that match the history alone."""
+        stats = reconcile_verification_counters()
+        
+        assert stats == {'checked': 1, 'corrected': 0}
+    
+    def test_corrects_drifted_counters(self, db_session, user, item):
+        """Should recompute counts and dates written outside the service."""
+        rows = [
+            ItemVerification(
+                user_id=user.user_id,
+                item_id=item.item_id,
+                created_at=datetime.utcnow() - timedelta(days=days)
+            )
+            for days in range(3)
+        ]
+        db_session.add_all(rows)
+        db_session.commit()
+        
+        stats = reconcile_verification_counters(batch_size=1)
+        
+        db_session.expire_all()
+        stored = db_session.get(Item, item.item_id)
+        assert stats == {'checked': 1, 'corrected': 1}
+        assert stored.number_of_verifications == 3
+        assert stored.last_verified_date == max(row.created_at for row in rows)
+    
+    def test_resets_items_without_history(self, db_session, item):
+        """Should zero counters left on an item whose verifications are gone."""
+        db_session.get(Item, item.item_id).number_of_verifications = 4
+        db_session.commit()
+        
+        stats = reconcile_verification_counters()
+        
+        db_session.expire_all()
+        stored = db_session.get(Item, item.item_id)
+        assert stats['corrected'] == 1
+        assert stored.number_of_verifications == 0
+        assert stored.last_verified_date is None
+    
+    def test_corrected_items_rescored_and_in_change_feed(self, db_session, user, item):
+        """Should refresh freshness and updated_at so rankings and the feed follow."""
+        item_service = ItemService()
+        _, token, _ = item_service.get_item_changes(item.rotation_city_id, limit=10)
+        db_session.add_all([
+            ItemVerification(
+                user_id=user.user_id,
+                item_id=item.item_id,
+                created_at=datetime.utcnow() - timedelta(days=days)
+            )
+            for days in range(3)
+        ])
+        db_session.commit()
+        
+        reconcile_verification_counters()
+        
+        db_session.expire_all()
+        stored = db_session.get(Item, item.item_id)
+        assert stored.freshness_score == pytest.approx(freshness_weight(3), rel=1e-3)
+        items, _, _ = item_service.get_item_changes(
+            item.rotation_city_id, limit=10, since=decode_cursor(token)
+        )
+        assert [changed.item_id for changed in items] == [item.item_id]
+        assert items[0].number_of_verifications == 3
@@ -1,5 +1,6 @@
 """Unit tests for VerificationService."""
 import pytest
+from datetime import datetime
 from app.services.verification_service import (
     VerificationService,
     ItemNotFoundError,
@@ -32,6 +33,18 @@ class TestVerificationService:
         assert result['created_at'] is not None
         assert result['verification_count'] == 1
 
+    def test_verify_item_updates_item_counters(self, db_session, user, item):
+        """Test verifying stores the count and date on the item."""
+        from app.models import Item
+        service = VerificationService()
+        
+        result = service.verify_item(user_id=user.user_id, item_id=item.item_id)
+        
+        db_session.expire_all()
+        stored = db_session.get(Item, item.item_id)
+        assert stored.number_of_verifications == 1
+        assert stored.last_verified_date.isoformat() == result['created_at']
+
     def test_verify_item_without_note(self, db_session, user, item):
         """Test verifying item without a note."""
         service = VerificationService()
@@ -114,6 +127,47 @@ class TestVerificationService:
         assert result1['user_id'] != result2['user_id']
         assert result2['verification_count'] == 2
 
+    def test_verify_items_batch(self, db_session, user, item, book):
+        """Test verifying several items reports a status per item."""
+        service = VerificationService()
+        service.verify_item(user.user_id, book.item_id)
+        
+        result = service.verify_items(user.user_id, [
+            (item.item_id, "Still here"),
+            (book.item_id, None),
+            (99999, None),
+            (item.item_id, "Repeated"),
+        ])
+        
+        assert result['verified_count'] == 1
+        assert [(r['item_id'], r['status']) for r in result['results']] == [
+            (item.item_id, 'verified'),
+            (book.item_id, 'already_verified'),
+            (99999, 'not_found'),
+        ]
+        assert result['results'][0]['verification_count'] == 1
+        verification = service.get_verification(result['results'][0]['verification_id'])
+        assert verification['note'] == "Still here"
+
+    def test_verify_items_statement_count(self, app, db_session, user, item, book):
+        """Test a batch costs the same number of statements as one item."""
+        from sqlalchemy import event
+        from app import db
+        statements = []
+        user_id, entries = user.user_id, [(item.item_id, None), (book.item_id, None)]
+        
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(db.engine, 'before_cursor_execute', capture)
+        try:
+            VerificationService().verify_items(user_id, entries)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', capture)
+        
+        # Lookup, insert, counter update and the two rollup upserts
+        assert len(statements) == 5
+
     def test_get_verification_success(self, db_session, item_verification):
         """Test getting a verification by ID."""
         service = VerificationService()
@@ -222,6 +276,64 @@ class TestVerificationService:
         assert result['count'] == 1
         assert len(result['verifications']) == 1
 
+    def test_verification_listing_single_statement(
+        self,
+        db_session,
+        item,
+        multiple_verifications
+    ):
+        """Test a listing page is one joined query without base64 avatars."""
+        from sqlalchemy import event
+        from app import db
+        item_id = item.item_id
+        statements = []
+        
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        db_session.expire_all()
+        event.listen(db.engine, 'before_cursor_execute', capture)
+        try:
+            result = VerificationService().get_item_verifications(item_id)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', capture)
+        
+        assert result['returned_count'] == 3
+        # The joined page plus the item's counter; no lazy loads, no COUNT(*)
+        assert len(statements) == 2
+        assert len([s for s in statements if ' JOIN ' in s]) == 1
+        assert not [s for s in statements if 'count(' in s]
+        assert all('"user".profile_picture,' not in s for s in statements)
+
+    def test_get_item_verifications_pages(
+        self,
+        db_session,
+        item,
+        multiple_verifications
+    ):
+        """Test walking the history with cursors and since."""
+        from app.utils.pagination import decode_cursor
+        service = VerificationService()
+        
+        first = service.get_item_verifications(item.item_id, limit=2)
+        second = service.get_item_verifications(
+            item.item_id, limit=2, cursor=decode_cursor(first['next_cursor'])
+        )
+        
+        assert first['total_count'] == 3
+        assert first['returned_count'] == 2
+        assert second['returned_count'] == 1
+        assert second['next_cursor'] is None
+        seen = [v['verification_id'] for v in first['verifications'] + second['verifications']]
+        assert sorted(seen) == sorted(v.verification_id for v in multiple_verifications)
+        
+        oldest = second['verifications'][0]['created_at']
+        newer = service.get_item_verifications(
+            item.item_id, since=datetime.fromisoformat(oldest)
+        )
+        assert newer['returned_count'] == 2
+        assert newer['total_count'] == 3
+
     def test_get_user_verifications_empty(self, db_session, user):
         """Test getting verifications for user with no verifications."""
         service = VerificationService()
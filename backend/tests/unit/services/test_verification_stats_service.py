@@ -0,0 +1,111 @@
+"""Unit tests for VerificationStatsService and the verification rollups."""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models.city_verification_daily import CityVerificationDaily
+from app.models.city_verifier_total import CityVerifierTotal
+from app.repositories.implementations.verification_stats_repository import (
+    VerificationStatsRepository
+)
+from app.services.verification_rollups import rebuild_verification_rollups
+from app.services.verification_service import VerificationService
+from app.services.verification_stats_service import VerificationStatsService
+
+
+def rollup_snapshot():
+    """Current contents of both rollup tables."""
+    daily = db.session.execute(
+        db.select(
+            CityVerificationDaily.rotation_city_id,
+            CityVerificationDaily.day,
+            CityVerificationDaily.verification_count
+        ).order_by(CityVerificationDaily.rotation_city_id, CityVerificationDaily.day)
+    ).all()
+    verifiers = db.session.execute(
+        db.select(
+            CityVerifierTotal.rotation_city_id,
+            CityVerifierTotal.user_id,
+            CityVerifierTotal.verification_count
+        ).order_by(CityVerifierTotal.rotation_city_id, CityVerifierTotal.user_id)
+    ).all()
+    return daily, verifiers
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestVerificationStatsService:
+    """Test VerificationStatsService methods."""
+
+    def test_verifying_updates_rollups(self, db_session, user, verified_user, item, book):
+        """Test single and batch verification increment the rollups."""
+        service = VerificationService()
+        service.verify_item(user.user_id, item.item_id)
+        service.verify_items(verified_user.user_id, [(item.item_id, None), (book.item_id, None)])
+        
+        daily, verifiers = rollup_snapshot()
+        
+        today = datetime.utcnow().date()
+        assert daily == [(item.rotation_city_id, today, 3)]
+        assert verifiers == [
+            (item.rotation_city_id, user.user_id, 1),
+            (item.rotation_city_id, verified_user.user_id, 2),
+        ]
+
+    def test_rebuild_matches_incremental(self, db_session, user, verified_user, item, book):
+        """Test rebuilding from history reproduces the incremental rollups."""
+        service = VerificationService()
+        service.verify_item(user.user_id, item.item_id)
+        service.verify_items(verified_user.user_id, [(item.item_id, None), (book.item_id, None)])
+        incremental = rollup_snapshot()
+        
+        stats = rebuild_verification_rollups()
+        
+        assert rollup_snapshot() == incremental
+        assert stats == {'daily_rows': 1, 'verifier_rows': 2}
+
+    def test_get_city_stats_buckets(self, db_session, user, verified_user, item, book):
+        """Test daily buckets are zero-filled and weeks start on Monday."""
+        city_id = item.rotation_city_id
+        repo = VerificationStatsRepository()
+        # Wednesday 2024-03-06 and Monday/Tuesday of the following week
+        for when, verifications in [
+            (datetime(2024, 3, 6, 9), [(city_id, user.user_id), (city_id, verified_user.user_id)]),
+            (datetime(2024, 3, 11, 9), [(city_id, user.user_id)]),
+            (datetime(2024, 3, 12, 9), [(city_id, user.user_id)]),
+        ]:
+            repo.record_verifications(verifications, when)
+        db_session.commit()
+        
+        stats = VerificationStatsService().get_city_stats(
+            city_id, days=10, stale_days=7, top=1, today=date(2024, 3, 12)
+        )
+        
+        assert stats['start_day'] == '2024-03-03'
+        assert len(stats['daily']) == 10
+        assert stats['daily'][3] == {'day': '2024-03-06', 'verification_count': 2}
+        assert stats['daily'][4]['verification_count'] == 0
+        assert stats['weekly'] == [
+            {'week_start': '2024-03-04', 'verification_count': 2},
+            {'week_start': '2024-03-11', 'verification_count': 2},
+        ]
+        assert stats['total_verifications'] == 4
+        assert [v['user_id'] for v in stats['top_verifiers']] == [user.user_id]
+        assert stats['top_verifiers'][0]['verification_count'] == 3
+
+    def test_get_city_stats_stale_items(self, db_session, user, item, book):
+        """Test items unverified within stale_days (or never) are stale."""
+        VerificationService().verify_item(user.user_id, item.item_id)
+        
+        stats = VerificationStatsService().get_city_stats(item.rotation_city_id, stale_days=7)
+        
+        assert stats['item_count'] == 2
+        assert stats['stale_item_count'] == 1
+
+        later = VerificationStatsService().get_city_stats(
+            item.rotation_city_id,
+            stale_days=7,
+            today=datetime.utcnow().date() + timedelta(days=8)
+        )
+        assert later['stale_item_count'] == 2
@@ -1,7 +1,73 @@
 import { apiFetch } from ".";
 
-export async function getItems() {
-  return await apiFetch("/item/", {
+// Array values repeat the parameter: { category_id: [1, 2] }
+function filterQuery(filters) {
+  const params = new URLSearchParams();
+  Object.entries(filters || {}).forEach(([key, value]) => {
+    [].concat(value).forEach((v) => params.append(key, v));
+  });
+  return params.toString();
+}
+
+/**
+ * Fetch the city's items. With filters the response is one page
+ * ({ items, next_cursor }), e.g.
+ * { category_id: [1, 2], tag: ["3:24/7"], max_walking_distance: 500 }.
+ */
+export async function getItems(filters) {
+  const query = filterQuery(filters);
+  return await apiFetch(query ? `/item/?${query}` : "/item/", {
+    method: "GET",
+  });
+}
+
+/**
+ * Fetch per-category and per-tag-value item counts, taking the same
+ * filters as getItems.
+ */
+export async function getItemFacets(filters) {
+  const query = filterQuery(filters);
+  return await apiFetch(query ? `/item/facets?${query}` : "/item/facets", {
+    method: "GET",
+  });
+}
+
+/**
+ * Search items in the current user's city, best match first.
+ * Pass the returned next_cursor back as cursor to fetch the next page.
+ */
+export async function searchItems(q, { limit, cursor } = {}) {
+  const params = new URLSearchParams({ q });
+  if (limit) params.set("limit", limit);
+  if (cursor) params.set("cursor", cursor);
+  return await apiFetch(`/item/search?${params}`, {
+    method: "GET",
+  });
+}
+
+/**
+ * Fetch items within radius meters of a point, closest first; each item
+ * carries distance_meters.
+ */
+export async function getNearbyItems(lat, lng, { radius, limit } = {}) {
+  const params = new URLSearchParams({ lat, lng });
+  if (radius) params.set("radius", radius);
+  if (limit) params.set("limit", limit);
+  return await apiFetch(`/item/nearby?${params}`, {
+    method: "GET",
+  });
+}
+
+/**
+ * Fetch items created, edited or verified since a previous sync.
+ * Omit since for a full sync; store next_token and pass it as since
+ * next time, fetching again right away while has_more is true.
+ */
+export async function getItemChanges(since, { limit } = {}) {
+  const params = new URLSearchParams();
+  if (since) params.set("since", since);
+  if (limit) params.set("limit", limit);
+  return await apiFetch(`/item/changes?${params}`, {
     method: "GET",
   });
 }
@@ -1,4 +1,5 @@
 import { apiFetch } from ".";
+import { saveTokens } from "../features/auth/services/authservice.js";
 
 export async function getCurrentUser() {
   return await apiFetch("/user/me", {
@@ -7,9 +8,15 @@ export async function getCurrentUser() {
 }
 
 export async function updateUserProfile(data) {
-  return await apiFetch("/user/me", {
+  const response = await apiFetch("/user/me", {
     method: "PUT",
     body: JSON.stringify(data),
   });
-}
 
+  // Tokens carry the rotation city; the backend re-issues them when it changes
+  if (response?.access_token) {
+    saveTokens(response.access_token, response.refresh_token);
+  }
+
+  return response;
+}
@@ -1,7 +1,12 @@
 import { apiFetch } from ".";
 
-export async function getItemVerifications(itemId, limit = 50) {
-  return await apiFetch(`/verification/items/${itemId}?limit=${limit}`, {
+// Pass the previous response's next_cursor as cursor to load older entries,
+// or an ISO timestamp as since to load only newer ones
+export async function getItemVerifications(itemId, limit = 50, { cursor, since } = {}) {
+  const params = new URLSearchParams({ limit });
+  if (cursor) params.set("cursor", cursor);
+  if (since) params.set("since", since);
+  return await apiFetch(`/verification/items/${itemId}?${params}`, {
     method: "GET",
   });
 }
@@ -13,4 +18,10 @@ export async function verifyItem(itemId, note) {
   });
 }
 
-
+// entries: [{ item_id, note? }]; resolves to a per-item status list
+export async function verifyItems(entries) {
+  return await apiFetch(`/verification/items/batch`, {
+    method: "POST",
+    body: JSON.stringify({ verifications: entries }),
+  });
+}
@@ -3,7 +3,7 @@ import { apiFetch, API_BASE_URL } from "../../../api/index.js"
 
 const AUTH_PREFIX = "/auth"
 
-const saveTokens = (accessToken, refreshToken) => {
+export const saveTokens = (accessToken, refreshToken) => {
   localStorage.setItem('access_token', accessToken)
   localStorage.setItem('refresh_token', refreshToken)
 }
@@ -6,6 +6,7 @@ import "@/shared/styles/locale-theme.css";
 import CategoryTag from "./component/category_tag";
 import SearchBar from "./component/SearchBar";
 import { verifyItem } from "../../api/verification";
+import { imageSrc } from "../../shared/utils/images";
 
 
 
@@ -75,7 +76,7 @@ function HomePage() {
                 setCategories(cats.map(c => ({ 
                     id: c.category_id, 
                     name: c.category_name,
-                    image: c.category_pic // base64 image data
+                    image: imageSrc(c.category_pic) // image URL, or legacy base64
                 })));
 
                 // Fetch items for user's rotation city
@@ -77,7 +77,7 @@ export default function CategoryTag({ categories, selectedCategoryIds, onToggleC
                                 {/* Category icon */}
                                 {cat.image && (
                                     <img 
-                                        src={`data:image/png;base64,${cat.image}`}
+                                        src={cat.image}
                                         alt={cat.name}
                                         className="w-5 h-5 object-contain filter drop-shadow-sm flex-shrink-0"
                                     />
@@ -9,6 +9,7 @@ import { getCurrentUser } from "../../../api/user";
 import { getCategories } from "../../../api/category";
 import { getItems } from "../../../api/item";
 import { getLocaleFromCity, getUserDisplayName } from "../../../config/localeConfig";
+import { imageSrc } from "../../../shared/utils/images";
 
 /**
  * Fetch and transform user data for home page
@@ -25,7 +26,7 @@ export async function fetchHomeUserData() {
 
 /**
  * Fetch and transform categories for home page
- * @returns {Promise<Array<{id: number, name: string, image: string|null}>>}
+ * @returns {Promise<Array<{id: number, name: string, image: string|null}>>} image is an <img src>
  */
 export async function fetchCategories() {
     const categories = await getCategories();
@@ -33,7 +34,7 @@ export async function fetchCategories() {
     return categories.map(c => ({
         id: c.category_id,
         name: c.category_name,
-        image: c.category_pic || null
+        image: imageSrc(c.category_pic)
     }));
 }
 
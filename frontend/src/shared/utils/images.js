@@ -0,0 +1,13 @@
+/**
+ * Build an <img src> from an image field returned by the API.
+ *
+ * Images moved to the image store come back as URLs; rows not migrated yet
+ * still hold a data URL or bare base64 (PNG, as the seed script wrote it).
+ * @param {string|null|undefined} value - category_pic / profile_picture value
+ * @returns {string|null}
+ */
+export function imageSrc(value) {
+    if (!value) return null;
+    if (/^(https?:|data:|\/)/.test(value)) return value;
+    return `data:image/png;base64,${value}`;
+}
@@ -57,6 +57,19 @@ describe('user API', () => {
       expect(result).toEqual({ success: true })
     })
 
+    it('stores re-issued tokens when the city changes', async () => {
+      api.apiFetch.mockResolvedValue({
+        rotation_city_id: 2,
+        access_token: 'new-access',
+        refresh_token: 'new-refresh',
+      })
+
+      await updateUserProfile({ rotation_city_id: 2 })
+
+      expect(localStorage.getItem('access_token')).toBe('new-access')
+      expect(localStorage.getItem('refresh_token')).toBe('new-refresh')
+    })
+
     it('handles update error', async () => {
       api.apiFetch.mockRejectedValue(new Error('Update failed'))
 